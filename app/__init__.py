@@ -6,35 +6,85 @@ It provides the application factory function for the Employee Management System
 from dotenv import load_dotenv
 from flask import Flask
 
-from app.extensions import db, spec
-from app.middleware.logging_middleware import setup_request_logging
-from app.utils.error_handlers import register_error_handlers
+from app.cli import register_commands
+from app.extensions import db
+from app.repositories.department_repository import department_repository
+from app.repositories.outbox_repository import outbox_repository
+from app.utils.invalidation_bus import invalidation_bus
+from app.utils.statement_cache import statement_cache
 
 load_dotenv()
 
 
-def create_app():
+def create_app(with_api: bool = True, config: dict | None = None):
     """
     Application factory for the Employee Management System API.
 
     Initializes Flask app, configures extensions, middleware, blueprints, error handlers, and API docs.
 
+    Args:
+        with_api (bool): Register the HTTP API layer. CLI-only processes such as
+            `flask --app "app:create_app(with_api=False)" init-db` pass False to skip
+            importing controllers, services and schemas.
+        config (dict, optional): Settings overriding config.Config, applied before any
+            extension reads them (e.g. a test database URI).
+
     Returns:
         Flask: The configured Flask application instance.
     """
     app = Flask(__name__)
     app.config.from_object("config.Config")
+    if config:
+        app.config.update(config)
 
     # Initialize extensions
     db.init_app(app)
+    outbox_repository.init_app(app)
+    statement_cache.init_app(app)
+    department_repository.init_app(app)
+    # CLI and job worker writes publish invalidations too; only API processes cache and listen
+    invalidation_bus.init_app(app)
+    register_commands(app)
+    if not with_api:
+        return app
+
+    # Deferred so that CLI-only applications do not pay for the API layer's imports
+    from app.extensions import spec
+    from app.middleware.logging_middleware import setup_request_logging
+    from app.middleware.proxy_middleware import setup_proxy_fix
+    from app.middleware.rate_limit_middleware import setup_rate_limiting
+    from app.middleware.tenant_middleware import setup_tenant_resolution
+    from app.middleware.tracing_middleware import setup_tracing
+    from app.services.analytics_service import analytics_service
+    from app.services.change_stream import change_stream
+    from app.services.job_service import job_service
+    from app.utils.error_handlers import register_error_handlers
+    from app.utils.query_cache import query_cache
+
+    query_cache.init_app(app)
+    analytics_service.init_app(app)
+    change_stream.init_app(app)
+    job_service.init_app(app)
+    invalidation_bus.listen()
 
+    setup_proxy_fix(app)
+    # Register tracing first so that the other middleware is part of each trace
+    setup_tracing(app)
     # Register request/response logging middleware
     setup_request_logging(app)
+    setup_tenant_resolution(app)
+    setup_rate_limiting(app)
 
     # Register blueprints
+    from app.controllers.analytics_controller import analytics_bp
+    from app.controllers.department_controller import departments_bp
     from app.controllers.employee_controller import employee_bp
+    from app.controllers.job_controller import jobs_bp
 
     app.register_blueprint(employee_bp, url_prefix="/employees")
+    app.register_blueprint(analytics_bp, url_prefix="/employees/analytics")
+    app.register_blueprint(jobs_bp, url_prefix="/jobs")
+    app.register_blueprint(departments_bp, url_prefix="/departments")
 
     # Register error handlers
     register_error_handlers(app)
@@ -43,6 +93,7 @@ def create_app():
     spec.config.TITLE = "Employee Management System API"
     spec.config.VERSION = "1.0.0"
     spec.config.PATH = "docs"
+    spec.spec_file = app.config.get("OPENAPI_SPEC_FILE")
     spec.register(app)
 
     app.logger.info("Application started successfully.")
@@ -0,0 +1,354 @@
+"""
+This module defines the Flask CLI commands for the Employee Management System.
+Commands are registered on every application built by the factory, including the lightweight
+CLI-only application that skips the API layer.
+"""
+
+import multiprocessing
+import time
+from datetime import datetime, timedelta
+
+import click
+from flask import Flask
+
+from app.extensions import db
+from app.utils.data_generator import DISTRIBUTIONS, generate_employees
+from app.utils.tenant import tenant_bind_key, tenant_context
+
+
+def _run_job_worker(app: Flask, once: bool) -> int:
+    """
+    Run background jobs of every tenant database in this process.
+
+    Args:
+        app (Flask): The Flask application instance.
+        once (bool): Return as soon as no job is queued.
+
+    Returns:
+        int: Number of jobs run.
+    """
+    from app.services.job_service import job_service
+
+    job_service.init_app(app)
+    with app.app_context():
+        try:
+            return job_service.run_worker(
+                [None, *app.config["TENANT_BINDS"]],
+                poll_seconds=app.config["JOB_POLL_SECONDS"],
+                once=once,
+            )
+        except KeyboardInterrupt:
+            return 0
+
+
+def _job_worker_process(once: bool) -> None:
+    """
+    Entry point of a pooled job worker process, which builds its own CLI-only application.
+
+    Args:
+        once (bool): Exit as soon as no job is queued.
+
+    Returns:
+        None
+    """
+    from app import create_app
+
+    _run_job_worker(create_app(with_api=False), once)
+
+
+def _import_models() -> None:
+    """
+    Import every model, so that its table is registered with the metadata.
+
+    Returns:
+        None
+    """
+    from app.models import (  # noqa: F401
+        cache_invalidation,
+        department,
+        employee,
+        employee_archive,
+        employee_change,
+        employee_snapshot,
+        job,
+        outbox_message,
+    )
+
+
+def register_commands(app: Flask) -> None:
+    """
+    Register the application's CLI commands.
+
+    Args:
+        app (Flask): The Flask application instance.
+
+    Returns:
+        None
+    """
+
+    @app.cli.command("init-db")
+    def init_db_command():
+        """
+        CLI command to initialize the database tables, including every tenant's dedicated bind.
+
+        Usage:
+            flask init-db
+
+        Returns:
+            None
+        """
+        _import_models()
+        with app.app_context():
+            db.create_all()
+            for tenant_id in app.config["TENANT_BINDS"]:
+                db.metadata.create_all(db.engines[tenant_bind_key(tenant_id)])
+        print("Initialized the database.")
+
+    @app.cli.command("migrate-db")
+    def migrate_db_command():
+        """
+        CLI command to bring databases created by an earlier version up to date.
+
+        Creates the missing tables, then adds the columns, constraints and indexes that later
+        versions added to existing tables. Safe to rerun; every tenant database is migrated.
+
+        Usage:
+            flask migrate-db
+
+        Returns:
+            None
+        """
+        from app.utils.migrations import migrate_database
+
+        _import_models()
+        with app.app_context():
+            for tenant_id in [None, *app.config["TENANT_BINDS"]]:
+                engine = db.engines[tenant_bind_key(tenant_id) if tenant_id else None]
+                db.metadata.create_all(engine)
+                applied = migrate_database(engine, tenant_id or app.config["DEFAULT_TENANT"])
+                print(f"{tenant_id or 'default database'}: {', '.join(applied) or 'up to date'}")
+
+    @app.cli.command("seed")
+    @click.option("--count", type=click.IntRange(min=1), default=10000, show_default=True)
+    @click.option("--departments", type=click.IntRange(min=1), default=8, show_default=True)
+    @click.option(
+        "--distribution",
+        type=click.Choice(DISTRIBUTIONS),
+        default="lognormal",
+        show_default=True,
+        help="Salary distribution.",
+    )
+    @click.option("--skew", type=click.FloatRange(min=0), default=1.0, show_default=True)
+    @click.option("--seed", "random_seed", type=int, default=0, show_default=True)
+    @click.option("--start", type=click.IntRange(min=0), default=0, help="First email index.")
+    @click.option("--tenant", default=None, help="Tenant to seed [default: DEFAULT_TENANT].")
+    def seed_command(count, departments, distribution, skew, random_seed, start, tenant):
+        """
+        CLI command to bulk insert deterministic synthetic employees for load testing.
+
+        Department sizes are Zipf-skewed and emails are unique; rerun with a different
+        --start to add more employees to a seeded database.
+
+        Usage:
+            flask seed --count 100000 --departments 12 --distribution pareto
+
+        Returns:
+            None
+        """
+        from app.repositories.employee_repository import employee_repository
+
+        batches = generate_employees(count, departments, distribution, skew, random_seed, start)
+        started = time.perf_counter()
+        with app.app_context(), tenant_context(tenant):
+            total = employee_repository.bulk_create(batches)
+        elapsed = time.perf_counter() - started
+        print(f"Seeded {total} employees in {elapsed:.2f}s ({total / elapsed:,.0f} rows/s).")
+
+    @app.cli.command("archive-employees")
+    @click.option(
+        "--older-than-days",
+        type=click.IntRange(min=0),
+        default=None,
+        help="Minimum days since deletion [default: ARCHIVE_AFTER_DAYS].",
+    )
+    @click.option("--batch-size", type=click.IntRange(min=1), default=1000, show_default=True)
+    def archive_employees_command(older_than_days, batch_size):
+        """
+        CLI command to move soft-deleted employees to the employees_archive table.
+
+        Rows are moved in short batched transactions so the job can run next to live traffic.
+        All tenants are archived: those in the shared database, then each dedicated bind.
+
+        Usage:
+            flask archive-employees --older-than-days 30 --batch-size 1000
+
+        Returns:
+            None
+        """
+        from app.repositories.employee_repository import employee_repository
+
+        if older_than_days is None:
+            older_than_days = app.config["ARCHIVE_AFTER_DAYS"]
+        cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+        total = 0
+        with app.app_context():
+            for tenant_id in [None, *app.config["TENANT_BINDS"]]:
+                with tenant_context(tenant_id):
+                    while moved := employee_repository.archive_deleted(cutoff, batch_size):
+                        total += moved
+        print(f"Archived {total} employees.")
+
+    @app.cli.command("migrate-departments")
+    @click.option("--batch-size", type=click.IntRange(min=1), default=1000, show_default=True)
+    def migrate_departments_command(batch_size):
+        """
+        CLI command moving employees to the departments table.
+
+        Migrates databases created before the departments table existed (see `migrate-db`),
+        then backfills the employees' keys from the department names in short batched
+        transactions. Safe to rerun; every tenant database is migrated.
+
+        Usage:
+            flask migrate-departments --batch-size 1000
+
+        Returns:
+            None
+        """
+        from app.repositories.department_repository import department_repository
+        from app.utils.migrations import migrate_database
+
+        _import_models()
+        total = 0
+        with app.app_context():
+            for tenant_id in [None, *app.config["TENANT_BINDS"]]:
+                engine = db.engines[tenant_bind_key(tenant_id) if tenant_id else None]
+                # The department key's indexes lead with tenant_id, which may be missing too
+                db.metadata.create_all(engine)
+                migrate_database(engine, tenant_id or app.config["DEFAULT_TENANT"])
+                with tenant_context(tenant_id):
+                    total += department_repository.backfill(batch_size)
+        print(f"Backfilled the department of {total} employees.")
+
+    @app.cli.command("snapshot-employees")
+    @click.option(
+        "--through",
+        type=click.DateTime(formats=["%Y-%m-%d"]),
+        default=None,
+        help="Last day to snapshot [default: today, UTC].",
+    )
+    def snapshot_employees_command(through):
+        """
+        CLI command writing the daily headcount and payroll aggregates behind /employees/trends.
+
+        Catches up from the latest snapshot day (or the first join date) for every tenant; run
+        it daily, e.g. from cron shortly after midnight UTC.
+
+        Usage:
+            flask snapshot-employees [--through 2024-12-31]
+
+        Returns:
+            None
+        """
+        from app.services.snapshot_service import snapshot_service
+
+        total = 0
+        with app.app_context():
+            for tenant_id in [None, *app.config["TENANT_BINDS"]]:
+                with tenant_context(tenant_id):
+                    total += snapshot_service.take_snapshots(through.date() if through else None)
+        print(f"Snapshotted {total} days.")
+
+    @app.cli.command("outbox-dispatch")
+    @click.option("--once", is_flag=True, help="Deliver what is due, then exit.")
+    def outbox_dispatch_command(once):
+        """
+        CLI worker delivering outbox messages to the configured sinks (OUTBOX_SINKS).
+
+        Several workers may run side by side: on databases with row locks they claim disjoint
+        batches with SKIP LOCKED. Messages of every tenant are delivered: those in the shared
+        database, then each dedicated bind.
+
+        Usage:
+            flask outbox-dispatch [--once]
+
+        Returns:
+            None
+        """
+        from app.services.outbox_dispatcher import outbox_dispatcher
+
+        outbox_dispatcher.init_app(app)
+        tenants = [None, *app.config["TENANT_BINDS"]]
+        with app.app_context():
+            if once:
+                print(f"Processed {outbox_dispatcher.drain(tenants)} outbox messages.")
+                return
+            try:
+                outbox_dispatcher.run(
+                    tenants,
+                    poll_seconds=app.config["OUTBOX_POLL_SECONDS"],
+                    retention_days=app.config["OUTBOX_RETENTION_DAYS"],
+                )
+            except KeyboardInterrupt:
+                pass
+
+    @app.cli.command("jobs-worker")
+    @click.option(
+        "--processes",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Worker processes [default: JOB_WORKER_PROCESSES].",
+    )
+    @click.option("--once", is_flag=True, help="Run the queued jobs, then exit.")
+    def jobs_worker_command(processes, once):
+        """
+        CLI command running background jobs (exports, imports, bulk updates) on a process pool.
+
+        Each process claims one job at a time (SKIP LOCKED on databases with row locks), so
+        heavy work runs here instead of on the web workers.
+
+        Usage:
+            flask --app "app:create_app(with_api=False)" jobs-worker --processes 4
+
+        Returns:
+            None
+        """
+        processes = processes or app.config["JOB_WORKER_PROCESSES"]
+        if processes == 1:
+            count = _run_job_worker(app, once)
+            print(f"Ran {count} jobs.")
+            return
+        # Spawned, not forked, so that no database connection is shared with the parent
+        context = multiprocessing.get_context("spawn")
+        workers = [
+            context.Process(target=_job_worker_process, args=(once,)) for _ in range(processes)
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            for worker in workers:
+                worker.join()
+        except KeyboardInterrupt:
+            for worker in workers:  # the workers got the interrupt too and are finishing up
+                worker.join()
+
+    @app.cli.command("openapi-export")
+    @click.argument("path", type=click.Path(dir_okay=False, writable=True))
+    def openapi_export_command(path):
+        """
+        CLI command to precompute the OpenAPI document, e.g. at image build time.
+
+        Point OPENAPI_SPEC_FILE at the output so workers serve it without generating it.
+
+        Usage:
+            flask openapi-export openapi.json
+
+        Returns:
+            None
+        """
+        if "openapi" not in app.view_functions:
+            raise click.UsageError("The API layer is not registered on this application.")
+        from app.extensions import spec
+
+        with open(path, "wb") as f:
+            f.write(spec.encoded_spec())
+        print(f"Wrote OpenAPI spec to {path}.")
@@ -0,0 +1,110 @@
+"""
+This module defines the Flask Blueprint and route handlers for salary analytics endpoints.
+Queries are answered from an in-memory columnar snapshot rather than the database.
+All endpoints are documented and validated using FlaskPydanticSpec.
+"""
+
+from flask import Blueprint, request
+from flask_pydantic_spec import Response
+
+from app.extensions import spec
+from app.schemas.analytics_schema import (
+    FilterQueryParams,
+    FilterResponse,
+    HistogramQueryParams,
+    HistogramResponse,
+    PercentileQueryParams,
+    PercentileResponse,
+    TopQueryParams,
+    TopResponse,
+)
+from app.services.analytics_service import analytics_service
+
+analytics_bp = Blueprint("analytics", __name__)
+
+FILTER_FIELDS = {"department", "min_salary", "max_salary", "joined_from", "joined_to"}
+
+
+@analytics_bp.route("/percentiles", methods=["GET"])
+@spec.validate(
+    query=PercentileQueryParams,
+    resp=Response(HTTP_200=PercentileResponse),
+    tags=["Analytics"],
+)
+def get_salary_percentiles():
+    """
+    Compute salary percentiles of the employees matching the filters.
+
+    Query Parameters:
+        PercentileQueryParams: Row filters and the percentiles to compute.
+
+    Returns:
+        Tuple (dict, int): JSON response with the percentiles and HTTP 200 status.
+    """
+    params = request.context.query  # type: ignore[attr-defined]
+    result = analytics_service.percentiles(params.model_dump(include=FILTER_FIELDS), params.p)
+    return PercentileResponse(**result).model_dump(mode="json"), 200
+
+
+@analytics_bp.route("/histogram", methods=["GET"])
+@spec.validate(
+    query=HistogramQueryParams,
+    resp=Response(HTTP_200=HistogramResponse),
+    tags=["Analytics"],
+)
+def get_salary_histogram():
+    """
+    Bucket the salaries of the employees matching the filters.
+
+    Query Parameters:
+        HistogramQueryParams: Row filters and either a bin count or explicit band edges.
+
+    Returns:
+        Tuple (dict, int): JSON response with bin edges and counts and HTTP 200 status.
+    """
+    params = request.context.query  # type: ignore[attr-defined]
+    result = analytics_service.histogram(
+        params.model_dump(include=FILTER_FIELDS), bins=params.bins, edges=params.edges
+    )
+    return HistogramResponse(**result).model_dump(mode="json"), 200
+
+
+@analytics_bp.route("/top", methods=["GET"])
+@spec.validate(query=TopQueryParams, resp=Response(HTTP_200=TopResponse), tags=["Analytics"])
+def get_top_salaries():
+    """
+    Rank the employees matching the filters by salary.
+
+    Query Parameters:
+        TopQueryParams: Row filters, number of employees and order.
+
+    Returns:
+        Tuple (dict, int): JSON response with the ranked employees and HTTP 200 status.
+    """
+    params = request.context.query  # type: ignore[attr-defined]
+    employees = analytics_service.top(
+        params.model_dump(include=FILTER_FIELDS), n=params.n, order=params.order
+    )
+    return TopResponse(employees=employees).model_dump(mode="json"), 200
+
+
+@analytics_bp.route("/filter", methods=["GET"])
+@spec.validate(
+    query=FilterQueryParams,
+    resp=Response(HTTP_200=FilterResponse),
+    tags=["Analytics"],
+)
+def filter_employees():
+    """
+    Count and summarize the employees matching the filters.
+
+    Query Parameters:
+        FilterQueryParams: Row filters and the maximum number of IDs to return.
+
+    Returns:
+        Tuple (dict, int): JSON response with the count, salary aggregates and matching IDs
+        and HTTP 200 status.
+    """
+    params = request.context.query  # type: ignore[attr-defined]
+    result = analytics_service.filter(params.model_dump(include=FILTER_FIELDS), limit=params.limit)
+    return FilterResponse(**result).model_dump(mode="json"), 200
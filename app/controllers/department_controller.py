@@ -0,0 +1,26 @@
+"""
+This module defines the Flask Blueprint and route handlers for departments.
+All endpoints are documented and validated using FlaskPydanticSpec.
+"""
+
+from flask import Blueprint
+from flask_pydantic_spec import Response
+
+from app.extensions import spec
+from app.schemas.department_schema import DepartmentsResponse
+from app.services.department_service import department_service
+
+departments_bp = Blueprint("departments", __name__)
+
+
+@departments_bp.route("/", methods=["GET"])
+@spec.validate(resp=Response(HTTP_200=DepartmentsResponse), tags=["Departments"])
+def list_departments():
+    """
+    List departments with their headcounts, served from cache until the next employee write.
+
+    Returns:
+        Tuple (dict, int): JSON response with the departments and HTTP 200 status.
+    """
+    response = DepartmentsResponse(departments=department_service.list_departments())
+    return response.model_dump(mode="json"), 200
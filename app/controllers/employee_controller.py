@@ -1,26 +1,91 @@
 """
 This module defines the Flask Blueprint and route handlers for employee-related API endpoints.
-It provides endpoints for creating, retrieving, updating, and deleting employees.
+It provides endpoints for creating, retrieving, updating, and deleting employees,
+a change feed for incremental synchronization, and a live server-sent events stream.
 All endpoints are documented and validated using FlaskPydanticSpec.
 """
 
-from flask import Blueprint, request
+from flask import Blueprint, current_app, request, stream_with_context
+from flask import Response as FlaskResponse
 from flask_pydantic_spec import Request, Response
 
+from app.exceptions import VersionConflictError
 from app.extensions import spec
 from app.schemas.employee_schema import (
+    CacheStatsResponse,
     DeleteEmployeeResponse,
+    EmployeeChangeResponse,
+    EmployeeChangesQueryParams,
+    EmployeeChangesResponse,
     EmployeeCreate,
     EmployeeQueryParams,
     EmployeeResponse,
     EmployeesListResponse,
     EmployeeUpdate,
+    EmployeeUpsert,
+    EmployeeUpsertBatch,
+    EmployeeUpsertBatchResponse,
+    EmployeeUpsertResult,
+    email_adapter,
 )
+from app.schemas.trend_schema import TrendQueryParams, TrendsResponse
+from app.services.change_stream import change_stream
 from app.services.employee_service import employee_service
+from app.services.snapshot_service import snapshot_service
+from app.utils.tenant import current_tenant
+from app.utils.tracing import span
 
 employee_bp = Blueprint("employee", __name__)
 
 
+def _employee_json(employee) -> dict:
+    """
+    Serialize an employee for a response.
+
+    Args:
+        employee (Employee | EmployeeResponse): The employee returned.
+
+    Returns:
+        dict: JSON-compatible employee data.
+    """
+    with span("serialize"):
+        return EmployeeResponse.from_orm(employee).model_dump(mode="json")
+
+
+def _if_match_version() -> int | None:
+    """
+    Read the expected employee version from the If-Match header.
+
+    The ETag of an employee is its quoted version number, e.g. `"3"`.
+
+    Returns:
+        int | None: The expected version, or None if the header is absent or `*`.
+
+    Raises:
+        VersionConflictError: If the header names a tag that cannot match any version.
+    """
+    value = request.headers.get("If-Match", "").strip()
+    if not value or value == "*":
+        return None
+    tag = value.removeprefix("W/").strip('"')
+    if not tag.isdigit():
+        raise VersionConflictError(f"If-Match {value!r} does not match the employee version.")
+    return int(tag)
+
+
+def _etag(employee) -> dict[str, str]:
+    """
+    Build the ETag header for an employee response.
+
+    Args:
+        employee (Employee | EmployeeResponse): The employee returned.
+
+    Returns:
+        dict: Headers to attach to the response.
+    """
+    return {"ETag": f'"{employee.version}"'}
+
+
 @employee_bp.route("/", methods=["POST"])
 @spec.validate(
     body=Request(EmployeeCreate),
@@ -39,7 +104,7 @@ def create_employee():
     """
     data = request.context.body.dict()  # type: ignore[attr-defined]
     employee = employee_service.create_employee(data)
-    return EmployeeResponse.from_orm(employee).model_dump(mode="json"), 201
+    return _employee_json(employee), 201, _etag(employee)
 
 
 @employee_bp.route("/", methods=["GET"])
@@ -60,13 +125,124 @@ def get_all_employees():
     """
     filters = request.context.query.dict()  # type: ignore[attr-defined]
     employees, total = employee_service.list_employees(filters)
-    response = EmployeesListResponse(
-        total=total,
-        employees=[EmployeeResponse.from_orm(e) for e in employees],
+    with span("serialize"):
+        response = EmployeesListResponse(
+            total=total,
+            employees=[EmployeeResponse.from_orm(e) for e in employees],
+        )
+        return response.model_dump(mode="json"), 200
+
+
+@employee_bp.route("/cache/stats", methods=["GET"])
+@spec.validate(resp=Response(HTTP_200=CacheStatsResponse), tags=["Employees"])
+def get_cache_stats():
+    """
+    Report hit ratio and size of the list query result cache and the statement caches.
+
+    Returns:
+        Tuple (dict, int): JSON response with cache statistics and HTTP 200 status.
+    """
+    return CacheStatsResponse(**employee_service.cache_stats()).model_dump(mode="json"), 200
+
+
+@employee_bp.route("/trends", methods=["GET"])
+@spec.validate(
+    query=TrendQueryParams,
+    resp=Response(HTTP_200=TrendsResponse),
+    tags=["Employees"],
+)
+def get_employee_trends():
+    """
+    Headcount and payroll over time, from the daily snapshots (never the live table).
+
+    Query Parameters:
+        TrendQueryParams: Day range, downsampling interval and optional department.
+
+    Returns:
+        Tuple (dict, int): JSON response with one point per period and HTTP 200 status.
+    """
+    query = request.context.query  # type: ignore[attr-defined]
+    points = snapshot_service.get_trends(query.from_, query.to, query.interval, query.department)
+    return TrendsResponse(interval=query.interval, points=points).model_dump(mode="json"), 200
+
+
+@employee_bp.route("/changes", methods=["GET"])
+@spec.validate(
+    query=EmployeeChangesQueryParams,
+    resp=Response(HTTP_200=EmployeeChangesResponse),
+    tags=["Employees"],
+)
+def get_employee_changes():
+    """
+    Retrieve insert/update/delete events recorded after a resume cursor.
+
+    Query Parameters:
+        EmployeeChangesQueryParams: Resume cursor and page size.
+
+    Returns:
+        Tuple (dict, int): JSON response with ordered changes, the next cursor and HTTP 200 status.
+    """
+    params = request.context.query  # type: ignore[attr-defined]
+    changes, has_more = employee_service.list_changes(params.since, params.limit)
+    response = EmployeeChangesResponse(
+        changes=[EmployeeChangeResponse.from_orm(c) for c in changes],
+        next_since=changes[-1].id if changes else params.since,
+        has_more=has_more,
     )
     return response.model_dump(mode="json"), 200
 
 
+@employee_bp.route("/stream", methods=["GET"])
+@spec.validate(resp=Response("HTTP_200"), tags=["Employees"])
+def stream_employee_changes():
+    """
+    Stream the tenant's insert/update/delete events as server-sent events.
+
+    Event IDs are change log IDs, so reconnecting clients send the `Last-Event-ID` header (or
+    `last_event_id` query parameter) to resume on any worker. Consumers that fall too far
+    behind receive a `dropped` event carrying the resume token. A `reset` event means the
+    requested events are no longer available and the client should resync from
+    `/employees/changes` while it keeps consuming the stream.
+
+    Returns:
+        Response: A text/event-stream response.
+    """
+    last_event_id = request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+    subscription = change_stream.subscribe(
+        last_event_id=int(last_event_id) if last_event_id and last_event_id.isdigit() else None,
+        maxsize=current_app.config["SSE_QUEUE_SIZE"],
+        tenant_id=current_tenant(),
+    )
+    heartbeat = current_app.config["SSE_HEARTBEAT_SECONDS"]
+    poll_seconds = change_stream.poll_seconds
+
+    def generate():
+        idle = 0.0
+        try:
+            while True:
+                event = subscription.get(timeout=poll_seconds)
+                if event is None:
+                    # Pick up the writes of other processes
+                    change_stream.poll(min_interval=poll_seconds)
+                    idle += poll_seconds
+                    if idle >= heartbeat:
+                        idle = 0.0
+                        yield ": keep-alive\n\n"
+                    continue
+                idle = 0.0
+                yield event.to_sse()
+                if event.type == "dropped":
+                    break
+        finally:
+            change_stream.unsubscribe(subscription)
+
+    return FlaskResponse(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @employee_bp.route("/<int:emp_id>", methods=["GET"])
 @spec.validate(resp=Response(HTTP_200=EmployeeResponse), tags=["Employees"])
 def get_employee(emp_id):
@@ -77,10 +253,10 @@ def get_employee(emp_id):
         emp_id (int): Employee ID.
 
     Returns:
-        Tuple (dict, int): JSON response with employee data and HTTP 200 status.
+        Tuple (dict, int, dict): JSON response with employee data, HTTP 200 status and ETag.
     """
     employee = employee_service.get_employee(emp_id)
-    return EmployeeResponse.from_orm(employee).model_dump(mode="json"), 200
+    return _employee_json(employee), 200, _etag(employee)
 
 
 @employee_bp.route("/<int:emp_id>", methods=["PUT"])
@@ -93,24 +269,105 @@ def update_employee(emp_id):
     """
     Update an existing employee by ID.
 
+    The expected version may be sent as an `If-Match` header or a `version` body field;
+    a mismatch, or a header and body field that disagree, returns 409 Conflict.
+
     Args:
         emp_id (int): Employee ID.
     Request Body:
         EmployeeUpdate: Pydantic model with fields to update.
 
     Returns:
-        Tuple (dict, int): JSON response with updated employee data and HTTP 200 status.
+        Tuple (dict, int, dict): JSON response with updated employee data, HTTP 200 status
+        and the new ETag.
+    """
+    data = request.context.body.dict(exclude_unset=True)  # type: ignore[attr-defined]
+    body_version = data.pop("version", None)
+    header_version = _if_match_version()
+    if header_version is not None and body_version is not None and header_version != body_version:
+        raise VersionConflictError(
+            f"If-Match version {header_version} and body version {body_version} disagree."
+        )
+    expected_version = header_version if header_version is not None else body_version
+    updated_employee = employee_service.update_employee(emp_id, data, expected_version)
+    return (
+        _employee_json(updated_employee),
+        200,
+        _etag(updated_employee),
+    )
+
+
+@employee_bp.route("/by-email/<email>", methods=["PUT"])
+@spec.validate(
+    body=Request(EmployeeUpsert),
+    resp=Response(HTTP_200=EmployeeResponse, HTTP_201=EmployeeResponse),
+    tags=["Employees"],
+)
+def upsert_employee(email):
+    """
+    Create the employee with the given email, or update it if it already exists.
+
+    The write is a single native upsert, so a sync client does not need to look the
+    employee up first. Fields left out of the body keep their stored value on update.
+
+    Args:
+        email (str): Email address identifying the employee.
+    Request Body:
+        EmployeeUpsert: Pydantic model with employee details.
+
+    Returns:
+        Tuple (dict, int, dict): JSON response with the employee, HTTP 201 if it was created
+        or 200 if it was updated, and its ETag.
     """
+    email = email_adapter.validate_python(email)
     data = request.context.body.dict(exclude_unset=True)  # type: ignore[attr-defined]
-    updated_employee = employee_service.update_employee(emp_id, data)
-    return EmployeeResponse.from_orm(updated_employee).model_dump(mode="json"), 200
+    employee, created = employee_service.upsert_employee(email, data)
+    return (
+        _employee_json(employee),
+        201 if created else 200,
+        _etag(employee),
+    )
+
+
+@employee_bp.route("/by-email", methods=["PUT"])
+@spec.validate(
+    body=Request(EmployeeUpsertBatch),
+    resp=Response(HTTP_200=EmployeeUpsertBatchResponse),
+    tags=["Employees"],
+)
+def upsert_employees():
+    """
+    Create or update many employees by email in one transaction.
+
+    Request Body:
+        EmployeeUpsertBatch: Up to 1000 rows with distinct emails.
+
+    Returns:
+        Tuple (dict, int): JSON response with the outcome of each row and HTTP 200 status.
+    """
+    body = request.context.body  # type: ignore[attr-defined]
+    rows = [item.model_dump(exclude_unset=True) for item in body.employees]
+    results = [
+        EmployeeUpsertResult(
+            email=employee.email,
+            id=employee.id,
+            version=employee.version,
+            status="created" if created else "updated",
+        )
+        for employee, created in employee_service.upsert_employees(rows)
+    ]
+    created = sum(result.status == "created" for result in results)
+    response = EmployeeUpsertBatchResponse(
+        created=created, updated=len(results) - created, results=results
+    )
+    return response.model_dump(mode="json"), 200
 
 
 @employee_bp.route("/<int:emp_id>", methods=["DELETE"])
 @spec.validate(resp=Response(HTTP_200=DeleteEmployeeResponse), tags=["Employees"])
 def delete_employee(emp_id):
     """
-    Delete an employee by ID.
+    Delete an employee by ID, optionally only if it matches the `If-Match` version.
 
     Args:
         emp_id (int): Employee ID.
@@ -118,7 +375,7 @@ def delete_employee(emp_id):
     Returns:
         Tuple (dict, int): JSON response with deletion message and HTTP 200 status.
     """
-    employee_service.delete_employee(emp_id)
+    employee_service.delete_employee(emp_id, _if_match_version())
     return (
         DeleteEmployeeResponse(
             message=f"Employee with ID {emp_id} deleted successfully."
@@ -0,0 +1,99 @@
+"""
+This module defines the Flask Blueprint and route handlers for background jobs.
+Long-running operations are submitted here, return 202 immediately, and run on the
+`flask jobs-worker` process pool; clients poll the job and download its result.
+All endpoints are documented and validated using FlaskPydanticSpec.
+"""
+
+import os
+
+from flask import Blueprint, request, send_file, url_for
+from flask_pydantic_spec import Request, Response
+
+from app.extensions import spec
+from app.models.job import Job
+from app.schemas.job_schema import JOB_PARAMS, JobCreate, JobResponse
+from app.services.job_service import job_service
+
+jobs_bp = Blueprint("jobs", __name__)
+
+RESULT_MIMETYPES = {".csv": "text/csv", ".jsonl": "application/x-ndjson"}
+
+
+def _job_response(job: Job) -> dict:
+    """
+    Serialize a job, with the download URL of its result once available.
+
+    Args:
+        job (Job): The job.
+
+    Returns:
+        dict: JSON-serializable JobResponse.
+    """
+    response = JobResponse.model_validate(job)
+    if job.status == "succeeded" and job.result_file:
+        response.result_url = url_for("jobs.get_job_result", job_id=job.id)
+    return response.model_dump(mode="json")
+
+
+@jobs_bp.route("/", methods=["POST"])
+@spec.validate(
+    body=Request(JobCreate),
+    resp=Response(HTTP_202=JobResponse),
+    tags=["Jobs"],
+)
+def submit_job():
+    """
+    Submit a long-running operation (export, import or bulk update) as a background job.
+
+    Request Body:
+        JobCreate: The job kind and its parameters (ExportJobParams, ImportJobParams or
+        BulkUpdateJobParams).
+
+    Returns:
+        Tuple (dict, int, dict): The queued job, HTTP 202 status and its Location header.
+    """
+    body = request.context.body  # type: ignore[attr-defined]
+    params = JOB_PARAMS[body.kind].model_validate(body.params)
+    data = params.model_dump(mode="json", exclude_unset=True)
+    rows = data.pop("rows", None)
+    job = job_service.submit(body.kind, data, rows)
+    location = url_for("jobs.get_job", job_id=job.id)
+    return _job_response(job), 202, {"Location": location}
+
+
+@jobs_bp.route("/<int:job_id>", methods=["GET"])
+@spec.validate(resp=Response(HTTP_200=JobResponse), tags=["Jobs"])
+def get_job(job_id):
+    """
+    Retrieve the status and progress of a job.
+
+    Args:
+        job_id (int): Job ID.
+
+    Returns:
+        Tuple (dict, int): JSON response with the job and HTTP 200 status.
+    """
+    return _job_response(job_service.get_job(job_id)), 200
+
+
+@jobs_bp.route("/<int:job_id>/result", methods=["GET"])
+@spec.validate(resp=Response("HTTP_200"), tags=["Jobs"])
+def get_job_result(job_id):
+    """
+    Download the result file of a succeeded job.
+
+    Args:
+        job_id (int): Job ID.
+
+    Returns:
+        Response: The result file as an attachment.
+    """
+    path = job_service.get_result_file(job_id)
+    extension = os.path.splitext(path)[1]
+    return send_file(
+        path,
+        mimetype=RESULT_MIMETYPES.get(extension, "application/octet-stream"),
+        as_attachment=True,
+        download_name=f"job-{job_id}{extension}",
+    )
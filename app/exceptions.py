@@ -1,10 +1,54 @@
 """
 This module defines custom exception classes for the Employee Management System.
-Each exception represents a specific error condition that can occur in the application.
+Each exception represents a specific error condition that can occur in the application and
+carries the HTTP status and machine-readable code it is reported with.
 """
 
+from typing import Any
 
-class EmployeeNotFound(Exception):
+
+class EmployeeManagementError(Exception):
+    """
+    Base class of the application's errors.
+
+    Subclasses set `status_code`, `code` and `default_message`. Error handlers render an
+    instance as {"error": message, "code": code, **payload}; instances raised with the default
+    message and no payload are answered with a body encoded once at startup.
+
+    Args:
+        message (str, optional): Error message; defaults to the class's default_message.
+        **payload: Extra JSON-serializable fields for the response body.
+    """
+
+    status_code = 500
+    code = "internal_error"
+    default_message = "Internal server error."
+
+    def __init__(self, message: str | None = None, **payload: Any):
+        super().__init__(message or self.default_message)
+        self.payload = payload
+
+    @property
+    def is_static(self) -> bool:
+        """Whether the response body is the same for every instance of the class."""
+        return not self.payload and self.args[0] == self.default_message
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Extra response headers."""
+        return {}
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Build the JSON response body.
+
+        Returns:
+            dict: Error message, code and payload fields.
+        """
+        return {"error": self.args[0], "code": self.code, **self.payload}
+
+
+class EmployeeNotFound(EmployeeManagementError):
     """
     Exception raised when an employee is not found in the database.
 
@@ -12,11 +56,12 @@ class EmployeeNotFound(Exception):
         message (str): Optional error message.
     """
 
-    def __init__(self, message: str = "Employee not found."):
-        super().__init__(message)
+    status_code = 404
+    code = "employee_not_found"
+    default_message = "Employee not found."
 
 
-class DuplicateEmailError(Exception):
+class DuplicateEmailError(EmployeeManagementError):
     """
     Exception raised when trying to create an employee with an email that already exists.
 
@@ -24,5 +69,122 @@ class DuplicateEmailError(Exception):
         message (str): Optional error message.
     """
 
-    def __init__(self, message: str = "Employee with this email already exists."):
+    status_code = 409
+    code = "duplicate_email"
+    default_message = "Employee with this email already exists."
+
+
+class VersionConflictError(EmployeeManagementError):
+    """
+    Exception raised when an update targets an outdated version of an employee.
+
+    Args:
+        message (str): Optional error message.
+    """
+
+    status_code = 409
+    code = "version_conflict"
+    default_message = "Employee was modified by another request."
+
+
+class InvalidFilterError(EmployeeManagementError):
+    """
+    Exception raised when a list filter expression cannot be parsed or validated.
+
+    Args:
+        message (str): Optional error message.
+    """
+
+    status_code = 400
+    code = "invalid_filter"
+    default_message = "Invalid filter expression."
+
+
+class AnalyticsUnavailableError(EmployeeManagementError):
+    """
+    Exception raised when analytics are requested but the optional NumPy dependency is missing.
+
+    Args:
+        message (str): Optional error message.
+    """
+
+    status_code = 503
+    code = "analytics_unavailable"
+    default_message = "Analytics require NumPy; install requirements-analytics.txt."
+
+
+class JobNotFound(EmployeeManagementError):
+    """
+    Exception raised when a background job is not found for the current tenant.
+
+    Args:
+        message (str): Optional error message.
+    """
+
+    status_code = 404
+    code = "job_not_found"
+    default_message = "Job not found."
+
+
+class JobNotReadyError(EmployeeManagementError):
+    """
+    Exception raised when the result of a job that has not succeeded is requested.
+
+    Args:
+        message (str): Optional error message.
+    """
+
+    status_code = 409
+    code = "job_not_ready"
+    default_message = "Job has no result yet."
+
+
+class JobLeaseLost(EmployeeManagementError):
+    """
+    Exception raised when a worker writes to a job it no longer runs, e.g. after stalling for
+    longer than the lease and being replaced by another worker.
+
+    Args:
+        message (str): Optional error message.
+    """
+
+    status_code = 409
+    code = "job_lease_lost"
+    default_message = "Job is no longer run by this worker."
+
+
+class RateLimitExceeded(EmployeeManagementError):
+    """
+    Exception raised when a client exceeds its request rate for a route.
+
+    Args:
+        retry_after (int): Seconds until the client may retry.
+        message (str): Optional error message.
+    """
+
+    status_code = 429
+    code = "rate_limited"
+    default_message = "Rate limit exceeded."
+
+    def __init__(self, retry_after: int = 1, message: str | None = None):
         super().__init__(message)
+        self.retry_after = retry_after
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Extra response headers."""
+        return {"Retry-After": str(self.retry_after)}
+
+
+class ServiceOverloadedError(RateLimitExceeded):
+    """
+    Exception raised when an expensive endpoint is at its concurrency limit.
+
+    Args:
+        retry_after (int): Seconds until the client may retry.
+        message (str): Optional error message.
+    """
+
+    status_code = 503
+    code = "overloaded"
+    default_message = "Service is overloaded; retry later."
@@ -1,13 +1,38 @@
 """
 This module initializes and provides shared Flask extensions for the application.
 Extensions are instantiated here and imported throughout the app to avoid circular imports.
+
+The API spec is created on first access (`from app.extensions import spec`), so CLI-only
+processes that never touch the API layer do not import flask-pydantic-spec and Pydantic.
 """
 
-from flask_pydantic_spec import FlaskPydanticSpec
+from typing import Any
+
 from flask_sqlalchemy import SQLAlchemy
 
-# API documentation and validation specification
-spec = FlaskPydanticSpec("flask")
+from app.utils.tenant import TenantSession
+
+# SQLAlchemy database instance, routing tenants with a dedicated bind to their own database
+db = SQLAlchemy(session_options={"class_": TenantSession})
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Lazily create module attributes that are expensive to import.
+
+    Args:
+        name (str): Attribute name.
+
+    Returns:
+        Any: The requested attribute.
+
+    Raises:
+        AttributeError: If the attribute does not exist.
+    """
+    if name == "spec":
+        from app.utils.openapi import CachedFlaskPydanticSpec
 
-# SQLAlchemy database instance
-db = SQLAlchemy()
+        # API documentation and validation specification
+        globals()["spec"] = CachedFlaskPydanticSpec("flask")
+        return globals()["spec"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
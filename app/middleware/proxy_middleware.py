@@ -0,0 +1,26 @@
+"""
+This module provides middleware that restores the client address and scheme of requests that
+reach the application through reverse proxies, from the X-Forwarded-For and
+X-Forwarded-Proto headers the proxies add.
+"""
+
+from werkzeug.middleware.proxy_fix import ProxyFix
+
+
+def setup_proxy_fix(app):
+    """
+    Wrap the WSGI application in ProxyFix if PROXY_FIX_HOPS proxies are configured.
+
+    Only the last PROXY_FIX_HOPS values of each header are trusted, since a client can send
+    the headers itself. With no proxies configured the headers are ignored, and every request
+    keeps the address of the peer connecting to the server.
+
+    Args:
+        app (Flask): The Flask application instance.
+
+    Returns:
+        None
+    """
+    hops = app.config["PROXY_FIX_HOPS"]
+    if hops:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=hops, x_proto=hops)
@@ -0,0 +1,103 @@
+"""
+This module provides admission control middleware for HTTP requests.
+Each client (identified by its API key if known, or else its address) gets a token bucket per
+route, and expensive endpoints admit a bounded number of concurrent requests, so a single
+misbehaving integration cannot starve everyone else.
+"""
+
+import hashlib
+from collections.abc import Collection
+
+from flask import g, request
+
+from app.exceptions import RateLimitExceeded, ServiceOverloadedError
+from app.utils.rate_limiter import concurrency_limiter, rate_limiter
+
+
+def _client_key(header: str, api_keys: Collection[str]) -> str:
+    """
+    Identify the client of the current request.
+
+    Only configured API keys identify a client: any other value is up to the caller, who
+    could send a new one with every request to get a fresh bucket. API keys are hashed so
+    that they are never stored, e.g. in a shared SQLite backend.
+
+    Args:
+        header (str): Name of the API key header.
+        api_keys (Collection[str]): API keys that get buckets of their own.
+
+    Returns:
+        str: Client identity for the rate limit buckets.
+    """
+    api_key = request.headers.get(header)
+    if api_key and api_key in api_keys:
+        return "key:" + hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+    return f"addr:{request.remote_addr}"
+
+
+def setup_rate_limiting(app):
+    """
+    Register handlers that rate limit requests and bound the concurrency of expensive endpoints.
+
+    Args:
+        app (Flask): The Flask application instance.
+
+    Returns:
+        None
+    """
+    rate_limiter.init_app(app)
+    concurrency_limiter.init_app(app)
+
+    @app.before_request
+    def admit_request():
+        """
+        Admit the current request or shed it.
+
+        Raises:
+            RateLimitExceeded: If the client has no tokens left for the route (429).
+            ServiceOverloadedError: If the endpoint is at its concurrency limit (503).
+        """
+        endpoint = request.endpoint or "-"
+        if app.config["RATE_LIMIT_ENABLED"]:
+            allowed, retry_after = rate_limiter.hit(
+                _client_key(
+                    app.config["RATE_LIMIT_KEY_HEADER"], app.config["RATE_LIMIT_API_KEYS"]
+                ),
+                endpoint,
+            )
+            if not allowed:
+                raise RateLimitExceeded(retry_after)
+        slot = concurrency_limiter.acquire(endpoint)
+        if slot is False:
+            raise ServiceOverloadedError()
+        g.admission_slot = slot
+
+    @app.after_request
+    def hold_slot_while_streaming(response):
+        """
+        Keep the slot of a streamed response (e.g. /employees/stream) until the server closes
+        it, rather than releasing it when the view returns.
+
+        Args:
+            response (Response): The response.
+
+        Returns:
+            Response: The same response.
+        """
+        if response.is_streamed:
+            slot = g.pop("admission_slot", None)
+            if slot:
+                response.call_on_close(lambda: concurrency_limiter.release(slot))
+        return response
+
+    @app.teardown_request
+    def release_slot(exc=None):
+        """
+        Release the concurrency slot held by the request, if any.
+
+        Args:
+            exc (Exception, optional): The exception that ended the request, if any.
+        """
+        slot = g.pop("admission_slot", None)
+        if slot:
+            concurrency_limiter.release(slot)
@@ -0,0 +1,54 @@
+"""
+This module provides middleware that resolves the tenant of each HTTP request.
+The tenant is taken from the tenant header, or else from the subdomain of the configured base
+domain, and falls back to the default tenant.
+"""
+
+from flask import g, request
+from werkzeug.exceptions import BadRequest
+
+from app.utils.tenant import TENANT_ID_PATTERN
+
+
+def setup_tenant_resolution(app):
+    """
+    Register a before_request handler that stores the request's tenant on `g.tenant_id`.
+
+    Args:
+        app (Flask): The Flask application instance.
+
+    Returns:
+        None
+    """
+
+    @app.before_request
+    def resolve_tenant():
+        """
+        Resolve and validate the tenant of the current request.
+
+        Raises:
+            BadRequest: If the tenant ID is malformed.
+        """
+        base_domain = app.config.get("TENANT_SUBDOMAIN_BASE")
+        tenant_id = request.headers.get(app.config["TENANT_HEADER"])
+        if not tenant_id and base_domain:
+            host = request.host.rsplit(":", 1)[0].lower()
+            subdomain = host.removesuffix(f".{base_domain}")
+            if subdomain != host and "." not in subdomain:
+                tenant_id = subdomain
+        if not tenant_id:
+            tenant_id = app.config["DEFAULT_TENANT"]
+        tenant_id = tenant_id.lower()
+        if not TENANT_ID_PATTERN.match(tenant_id):
+            raise BadRequest(f"Invalid tenant ID {tenant_id!r}.")
+        g.tenant_id = tenant_id
+
+    @app.teardown_request
+    def clear_tenant(exc=None):
+        """
+        Forget the request's tenant, in case the application context outlives the request.
+
+        Args:
+            exc (Exception, optional): The exception that ended the request, if any.
+        """
+        g.pop("tenant_id", None)
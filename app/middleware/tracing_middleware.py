@@ -0,0 +1,69 @@
+"""
+This module provides middleware tracing HTTP requests.
+When tracing is enabled, each request is traced and its spans exported to the configured
+sinks; in debug mode (or with TRACING_SERVER_TIMING), the response also carries a
+Server-Timing header breaking its duration down by layer.
+"""
+
+from flask import request
+
+from app.utils.tracing import tracer
+
+
+def setup_tracing(app):
+    """
+    Register handlers that start, finish and export a trace for each request.
+
+    Register it before the other middleware so that their time is part of the trace.
+
+    Args:
+        app (Flask): The Flask application instance.
+
+    Returns:
+        None
+    """
+    tracer.init_app(app)
+
+    def server_timing() -> bool:
+        return app.config["TRACING_SERVER_TIMING"] or app.debug
+
+    @app.before_request
+    def start_trace():
+        """
+        Start tracing the request if tracing or the Server-Timing breakdown is on.
+        """
+        if app.config["TRACING_ENABLED"] or server_timing():
+            tracer.start(
+                f"{request.method} {request.path}",
+                {"http.method": request.method, "http.target": request.full_path.rstrip("?")},
+            )
+
+    @app.after_request
+    def finish_trace(response):
+        """
+        Finish the request's trace, export it and add the Server-Timing header.
+
+        Args:
+            response (Response): The Flask response object.
+
+        Returns:
+            Response: The response, with a Server-Timing header in debug mode.
+        """
+        trace = tracer.finish()
+        if trace is None:
+            return response
+        trace.root.attributes["http.status_code"] = response.status_code
+        if app.config["TRACING_ENABLED"]:
+            tracer.export(trace)
+        if server_timing():
+            response.headers["Server-Timing"] = ", ".join(
+                f"{layer};dur={ms:.3f}" for layer, ms in trace.breakdown().items()
+            )
+        return response
+
+    @app.teardown_request
+    def discard_trace(exc):
+        """
+        Drop the trace of a request that failed before its response was built.
+        """
+        tracer.discard()
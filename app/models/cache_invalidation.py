@@ -0,0 +1,40 @@
+"""
+This module defines the CacheInvalidation model for the Employee Management System.
+With the database backend of the invalidation bus, every node appends the cache invalidations
+caused by its writes to this table and polls it for those of the other nodes.
+"""
+
+from datetime import datetime
+
+from app.extensions import db
+
+
+class CacheInvalidation(db.Model):
+    """
+    SQLAlchemy model for the cache_invalidations table.
+
+    Rows are short-lived: nodes read them within a poll interval and prune them after
+    INVALIDATION_RETENTION_SECONDS. The auto-incrementing ID is each node's read cursor.
+
+    Attributes:
+        id (int): Primary key and read cursor.
+        node (str): ID of the publishing node, which skips its own messages.
+        message (dict): The invalidation message.
+        created_at (datetime): Time the message was published.
+    """
+
+    __tablename__ = "cache_invalidations"
+
+    id = db.Column(db.Integer, primary_key=True)
+    node = db.Column(db.String(64), nullable=False)
+    message = db.Column(db.JSON, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the CacheInvalidation instance.
+
+        Returns:
+            str: String representation of the invalidation.
+        """
+        return f"<CacheInvalidation {self.id} from {self.node}>"
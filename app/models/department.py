@@ -0,0 +1,42 @@
+"""
+This module defines the Department model for the Employee Management System.
+Departments are a dimension table referenced by employees through an integer key, so filters
+and reports compare and group compact IDs instead of repeated names.
+"""
+
+from datetime import datetime
+
+from app.extensions import db
+from app.utils.tenant import DEFAULT_TENANT
+
+
+class Department(db.Model):
+    """
+    SQLAlchemy model for the departments table.
+
+    Departments are created on first use by an employee write and are never renamed or
+    removed, which lets every process cache name/ID pairs indefinitely.
+
+    Attributes:
+        id (int): Primary key.
+        tenant_id (str): Tenant the department belongs to.
+        name (str): Department name, unique within the tenant.
+        created_at (datetime): Time the department was first used.
+    """
+
+    __tablename__ = "departments"
+    __table_args__ = (db.UniqueConstraint("tenant_id", "name", name="uq_departments_tenant_name"),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    tenant_id = db.Column(db.String(64), nullable=False, default=DEFAULT_TENANT)
+    name = db.Column(db.String(100), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the Department instance.
+
+        Returns:
+            str: String representation of the department.
+        """
+        return f"<Department {self.name}>"
@@ -6,6 +6,8 @@ The Employee model represents an employee record in the database.
 from datetime import datetime
 
 from app.extensions import db
+from app.models.department import Department
+from app.utils.tenant import DEFAULT_TENANT
 
 
 class Employee(db.Model):
@@ -14,21 +16,57 @@ class Employee(db.Model):
 
     Attributes:
         id (int): Primary key.
+        tenant_id (str): Tenant (company) the employee belongs to.
         name (str): Employee's name.
-        email (str): Employee's unique email address.
+        email (str): Employee's email address, unique within the tenant.
         department (str): Department name.
+        department_id (int | None): Key of the department in the departments table, set by
+            the repository from the name.
         date_joined (datetime): Date the employee joined.
         salary (float): Employee's salary.
+        deleted_at (datetime | None): Time the employee was soft-deleted, if at all.
+        version (int): Row version, incremented by every update and checked by it
+            (optimistic concurrency).
     """
 
     __tablename__ = "employees"
+    # Every query is scoped to one tenant, so the indexes lead with tenant_id
+    __table_args__ = (
+        db.UniqueConstraint("tenant_id", "email", name="uq_employees_tenant_email"),
+        db.Index("ix_employees_tenant_department", "tenant_id", "department"),
+        db.Index("ix_employees_tenant_deleted_at", "tenant_id", "deleted_at"),
+        db.Index("ix_employees_tenant_department_id", "tenant_id", "department_id"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
+    tenant_id = db.Column(db.String(64), nullable=False, default=DEFAULT_TENANT)
     name = db.Column(db.String(120), nullable=False)
-    email = db.Column(db.String(120), unique=True, nullable=False)
+    email = db.Column(db.String(120), nullable=False)
     department = db.Column(db.String(100))
+    department_id = db.Column(db.Integer, db.ForeignKey(Department.id))
     date_joined = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     salary = db.Column(db.Float)
+    deleted_at = db.Column(db.DateTime)
+    version = db.Column(db.Integer, nullable=False)
+
+    __mapper_args__ = {"version_id_col": version}
+
+    def to_dict(self) -> dict:
+        """
+        Return a JSON-serializable dictionary of the employee's columns.
+
+        Returns:
+            dict: Employee fields keyed by column name.
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "email": self.email,
+            "department": self.department,
+            "date_joined": self.date_joined.isoformat() if self.date_joined else None,
+            "salary": self.salary,
+            "version": self.version,
+        }
 
     def __repr__(self) -> str:
         """
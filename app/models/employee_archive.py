@@ -0,0 +1,49 @@
+"""
+This module defines the EmployeeArchive model for the Employee Management System.
+Soft-deleted employees are moved here in batches by the archival job, which keeps the hot
+employees table and its indexes small.
+"""
+
+from datetime import datetime
+
+from app.extensions import db
+from app.utils.tenant import DEFAULT_TENANT
+
+
+class EmployeeArchive(db.Model):
+    """
+    SQLAlchemy model for the employees_archive table.
+
+    Attributes:
+        id (int): Primary key, the employee's original ID.
+        tenant_id (str): Tenant the employee belonged to.
+        name (str): Employee's name.
+        email (str): Employee's email address (not unique once archived).
+        department (str): Department name.
+        date_joined (datetime): Date the employee joined.
+        salary (float): Employee's salary.
+        deleted_at (datetime): Time the employee was soft-deleted.
+        archived_at (datetime): Time the row was moved to the archive.
+    """
+
+    __tablename__ = "employees_archive"
+    __table_args__ = (db.Index("ix_employees_archive_tenant_email", "tenant_id", "email"),)
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    tenant_id = db.Column(db.String(64), nullable=False, default=DEFAULT_TENANT)
+    name = db.Column(db.String(120), nullable=False)
+    email = db.Column(db.String(120), nullable=False)
+    department = db.Column(db.String(100))
+    date_joined = db.Column(db.DateTime, nullable=False)
+    salary = db.Column(db.Float)
+    deleted_at = db.Column(db.DateTime, nullable=False)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the EmployeeArchive instance.
+
+        Returns:
+            str: String representation of the archived employee.
+        """
+        return f"<EmployeeArchive {self.name}>"
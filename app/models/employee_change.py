@@ -0,0 +1,50 @@
+"""
+This module defines the EmployeeChange model for the Employee Management System.
+The EmployeeChange model is an append-only log of insert, update, and delete events
+on employee records, used to serve the incremental change feed.
+"""
+
+from datetime import datetime
+
+from app.extensions import db
+from app.utils.tenant import DEFAULT_TENANT
+
+
+class EmployeeChange(db.Model):
+    """
+    SQLAlchemy model for the employee_changes table.
+
+    Rows are only ever appended, in the same transaction as the employee write they describe.
+    The auto-incrementing ID orders the feed, but it is assigned at insert time while rows
+    become visible at commit, in a different order: a reader may see ID N+1 before N. Readers
+    that must not miss an entry resume from a cursor held below the IDs still missing (see
+    ChangeCursor) and reload from scratch when one is given up on. Entries of the same
+    employee are committed in ID order, as the employee's row lock serializes their writes.
+
+    Attributes:
+        id (int): Primary key and change feed cursor.
+        tenant_id (str): Tenant of the employee that changed.
+        employee_id (int): ID of the employee that changed.
+        operation (str): One of "insert", "update" or "delete".
+        payload (dict | None): Employee state after the change (None for deletes).
+        changed_at (datetime): Time the change was recorded.
+    """
+
+    __tablename__ = "employee_changes"
+    __table_args__ = (db.Index("ix_employee_changes_tenant_id_id", "tenant_id", "id"),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    tenant_id = db.Column(db.String(64), nullable=False, default=DEFAULT_TENANT)
+    employee_id = db.Column(db.Integer, nullable=False, index=True)
+    operation = db.Column(db.String(10), nullable=False)
+    payload = db.Column(db.JSON)
+    changed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the EmployeeChange instance.
+
+        Returns:
+            str: String representation of the change.
+        """
+        return f"<EmployeeChange {self.id} {self.operation} {self.employee_id}>"
@@ -0,0 +1,37 @@
+"""
+This module defines the EmployeeSnapshot model for the Employee Management System.
+Each row holds one day's headcount and payroll of one department of a tenant, written by the
+`flask snapshot-employees` job, so trend queries read a few compact rows per day instead of
+scanning the employees table.
+"""
+
+from datetime import datetime
+
+from app.extensions import db
+from app.utils.tenant import DEFAULT_TENANT
+
+
+class EmployeeSnapshot(db.Model):
+    """
+    SQLAlchemy model for the employee_snapshots table.
+
+    Attributes:
+        id (int): Primary key.
+        tenant_id (str): Tenant of the aggregate.
+        day (date): Day the aggregate describes, at its end (UTC).
+        department_id (int | None): Department key, None for employees without a department.
+        headcount (int): Employees at the end of the day.
+        payroll (float): Sum of their salaries.
+        created_at (datetime): Time the aggregate was computed.
+    """
+
+    __tablename__ = "employee_snapshots"
+    __table_args__ = (db.Index("ix_employee_snapshots_tenant_day", "tenant_id", "day"),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    tenant_id = db.Column(db.String(64), nullable=False, default=DEFAULT_TENANT)
+    day = db.Column(db.Date, nullable=False)
+    department_id = db.Column(db.Integer)
+    headcount = db.Column(db.Integer, nullable=False)
+    payroll = db.Column(db.Float, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
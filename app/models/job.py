@@ -0,0 +1,76 @@
+"""
+This module defines the Job model for the Employee Management System.
+Long-running operations (exports, imports, bulk updates) are recorded as jobs, executed by the
+`flask jobs-worker` process pool instead of a web worker, and polled by the client.
+"""
+
+from datetime import datetime
+
+from app.extensions import db
+from app.utils.tenant import DEFAULT_TENANT
+
+
+class Job(db.Model):
+    """
+    SQLAlchemy model for the jobs table.
+
+    Attributes:
+        id (int): Primary key.
+        tenant_id (str): Tenant that submitted the job; it runs in that tenant's context.
+        kind (str): Operation, e.g. "export", "import" or "bulk_update".
+        params (dict): Validated operation parameters.
+        status (str): "queued", "running", "succeeded" or "failed".
+        processed (int): Rows processed so far.
+        checkpoint (dict | None): Handler state committed with each batch, from which a
+            restarted job resumes instead of starting over.
+        total (int | None): Rows to process, once known.
+        result (dict | None): Summary of a finished job.
+        result_file (str | None): Path of the downloadable result, if the job produces one.
+        error (str | None): Failure reason.
+        attempts (int): Number of times a worker started the job.
+        worker (str | None): Worker running the job.
+        heartbeat_at (datetime | None): Last progress report of the running worker; a job
+            whose worker stops reporting is picked up again by another one.
+        created_at (datetime): Submission time.
+        started_at (datetime | None): Time the job last started.
+        finished_at (datetime | None): Time the job succeeded or failed.
+    """
+
+    __tablename__ = "jobs"
+    __table_args__ = (db.Index("ix_jobs_status_id", "status", "id"),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    tenant_id = db.Column(db.String(64), nullable=False, default=DEFAULT_TENANT)
+    kind = db.Column(db.String(32), nullable=False)
+    params = db.Column(db.JSON, nullable=False, default=dict)
+    status = db.Column(db.String(10), nullable=False, default="queued")
+    processed = db.Column(db.Integer, nullable=False, default=0)
+    checkpoint = db.Column(db.JSON)
+    total = db.Column(db.Integer)
+    result = db.Column(db.JSON)
+    result_file = db.Column(db.String(255))
+    error = db.Column(db.Text)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    worker = db.Column(db.String(64))
+    heartbeat_at = db.Column(db.DateTime)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+
+    @property
+    def progress(self) -> float | None:
+        """Fraction of the rows processed, once the total is known."""
+        if self.status == "succeeded":
+            return 1.0
+        if not self.total:
+            return None
+        return min(1.0, self.processed / self.total)
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the Job instance.
+
+        Returns:
+            str: String representation of the job.
+        """
+        return f"<Job {self.id} {self.kind} {self.status}>"
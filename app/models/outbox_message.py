@@ -0,0 +1,68 @@
+"""
+This module defines the OutboxMessage model for the Employee Management System.
+Notifications for downstream systems (payroll, IT provisioning, ...) are written to the outbox
+in the same transaction as the employee write they describe, and delivered afterwards by the
+outbox dispatcher, so a committed change is never lost and a rolled back one is never sent.
+"""
+
+from datetime import datetime
+
+from app.extensions import db
+from app.utils.tenant import DEFAULT_TENANT
+
+
+class OutboxMessage(db.Model):
+    """
+    SQLAlchemy model for the outbox table.
+
+    Attributes:
+        id (int): Primary key, also the message ID consumers deduplicate on.
+        tenant_id (str): Tenant of the change.
+        topic (str): Message topic, e.g. "employee.update".
+        payload (dict | None): Message body.
+        status (str): "pending", "delivered" or "dead" (gave up after too many attempts).
+        attempts (int): Number of delivery attempts so far.
+        next_attempt_at (datetime): Earliest time of the next attempt; also the lease of a
+            claimed message, after which another dispatcher may retry it.
+        last_error (str | None): Error of the last failed attempt.
+        created_at (datetime): Time the message was written.
+        delivered_at (datetime | None): Time the message was delivered.
+    """
+
+    __tablename__ = "outbox"
+    __table_args__ = (db.Index("ix_outbox_status_next_attempt_at", "status", "next_attempt_at"),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    tenant_id = db.Column(db.String(64), nullable=False, default=DEFAULT_TENANT)
+    topic = db.Column(db.String(64), nullable=False)
+    payload = db.Column(db.JSON)
+    status = db.Column(db.String(10), nullable=False, default="pending")
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    next_attempt_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    last_error = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    delivered_at = db.Column(db.DateTime)
+
+    def to_message(self) -> dict:
+        """
+        Build the message sent to the sinks.
+
+        Returns:
+            dict: Message ID, tenant, topic, payload and creation time.
+        """
+        return {
+            "id": self.id,
+            "tenant_id": self.tenant_id,
+            "topic": self.topic,
+            "payload": self.payload,
+            "created_at": self.created_at.isoformat(),
+        }
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the OutboxMessage instance.
+
+        Returns:
+            str: String representation of the message.
+        """
+        return f"<OutboxMessage {self.id} {self.topic} {self.status}>"
@@ -0,0 +1,314 @@
+"""
+This module provides the DepartmentRepository class for the departments dimension table.
+Every ORM flush of an employee sets its department key from its department name, and bulk
+writes resolve names with `ensure_ids`. The repository keeps an in-process name/ID cache per
+tenant. Departments are append-only, so a cached pair
+never goes stale; departments created by a transaction enter the cache once it commits, so a
+rolled-back ID is never served.
+"""
+
+import threading
+from collections.abc import Iterable
+
+from sqlalchemy import event, inspect, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.extensions import db
+from app.models.department import Department
+from app.models.employee import Employee
+from app.utils.tenant import current_tenant
+
+# Session.info key of the departments inserted by the session's open transaction
+PENDING_KEY = "pending_departments"
+
+
+class DepartmentRepository:
+    """
+    Repository class for Department database operations, with a name/ID cache.
+    """
+
+    def __init__(self):
+        """
+        Initialize the DepartmentRepository with an empty cache.
+        """
+        self._lock = threading.Lock()
+        self._ids: dict[str, dict[str, int]] = {}
+        self._names: dict[str, dict[int, str]] = {}
+
+    def init_app(self, app) -> None:
+        """
+        Reset the cache, set department keys on flush, and promote departments into the cache
+        when the transaction creating them commits.
+
+        Args:
+            app (Flask): The Flask application instance.
+
+        Returns:
+            None
+        """
+        self.clear()
+        if not event.contains(Session, "after_commit", self._promote_pending):
+            event.listen(Session, "before_flush", self._assign_keys)
+            event.listen(Session, "after_commit", self._promote_pending)
+            event.listen(Session, "after_rollback", self._discard_pending)
+
+    def get_id(self, name: str) -> int | None:
+        """
+        Look up the ID of one of the current tenant's departments by name.
+
+        Args:
+            name (str): Department name.
+
+        Returns:
+            int | None: The department ID, or None if no employee ever used the name.
+        """
+        department_id = self._ids.get(current_tenant(), {}).get(name)
+        if department_id is None:
+            department_id = self._load([name]).get(name)
+        return department_id
+
+    def get_name(self, department_id: int) -> str | None:
+        """
+        Look up the name of one of the current tenant's departments by ID.
+
+        Args:
+            department_id (int): Department ID.
+
+        Returns:
+            str | None: The department name, or None if unknown.
+        """
+        name = self._names.get(current_tenant(), {}).get(department_id)
+        if name is None:
+            self.get_all()
+            name = self._names.get(current_tenant(), {}).get(department_id)
+        return name
+
+    def get_all(self) -> list[tuple[int, str]]:
+        """
+        Load all of the current tenant's departments, refreshing the cache.
+
+        Returns:
+            list[tuple[int, str]]: (id, name) pairs ordered by name.
+        """
+        tenant_id = current_tenant()
+        rows = db.session.execute(
+            select(Department.id, Department.name)
+            .where(Department.tenant_id == tenant_id)
+            .order_by(Department.name)
+        ).all()
+        pending = db.session.info.get(PENDING_KEY, {})
+        self._cache(
+            tenant_id,
+            {name: id_ for id_, name in rows if (tenant_id, name) not in pending},
+        )
+        return [(department_id, name) for department_id, name in rows]
+
+    def ensure_ids(self, names: Iterable[str | None]) -> dict[str, int]:
+        """
+        Resolve department names to IDs, creating the missing departments in the caller's
+        transaction.
+
+        Concurrent writers creating the same department do not conflict: the insert skips
+        names that already exist, and the IDs are read back afterwards.
+
+        Args:
+            names (Iterable[str | None]): Department names; empty names are ignored.
+
+        Returns:
+            dict[str, int]: ID of each non-empty name.
+        """
+        tenant_id = current_tenant()
+        cached = self._ids.get(tenant_id, {})
+        wanted = {name for name in names if name}
+        resolved = {name: cached[name] for name in wanted if name in cached}
+        missing = wanted - resolved.keys()
+        if not missing:
+            return resolved
+        # Keep the caller's pending employee changes out of these statements
+        with db.session.no_autoflush:
+            resolved.update(self._load(missing))
+            missing -= resolved.keys()
+            if missing:
+                db.session.execute(
+                    _insert_missing_statement(db.session.connection().dialect.name),
+                    [{"tenant_id": tenant_id, "name": name} for name in sorted(missing)],
+                )
+                created = self._select(tenant_id, missing)
+                pending = db.session.info.setdefault(PENDING_KEY, {})
+                pending.update({(tenant_id, name): id_ for name, id_ in created.items()})
+                resolved.update(created)
+        return resolved
+
+    def backfill(self, batch_size: int = 1000) -> int:
+        """
+        Create departments for the names found on employees and set their department IDs,
+        for rows written before the departments table existed.
+
+        Works on the database the session is bound to, across its tenants, one committed ID
+        range at a time so that locks stay short.
+
+        Args:
+            batch_size (int): Width of each employee ID range.
+
+        Returns:
+            int: Number of employees updated.
+        """
+        names = db.session.execute(
+            select(Employee.tenant_id, Employee.department)
+            .where(Employee.department.is_not(None), Employee.department_id.is_(None))
+            .distinct()
+        ).all()
+        by_tenant: dict[str, set[str]] = {}
+        for tenant_id, name in names:
+            by_tenant.setdefault(tenant_id, set()).add(name)
+        for tenant_id, tenant_names in by_tenant.items():
+            db.session.execute(
+                _insert_missing_statement(db.session.connection().dialect.name),
+                [{"tenant_id": tenant_id, "name": name} for name in sorted(tenant_names)],
+            )
+        db.session.commit()
+
+        department_id = (
+            select(Department.id)
+            .where(
+                Department.tenant_id == Employee.tenant_id,
+                Department.name == Employee.department,
+            )
+            .scalar_subquery()
+        )
+        last_id = db.session.scalar(select(db.func.max(Employee.id))) or 0
+        updated = 0
+        for start in range(0, last_id, batch_size):
+            result = db.session.execute(
+                update(Employee)
+                .where(
+                    Employee.id > start,
+                    Employee.id <= start + batch_size,
+                    Employee.department.is_not(None),
+                    Employee.department_id.is_(None),
+                )
+                .values(department_id=department_id)
+                .execution_options(synchronize_session=False)
+            )
+            db.session.commit()
+            updated += result.rowcount
+        return updated
+
+    def clear(self) -> None:
+        """
+        Empty the cache.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._ids.clear()
+            self._names.clear()
+
+    def _load(self, names: Iterable[str]) -> dict[str, int]:
+        """
+        Read the IDs of existing departments, caching those already committed.
+
+        Args:
+            names (Iterable[str]): Department names.
+
+        Returns:
+            dict[str, int]: ID of each existing name.
+        """
+        tenant_id = current_tenant()
+        found = self._select(tenant_id, names)
+        pending = db.session.info.get(PENDING_KEY, {})
+        self._cache(
+            tenant_id,
+            {name: id_ for name, id_ in found.items() if (tenant_id, name) not in pending},
+        )
+        return found
+
+    def _select(self, tenant_id: str, names: Iterable[str]) -> dict[str, int]:
+        """
+        Read the IDs of departments by name.
+
+        Args:
+            tenant_id (str): Tenant of the departments.
+            names (Iterable[str]): Department names.
+
+        Returns:
+            dict[str, int]: ID of each existing name.
+        """
+        return dict(
+            db.session.execute(
+                select(Department.name, Department.id).where(
+                    Department.tenant_id == tenant_id, Department.name.in_(list(names))
+                )
+            ).all()
+        )
+
+    def _cache(self, tenant_id: str, pairs: dict[str, int]) -> None:
+        """
+        Add name/ID pairs of a tenant to the cache.
+
+        Args:
+            tenant_id (str): Tenant of the departments.
+            pairs (dict[str, int]): IDs by name.
+
+        Returns:
+            None
+        """
+        if not pairs:
+            return
+        with self._lock:
+            self._ids.setdefault(tenant_id, {}).update(pairs)
+            self._names.setdefault(tenant_id, {}).update({v: k for k, v in pairs.items()})
+
+    def _assign_keys(self, session: Session, flush_context, instances) -> None:
+        """
+        Set the department key of every new employee, and of every employee whose department
+        name changed, before the flush writes them.
+        """
+        employees = [
+            obj
+            for obj in (*session.new, *session.dirty)
+            if isinstance(obj, Employee)
+            and (obj in session.new or inspect(obj).attrs.department.history.has_changes())
+        ]
+        if employees:
+            department_ids = self.ensure_ids(employee.department for employee in employees)
+            for employee in employees:
+                employee.department_id = department_ids.get(employee.department)
+
+    def _promote_pending(self, session: Session) -> None:
+        """
+        Cache the departments created by a transaction that just committed.
+        """
+        pending = session.info.pop(PENDING_KEY, None)
+        for (tenant_id, name), department_id in (pending or {}).items():
+            self._cache(tenant_id, {name: department_id})
+
+    def _discard_pending(self, session: Session) -> None:
+        """
+        Forget the departments created by a transaction that rolled back.
+        """
+        session.info.pop(PENDING_KEY, None)
+
+
+def _insert_missing_statement(dialect: str):
+    """
+    Build an insert of departments that skips names already present, for a dialect.
+
+    Args:
+        dialect (str): SQLAlchemy dialect name.
+
+    Returns:
+        Insert: The dialect-specific INSERT ignoring duplicates.
+    """
+    table = Department.__table__
+    if dialect == "mysql":
+        return table.insert().prefix_with("IGNORE")
+    statement = (postgresql_insert if dialect == "postgresql" else sqlite_insert)(table)
+    return statement.on_conflict_do_nothing(index_elements=[table.c.tenant_id, table.c.name])
+
+
+# Instantiate the repository for dependency injection
+department_repository = DepartmentRepository()
@@ -1,61 +1,187 @@
 """
 This module provides the EmployeeRepository class for database operations on Employee records.
 It encapsulates CRUD operations and query logic for the Employee model.
+Deletes are soft: rows get a `deleted_at` timestamp, are hidden from every read, and are later
+moved to the employees_archive table in batches by `archive_deleted`.
+Every query is scoped to the current tenant (see app.utils.tenant).
 """
 
-from sqlalchemy import asc, desc
+import threading
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from operator import itemgetter
+from typing import Any
 
+from sqlalchemy import Select, asc, bindparam, delete, desc, func, insert, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm.exc import StaleDataError
+
+from app.exceptions import VersionConflictError
 from app.extensions import db
 from app.models.employee import Employee
+from app.models.employee_archive import EmployeeArchive
+from app.models.employee_change import EmployeeChange
+from app.repositories.department_repository import DepartmentRepository, department_repository
+from app.repositories.outbox_repository import outbox_repository
+from app.utils.filter_dsl import compile_filter
+from app.utils.invalidation_bus import InvalidationBus, invalidation_bus
+from app.utils.statement_cache import StatementCache, statement_cache
+from app.utils.tenant import current_tenant
+from app.utils.tracing import traced
+
+# Writes of more employees are published without their IDs, keeping messages small
+MAX_PUBLISHED_IDS = 1000
+# Emails per query when reading back bulk inserted employees
+BULK_READ_SIZE = 1000
 
 
+@traced("repository")
 class EmployeeRepository:
     """
     Repository class for Employee model database operations.
     Provides methods for CRUD and query operations on employees.
+
+    Every committed write bumps `generation`, which read-side caches use to detect staleness,
+    and publishes the written employee IDs on the invalidation bus; an invalidation received
+    from another node bumps `generation` too.
     """
 
+    def __init__(
+        self,
+        statements: StatementCache | None = None,
+        departments: DepartmentRepository | None = None,
+        bus: InvalidationBus | None = None,
+    ):
+        """
+        Initialize the EmployeeRepository with a zero write generation.
+
+        Args:
+            statements (StatementCache, optional): Caches the read statements by query shape.
+            departments (DepartmentRepository, optional): Resolves department names to the
+                integer keys stored on employees and used by filters.
+            bus (InvalidationBus, optional): Carries write generation bumps between nodes.
+        """
+        self.generation = 0
+        self._generation_lock = threading.Lock()
+        self.statements = statements if statements is not None else StatementCache()
+        self.departments = departments if departments is not None else DepartmentRepository()
+        self.bus = bus
+        if bus is not None:
+            bus.subscribe("employee", self._apply_invalidation)
+            bus.subscribe("reset", self._apply_invalidation)
+
     def get_all(self, filters: dict | None = None) -> tuple[list[Employee], int]:
         """
         Retrieve employees with optional filters, pagination, and sorting.
 
+        The page and count statements are built once per filter shape and sort, then run with
+        the request's values as bound parameters.
+
         Args:
             filters (dict, optional): Filtering, sorting, and pagination options.
 
         Returns:
             tuple[list[Employee], int]: List of employees and total count.
         """
-        query = Employee.query
-
-        # Apply filters
-        if filters:
-            if filters.get("department"):
-                query = query.filter(Employee.department == filters["department"])
-
-            if filters.get("min_salary") is not None:
-                query = query.filter(Employee.salary >= float(filters["min_salary"]))
+        filters = filters or {}
+        shape = _filter_shape(filters)
+        sort_field = filters.get("sort")
+        if not sort_field or sort_field not in Employee.__table__.columns:
+            sort_field = None
+        descending = sort_field is not None and (filters.get("order") or "asc").lower() == "desc"
 
-            if filters.get("max_salary") is not None:
-                query = query.filter(Employee.salary <= float(filters["max_salary"]))
+        def build_page():
+            statement = _filtered_statement(shape)
+            if sort_field:
+                column = Employee.__table__.columns[sort_field]
+                statement = statement.order_by(desc(column) if descending else asc(column))
+            return statement.limit(bindparam("limit")).offset(bindparam("offset"))
 
-            # Sorting
-            sort_field = filters.get("sort")
-            order = filters.get("order", "asc")
-            if sort_field and hasattr(Employee, sort_field):
-                query = query.order_by(
-                    desc(getattr(Employee, sort_field))
-                    if order.lower() == "desc"
-                    else asc(getattr(Employee, sort_field))
-                )
+        page_statement = self.statements.get(("page", shape, sort_field, descending), build_page)
+        count_statement = self.statements.get(("count", shape), lambda: _count_statement(shape))
 
         # Pagination
-        filters = filters or {}
         page = int(filters.get("page", 1))
         page_size = int(filters.get("page_size", 10))
+        params = {
+            **self._filter_params(filters),
+            "limit": page_size,
+            "offset": (page - 1) * page_size,
+        }
+
+        total = db.session.scalar(count_statement, params)
+        employees = db.session.scalars(page_statement, params).all()
+        return list(employees), total or 0
+
+    def count_by_department(self) -> dict[int | None, int]:
+        """
+        Count the current tenant's live employees per department, grouping by the integer key.
+
+        Returns:
+            dict[int | None, int]: Headcount by department ID (None for no department).
+        """
+        statement = self.statements.get(
+            ("by_department",),
+            lambda: _count_statement(_filter_shape({}))
+            .add_columns(Employee.department_id)
+            .group_by(Employee.department_id),
+        )
+        rows = db.session.execute(statement, {"tenant_id": current_tenant()})
+        return {department_id: count for count, department_id in rows}
+
+    def count(self, filters: dict | None = None) -> int:
+        """
+        Count the employees matching the filters.
+
+        Args:
+            filters (dict, optional): department, min_salary, max_salary and filter options.
+
+        Returns:
+            int: Number of matching employees.
+        """
+        filters = filters or {}
+        shape = _filter_shape(filters)
+        statement = self.statements.get(("count", shape), lambda: _count_statement(shape))
+        return db.session.scalar(statement, self._filter_params(filters)) or 0
+
+    def iter_batches(
+        self, filters: dict | None = None, batch_size: int = 1000, after_id: int = 0
+    ) -> Iterator[list[Employee]]:
+        """
+        Stream the employees matching the filters in ID order, one batch at a time.
 
-        total = query.count()
-        employees = query.offset((page - 1) * page_size).limit(page_size).all()
-        return employees, total or 0
+        Batches are fetched with keyset pagination (`id > last seen id`), so each is an
+        independent short query and the caller may modify and commit a batch before asking
+        for the next one.
+
+        Args:
+            filters (dict, optional): department, min_salary, max_salary and filter options.
+            batch_size (int): Maximum number of employees per batch.
+            after_id (int): Start after this employee ID, e.g. to resume an interrupted pass.
+
+        Yields:
+            list[Employee]: The next batch of employees.
+        """
+        filters = filters or {}
+        shape = _filter_shape(filters)
+        statement = self.statements.get(
+            ("batch", shape),
+            lambda: _filtered_statement(shape)
+            .where(Employee.id > bindparam("last_id"))
+            .order_by(Employee.id)
+            .limit(bindparam("limit")),
+        )
+        params = {**self._filter_params(filters), "limit": batch_size, "last_id": after_id}
+        while True:
+            batch = list(db.session.scalars(statement, params))
+            if not batch:
+                return
+            params["last_id"] = batch[-1].id  # read before the caller's commit expires it
+            yield batch
+            if len(batch) < batch_size:
+                return
 
     def get_by_id(self, emp_id: int) -> Employee | None:
         """
@@ -65,9 +191,14 @@ class EmployeeRepository:
             emp_id (int): Employee ID.
 
         Returns:
-            Employee | None: Employee instance or None if not found.
+            Employee | None: Employee instance or None if not found, soft-deleted, or owned
+            by another tenant.
         """
-        return Employee.query.get(emp_id)
+        statement = self.statements.get(
+            ("by_id",),
+            lambda: _filtered_statement(_filter_shape({})).where(Employee.id == bindparam("id")),
+        )
+        return db.session.scalar(statement, {"tenant_id": current_tenant(), "id": emp_id})
 
     def get_by_email(self, email: str) -> Employee | None:
         """
@@ -77,13 +208,19 @@ class EmployeeRepository:
             email (str): Employee email.
 
         Returns:
-            Employee | None: Employee instance or None if not found.
+            Employee | None: Employee instance or None if not found or soft-deleted.
         """
-        return Employee.query.filter_by(email=email).first()
+        statement = self.statements.get(
+            ("by_email",),
+            lambda: _filtered_statement(_filter_shape({})).where(
+                Employee.email == bindparam("email")
+            ),
+        )
+        return db.session.scalar(statement, {"tenant_id": current_tenant(), "email": email})
 
     def create(self, employee: Employee) -> Employee:
         """
-        Add a new employee to the database.
+        Add a new employee to the database, owned by the current tenant.
 
         Args:
             employee (Employee): Employee instance to add.
@@ -91,36 +228,631 @@ class EmployeeRepository:
         Returns:
             Employee: The created employee instance.
         """
+        employee.tenant_id = current_tenant()
+        self._release_email(employee.email)
         db.session.add(employee)
+        db.session.flush()  # assign the primary key before logging the change
+        self._record_change(employee, "insert")
+        emp_ids = [employee.id]
         db.session.commit()
+        self._bump_generation(emp_ids)
         return employee
 
+    def bulk_create(self, batches: Iterable[list[dict[str, Any]]]) -> int:
+        """
+        Insert employees for the current tenant through the fastest bulk path.
+
+        Each batch is bound with the column types' bind processors and passed straight to the
+        driver's executemany (a multi-row INSERT on MySQL), skipping ORM unit-of-work and
+        per-row statement compilation. The batch's change log entries (and outbox messages,
+        if enabled) are bulk inserted in the same transaction, so the change feed, the live
+        stream and analytics snapshots see seeded employees like any other insert. Every
+        batch is committed on its own. Intended for seeding.
+
+        Args:
+            batches (Iterable[list[dict]]): Batches of employee column dictionaries, all with
+                the same keys.
+
+        Returns:
+            int: Number of employees inserted.
+        """
+        tenant_id = current_tenant()
+        total = 0
+        for rows in batches:
+            if not rows:
+                continue
+            if "department" in rows[0]:
+                department_ids = self.departments.ensure_ids({row["department"] for row in rows})
+                for row in rows:
+                    row["department_id"] = department_ids.get(row["department"])
+            connection = db.session.connection()
+            dialect = connection.dialect
+            names = [name for name in rows[0] if name != "tenant_id"]
+            for name in names:
+                column_type = Employee.__table__.columns[name].type
+                process = column_type.dialect_impl(dialect).bind_processor(dialect)
+                if process is not None:
+                    for row in rows:
+                        row[name] = process(row[name])
+            values = itemgetter(*names)
+            parameters = [(tenant_id, *values(row)) for row in rows]
+            placeholder = "?" if dialect.paramstyle == "qmark" else "%s"
+            sql = (
+                f"INSERT INTO {Employee.__tablename__} (tenant_id, {', '.join(names)}) "
+                f"VALUES ({', '.join([placeholder] * (len(names) + 1))})"
+            )
+            connection.exec_driver_sql(sql, parameters)
+            self._record_bulk_inserts(tenant_id, [row["email"] for row in rows])
+            db.session.commit()
+            total += len(rows)
+        self._bump_generation()
+        return total
+
+    def _record_bulk_inserts(self, tenant_id: str, emails: list[str]) -> None:
+        """
+        Bulk insert the change log entries, and outbox messages if enabled, of employees just
+        inserted by bulk_create, in the current transaction.
+
+        Args:
+            tenant_id (str): Tenant of the employees.
+            emails (list[str]): Emails of the inserted employees, unique within the tenant.
+
+        Returns:
+            None
+        """
+        for start in range(0, len(emails), BULK_READ_SIZE):
+            employees = db.session.scalars(
+                select(Employee)
+                .where(
+                    Employee.tenant_id == tenant_id,
+                    Employee.email.in_(emails[start : start + BULK_READ_SIZE]),
+                )
+                .order_by(Employee.id)
+            ).all()
+            payloads = [employee.to_dict() for employee in employees]
+            db.session.execute(
+                insert(EmployeeChange),
+                [
+                    {
+                        "tenant_id": tenant_id,
+                        "employee_id": payload["id"],
+                        "operation": "insert",
+                        "payload": payload,
+                    }
+                    for payload in payloads
+                ],
+            )
+            outbox_repository.add_many(tenant_id, "employee.insert", payloads)
+
+    def create_many(self, employees: list[Employee]) -> tuple[list[Employee], list[str]]:
+        """
+        Add a batch of new employees for the current tenant in one transaction, skipping
+        emails that are already taken.
+
+        Args:
+            employees (list[Employee]): Employee instances to add.
+
+        Returns:
+            tuple[list[Employee], list[str]]: The created employees and the skipped emails
+            (held by a live employee, or repeated within the batch).
+        """
+        tenant_id = current_tenant()
+        holders = dict(
+            db.session.execute(
+                select(Employee.email, Employee.deleted_at).where(
+                    Employee.tenant_id == tenant_id,
+                    Employee.email.in_([e.email for e in employees]),
+                )
+            ).all()
+        )
+        created, skipped, seen = [], [], set()
+        for employee in employees:
+            email = employee.email
+            if email in seen or (email in holders and holders[email] is None):
+                skipped.append(email)
+                continue
+            seen.add(email)
+            if email in holders:
+                self._release_email(email)
+            employee.tenant_id = tenant_id
+            created.append(employee)
+        db.session.add_all(created)
+        db.session.flush()  # assign the primary keys before logging the changes
+        for employee in created:
+            self._record_change(employee, "insert")
+        emp_ids = [employee.id for employee in created]
+        db.session.commit()
+        self._bump_generation(emp_ids)
+        return created, skipped
+
+    def upsert_many(self, rows: list[dict[str, Any]]) -> list[tuple[Employee, bool]]:
+        """
+        Create or update employees of the current tenant by email, in one transaction.
+
+        Rows are written with the database's native upsert (INSERT ... ON CONFLICT DO UPDATE on
+        SQLite and PostgreSQL, INSERT ... ON DUPLICATE KEY UPDATE on MySQL): one statement per
+        distinct set of provided fields, so no per-row lookup is needed. Fields absent from a
+        row keep their stored value on update. An update increments the row version, so a
+        version of 1 after the statement identifies a created employee.
+
+        Args:
+            rows (list[dict]): Employee fields including "email"; emails must be distinct.
+
+        Returns:
+            list[tuple[Employee, bool]]: Each row's resulting employee, detached from the
+            session, and whether it was created, in input order.
+        """
+        tenant_id = current_tenant()
+        emails = [row["email"] for row in rows]
+        self._release_emails(emails)
+        department_ids = self.departments.ensure_ids(row.get("department") for row in rows)
+        dialect = db.session.connection().dialect.name
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for row in rows:
+            if "department" in row:
+                row = {**row, "department_id": department_ids.get(row["department"])}
+            groups.setdefault(tuple(sorted(row.keys() - {"email"})), []).append(row)
+        for fields, group in groups.items():
+            db.session.execute(
+                _upsert_statement(dialect, fields),
+                [{**row, "tenant_id": tenant_id, "version": 1} for row in group],
+            )
+
+        by_email = {
+            employee.email: employee
+            for employee in db.session.scalars(
+                select(Employee)
+                .where(
+                    Employee.tenant_id == tenant_id,
+                    Employee.email.in_(emails),
+                    Employee.deleted_at.is_(None),
+                )
+                .execution_options(populate_existing=True)
+            )
+        }
+        results = [(by_email[email], by_email[email].version == 1) for email in emails]
+        for employee, created in results:
+            self._record_change(employee, "insert" if created else "update")
+            # Detach with the loaded state so callers can serialize the rows after the commit
+            # without reloading each one
+            db.session.expunge(employee)
+        db.session.commit()
+        self._bump_generation([employee.id for employee, _ in results])
+        return results
+
     def update(self, employee: Employee) -> Employee:
         """
         Commit changes to an existing employee.
 
+        The UPDATE only matches the row version the employee was loaded at, so a concurrent
+        write committed in between is detected instead of silently overwritten.
+
         Args:
             employee (Employee): Employee instance with updated fields.
 
         Returns:
             Employee: The updated employee instance.
+
+        Raises:
+            VersionConflictError: If the employee was modified since it was loaded.
         """
-        db.session.commit()
+        self._release_email(employee.email)
+        self._commit_versioned([employee], "update")
         return employee
 
+    def update_many(self, employees: list[Employee]) -> None:
+        """
+        Commit changes to a batch of existing employees in one transaction.
+
+        Each row's UPDATE is versioned as in `update`; emails must not change.
+
+        Args:
+            employees (list[Employee]): Modified employee instances.
+
+        Returns:
+            None
+
+        Raises:
+            VersionConflictError: If any employee was modified since it was loaded; the whole
+                batch is rolled back.
+        """
+        self._commit_versioned(employees, "update")
+
     def delete(self, employee: Employee) -> None:
         """
-        Delete an employee from the database.
+        Soft-delete an employee, hiding it from all reads until it is archived.
 
         Args:
             employee (Employee): Employee instance to delete.
 
         Returns:
             None
+
+        Raises:
+            VersionConflictError: If the employee was modified since it was loaded.
+        """
+        employee.deleted_at = datetime.utcnow()
+        self._commit_versioned([employee], "delete")
+
+    def archive_deleted(self, deleted_before: datetime, batch_size: int = 1000) -> int:
+        """
+        Move one batch of employees soft-deleted before the cutoff to the archive table.
+
+        The batch is copied and removed in a single transaction. On MySQL the selected rows are
+        locked with SKIP LOCKED so that concurrent archival jobs work on disjoint batches.
+        Unlike every other method this maintenance job spans all tenants of the database the
+        session is bound to.
+
+        Args:
+            deleted_before (datetime): Only archive employees deleted before this time.
+            batch_size (int): Maximum number of employees to move.
+
+        Returns:
+            int: Number of employees archived (0 when nothing is left to archive).
         """
-        db.session.delete(employee)
+        ids = db.session.scalars(
+            select(Employee.id)
+            .where(Employee.deleted_at.is_not(None), Employee.deleted_at < deleted_before)
+            .order_by(Employee.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        ).all()
+        if ids:
+            columns = [
+                "id",
+                "tenant_id",
+                "name",
+                "email",
+                "department",
+                "date_joined",
+                "salary",
+                "deleted_at",
+            ]
+            db.session.execute(
+                insert(EmployeeArchive).from_select(
+                    columns,
+                    select(*(getattr(Employee, c) for c in columns)).where(Employee.id.in_(ids)),
+                )
+            )
+            db.session.execute(delete(Employee).where(Employee.id.in_(ids)))
         db.session.commit()
+        return len(ids)
+
+    def get_changes(
+        self,
+        since: int = 0,
+        limit: int = 100,
+        until: int | None = None,
+        all_tenants: bool = False,
+    ) -> list[EmployeeChange]:
+        """
+        Retrieve the current tenant's change log entries after the given cursor, oldest first.
+
+        IDs follow insertion, not commit order: an entry below `since` may still become
+        visible after a later one (see EmployeeChange).
+
+        Args:
+            since (int): Cursor of the last change already seen (0 for the beginning).
+            limit (int): Maximum number of changes to return.
+            until (int, optional): Highest change ID to return.
+            all_tenants (bool): Return the entries of every tenant sharing the current
+                tenant's database.
+
+        Returns:
+            list[EmployeeChange]: Ordered change log entries.
+        """
+        query = EmployeeChange.query.filter(EmployeeChange.id > since)
+        if not all_tenants:
+            query = query.filter(EmployeeChange.tenant_id == current_tenant())
+        if until is not None:
+            query = query.filter(EmployeeChange.id <= until)
+        return query.order_by(EmployeeChange.id).limit(limit).all()
+
+    def get_change_ids(self, since: int, limit: int) -> list[int]:
+        """
+        Retrieve the IDs of the visible change log entries after a cursor, of every tenant
+        sharing the current tenant's database, so that readers can tell missing IDs apart
+        from other tenants' entries.
+
+        Args:
+            since (int): Lowest ID excluded.
+            limit (int): Maximum number of IDs to return.
+
+        Returns:
+            list[int]: Ascending change IDs.
+        """
+        return list(
+            db.session.scalars(
+                select(EmployeeChange.id)
+                .where(EmployeeChange.id > since)
+                .order_by(EmployeeChange.id)
+                .limit(limit)
+            )
+        )
+
+    def get_recent_change_ids(self, limit: int) -> list[int]:
+        """
+        Retrieve the IDs of the latest visible change log entries of every tenant sharing the
+        current tenant's database.
+
+        Args:
+            limit (int): Maximum number of IDs to return.
+
+        Returns:
+            list[int]: Ascending change IDs.
+        """
+        return sorted(
+            db.session.scalars(
+                select(EmployeeChange.id).order_by(EmployeeChange.id.desc()).limit(limit)
+            )
+        )
+
+    def iter_columns(
+        self, batch_size: int = 10000
+    ) -> Iterator[tuple[int, str | None, float | None, datetime]]:
+        """
+        Stream the analytic columns of the current tenant's employees without building ORM
+        objects.
+
+        Args:
+            batch_size (int): Number of rows fetched from the driver at a time.
+
+        Yields:
+            tuple: (id, department, salary, date_joined) for each employee.
+        """
+        result = db.session.execute(
+            select(Employee.id, Employee.department, Employee.salary, Employee.date_joined)
+            .where(Employee.tenant_id == current_tenant(), Employee.deleted_at.is_(None))
+            .order_by(Employee.id)
+            .execution_options(yield_per=batch_size)
+        )
+        for row in result:
+            yield row.id, row.department, row.salary, row.date_joined
+
+    def _filter_params(self, filters: dict[str, Any]) -> dict[str, Any]:
+        """
+        Collect the bound parameter values of the filtered statement.
+
+        Args:
+            filters (dict): department, min_salary, max_salary and filter options.
+
+        Returns:
+            dict: Parameter values by bind name, including the current tenant and the
+            department's integer key.
+        """
+        params: dict[str, Any] = {"tenant_id": current_tenant()}
+        if filters.get("department"):
+            # A name no employee ever used has no key and matches nothing (IDs start at 1)
+            params["department_id"] = self.departments.get_id(filters["department"]) or 0
+        if filters.get("min_salary") is not None:
+            params["min_salary"] = float(filters["min_salary"])
+        if filters.get("max_salary") is not None:
+            params["max_salary"] = float(filters["max_salary"])
+        return params
+
+    def _bump_generation(self, emp_ids: list[int] | None = None) -> None:
+        """
+        Advance the write generation after a successful commit, and tell the other nodes.
+
+        Args:
+            emp_ids (list[int], optional): IDs of the written employees; None when unknown,
+                e.g. after a bulk insert. Large batches are published without IDs.
+
+        Returns:
+            None
+        """
+        with self._generation_lock:
+            self.generation += 1
+        if self.bus is not None:
+            if emp_ids is not None and len(emp_ids) > MAX_PUBLISHED_IDS:
+                emp_ids = None
+            self.bus.publish("employee", tenant=current_tenant(), ids=emp_ids)
+
+    def _apply_invalidation(self, message: dict[str, Any]) -> None:
+        """
+        Advance the write generation for a write committed by another node, without
+        publishing it again.
+
+        The generation is shared by all tenants, so the message's tenant and IDs are not
+        needed to invalidate the caches keyed on it.
+
+        Args:
+            message (dict): An "employee" or "reset" invalidation message.
+
+        Returns:
+            None
+        """
+        with self._generation_lock:
+            self.generation += 1
+
+    def _release_email(self, email: str) -> None:
+        """
+        Archive a soft-deleted employee still holding an email address, so it can be reused.
+
+        Runs in the caller's transaction.
+
+        Args:
+            email (str): Email address about to be assigned.
+
+        Returns:
+            None
+        """
+        self._release_emails([email])
+
+    def _release_emails(self, emails: list[str]) -> None:
+        """
+        Archive the soft-deleted employees still holding any of the email addresses, with a
+        single lookup.
+
+        Runs in the caller's transaction.
+
+        Args:
+            emails (list[str]): Email addresses about to be assigned.
+
+        Returns:
+            None
+        """
+        with db.session.no_autoflush:
+            holders = Employee.query.filter(
+                Employee.tenant_id == current_tenant(),
+                Employee.email.in_(emails),
+                Employee.deleted_at.is_not(None),
+            ).all()
+        for holder in holders:
+            db.session.add(
+                EmployeeArchive(
+                    id=holder.id,
+                    tenant_id=holder.tenant_id,
+                    name=holder.name,
+                    email=holder.email,
+                    department=holder.department,
+                    date_joined=holder.date_joined,
+                    salary=holder.salary,
+                    deleted_at=holder.deleted_at,
+                )
+            )
+            db.session.delete(holder)
+        if holders:
+            db.session.flush()
+
+    def _commit_versioned(self, employees: list[Employee], operation: str) -> None:
+        """
+        Flush versioned UPDATEs of employees, log the changes and commit.
+
+        Args:
+            employees (list[Employee]): The employees being written.
+            operation (str): "update" or "delete".
+
+        Returns:
+            None
+
+        Raises:
+            VersionConflictError: If a row version no longer matches the loaded one.
+        """
+        emp_ids = [employee.id for employee in employees]
+        try:
+            db.session.flush()  # issue the versioned UPDATEs so the logged payloads are current
+            for employee in employees:
+                self._record_change(employee, operation)
+            db.session.commit()
+        except StaleDataError:
+            db.session.rollback()
+            subject = f"Employee with ID {emp_ids[0]}" if len(emp_ids) == 1 else "An employee"
+            raise VersionConflictError(
+                f"{subject} was modified concurrently; reload and retry."
+            ) from None
+        self._bump_generation(emp_ids)
+
+    def _record_change(self, employee: Employee, operation: str) -> None:
+        """
+        Append a change log entry, and an outbox message if enabled, to the current session.
+
+        Both are committed together with the employee write they describe.
+
+        Args:
+            employee (Employee): The employee being written.
+            operation (str): One of "insert", "update" or "delete".
+
+        Returns:
+            None
+        """
+        db.session.add(
+            EmployeeChange(
+                tenant_id=employee.tenant_id,
+                employee_id=employee.id,
+                operation=operation,
+                payload=employee.to_dict() if operation != "delete" else None,
+            )
+        )
+        outbox_repository.add(
+            employee.tenant_id,
+            f"employee.{operation}",
+            employee.to_dict() if operation != "delete" else {"id": employee.id},
+        )
+
+
+def _filter_shape(filters: dict[str, Any]) -> tuple:
+    """
+    Reduce list filters to the parts that change the SQL of the filtered statement.
+
+    Args:
+        filters (dict): department, min_salary, max_salary and filter options.
+
+    Returns:
+        tuple: Which of department, min_salary and max_salary are set, and the filter
+        expression (its values are part of the compiled condition).
+    """
+    return (
+        bool(filters.get("department")),
+        filters.get("min_salary") is not None,
+        filters.get("max_salary") is not None,
+        filters.get("filter") or None,
+    )
+
+
+def _filtered_statement(shape: tuple) -> Select:
+    """
+    Build the select of live employees of the bound tenant matching a filter shape.
+
+    Args:
+        shape (tuple): Result of _filter_shape.
+
+    Returns:
+        Select: The statement, with tenant_id and filter values as bound parameters.
+    """
+    has_department, has_min_salary, has_max_salary, expression = shape
+    statement = select(Employee).where(
+        Employee.tenant_id == bindparam("tenant_id"), Employee.deleted_at.is_(None)
+    )
+    if has_department:
+        statement = statement.where(Employee.department_id == bindparam("department_id"))
+    if has_min_salary:
+        statement = statement.where(Employee.salary >= bindparam("min_salary"))
+    if has_max_salary:
+        statement = statement.where(Employee.salary <= bindparam("max_salary"))
+    if expression:
+        statement = statement.where(compile_filter(expression))
+    return statement
+
+
+def _count_statement(shape: tuple) -> Select:
+    """
+    Build the count of live employees of the bound tenant matching a filter shape.
+
+    Args:
+        shape (tuple): Result of _filter_shape.
+
+    Returns:
+        Select: The counting statement.
+    """
+    return _filtered_statement(shape).with_only_columns(func.count(), maintain_column_froms=True)
+
+
+def _upsert_statement(dialect: str, fields: tuple[str, ...]):
+    """
+    Build the native upsert of employees keyed by (tenant_id, email) for a dialect.
+
+    Args:
+        dialect (str): SQLAlchemy dialect name.
+        fields (tuple[str, ...]): Columns provided besides email, updated on conflict.
+
+    Returns:
+        Insert: The dialect-specific INSERT with its conflict clause.
+    """
+    table = Employee.__table__
+    if dialect == "mysql":
+        statement = mysql_insert(table)
+        values = {field: statement.inserted[field] for field in fields}
+        return statement.on_duplicate_key_update({**values, "version": table.c.version + 1})
+    statement = (postgresql_insert if dialect == "postgresql" else sqlite_insert)(table)
+    values = {field: statement.excluded[field] for field in fields}
+    return statement.on_conflict_do_update(
+        index_elements=[table.c.tenant_id, table.c.email],
+        set_={**values, "version": table.c.version + 1},
+    )
 
 
 # Instantiate the repository for dependency injection
-employee_repository = EmployeeRepository()
+employee_repository = EmployeeRepository(
+    statements=statement_cache, departments=department_repository, bus=invalidation_bus
+)
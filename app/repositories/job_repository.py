@@ -0,0 +1,267 @@
+"""
+This module provides the JobRepository class for database operations on background jobs.
+Reads are scoped to the current tenant; claiming, like the other maintenance operations,
+spans all tenants of the database the session is bound to.
+Writes to a running job are fenced by its attempt number, so a worker that lost its lease
+(stalled past it, and the job was claimed again) cannot overwrite its successor's progress.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, or_, select, update
+
+from app.exceptions import JobLeaseLost
+from app.extensions import db
+from app.models.job import Job
+from app.utils.tenant import current_tenant
+
+
+class JobRepository:
+    """
+    Repository class for Job model database operations.
+    """
+
+    def create(self, kind: str, params: dict[str, Any]) -> Job:
+        """
+        Queue a job for the current tenant.
+
+        Args:
+            kind (str): Operation to run.
+            params (dict): Operation parameters.
+
+        Returns:
+            Job: The queued job.
+        """
+        job = Job(tenant_id=current_tenant(), kind=kind, params=params)
+        db.session.add(job)
+        db.session.commit()
+        return job
+
+    def get_by_id(self, job_id: int) -> Job | None:
+        """
+        Retrieve a job by ID.
+
+        Args:
+            job_id (int): Job ID.
+
+        Returns:
+            Job | None: The job, or None if not found or owned by another tenant.
+        """
+        job = db.session.get(Job, job_id)
+        return job if job is not None and job.tenant_id == current_tenant() else None
+
+    def claim(self, worker: str, lease_seconds: float, max_attempts: int) -> Job | None:
+        """
+        Claim the oldest queued job, or a running one whose worker stopped reporting, and
+        commit.
+
+        On databases with row locks, SKIP LOCKED lets concurrent workers claim different jobs.
+        Abandoned jobs that already used up their attempts are marked failed instead. A
+        reclaimed job keeps its checkpoint, so its handler resumes where the previous attempt
+        left off.
+
+        Args:
+            worker (str): Name of the claiming worker.
+            lease_seconds (float): Seconds without a heartbeat after which a running job is
+                considered abandoned.
+            max_attempts (int): Maximum number of times a job is started.
+
+        Returns:
+            Job | None: The claimed job, now running, or None if there is nothing to do.
+        """
+        now = datetime.utcnow()
+        while True:
+            job = db.session.scalars(
+                select(Job)
+                .where(
+                    or_(
+                        Job.status == "queued",
+                        (Job.status == "running")
+                        & (Job.heartbeat_at < now - timedelta(seconds=lease_seconds)),
+                    )
+                )
+                .order_by(Job.id)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            ).first()
+            if job is None:
+                db.session.commit()
+                return None
+            if job.attempts >= max_attempts:
+                self.fail(job, f"Worker {job.worker} stopped responding.")
+                continue
+            job.status = "running"
+            job.worker = worker
+            job.attempts += 1
+            job.processed = 0
+            job.started_at = job.heartbeat_at = now
+            db.session.commit()
+            return job
+
+    def report_progress(
+        self, job: Job, attempt: int, processed: int, total: int | None = None
+    ) -> None:
+        """
+        Record a running job's progress and heartbeat, and commit.
+
+        Args:
+            job (Job): The running job.
+            attempt (int): The reporting worker's attempt number.
+            processed (int): Rows processed so far.
+            total (int, optional): Rows to process, if known.
+
+        Returns:
+            None
+
+        Raises:
+            JobLeaseLost: If the attempt no longer runs the job.
+        """
+        values = {"processed": processed, "heartbeat_at": datetime.utcnow()}
+        if total is not None:
+            values["total"] = total
+        self._update_running(job, attempt, values)
+        db.session.commit()
+
+    def save_checkpoint(
+        self, job: Job, attempt: int, processed: int, checkpoint: dict[str, Any]
+    ) -> None:
+        """
+        Add a running job's progress, heartbeat and checkpoint to the current transaction,
+        without committing: the caller commits them together with the batch they describe.
+
+        Must run before the batch's changes are made, as the UPDATE flushes the session.
+
+        Args:
+            job (Job): The running job.
+            attempt (int): The reporting worker's attempt number.
+            processed (int): Rows processed once the transaction commits.
+            checkpoint (dict): Handler state to resume from once the transaction commits.
+
+        Returns:
+            None
+
+        Raises:
+            JobLeaseLost: If the attempt no longer runs the job; the transaction is rolled back.
+        """
+        values = {
+            "processed": processed,
+            "checkpoint": checkpoint,
+            "heartbeat_at": datetime.utcnow(),
+        }
+        self._update_running(job, attempt, values)
+
+    def finish(
+        self, job: Job, attempt: int, result: dict[str, Any], result_file: str | None
+    ) -> None:
+        """
+        Mark a job succeeded and commit.
+
+        Args:
+            job (Job): The running job.
+            attempt (int): The finishing worker's attempt number.
+            result (dict): Summary of the job.
+            result_file (str | None): Path of the downloadable result, if any.
+
+        Returns:
+            None
+
+        Raises:
+            JobLeaseLost: If the attempt no longer runs the job.
+        """
+        values = {
+            "status": "succeeded",
+            "result": result,
+            "result_file": result_file,
+            "finished_at": datetime.utcnow(),
+        }
+        self._update_running(job, attempt, values)
+        db.session.commit()
+
+    def fail(self, job: Job, error: str, attempt: int | None = None) -> None:
+        """
+        Mark a job failed and commit.
+
+        Args:
+            job (Job): The job.
+            error (str): Failure reason.
+            attempt (int, optional): The failing worker's attempt number; if given, a job
+                claimed again since then is left alone.
+
+        Returns:
+            None
+
+        Raises:
+            JobLeaseLost: If the attempt no longer runs the job.
+        """
+        values = {"status": "failed", "error": error[:2000], "finished_at": datetime.utcnow()}
+        if attempt is None:
+            for key, value in values.items():
+                setattr(job, key, value)
+        else:
+            self._update_running(job, attempt, values)
+        db.session.commit()
+
+    def prune(self, cutoff: datetime) -> list[str]:
+        """
+        Delete the jobs that finished before a cutoff, of every tenant, and commit.
+
+        Args:
+            cutoff (datetime): Jobs that succeeded or failed before this time are deleted.
+
+        Returns:
+            list[str]: Paths of the deleted jobs' input and result files, for the caller to
+            remove.
+        """
+        jobs = db.session.scalars(
+            select(Job).where(Job.status.in_(("succeeded", "failed")), Job.finished_at < cutoff)
+        ).all()
+        if not jobs:
+            return []
+        files = [path for job in jobs for path in _job_files(job)]
+        db.session.execute(delete(Job).where(Job.id.in_([job.id for job in jobs])))
+        db.session.commit()
+        return files
+
+    def _update_running(self, job: Job, attempt: int, values: dict[str, Any]) -> None:
+        """
+        Update a job in the current transaction, provided the attempt still runs it.
+
+        Args:
+            job (Job): The running job.
+            attempt (int): The writing worker's attempt number.
+            values (dict): Column values to set.
+
+        Returns:
+            None
+
+        Raises:
+            JobLeaseLost: If the job finished or was claimed again; the transaction is rolled
+                back.
+        """
+        job_id = job.id
+        result = db.session.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.attempts == attempt, Job.status == "running")
+            .values(**values)
+        )
+        if result.rowcount != 1:
+            db.session.rollback()
+            raise JobLeaseLost(f"Job {job_id} is no longer run by attempt {attempt}.")
+
+
+def _job_files(job: Job) -> list[str]:
+    """
+    List the files a job owns in the storage directory.
+
+    Args:
+        job (Job): The job.
+
+    Returns:
+        list[str]: Paths of its uploaded input and its result, if any.
+    """
+    return [path for path in (job.params.get("input_file"), job.result_file) if path]
+
+
+# Instantiate the repository for dependency injection
+job_repository = JobRepository()
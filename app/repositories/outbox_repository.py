@@ -0,0 +1,164 @@
+"""
+This module provides the OutboxRepository class for database operations on outbox messages.
+Messages are added to the caller's session, so they commit or roll back with the write they
+describe, and are claimed by dispatchers in short transactions using SKIP LOCKED.
+Like the archival job, claiming spans all tenants of the database the session is bound to.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, insert, select, update
+
+from app.extensions import db
+from app.models.outbox_message import OutboxMessage
+
+
+class OutboxRepository:
+    """
+    Repository class for OutboxMessage database operations.
+
+    Args:
+        enabled (bool): Whether writes add messages; when disabled `add` is a no-op.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+
+    def init_app(self, app) -> None:
+        """
+        Enable or disable the outbox from the application config.
+
+        Args:
+            app (Flask): The Flask application instance.
+
+        Returns:
+            None
+        """
+        self.enabled = app.config.get("OUTBOX_ENABLED", self.enabled)
+
+    def add(self, tenant_id: str, topic: str, payload: dict[str, Any] | None) -> None:
+        """
+        Add a message to the current session, without committing.
+
+        Args:
+            tenant_id (str): Tenant of the change.
+            topic (str): Message topic, e.g. "employee.insert".
+            payload (dict | None): Message body.
+
+        Returns:
+            None
+        """
+        if self.enabled:
+            db.session.add(OutboxMessage(tenant_id=tenant_id, topic=topic, payload=payload))
+
+    def add_many(self, tenant_id: str, topic: str, payloads: list[dict[str, Any]]) -> None:
+        """
+        Bulk insert messages of one topic in the current transaction, without committing.
+
+        Args:
+            tenant_id (str): Tenant of the changes.
+            topic (str): Message topic, e.g. "employee.insert".
+            payloads (list[dict]): Message bodies.
+
+        Returns:
+            None
+        """
+        if self.enabled and payloads:
+            db.session.execute(
+                insert(OutboxMessage),
+                [{"tenant_id": tenant_id, "topic": topic, "payload": p} for p in payloads],
+            )
+
+    def claim(self, batch_size: int, lease_seconds: float) -> list[dict[str, Any]]:
+        """
+        Claim a batch of due messages, oldest first, and commit.
+
+        Claimed messages are leased: their next attempt is pushed back by `lease_seconds`, so
+        if the dispatcher dies before reporting the outcome another one retries them. On
+        databases with row locks, SKIP LOCKED lets concurrent dispatchers claim disjoint
+        batches.
+
+        Args:
+            batch_size (int): Maximum number of messages to claim.
+            lease_seconds (float): Seconds before an unacknowledged message is due again.
+
+        Returns:
+            list[dict]: Claimed messages, as built by OutboxMessage.to_message, each with
+            its attempt number under "attempt".
+        """
+        now = datetime.utcnow()
+        messages = db.session.scalars(
+            select(OutboxMessage)
+            .where(OutboxMessage.status == "pending", OutboxMessage.next_attempt_at <= now)
+            .order_by(OutboxMessage.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        ).all()
+        claimed = []
+        for message in messages:
+            message.attempts += 1
+            message.next_attempt_at = now + timedelta(seconds=lease_seconds)
+            claimed.append({**message.to_message(), "attempt": message.attempts})
+        db.session.commit()
+        return claimed
+
+    def mark_delivered(self, ids: list[int]) -> None:
+        """
+        Mark messages as delivered and commit.
+
+        Args:
+            ids (list[int]): IDs of the delivered messages.
+
+        Returns:
+            None
+        """
+        db.session.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(ids))
+            .values(status="delivered", delivered_at=datetime.utcnow(), last_error=None)
+        )
+        db.session.commit()
+
+    def mark_failed(self, ids: list[int], error: str, retry_at: datetime | None) -> None:
+        """
+        Record a failed delivery attempt and commit.
+
+        Args:
+            ids (list[int]): IDs of the messages that could not be delivered.
+            error (str): Description of the failure.
+            retry_at (datetime | None): Time of the next attempt, or None to give up.
+
+        Returns:
+            None
+        """
+        values = {"last_error": error[:2000]}
+        if retry_at is None:
+            values["status"] = "dead"
+        else:
+            values["next_attempt_at"] = retry_at
+        db.session.execute(update(OutboxMessage).where(OutboxMessage.id.in_(ids)).values(values))
+        db.session.commit()
+
+    def prune(self, delivered_before: datetime) -> int:
+        """
+        Delete messages delivered before the cutoff and commit.
+
+        Args:
+            delivered_before (datetime): Only delete messages delivered before this time.
+
+        Returns:
+            int: Number of deleted messages.
+        """
+        result = db.session.execute(
+            delete(OutboxMessage).where(
+                OutboxMessage.status == "delivered",
+                OutboxMessage.delivered_at < delivered_before,
+            )
+        )
+        db.session.commit()
+        return result.rowcount
+
+
+# Instantiate the repository for dependency injection
+outbox_repository = OutboxRepository()
@@ -0,0 +1,157 @@
+"""
+This module provides the SnapshotRepository class for daily headcount and payroll aggregates.
+Aggregates are rebuilt from the employee history (join and deletion dates, including archived
+employees) and read back as per-day totals for trend queries.
+"""
+
+from collections.abc import Iterator
+from datetime import date, datetime
+
+from sqlalchemy import delete, func, insert, or_, select
+
+from app.extensions import db
+from app.models.department import Department
+from app.models.employee import Employee
+from app.models.employee_archive import EmployeeArchive
+from app.models.employee_snapshot import EmployeeSnapshot
+from app.utils.tenant import current_tenant
+
+
+class SnapshotRepository:
+    """
+    Repository class for EmployeeSnapshot database operations.
+    """
+
+    def latest_day(self) -> date | None:
+        """
+        Retrieve the most recent day with aggregates for the current tenant.
+
+        Returns:
+            date | None: The latest snapshot day, or None if none was taken.
+        """
+        return db.session.scalar(
+            select(func.max(EmployeeSnapshot.day)).where(
+                EmployeeSnapshot.tenant_id == current_tenant()
+            )
+        )
+
+    def first_join_day(self) -> date | None:
+        """
+        Retrieve the day the current tenant's earliest employee joined, archived ones included.
+
+        Returns:
+            date | None: The first join day, or None if the tenant has no employees.
+        """
+        tenant_id = current_tenant()
+        first = [
+            db.session.scalar(
+                select(func.min(model.date_joined)).where(model.tenant_id == tenant_id)
+            )
+            for model in (Employee, EmployeeArchive)
+        ]
+        first = [value for value in first if value is not None]
+        return min(first).date() if first else None
+
+    def iter_history(
+        self, employed_at: datetime, batch_size: int = 10000
+    ) -> Iterator[tuple[int | None, float | None, datetime, datetime | None]]:
+        """
+        Stream the current tenant's employees, soft-deleted and archived ones included, that
+        were still employed at a point in time or joined later.
+
+        Rows are streamed from server-side cursors, on which the connection cannot run other
+        queries, so the department IDs of archived employees are joined in the query rather
+        than looked up per row.
+
+        Args:
+            employed_at (datetime): Skip employees deleted before this time.
+            batch_size (int): Number of rows fetched from the driver at a time.
+
+        Yields:
+            tuple: (department_id, salary, date_joined, deleted_at) of each employee.
+        """
+        tenant_id = current_tenant()
+        yield from db.session.execute(
+            select(
+                Employee.department_id, Employee.salary, Employee.date_joined, Employee.deleted_at
+            )
+            .where(
+                Employee.tenant_id == tenant_id,
+                or_(Employee.deleted_at.is_(None), Employee.deleted_at >= employed_at),
+            )
+            .execution_options(yield_per=batch_size)
+        )
+        yield from db.session.execute(
+            select(
+                Department.id,
+                EmployeeArchive.salary,
+                EmployeeArchive.date_joined,
+                EmployeeArchive.deleted_at,
+            )
+            .outerjoin(
+                Department,
+                (Department.tenant_id == tenant_id)
+                & (Department.name == EmployeeArchive.department),
+            )
+            .where(
+                EmployeeArchive.tenant_id == tenant_id, EmployeeArchive.deleted_at >= employed_at
+            )
+            .execution_options(yield_per=batch_size)
+        )
+
+    def replace_from(self, start: date, rows: list[dict]) -> None:
+        """
+        Replace the current tenant's aggregates from a day on, and commit.
+
+        Args:
+            start (date): First day to replace.
+            rows (list[dict]): day, department_id, headcount and payroll of each aggregate.
+
+        Returns:
+            None
+        """
+        tenant_id = current_tenant()
+        db.session.execute(
+            delete(EmployeeSnapshot).where(
+                EmployeeSnapshot.tenant_id == tenant_id, EmployeeSnapshot.day >= start
+            )
+        )
+        if rows:
+            db.session.execute(
+                insert(EmployeeSnapshot), [{**row, "tenant_id": tenant_id} for row in rows]
+            )
+        db.session.commit()
+
+    def get_series(
+        self, start: date, end: date, department_id: int | None = None
+    ) -> list[tuple[date, int, float]]:
+        """
+        Retrieve the current tenant's daily totals, optionally for one department.
+
+        Args:
+            start (date): First day.
+            end (date): Last day.
+            department_id (int, optional): Only this department.
+
+        Returns:
+            list[tuple[date, int, float]]: (day, headcount, payroll) ordered by day.
+        """
+        statement = select(
+            EmployeeSnapshot.day,
+            func.sum(EmployeeSnapshot.headcount),
+            func.sum(EmployeeSnapshot.payroll),
+        ).where(
+            EmployeeSnapshot.tenant_id == current_tenant(),
+            EmployeeSnapshot.day >= start,
+            EmployeeSnapshot.day <= end,
+        )
+        if department_id is not None:
+            statement = statement.where(EmployeeSnapshot.department_id == department_id)
+        rows = db.session.execute(
+            statement.group_by(EmployeeSnapshot.day).order_by(EmployeeSnapshot.day)
+        )
+        return [(day, int(headcount), float(payroll)) for day, headcount, payroll in rows]
+
+
+# Instantiate the repository for dependency injection
+snapshot_repository = SnapshotRepository()
@@ -1,32 +1,16 @@
 """
 This module serves as the entry point for running the Flask application.
-It also provides a CLI command to initialize the database.
+CLI commands such as `init-db` are registered by the application factory (see app/cli.py).
 """
 
 import os
 
-from app import create_app, db
+from app import create_app
 
 # Create the Flask application instance
 app = create_app()
 
 
-@app.cli.command("init-db")
-def init_db_command():
-    """
-    CLI command to initialize the database tables.
-
-    Usage:
-        flask init-db
-
-    Returns:
-        None
-    """
-    with app.app_context():
-        db.create_all()
-    print("Initialized the database.")
-
-
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
     # Use 0.0.0.0 to be accessible from outside the container
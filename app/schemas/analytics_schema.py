@@ -0,0 +1,197 @@
+"""
+This module defines Pydantic schemas for the salary analytics endpoints.
+Schemas are used for query parameter validation and response serialization.
+"""
+
+from datetime import date
+from typing import ClassVar, Literal
+
+from pydantic import BaseModel, Field, field_validator
+
+
+def _split_csv(value):
+    """
+    Accept comma-separated numbers in a single query parameter.
+
+    Args:
+        value: Raw parameter value.
+
+    Returns:
+        The value split into a list if it was a string, otherwise unchanged.
+    """
+    if isinstance(value, str):
+        return [part for part in value.split(",") if part.strip()]
+    return value
+
+
+# ---------------------------------------------------------------------------
+# Query Parameter Schemas
+# ---------------------------------------------------------------------------
+class AnalyticsFilterParams(BaseModel):
+    """
+    Row filters shared by all analytics endpoints.
+
+    Attributes:
+        department (str | None): Only employees of this department.
+        min_salary (float | None): Minimum salary (inclusive).
+        max_salary (float | None): Maximum salary (inclusive).
+        joined_from (date | None): Joined on or after this date.
+        joined_to (date | None): Joined on or before this date.
+    """
+
+    # Validated once per distinct query string (see FastFlaskBackend)
+    cache_by_query_string: ClassVar[bool] = True
+
+    department: str | None = Field(None, description="Filter by department")
+    min_salary: float | None = Field(None, ge=0, description="Minimum salary filter")
+    max_salary: float | None = Field(None, ge=0, description="Maximum salary filter")
+    joined_from: date | None = Field(None, description="Joined on or after this date")
+    joined_to: date | None = Field(None, description="Joined on or before this date")
+
+
+class PercentileQueryParams(AnalyticsFilterParams):
+    """
+    Query parameters for the salary percentile endpoint.
+
+    Attributes:
+        p (list[float]): Percentiles to compute, e.g. `p=50,90,99`.
+    """
+
+    p: list[float] = Field([50, 90, 99], description="Comma-separated percentiles (0-100)")
+
+    _split_p = field_validator("p", mode="before")(_split_csv)
+
+    @field_validator("p")
+    @classmethod
+    def check_range(cls, value: list[float]) -> list[float]:
+        """
+        Ensure every percentile is between 0 and 100.
+        """
+        if not value or any(p < 0 or p > 100 for p in value):
+            raise ValueError("percentiles must be between 0 and 100")
+        return value
+
+
+class HistogramQueryParams(AnalyticsFilterParams):
+    """
+    Query parameters for the salary histogram endpoint.
+
+    Attributes:
+        bins (int): Number of equal-width bins.
+        edges (list[float] | None): Explicit band edges, e.g. `edges=0,50000,100000`.
+    """
+
+    bins: int = Field(20, ge=1, le=1000, description="Number of equal-width bins")
+    edges: list[float] | None = Field(None, description="Comma-separated salary band edges")
+
+    _split_edges = field_validator("edges", mode="before")(_split_csv)
+
+    @field_validator("edges")
+    @classmethod
+    def check_sorted(cls, value: list[float] | None) -> list[float] | None:
+        """
+        Ensure band edges are increasing and define at least one band.
+        """
+        if value is not None and (len(value) < 2 or value != sorted(set(value))):
+            raise ValueError("edges must contain at least two increasing values")
+        return value
+
+
+class TopQueryParams(AnalyticsFilterParams):
+    """
+    Query parameters for the top-N salary endpoint.
+
+    Attributes:
+        n (int): Number of employees to return.
+        order (str): "desc" for the highest salaries, "asc" for the lowest.
+    """
+
+    n: int = Field(10, ge=1, le=1000, description="Number of employees to return")
+    order: Literal["asc", "desc"] = Field("desc", description="Salary order")
+
+
+class FilterQueryParams(AnalyticsFilterParams):
+    """
+    Query parameters for the filter/summary endpoint.
+
+    Attributes:
+        limit (int): Maximum number of matching IDs to return.
+    """
+
+    limit: int = Field(100, ge=0, le=10000, description="Maximum number of IDs to return")
+
+
+# ---------------------------------------------------------------------------
+# Response Schemas
+# ---------------------------------------------------------------------------
+class PercentileResponse(BaseModel):
+    """
+    Salary percentiles of the matching employees.
+
+    Attributes:
+        count (int): Number of matching employees with a salary.
+        percentiles (dict[str, float | None]): Salary at each requested percentile.
+    """
+
+    count: int
+    percentiles: dict[str, float | None]
+
+
+class HistogramResponse(BaseModel):
+    """
+    Salary histogram of the matching employees.
+
+    Attributes:
+        edges (list[float]): Bin edges (one more than the number of bins).
+        counts (list[int]): Number of salaries in each bin.
+    """
+
+    edges: list[float]
+    counts: list[int]
+
+
+class TopEmployee(BaseModel):
+    """
+    A single entry of a top-N salary ranking.
+
+    Attributes:
+        id (int): Employee ID.
+        department (str | None): Department name.
+        salary (float): Salary.
+    """
+
+    id: int
+    department: str | None
+    salary: float
+
+
+class TopResponse(BaseModel):
+    """
+    Top-N salary ranking of the matching employees.
+
+    Attributes:
+        employees (list[TopEmployee]): Employees in salary order.
+    """
+
+    employees: list[TopEmployee]
+
+
+class FilterResponse(BaseModel):
+    """
+    Count and salary aggregates of the matching employees.
+
+    Attributes:
+        count (int): Number of matching employees.
+        salary_sum (float): Sum of their salaries.
+        salary_mean (float | None): Mean salary.
+        salary_min (float | None): Lowest salary.
+        salary_max (float | None): Highest salary.
+        ids (list[int]): Matching employee IDs in ascending order, up to the limit.
+    """
+
+    count: int
+    salary_sum: float
+    salary_mean: float | None
+    salary_min: float | None
+    salary_max: float | None
+    ids: list[int]
@@ -0,0 +1,31 @@
+"""
+This module defines Pydantic schemas for department responses.
+"""
+
+from pydantic import BaseModel, Field
+
+
+class DepartmentResponse(BaseModel):
+    """
+    A department and its headcount.
+
+    Attributes:
+        id (int): Department ID.
+        name (str): Department name.
+        headcount (int): Number of live employees in the department.
+    """
+
+    id: int = Field(..., description="Department ID")
+    name: str = Field(..., description="Department name")
+    headcount: int = Field(..., description="Number of live employees in the department")
+
+
+class DepartmentsResponse(BaseModel):
+    """
+    Departments of the tenant, ordered by name.
+
+    Attributes:
+        departments (list[DepartmentResponse]): Departments with their headcounts.
+    """
+
+    departments: list[DepartmentResponse]
@@ -4,8 +4,69 @@ Schemas are used for request/response validation in API endpoints.
 """
 
 from datetime import datetime
+from functools import lru_cache
+from typing import Annotated, Any, ClassVar, Literal
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import AfterValidator, BaseModel, Field, TypeAdapter, WithJsonSchema, field_validator
+from pydantic.networks import validate_email
+
+from app.exceptions import InvalidFilterError
+from app.utils.filter_dsl import MAX_FILTER_LENGTH, compile_filter
+
+# Maximum number of rows in one batch upsert request
+MAX_UPSERT_BATCH = 1000
+# Distinct valid email addresses remembered by CachedEmailStr
+EMAIL_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=EMAIL_CACHE_SIZE)
+def _validate_email(value: str) -> str:
+    """
+    Validate and normalize an email address, remembering valid ones.
+
+    Args:
+        value (str): Email address.
+
+    Returns:
+        str: The normalized address, as EmailStr returns it.
+
+    Raises:
+        PydanticCustomError: If the address is invalid.
+    """
+    return validate_email(value)[1]
+
+
+# EmailStr with its (comparatively slow) syntax check cached per address. Employee emails are
+# validated on every write and again for every employee of a response, mostly the same ones.
+CachedEmailStr = Annotated[
+    str,
+    AfterValidator(_validate_email),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
+
+# Validates emails taken from URL paths, as CachedEmailStr does for body fields
+email_adapter = TypeAdapter(CachedEmailStr)
+
+
+def validate_filter(value: str | None) -> str | None:
+    """
+    Parse and validate a filter expression (the compiled form is cached for the query).
+
+    Args:
+        value (str | None): Filter expression.
+
+    Returns:
+        str | None: The unchanged expression.
+
+    Raises:
+        ValueError: If the expression is invalid.
+    """
+    if value:
+        try:
+            compile_filter(value)
+        except InvalidFilterError as e:
+            raise ValueError(str(e)) from None
+    return value
 
 
 # ---------------------------------------------------------------------------
@@ -17,13 +78,13 @@ class EmployeeBase(BaseModel):
 
     Attributes:
         name (str): Full name of the employee.
-        email (EmailStr): Employee email address (must be unique).
+        email (CachedEmailStr): Employee email address (must be unique).
         department (str | None): Department name.
         salary (float | None): Monthly salary of the employee.
     """
 
     name: str = Field(..., min_length=1, max_length=120, description="Full name of the employee")
-    email: EmailStr = Field(..., description="Employee email address (must be unique)")
+    email: CachedEmailStr = Field(..., description="Employee email address (must be unique)")
     department: str | None = Field(None, description="Department name")
     salary: float | None = Field(None, ge=0, description="Monthly salary of the employee")
 
@@ -48,9 +109,54 @@ class EmployeeUpdate(BaseModel):
     """
 
     name: str | None = Field(None, min_length=1, max_length=120)
-    email: EmailStr | None = None
+    email: CachedEmailStr | None = None
     department: str | None = None
     salary: float | None = Field(None, ge=0)
+    version: int | None = Field(
+        None, ge=1, description="Version last read; the update fails with 409 if it changed"
+    )
+
+
+class EmployeeUpsert(BaseModel):
+    """
+    Schema for creating or replacing the employee identified by the email in the URL.
+
+    Fields left out of the request keep their stored value when the employee exists.
+    """
+
+    name: str = Field(..., min_length=1, max_length=120, description="Full name of the employee")
+    department: str | None = Field(None, description="Department name")
+    salary: float | None = Field(None, ge=0, description="Monthly salary of the employee")
+
+
+class EmployeeUpsertItem(EmployeeUpsert):
+    """
+    One row of a batch upsert, identified by its email.
+    """
+
+    email: CachedEmailStr = Field(..., description="Employee email address identifying the row")
+
+
+class EmployeeUpsertBatch(BaseModel):
+    """
+    Schema for creating or updating many employees by email in one request.
+
+    Attributes:
+        employees (list[EmployeeUpsertItem]): Rows to write, with distinct emails.
+    """
+
+    employees: list[EmployeeUpsertItem] = Field(..., min_length=1, max_length=MAX_UPSERT_BATCH)
+
+    @field_validator("employees")
+    @classmethod
+    def check_distinct_emails(cls, value: list[EmployeeUpsertItem]) -> list[EmployeeUpsertItem]:
+        """
+        Reject batches naming the same email twice.
+        """
+        emails = {item.email.lower() for item in value}
+        if len(emails) != len(value):
+            raise ValueError("Each email may appear only once in a batch.")
+        return value
 
 
 class EmployeeResponse(EmployeeBase):
@@ -60,10 +166,12 @@ class EmployeeResponse(EmployeeBase):
     Attributes:
         id (int): Unique employee ID.
         date_joined (datetime): Date of joining.
+        version (int): Row version for optimistic concurrency.
     """
 
     id: int = Field(..., description="Unique employee ID")
     date_joined: datetime = Field(..., description="Date of joining")
+    version: int = Field(..., description="Row version, also returned as the ETag")
 
     class Config:
         from_attributes = True  # allows returning ORM objects directly
@@ -82,6 +190,38 @@ class EmployeesListResponse(BaseModel):
     employees: list[EmployeeResponse]
 
 
+class EmployeeUpsertResult(BaseModel):
+    """
+    Outcome of one batch upsert row.
+
+    Attributes:
+        email (str): Email of the row.
+        id (int): Employee ID.
+        version (int): Row version after the write.
+        status (str): "created" or "updated".
+    """
+
+    email: str
+    id: int
+    version: int
+    status: Literal["created", "updated"]
+
+
+class EmployeeUpsertBatchResponse(BaseModel):
+    """
+    Outcome of a batch upsert.
+
+    Attributes:
+        created (int): Number of created employees.
+        updated (int): Number of updated employees.
+        results (list[EmployeeUpsertResult]): Outcome of each row, in request order.
+    """
+
+    created: int
+    updated: int
+    results: list[EmployeeUpsertResult]
+
+
 class DeleteEmployeeResponse(BaseModel):
     """
     Schema for confirmation message after employee deletion.
@@ -105,8 +245,12 @@ class EmployeeQueryParams(BaseModel):
         order (str | None): Sorting order (asc or desc).
         min_salary (float | None): Minimum salary filter.
         max_salary (float | None): Maximum salary filter.
+        filter (str | None): Filter expression, e.g. `department in (A, B) and name ~ "ann"`.
     """
 
+    # Validated once per distinct query string (see FastFlaskBackend)
+    cache_by_query_string: ClassVar[bool] = True
+
     page: int = Field(1, ge=1, description="Page number for pagination")
     page_size: int = Field(10, ge=1, le=100, description="Number of records per page")
     department: str | None = Field(None, description="Filter by department")
@@ -114,3 +258,118 @@ class EmployeeQueryParams(BaseModel):
     order: str | None = Field(None, description="Sorting order (asc or desc)")
     min_salary: float | None = Field(None, ge=0, description="Minimum salary filter")
     max_salary: float | None = Field(None, ge=0, description="Maximum salary filter")
+    filter: str | None = Field(
+        None,
+        max_length=MAX_FILTER_LENGTH,
+        description='Filter expression, e.g. department in (A, B) and name ~ "ann"',
+    )
+
+    @field_validator("filter")
+    @classmethod
+    def check_filter(cls, value: str | None) -> str | None:
+        """
+        Parse and validate the filter expression (the compiled form is cached for the query).
+        """
+        return validate_filter(value)
+
+
+class EmployeeChangesQueryParams(BaseModel):
+    """
+    Query parameters for the employee change feed endpoint.
+
+    Attributes:
+        since (int): Cursor returned as next_since by the previous call (0 to start over).
+        limit (int): Maximum number of changes to return.
+    """
+
+    since: int = Field(0, ge=0, description="Resume cursor from a previous response")
+    limit: int = Field(100, ge=1, le=1000, description="Maximum number of changes to return")
+
+
+class EmployeeChangeResponse(BaseModel):
+    """
+    A single entry of the employee change feed.
+
+    Attributes:
+        id (int): Cursor of this change.
+        employee_id (int): ID of the employee that changed.
+        operation (str): One of "insert", "update" or "delete".
+        payload (dict | None): Employee state after the change (None for deletes).
+        changed_at (datetime): Time the change was recorded.
+    """
+
+    id: int = Field(..., description="Cursor of this change")
+    employee_id: int = Field(..., description="ID of the employee that changed")
+    operation: str = Field(..., description="insert, update or delete")
+    payload: dict[str, Any] | None = Field(None, description="Employee state after the change")
+    changed_at: datetime = Field(..., description="Time the change was recorded")
+
+    class Config:
+        from_attributes = True
+
+
+class EmployeeChangesResponse(BaseModel):
+    """
+    Page of the employee change feed.
+
+    Attributes:
+        changes (list[EmployeeChangeResponse]): Ordered changes after the requested cursor.
+        next_since (int): Cursor to pass as `since` on the next call.
+        has_more (bool): Whether more changes are immediately available.
+    """
+
+    changes: list[EmployeeChangeResponse]
+    next_since: int
+    has_more: bool
+
+
+class StatementCacheStats(BaseModel):
+    """
+    Effectiveness of the repository statement cache and the engine's compiled SQL cache.
+
+    Attributes:
+        hits (int): Queries that reused a prebuilt statement.
+        misses (int): Queries that built their statement.
+        size (int): Statements currently cached.
+        maxsize (int): Maximum number of statements (0 when disabled).
+        compiled_hits (int): Executions that reused compiled SQL.
+        compiled_misses (int): Executions that compiled SQL.
+        compiled_hit_ratio (float): compiled_hits / (compiled_hits + compiled_misses).
+    """
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+    compiled_hits: int
+    compiled_misses: int
+    compiled_hit_ratio: float
+
+
+class CacheStatsResponse(BaseModel):
+    """
+    Effectiveness of the list query result cache.
+
+    Attributes:
+        hits (int): Lookups served from the cache.
+        misses (int): Lookups that ran the query.
+        hit_ratio (float): hits / (hits + misses).
+        evictions (int): Entries evicted to stay within maxsize.
+        stale_served (int): Stale pages served while a refresh ran (stale-while-revalidate).
+        coalesced (int): Reads that shared an identical in-flight read instead of querying.
+        size (int): Entries currently cached.
+        maxsize (int): Maximum number of entries (0 when disabled).
+        generation (int): Current repository write generation.
+        statements (StatementCacheStats): Repository statement and compiled SQL caches.
+    """
+
+    hits: int
+    misses: int
+    hit_ratio: float
+    evictions: int
+    stale_served: int
+    coalesced: int
+    size: int
+    maxsize: int
+    generation: int
+    statements: StatementCacheStats
@@ -0,0 +1,150 @@
+"""
+This module defines Pydantic schemas for background job submission and status.
+Each job kind has its own parameter schema, selected by the submitted `kind`.
+"""
+
+from datetime import datetime
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from app.schemas.employee_schema import EmployeeCreate, validate_filter
+from app.utils.filter_dsl import MAX_FILTER_LENGTH
+
+
+class JobCreate(BaseModel):
+    """
+    Request body submitting a job.
+
+    Attributes:
+        kind (str): Operation to run.
+        params (dict): Parameters of the operation, validated by the kind's schema.
+    """
+
+    kind: Literal["export", "import", "bulk_update"] = Field(..., description="Operation to run")
+    params: dict[str, Any] = Field(default_factory=dict, description="Operation parameters")
+
+
+class JobFilters(BaseModel):
+    """
+    Employee selection shared by export and bulk update jobs, as in the list endpoint.
+
+    Attributes:
+        department (str | None): Filter by department.
+        min_salary (float | None): Minimum salary filter.
+        max_salary (float | None): Maximum salary filter.
+        filter (str | None): Filter expression.
+    """
+
+    department: str | None = None
+    min_salary: float | None = Field(None, ge=0)
+    max_salary: float | None = Field(None, ge=0)
+    filter: str | None = Field(None, max_length=MAX_FILTER_LENGTH)
+
+    @field_validator("filter")
+    @classmethod
+    def check_filter(cls, value: str | None) -> str | None:
+        """
+        Parse and validate the filter expression.
+        """
+        return validate_filter(value)
+
+
+class ExportJobParams(JobFilters):
+    """
+    Parameters of an export job.
+
+    Attributes:
+        format (str): "csv" or "jsonl".
+    """
+
+    format: Literal["csv", "jsonl"] = "csv"
+
+
+class BulkUpdateValues(BaseModel):
+    """
+    Fields set on every selected employee.
+
+    Attributes:
+        department (str | None): New department.
+        salary (float | None): New salary.
+    """
+
+    department: str | None = None
+    salary: float | None = Field(None, ge=0)
+
+
+class BulkUpdateJobParams(JobFilters):
+    """
+    Parameters of a bulk update job.
+
+    Attributes:
+        changes (BulkUpdateValues | None): Fields to set.
+        salary_factor (float | None): Multiplier applied to current salaries, e.g. 1.03.
+    """
+
+    changes: BulkUpdateValues | None = None
+    salary_factor: float | None = Field(None, gt=0, le=10)
+
+    @model_validator(mode="after")
+    def check_update(self) -> "BulkUpdateJobParams":
+        """
+        Require at least one change.
+        """
+        if not (self.changes and self.changes.model_fields_set) and self.salary_factor is None:
+            raise ValueError("A bulk update needs changes or a salary_factor.")
+        return self
+
+
+class ImportJobParams(BaseModel):
+    """
+    Parameters of an import job.
+
+    Attributes:
+        rows (list[EmployeeCreate]): Employees to create; taken emails are skipped.
+    """
+
+    rows: list[EmployeeCreate] = Field(..., min_length=1)
+
+
+JOB_PARAMS: dict[str, type[BaseModel]] = {
+    "export": ExportJobParams,
+    "import": ImportJobParams,
+    "bulk_update": BulkUpdateJobParams,
+}
+
+
+class JobResponse(BaseModel):
+    """
+    Status of a background job.
+
+    Attributes:
+        id (int): Job ID.
+        kind (str): Operation.
+        status (str): "queued", "running", "succeeded" or "failed".
+        processed (int): Rows processed so far.
+        total (int | None): Rows to process, once known.
+        progress (float | None): processed / total.
+        result (dict | None): Summary of a finished job.
+        result_url (str | None): Download URL of the result file, once available.
+        error (str | None): Failure reason.
+        created_at (datetime): Submission time.
+        started_at (datetime | None): Start time.
+        finished_at (datetime | None): Completion time.
+    """
+
+    id: int
+    kind: str
+    status: str
+    processed: int
+    total: int | None = None
+    progress: float | None = None
+    result: dict[str, Any] | None = None
+    result_url: str | None = None
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    class Config:
+        from_attributes = True
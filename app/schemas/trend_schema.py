@@ -0,0 +1,72 @@
+"""
+This module defines Pydantic schemas for the headcount and payroll trends endpoint.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+# Range returned when the request does not give a start day
+DEFAULT_TREND_DAYS = 90
+
+
+class TrendQueryParams(BaseModel):
+    """
+    Query parameters for the trends endpoint.
+
+    Attributes:
+        from_ (date | None): First day, sent as `from` (default: 90 days before `to`).
+        to (date | None): Last day (default: today, UTC).
+        interval (str): "day", "week" or "month"; longer intervals report the last day of
+            each period.
+        department (str | None): Only this department.
+    """
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    from_: date | None = Field(None, alias="from", description="First day (YYYY-MM-DD)")
+    to: date | None = Field(None, description="Last day (YYYY-MM-DD)")
+    interval: Literal["day", "week", "month"] = Field("day", description="Downsampling interval")
+    department: str | None = Field(None, description="Only this department")
+
+    @model_validator(mode="after")
+    def check_range(self) -> "TrendQueryParams":
+        """
+        Fill in the default range and reject reversed ones.
+        """
+        self.to = self.to or datetime.utcnow().date()
+        self.from_ = self.from_ or self.to - timedelta(days=DEFAULT_TREND_DAYS)
+        if self.from_ > self.to:
+            raise ValueError("'from' must not be after 'to'.")
+        return self
+
+
+class TrendPoint(BaseModel):
+    """
+    Headcount and payroll at the end of one period.
+
+    Attributes:
+        period (date): First day of the period.
+        day (date): Snapshot day the values were taken from (the period's last one).
+        headcount (int): Employees at the end of that day.
+        payroll (float): Sum of their salaries.
+    """
+
+    period: date
+    day: date
+    headcount: int
+    payroll: float
+
+
+class TrendsResponse(BaseModel):
+    """
+    Headcount and payroll trends.
+
+    Attributes:
+        interval (str): Downsampling interval.
+        points (list[TrendPoint]): One point per period with snapshots, oldest first.
+    """
+
+    interval: str
+    points: list[TrendPoint]
@@ -0,0 +1,480 @@
+"""
+This module provides the AnalyticsService class, which answers salary analytics queries from an
+in-memory columnar snapshot of each tenant's employees.
+The snapshot holds NumPy arrays of the analytic columns and is kept current incrementally from
+the employee change log, so percentile, histogram, top-N and filter queries never scan MySQL.
+NumPy is an optional dependency (see requirements-analytics.txt).
+"""
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from datetime import time as dt_time
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    np = None
+
+from app.exceptions import AnalyticsUnavailableError
+from app.repositories.employee_repository import employee_repository
+from app.utils.change_cursor import ChangeCursor
+from app.utils.tenant import current_tenant
+
+NO_DEPARTMENT = -1
+UNKNOWN_DEPARTMENT = -2
+# Latest change log IDs checked for entries still in flight when a snapshot is loaded
+RESUME_WINDOW = 1000
+
+
+def _to_epoch_seconds(value: datetime | date) -> int:
+    """
+    Convert a naive UTC datetime (or a date, at midnight) to epoch seconds.
+
+    Args:
+        value (datetime | date): Value to convert.
+
+    Returns:
+        int: Seconds since the Unix epoch.
+    """
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, dt_time.min)
+    return int(value.replace(tzinfo=timezone.utc).timestamp())
+
+
+class ColumnarSnapshot:
+    """
+    Growable NumPy column arrays for the analytic fields of every employee.
+
+    Departments are dictionary-encoded to int32 codes and date_joined is stored as int64 epoch
+    seconds. Rows are addressed by employee ID through an index so that single-row updates and
+    deletes are O(1); deletes swap the last row into the freed slot.
+
+    Args:
+        capacity (int): Initial number of rows allocated.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.cursor = ChangeCursor()  # change log entries applied
+        self.refreshed_at = 0.0
+        self.stale = False  # missed a change and awaits replacement by a reload
+        self.size = 0
+        self.ids = np.empty(capacity, dtype=np.int64)
+        self.departments = np.empty(capacity, dtype=np.int32)
+        self.salaries = np.empty(capacity, dtype=np.float64)
+        self.joined = np.empty(capacity, dtype=np.int64)
+        self.department_names: list[str] = []
+        self._department_codes: dict[str, int] = {}
+        self._row_of: dict[int, int] = {}
+
+    def department_code(self, name: str | None, create: bool = False) -> int:
+        """
+        Look up (or assign) the integer code of a department name.
+
+        Args:
+            name (str | None): Department name.
+            create (bool): Assign a new code if the name has not been seen.
+
+        Returns:
+            int: The department code, NO_DEPARTMENT for None, or UNKNOWN_DEPARTMENT.
+        """
+        if name is None:
+            return NO_DEPARTMENT
+        code = self._department_codes.get(name)
+        if code is None:
+            if not create:
+                return UNKNOWN_DEPARTMENT
+            code = self._department_codes[name] = len(self.department_names)
+            self.department_names.append(name)
+        return code
+
+    def department_name(self, code: int) -> str | None:
+        """
+        Decode a department code.
+
+        Args:
+            code (int): Department code.
+
+        Returns:
+            str | None: The department name, or None for NO_DEPARTMENT.
+        """
+        return self.department_names[code] if code >= 0 else None
+
+    def load(self, rows) -> None:
+        """
+        Replace the snapshot contents with the given rows.
+
+        Args:
+            rows (Iterable[tuple]): (id, department, salary, date_joined) tuples.
+
+        Returns:
+            None
+        """
+        ids, departments, salaries, joined = [], [], [], []
+        for emp_id, department, salary, date_joined in rows:
+            ids.append(emp_id)
+            departments.append(self.department_code(department, create=True))
+            salaries.append(salary)
+            joined.append(date_joined)
+        self.size = len(ids)
+        self.ids = np.array(ids, dtype=np.int64)
+        self.departments = np.array(departments, dtype=np.int32)
+        self.salaries = np.array(salaries, dtype=np.float64)  # None becomes NaN
+        self.joined = np.array(joined, dtype="datetime64[s]").astype(np.int64)
+        self._row_of = {emp_id: row for row, emp_id in enumerate(ids)}
+
+    def upsert(
+        self, emp_id: int, department: str | None, salary: float | None, date_joined: datetime
+    ) -> None:
+        """
+        Insert or overwrite a single employee's row.
+
+        Args:
+            emp_id (int): Employee ID.
+            department (str | None): Department name.
+            salary (float | None): Salary.
+            date_joined (datetime): Join date.
+
+        Returns:
+            None
+        """
+        row = self._row_of.get(emp_id)
+        if row is None:
+            if self.size == len(self.ids):
+                self._grow()
+            row = self._row_of[emp_id] = self.size
+            self.size += 1
+        self.ids[row] = emp_id
+        self.departments[row] = self.department_code(department, create=True)
+        self.salaries[row] = np.nan if salary is None else salary
+        self.joined[row] = _to_epoch_seconds(date_joined)
+
+    def remove(self, emp_id: int) -> None:
+        """
+        Delete a single employee's row, if present.
+
+        Args:
+            emp_id (int): Employee ID.
+
+        Returns:
+            None
+        """
+        row = self._row_of.pop(emp_id, None)
+        if row is None:
+            return
+        last = self.size - 1
+        if row != last:
+            for column in (self.ids, self.departments, self.salaries, self.joined):
+                column[row] = column[last]
+            self._row_of[int(self.ids[row])] = row
+        self.size = last
+
+    def mask(self, filters: dict[str, Any]) -> "np.ndarray":
+        """
+        Build a boolean row mask for the given filters.
+
+        Args:
+            filters (dict): Optional department, min_salary, max_salary, joined_from and
+                joined_to constraints.
+
+        Returns:
+            np.ndarray: Boolean mask over the live rows.
+        """
+        n = self.size
+        mask = np.ones(n, dtype=bool)
+        if filters.get("department") is not None:
+            mask &= self.departments[:n] == self.department_code(filters["department"])
+        if filters.get("min_salary") is not None:
+            mask &= self.salaries[:n] >= filters["min_salary"]
+        if filters.get("max_salary") is not None:
+            mask &= self.salaries[:n] <= filters["max_salary"]
+        if filters.get("joined_from") is not None:
+            mask &= self.joined[:n] >= _to_epoch_seconds(filters["joined_from"])
+        if filters.get("joined_to") is not None:
+            mask &= self.joined[:n] < _to_epoch_seconds(filters["joined_to"]) + 86400
+        return mask
+
+    def _grow(self) -> None:
+        """
+        Double the allocated capacity of every column.
+
+        Returns:
+            None
+        """
+        capacity = max(1024, len(self.ids) * 2)
+        for name in ("ids", "departments", "salaries", "joined"):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[: self.size] = column[: self.size]
+            setattr(self, name, grown)
+
+
+class AnalyticsService:
+    """
+    Vectorized salary analytics over per-tenant columnar snapshots of the employees table.
+
+    A tenant's snapshot is loaded on its first query and then caught up from the tenant's change
+    log at most once per refresh interval, so writes made by any worker or node become visible.
+    Each tenant's snapshot has a lock of its own, held by queries and catch-ups but not by full
+    loads: a reloaded snapshot is built unlocked and swapped in when complete.
+    """
+
+    def __init__(self, repository, refresh_interval: float = 1.0, grace_seconds: float = 60.0):
+        """
+        Initialize the AnalyticsService.
+
+        Args:
+            repository: The repository instance for data access.
+            refresh_interval (float): Minimum seconds between change log catch-ups.
+            grace_seconds (float): Time a missing change log ID is waited for before the
+                snapshot is reloaded.
+        """
+        self.repository = repository
+        self.refresh_interval = refresh_interval
+        self.grace_seconds = grace_seconds
+        self._lock = threading.Lock()  # guards _locks
+        # Per tenant: the lock of its snapshot, and the lock taken by the thread reloading it
+        self._locks: dict[str, tuple[threading.Lock, threading.Lock]] = {}
+        self._snapshots: dict[str, ColumnarSnapshot] = {}
+
+    def init_app(self, app) -> None:
+        """
+        Configure the refresh interval from the application config and drop all snapshots.
+
+        Args:
+            app (Flask): The Flask application instance.
+
+        Returns:
+            None
+        """
+        self.refresh_interval = app.config.get("ANALYTICS_REFRESH_SECONDS", self.refresh_interval)
+        self.grace_seconds = app.config.get("CHANGE_CURSOR_GRACE_SECONDS", self.grace_seconds)
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Drop every tenant's snapshot so that the next query reloads it from the database.
+
+        Returns:
+            None
+        """
+        self._snapshots.clear()
+
+    def percentiles(self, filters: dict[str, Any], percentiles: list[float]) -> dict[str, Any]:
+        """
+        Compute salary percentiles over the matching employees.
+
+        Args:
+            filters (dict): Row filters (see ColumnarSnapshot.mask).
+            percentiles (list[float]): Percentiles to compute, between 0 and 100.
+
+        Returns:
+            dict: Number of salaried matches and the value of each percentile.
+        """
+        with self._snapshot() as snapshot:
+            salaries = snapshot.salaries[: snapshot.size][snapshot.mask(filters)]
+            salaries = salaries[~np.isnan(salaries)]
+            values = np.percentile(salaries, percentiles) if salaries.size else None
+        return {
+            "count": int(salaries.size),
+            "percentiles": {
+                f"{p:g}": float(values[i]) if values is not None else None
+                for i, p in enumerate(percentiles)
+            },
+        }
+
+    def histogram(
+        self, filters: dict[str, Any], bins: int = 20, edges: list[float] | None = None
+    ) -> dict[str, Any]:
+        """
+        Bucket the salaries of the matching employees.
+
+        Args:
+            filters (dict): Row filters (see ColumnarSnapshot.mask).
+            bins (int): Number of equal-width bins, used when edges is not given.
+            edges (list[float], optional): Explicit salary band edges.
+
+        Returns:
+            dict: Bin edges and the count of salaries in each bin.
+        """
+        with self._snapshot() as snapshot:
+            salaries = snapshot.salaries[: snapshot.size][snapshot.mask(filters)]
+            salaries = salaries[~np.isnan(salaries)]
+            counts, bin_edges = np.histogram(salaries, bins=edges if edges else bins)
+        return {"edges": bin_edges.tolist(), "counts": counts.tolist()}
+
+    def top(self, filters: dict[str, Any], n: int = 10, order: str = "desc") -> list[dict]:
+        """
+        Find the employees with the highest (or lowest) salaries among the matches.
+
+        Args:
+            filters (dict): Row filters (see ColumnarSnapshot.mask).
+            n (int): Number of employees to return.
+            order (str): "desc" for highest salaries first, "asc" for lowest.
+
+        Returns:
+            list[dict]: id, department and salary of each employee, in salary order.
+        """
+        with self._snapshot() as snapshot:
+            rows = np.flatnonzero(snapshot.mask(filters))
+            salaries = snapshot.salaries[rows]
+            rows, salaries = rows[~np.isnan(salaries)], salaries[~np.isnan(salaries)]
+            keys = -salaries if order == "desc" else salaries
+            if rows.size > n:
+                selected = np.argpartition(keys, n - 1)[:n]
+                rows, keys = rows[selected], keys[selected]
+            rows = rows[np.argsort(keys, kind="stable")]
+            return [
+                {
+                    "id": int(snapshot.ids[row]),
+                    "department": snapshot.department_name(int(snapshot.departments[row])),
+                    "salary": float(snapshot.salaries[row]),
+                }
+                for row in rows
+            ]
+
+    def filter(self, filters: dict[str, Any], limit: int = 100) -> dict[str, Any]:
+        """
+        Count and summarize the matching employees.
+
+        Args:
+            filters (dict): Row filters (see ColumnarSnapshot.mask).
+            limit (int): Maximum number of matching IDs to return.
+
+        Returns:
+            dict: Match count, salary aggregates and up to `limit` matching IDs.
+        """
+        with self._snapshot() as snapshot:
+            rows = np.flatnonzero(snapshot.mask(filters))
+            salaries = snapshot.salaries[rows]
+            salaries = salaries[~np.isnan(salaries)]
+            ids = np.sort(snapshot.ids[rows])[:limit]
+        has_salaries = salaries.size > 0
+        return {
+            "count": int(rows.size),
+            "salary_sum": float(salaries.sum()),
+            "salary_mean": float(salaries.mean()) if has_salaries else None,
+            "salary_min": float(salaries.min()) if has_salaries else None,
+            "salary_max": float(salaries.max()) if has_salaries else None,
+            "ids": ids.tolist(),
+        }
+
+    @contextmanager
+    def _snapshot(self) -> Iterator[ColumnarSnapshot]:
+        """
+        Lock the current tenant's snapshot for a query, loading it or catching up from the
+        change log as needed.
+
+        Yields:
+            ColumnarSnapshot: The current snapshot, locked until the block exits.
+
+        Raises:
+            AnalyticsUnavailableError: If NumPy is not installed.
+        """
+        if np is None:
+            raise AnalyticsUnavailableError()
+        tenant_id = current_tenant()
+        with self._lock:
+            if tenant_id not in self._locks:
+                self._locks[tenant_id] = (threading.Lock(), threading.Lock())
+            lock, load_lock = self._locks[tenant_id]
+        while True:
+            with lock:
+                snapshot = self._snapshots.get(tenant_id)
+                if snapshot is not None and self._catch_up(snapshot):
+                    yield snapshot
+                    return
+            with load_lock:
+                # Another thread may have replaced the snapshot while this one waited
+                if self._snapshots.get(tenant_id) is snapshot:
+                    loaded = self._load()
+                    self._apply_changes(loaded)
+                    loaded.refreshed_at = time.monotonic()
+                    with lock:
+                        self._snapshots[tenant_id] = loaded
+
+    def _catch_up(self, snapshot: ColumnarSnapshot) -> bool:
+        """
+        Apply the snapshot's pending change log entries, at most once per refresh interval.
+
+        Must be called with the snapshot's lock held.
+
+        Args:
+            snapshot (ColumnarSnapshot): The current tenant's snapshot.
+
+        Returns:
+            bool: False if the snapshot missed a change and must be replaced by a reload.
+        """
+        if snapshot.stale:
+            return False
+        now = time.monotonic()
+        if now - snapshot.refreshed_at < self.refresh_interval:
+            return True
+        if not self._apply_changes(snapshot):
+            snapshot.stale = True
+            return False
+        snapshot.refreshed_at = now
+        return True
+
+    def _load(self) -> ColumnarSnapshot:
+        """
+        Load a snapshot of the current tenant's employees.
+
+        Returns:
+            ColumnarSnapshot: The snapshot, with its cursor over the change log entries
+            already visible.
+        """
+        snapshot = ColumnarSnapshot()
+        # Take the cursor first: changes racing the load are re-applied idempotently. Entries
+        # missing among the latest IDs may belong to writes still in flight, which the load
+        # does not see: the cursor waits for them.
+        recent = self.repository.get_recent_change_ids(RESUME_WINDOW)
+        snapshot.cursor = ChangeCursor(recent[0] - 1 if recent else 0, self.grace_seconds)
+        snapshot.cursor.advance(recent)
+        snapshot.load(self.repository.iter_columns())
+        return snapshot
+
+    def _apply_changes(self, snapshot: ColumnarSnapshot, batch_size: int = 10000) -> bool:
+        """
+        Apply the change log entries the snapshot's cursor has not consumed yet, including
+        those committed late, below entries already applied.
+
+        Args:
+            snapshot (ColumnarSnapshot): The current tenant's snapshot.
+            batch_size (int): Number of change log entries read per query.
+
+        Returns:
+            bool: False if a missing entry was given up on, so the snapshot may have missed
+            a change and must be reloaded.
+        """
+        cursor = snapshot.cursor
+        since = cursor.position
+        while True:
+            ids = self.repository.get_change_ids(since, batch_size)
+            if not ids:
+                return True
+            for change in self.repository.get_changes(since, batch_size, until=ids[-1]):
+                if change.id in cursor:
+                    continue
+                if change.operation == "delete":
+                    snapshot.remove(change.employee_id)
+                else:
+                    payload = change.payload
+                    snapshot.upsert(
+                        change.employee_id,
+                        payload["department"],
+                        payload["salary"],
+                        datetime.fromisoformat(payload["date_joined"]),
+                    )
+            if cursor.advance(ids):
+                return False
+            if len(ids) < batch_size:
+                return True
+            since = ids[-1]
+
+
+# Instantiate the service for dependency injection
+analytics_service = AnalyticsService(repository=employee_repository)
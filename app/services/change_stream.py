@@ -0,0 +1,278 @@
+"""
+This module provides the ChangeStream, which feeds the live change stream from the employee
+change log.
+Event IDs are change log IDs, so a resume token means the same thing on every worker process,
+and the writes of every process (other workers, job workers, CLI commands) are streamed. While
+a database has subscribers, the process tails its change log and releases the entries in ID
+order once every lower ID has committed or been given up on (see ChangeCursor). Tailing runs on
+the waiting subscribers' request threads and right after this process's own writes, so there is
+no background thread to keep alive across worker forks.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any
+
+from app.models.employee_change import EmployeeChange
+from app.repositories.employee_repository import employee_repository
+from app.utils.change_cursor import ChangeCursor
+from app.utils.event_broadcaster import EventBroadcaster, Subscription
+from app.utils.tenant import tenant_context
+
+logger = logging.getLogger("app.stream")
+
+# Change log entries read per query
+BATCH_SIZE = 1000
+
+
+class _DatabaseTail:
+    """
+    Position in the change log of one database, and the subscribers of its tenants.
+
+    Args:
+        broadcaster (EventBroadcaster): Fans the database's events out to its subscribers.
+        cursor (ChangeCursor): Change log entries read so far.
+    """
+
+    def __init__(self, broadcaster: EventBroadcaster, cursor: ChangeCursor):
+        self.broadcaster = broadcaster
+        self.cursor = cursor
+        # Entries read above the cursor position, released once the IDs below them settle
+        self.pending: dict[int, tuple[str, dict[str, Any], str]] = {}
+
+
+class ChangeStream:
+    """
+    Tails the change log of every database with live subscribers.
+
+    Args:
+        repository: The repository reading the change log.
+        poll_seconds (float): Minimum interval between the polls of waiting subscribers.
+        history_size (int): Number of recent events kept per database for resumption.
+        grace_seconds (float): Time a missing change ID is waited for.
+    """
+
+    def __init__(
+        self,
+        repository,
+        poll_seconds: float = 0.5,
+        history_size: int = 1024,
+        grace_seconds: float = 60.0,
+    ):
+        self.repository = repository
+        self.poll_seconds = poll_seconds
+        self.history_size = history_size
+        self.grace_seconds = grace_seconds
+        self._app = None
+        self._tails: dict[str | None, _DatabaseTail] = {}
+        self._lock = threading.Lock()  # guards _tails
+        self._polling = threading.Lock()  # held by the one poll in progress
+        self._last_poll = 0.0
+
+    def init_app(self, app) -> None:
+        """
+        Read the polling settings from the application config.
+
+        Args:
+            app (Flask): The Flask application instance.
+
+        Returns:
+            None
+        """
+        self._app = app
+        self.poll_seconds = app.config.get("SSE_POLL_SECONDS", self.poll_seconds)
+        self.grace_seconds = app.config.get("CHANGE_CURSOR_GRACE_SECONDS", self.grace_seconds)
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forget every database's position, e.g. after its contents were replaced.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._tails.clear()
+
+    def subscribe(self, last_event_id: int | None, maxsize: int, tenant_id: str) -> Subscription:
+        """
+        Subscribe to a tenant's events, replaying those after last_event_id if given.
+
+        The first subscriber of a database loads its latest change log entries, so resume
+        tokens issued by any process (or before a restart) can be replayed.
+
+        Args:
+            last_event_id (int | None): Change ID of the last event the client received.
+            maxsize (int): Maximum number of undelivered events before the subscriber is dropped.
+            tenant_id (str): Tenant whose events are delivered.
+
+        Returns:
+            Subscription: The new subscription.
+        """
+        database = self._database(tenant_id)
+        with self._lock:
+            tail = self._tails.get(database)
+            if tail is None:
+                tail = self._tails[database] = self._load(database)
+            return tail.broadcaster.subscribe(last_event_id, maxsize, tenant_id)
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Remove a subscription, and stop tailing its database if it was the last one.
+
+        Args:
+            subscription (Subscription): Subscription to remove.
+
+        Returns:
+            None
+        """
+        database = self._database(subscription.tenant_id)
+        with self._lock:
+            tail = self._tails.get(database)
+            if tail is None:
+                return
+            tail.broadcaster.unsubscribe(subscription)
+            if tail.broadcaster.subscriber_count == 0:
+                del self._tails[database]
+
+    def notify(self) -> None:
+        """
+        Poll right away if anyone is subscribed, so that this process's own writes reach
+        its subscribers without waiting for the next poll.
+
+        Returns:
+            None
+        """
+        if self._tails:
+            self.poll()
+
+    def poll(self, min_interval: float = 0.0) -> int:
+        """
+        Publish the change log entries that settled since the last poll.
+
+        Never raises: a failure is logged and the entries are read again by the next poll.
+        Returns at once if another poll is in progress, or if the last one is more recent
+        than min_interval.
+
+        Args:
+            min_interval (float): Seconds that must have passed since the last poll.
+
+        Returns:
+            int: Number of events published.
+        """
+        if time.monotonic() - self._last_poll < min_interval:
+            return 0
+        if not self._polling.acquire(blocking=False):
+            return 0
+        try:
+            self._last_poll = time.monotonic()
+            with self._lock:
+                tails = list(self._tails.items())
+            published = 0
+            for database, tail in tails:
+                try:
+                    with self._app.app_context(), tenant_context(database):
+                        published += self._tail(tail)
+                except Exception:
+                    logger.exception("Polling the change log failed")
+            return published
+        finally:
+            self._polling.release()
+
+    def _database(self, tenant_id: str | None) -> str | None:
+        """
+        Identify the database holding a tenant's change log.
+
+        Args:
+            tenant_id (str | None): Tenant ID.
+
+        Returns:
+            str | None: The tenant ID if it has a dedicated database, else None for the
+            shared one.
+        """
+        return tenant_id if tenant_id in self._app.config.get("TENANT_BINDS", {}) else None
+
+    def _load(self, database: str | None) -> _DatabaseTail:
+        """
+        Start tailing a database, with its latest change log entries as the history.
+
+        Entries older than the grace period are published as they are: IDs missing among them
+        were rolled back long ago. Missing IDs among the newer ones may still commit, and are
+        waited for.
+
+        Args:
+            database (str | None): Tenant with a dedicated database, or None for the shared one.
+
+        Returns:
+            _DatabaseTail: The database's tail.
+        """
+        with self._app.app_context(), tenant_context(database):
+            ids = self.repository.get_recent_change_ids(self.history_size)
+            start = ids[0] - 1 if ids else 0
+            broadcaster = EventBroadcaster(self.history_size, sequence=start)
+            cutoff = datetime.utcnow() - timedelta(seconds=self.grace_seconds)
+            position = start
+            for change in self.repository.get_changes(start, len(ids), all_tenants=True):
+                if change.changed_at >= cutoff:
+                    break
+                broadcaster.publish(*_event(change), event_id=change.id)
+                position = change.id
+            tail = _DatabaseTail(broadcaster, ChangeCursor(position, self.grace_seconds))
+            self._tail(tail)
+        return tail
+
+    def _tail(self, tail: _DatabaseTail) -> int:
+        """
+        Read a database's new change log entries, and publish those that settled.
+
+        Must run in the database's tenant context.
+
+        Args:
+            tail (_DatabaseTail): The database's tail.
+
+        Returns:
+            int: Number of events published.
+        """
+        cursor = tail.cursor
+        published = 0
+        since = cursor.position
+        while True:
+            changes = self.repository.get_changes(since, BATCH_SIZE, all_tenants=True)
+            for change in changes:
+                if change.id not in cursor:
+                    tail.pending[change.id] = _event(change)
+            gave_up = cursor.advance(change.id for change in changes)
+            for id_ in sorted(tail.pending):
+                if id_ > cursor.position:
+                    break
+                tail.broadcaster.publish(*tail.pending.pop(id_), event_id=id_)
+                published += 1
+            if gave_up:
+                # A missing entry may commit after all and never be streamed
+                tail.broadcaster.publish(
+                    "reset", {"resume": cursor.position}, event_id=cursor.position
+                )
+                published += 1
+            if len(changes) < BATCH_SIZE:
+                return published
+            since = changes[-1].id
+
+
+def _event(change: EmployeeChange) -> tuple[str, dict[str, Any], str]:
+    """
+    Build the event of a change log entry.
+
+    Args:
+        change (EmployeeChange): The entry.
+
+    Returns:
+        tuple[str, dict, str]: Event type, data and tenant ID.
+    """
+    data = change.payload if change.payload is not None else {"id": change.employee_id}
+    return change.operation, data, change.tenant_id
+
+
+# Instantiate the stream shared by the service layer and the stream endpoint
+change_stream = ChangeStream(employee_repository)
@@ -0,0 +1,68 @@
+"""
+This module provides the DepartmentService class, which lists departments with their headcounts.
+Headcounts are grouped by the integer department key and cached per tenant until the next
+employee write, so repeated requests never touch the database.
+"""
+
+import threading
+from typing import Any
+
+from app.repositories.department_repository import department_repository
+from app.repositories.employee_repository import employee_repository
+from app.utils.tenant import current_tenant
+
+
+class DepartmentService:
+    """
+    Business logic layer for departments.
+
+    Args:
+        repository: The department repository.
+        employees: The employee repository, whose write generation invalidates the cache.
+    """
+
+    def __init__(self, repository, employees):
+        self.repository = repository
+        self.employees = employees
+        self._lock = threading.Lock()
+        self._cached: dict[str, tuple[int, list[dict[str, Any]]]] = {}
+
+    def list_departments(self) -> list[dict[str, Any]]:
+        """
+        List the current tenant's departments with the number of live employees in each.
+
+        Returns:
+            list[dict]: id, name and headcount of each department, ordered by name.
+        """
+        tenant_id = current_tenant()
+        generation = self.employees.generation
+        cached = self._cached.get(tenant_id)
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+
+        headcounts = self.employees.count_by_department()
+        departments = [
+            {"id": department_id, "name": name, "headcount": headcounts.get(department_id, 0)}
+            for department_id, name in self.repository.get_all()
+        ]
+        with self._lock:
+            current = self._cached.get(tenant_id)
+            if current is None or current[0] <= generation:
+                self._cached[tenant_id] = (generation, departments)
+        return departments
+
+    def reset(self) -> None:
+        """
+        Drop the cached department lists.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._cached.clear()
+
+
+# Instantiate the service for dependency injection
+department_service = DepartmentService(
+    repository=department_repository, employees=employee_repository
+)
@@ -3,27 +3,53 @@ This module provides the EmployeeService class, which implements business logic
 It acts as a service layer between the API routes and the data repository.
 """
 
+import threading
+from collections.abc import Callable, Hashable
 from typing import Any
 
-from app.exceptions import DuplicateEmailError, EmployeeNotFound
+from flask import current_app
+
+from app.exceptions import DuplicateEmailError, EmployeeNotFound, VersionConflictError
 from app.models.employee import Employee
+from app.models.employee_change import EmployeeChange
 from app.repositories.employee_repository import employee_repository
+from app.schemas.employee_schema import EmployeeResponse
+from app.services.change_stream import ChangeStream, change_stream
+from app.utils.query_cache import QueryResultCache, query_cache
+from app.utils.single_flight import SingleFlight, single_flight
+from app.utils.tenant import current_tenant, tenant_context
+from app.utils.tracing import span, traced
 
 
+@traced("service")
 class EmployeeService:
     """
     Business logic layer for employee operations.
     Provides methods for creating, retrieving, updating, and deleting employees.
     """
 
-    def __init__(self, repository):
+    def __init__(
+        self,
+        repository,
+        stream: ChangeStream | None = None,
+        cache: QueryResultCache | None = None,
+        coalescer: SingleFlight | None = None,
+    ):
         """
         Initialize the EmployeeService.
 
         Args:
             repository: The repository instance for data access.
+            stream (ChangeStream, optional): Notified after every write, so that live
+                subscribers receive it at once.
+            cache (QueryResultCache, optional): Caches list results by normalized filters.
+            coalescer (SingleFlight, optional): Shares one execution among identical
+                concurrent reads.
         """
         self.repository = repository
+        self.stream = stream
+        self.cache = cache
+        self.coalescer = coalescer
 
     def create_employee(self, data: dict[str, Any]) -> Employee:
         """
@@ -39,80 +65,318 @@ class EmployeeService:
             DuplicateEmailError: If an employee with the same email already exists.
         """
         if self.repository.get_by_email(data["email"]):
-            raise DuplicateEmailError(f"Employee with email '{data['email']}' already exists.")
+            raise DuplicateEmailError()
+
+        employee = self.repository.create(Employee(**data))
+        self._notify()
+        return employee
+
+    def upsert_employee(self, email: str, data: dict[str, Any]) -> tuple[Employee, bool]:
+        """
+        Create the employee with the given email, or update it if it already exists.
+
+        Args:
+            email (str): Email address identifying the employee.
+            data (dict): Employee fields; fields left out keep their stored value on update.
+
+        Returns:
+            tuple[Employee, bool]: The resulting employee and whether it was created.
+        """
+        return self.upsert_employees([{**data, "email": email}])[0]
+
+    def upsert_employees(self, rows: list[dict[str, Any]]) -> list[tuple[Employee, bool]]:
+        """
+        Create or update employees by email in one transaction, without looking each one up.
 
-        employee = Employee(**data)
-        return self.repository.create(employee)
+        Args:
+            rows (list[dict]): Employee fields including a distinct "email" per row.
+
+        Returns:
+            list[tuple[Employee, bool]]: Each resulting employee and whether it was created,
+            in input order.
+        """
+        results = self.repository.upsert_many(rows)
+        self._notify()
+        return results
 
-    def list_employees(self, filters: dict[str, Any] | None = None) -> tuple[list[Employee], int]:
+    def list_employees(
+        self, filters: dict[str, Any] | None = None
+    ) -> tuple[list[Employee | EmployeeResponse], int]:
         """
         Retrieve all employees with optional filters, pagination, and sorting.
 
+        When a cache is configured, results are served from it until the next repository
+        write. With a cache or a coalescer, employees are returned as immutable
+        EmployeeResponse snapshots, since ORM instances are bound to the session of the
+        thread that loaded them. Cache and coalescing keys include the current tenant.
+
         Args:
             filters (dict, optional): Filtering, sorting, and pagination options.
 
         Returns:
-            tuple[list[Employee], int]: List of employees and total count.
+            tuple[list[Employee | EmployeeResponse], int]: List of employees and total count.
         """
-        return self.repository.get_all(filters)
+        tenant_filters = {**(filters or {}), "tenant_id": current_tenant()}
+        if self.cache is None:
+            if self.coalescer is None:
+                return self.repository.get_all(filters)
+            return self._coalesce(
+                ("list", QueryResultCache.make_key(tenant_filters), self.repository.generation),
+                lambda: self._load_snapshots(filters),
+            )
+
+        key = self.cache.make_key(tenant_filters)
+        generation = self.repository.generation
+        result = self.cache.get(key, generation)
+        if result is not None:
+            return result
 
-    def get_employee(self, emp_id: int) -> Employee:
+        flight_key = ("list", key, generation)
+        result = self.cache.get_stale(key)
+        if result is not None:
+            self._revalidate_in_background(flight_key, lambda: self._load_page(filters, key))
+            return result
+        return self._coalesce(flight_key, lambda: self._load_page(filters, key))
+
+    def get_employee(self, emp_id: int) -> Employee | EmployeeResponse:
         """
         Retrieve an employee by ID.
 
+        With a coalescer, concurrent callers share one immutable EmployeeResponse snapshot
+        instead of the ORM instance bound to the leader's session.
+
         Args:
             emp_id (int): Employee ID.
 
+        Returns:
+            Employee | EmployeeResponse: The employee instance, or its snapshot.
+
+        Raises:
+            EmployeeNotFound: If no employee with the given ID exists.
+        """
+        if self.coalescer is None:
+            employee = self.repository.get_by_id(emp_id)
+        else:
+            employee = self._coalesce(
+                ("get", current_tenant(), emp_id, self.repository.generation),
+                lambda: _snapshot(self.repository.get_by_id(emp_id)),
+            )
+        if not employee:
+            raise EmployeeNotFound()
+        return employee
+
+    def _get_employee_for_write(
+        self, emp_id: int, expected_version: int | None = None
+    ) -> Employee:
+        """
+        Load an employee into the current session for modification, bypassing coalescing.
+
+        Args:
+            emp_id (int): Employee ID.
+            expected_version (int, optional): Version the caller expects the employee at.
+
         Returns:
             Employee: The employee instance.
 
         Raises:
             EmployeeNotFound: If no employee with the given ID exists.
+            VersionConflictError: If the employee is not at the expected version.
         """
         employee = self.repository.get_by_id(emp_id)
         if not employee:
-            raise EmployeeNotFound(f"Employee with ID {emp_id} not found.")
+            raise EmployeeNotFound()
+        if expected_version is not None and employee.version != expected_version:
+            raise VersionConflictError(
+                f"Employee with ID {emp_id} is at version {employee.version}, "
+                f"not {expected_version}."
+            )
         return employee
 
-    def update_employee(self, emp_id: int, data: dict[str, Any]) -> Employee:
+    def update_employee(
+        self, emp_id: int, data: dict[str, Any], expected_version: int | None = None
+    ) -> Employee:
         """
         Update an existing employee record.
 
         Args:
             emp_id (int): Employee ID.
             data (dict): Fields to update.
+            expected_version (int, optional): Version the client last read; if given, the
+                update is rejected when the employee has changed since.
 
         Returns:
             Employee: The updated employee instance.
 
         Raises:
             DuplicateEmailError: If updating to an email that already exists.
+            VersionConflictError: If the employee is not at the expected version, or was
+                modified concurrently.
         """
-        employee = self.get_employee(emp_id)
+        employee = self._get_employee_for_write(emp_id, expected_version)
 
         # Check for email uniqueness if email is being updated
         if "email" in data and data["email"] != employee.email:
             if self.repository.get_by_email(data["email"]):
-                raise DuplicateEmailError(f"Employee with email '{data['email']}' already exists.")
+                raise DuplicateEmailError()
 
         for key, value in data.items():
             setattr(employee, key, value)
 
-        return self.repository.update(employee)
+        employee = self.repository.update(employee)
+        self._notify()
+        return employee
 
-    def delete_employee(self, emp_id: int) -> None:
+    def delete_employee(self, emp_id: int, expected_version: int | None = None) -> None:
         """
         Delete an employee by ID.
 
         Args:
             emp_id (int): Employee ID.
+            expected_version (int, optional): Version the client last read.
 
         Returns:
             None
+
+        Raises:
+            VersionConflictError: If the employee is not at the expected version.
         """
-        employee = self.get_employee(emp_id)
+        employee = self._get_employee_for_write(emp_id, expected_version)
         self.repository.delete(employee)
+        self._notify()
+
+    def list_changes(self, since: int = 0, limit: int = 100) -> tuple[list[EmployeeChange], bool]:
+        """
+        Retrieve the employee change feed after the given cursor.
+
+        Args:
+            since (int): Cursor of the last change already seen (0 for the beginning).
+            limit (int): Maximum number of changes to return.
+
+        Returns:
+            tuple[list[EmployeeChange], bool]: Ordered changes and whether more are available.
+        """
+        changes = self.repository.get_changes(since, limit + 1)
+        return changes[:limit], len(changes) > limit
+
+    def cache_stats(self) -> dict[str, Any]:
+        """
+        Report list result cache statistics.
+
+        Returns:
+            dict: Cache statistics plus the current repository write generation and the
+            repository's statement cache statistics.
+        """
+        cache = self.cache if self.cache is not None else QueryResultCache(maxsize=0)
+        coalescer = self.coalescer if self.coalescer is not None else SingleFlight()
+        return {
+            **cache.stats(),
+            "coalesced": coalescer.stats()["coalesced"],
+            "generation": self.repository.generation,
+            "statements": self.repository.statements.stats(),
+        }
+
+    def _load_page(self, filters: dict[str, Any] | None, key: tuple) -> tuple[list, int]:
+        """
+        Run a list query and cache its result as EmployeeResponse snapshots.
+
+        Args:
+            filters (dict, optional): Filtering, sorting, and pagination options.
+            key (tuple): Normalized cache key for the filters.
+
+        Returns:
+            tuple[list[EmployeeResponse], int]: Employee snapshots and total count.
+        """
+        # Read the generation before querying so a concurrent write invalidates this result
+        generation = self.repository.generation
+        result = self._load_snapshots(filters)
+        self.cache.set(key, generation, result)
+        return result
+
+    def _load_snapshots(self, filters: dict[str, Any] | None) -> tuple[list, int]:
+        """
+        Run a list query and return its result as EmployeeResponse snapshots.
+
+        Args:
+            filters (dict, optional): Filtering, sorting, and pagination options.
+
+        Returns:
+            tuple[list[EmployeeResponse], int]: Employee snapshots and total count.
+        """
+        employees, total = self.repository.get_all(filters)
+        with span("serialize"):
+            return [EmployeeResponse.from_orm(e) for e in employees], total
+
+    def _coalesce(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run a read through the coalescer, if one is configured.
+
+        Keys include the repository write generation, so callers arriving after a write
+        never join a read that started before it.
+
+        Args:
+            key (Hashable): Identity of the read.
+            fn (Callable): Zero-argument function performing the read.
+
+        Returns:
+            Any: The result of the read.
+        """
+        if self.coalescer is None:
+            return fn()
+        return self.coalescer.do(key, fn)
+
+    def _revalidate_in_background(self, key: Hashable, fn: Callable[[], Any]) -> None:
+        """
+        Refresh a stale cache entry on a background thread, as the current tenant, unless a
+        refresh is in flight.
+
+        Args:
+            key (Hashable): Identity of the read.
+            fn (Callable): Zero-argument function that recomputes and caches the result.
+
+        Returns:
+            None
+        """
+        if self.coalescer is not None and self.coalescer.in_flight(key):
+            return
+        app = current_app._get_current_object()  # type: ignore[attr-defined]
+        # The new application context has no tenant of its own
+        tenant_id = current_tenant()
+
+        def refresh():
+            with app.app_context(), tenant_context(tenant_id):
+                self._coalesce(key, fn)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _notify(self) -> None:
+        """
+        Stream the change log entries of a committed write to live subscribers, if a stream
+        is configured.
+
+        Returns:
+            None
+        """
+        if self.stream is not None:
+            self.stream.notify()
+
+
+def _snapshot(employee: Employee | None) -> EmployeeResponse | None:
+    """
+    Copy an employee into an immutable snapshot that can be shared across threads.
+
+    Args:
+        employee (Employee, optional): Employee loaded in the current session.
+
+    Returns:
+        EmployeeResponse | None: The snapshot, or None if no employee was given.
+    """
+    return EmployeeResponse.from_orm(employee) if employee is not None else None
 
 
 # Instantiate the service for dependency injection
-employee_service = EmployeeService(repository=employee_repository)
+employee_service = EmployeeService(
+    repository=employee_repository,
+    stream=change_stream,
+    cache=query_cache,
+    coalescer=single_flight,
+)
@@ -0,0 +1,139 @@
+"""
+This module implements the long-running operations executed as background jobs.
+Each handler receives the job's validated parameters and a JobContext for progress reports and
+files, runs in the submitting tenant's context on a `flask jobs-worker` process, and returns a
+JSON-serializable summary stored as the job result.
+"""
+
+import csv
+import json
+from collections.abc import Callable
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+from app.exceptions import VersionConflictError
+from app.models.employee import Employee
+from app.repositories.employee_repository import employee_repository
+
+if TYPE_CHECKING:
+    from app.services.job_service import JobContext
+
+EXPORT_FIELDS = ["id", "name", "email", "department", "date_joined", "salary", "version"]
+FILTER_KEYS = ("department", "min_salary", "max_salary", "filter")
+# Attempts per bulk update batch when it races with interactive writes
+CONFLICT_RETRIES = 3
+
+
+def _filters(params: dict[str, Any]) -> dict[str, Any]:
+    return {key: params.get(key) for key in FILTER_KEYS}
+
+
+def export_employees(params: dict[str, Any], context: "JobContext") -> dict[str, Any]:
+    """
+    Write the employees matching the filters to a CSV or JSON lines file.
+
+    Args:
+        params (dict): ExportJobParams fields.
+        context (JobContext): Progress reporting and file locations.
+
+    Returns:
+        dict: Number of rows and format of the export.
+    """
+    filters = _filters(params)
+    export_format = params.get("format", "csv")
+    context.report(0, employee_repository.count(filters))
+    processed = 0
+    with open(context.result_path(export_format), "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, EXPORT_FIELDS) if export_format == "csv" else None
+        if writer:
+            writer.writeheader()
+        for batch in employee_repository.iter_batches(filters, context.batch_size):
+            rows = [employee.to_dict() for employee in batch]
+            if writer:
+                writer.writerows(rows)
+            else:
+                f.writelines(json.dumps(row) + "\n" for row in rows)
+            processed += len(rows)
+            context.report(processed)
+    return {"rows": processed, "format": export_format}
+
+
+def bulk_update_employees(params: dict[str, Any], context: "JobContext") -> dict[str, Any]:
+    """
+    Update the employees matching the filters, one committed batch at a time.
+
+    Every row goes through the versioned update path, so concurrent interactive writes are
+    never overwritten: a conflicting batch is reloaded and reapplied. Each batch commits the
+    job's checkpoint (the last employee ID written) with it, so a restarted job resumes after
+    the last committed batch instead of applying the changes (e.g. a salary factor) twice.
+
+    Args:
+        params (dict): BulkUpdateJobParams fields.
+        context (JobContext): Progress reporting and file locations.
+
+    Returns:
+        dict: Number of updated employees.
+
+    Raises:
+        VersionConflictError: If a batch still conflicts after CONFLICT_RETRIES attempts.
+        JobLeaseLost: If another worker has taken the job over.
+    """
+    filters = _filters(params)
+    values = params.get("changes") or {}
+    factor = params.get("salary_factor")
+    last_id = context.checkpoint.get("last_id", 0)
+    processed = context.checkpoint.get("processed", 0)
+    context.report(processed, employee_repository.count(filters))
+    for batch in employee_repository.iter_batches(filters, context.batch_size, last_id):
+        last_id = batch[-1].id  # read before the commit expires it
+        for attempt in range(1, CONFLICT_RETRIES + 1):
+            # After a rollback the batch reloads the latest committed state
+            batch = [employee for employee in batch if employee.deleted_at is None]
+            # Staged before the changes, which its UPDATE would otherwise flush
+            checkpoint = {"last_id": last_id, "processed": processed + len(batch)}
+            context.save(checkpoint["processed"], checkpoint)
+            for employee in batch:
+                for key, value in values.items():
+                    setattr(employee, key, value)
+                if factor is not None and employee.salary is not None:
+                    employee.salary = round(employee.salary * factor, 2)
+            try:
+                employee_repository.update_many(batch)
+                break
+            except VersionConflictError:
+                if attempt == CONFLICT_RETRIES:
+                    raise
+        processed += len(batch)
+    return {"updated": processed}
+
+
+def import_employees(params: dict[str, Any], context: "JobContext") -> dict[str, Any]:
+    """
+    Create employees from the uploaded rows, skipping emails that are already taken.
+
+    Args:
+        params (dict): ImportJobParams fields, with the rows moved to the job's input file.
+        context (JobContext): Progress reporting and file locations.
+
+    Returns:
+        dict: Numbers of created and skipped rows, and up to 100 skipped emails.
+    """
+    context.report(0, params["rows"])
+    created, skipped, processed = 0, [], 0
+    with open(params["input_file"], encoding="utf-8") as f:
+        while lines := list(islice(f, context.batch_size)):
+            employees = [Employee(**json.loads(line)) for line in lines]
+            done, duplicates = employee_repository.create_many(employees)
+            created += len(done)
+            skipped += duplicates
+            processed += len(lines)
+            context.report(processed)
+    return {"created": created, "skipped": len(skipped), "skipped_emails": skipped[:100]}
+
+
+# Operations that can be submitted as jobs, by kind
+JOB_HANDLERS: dict[str, Callable[[dict[str, Any], "JobContext"], dict[str, Any]]] = {
+    "export": export_employees,
+    "bulk_update": bulk_update_employees,
+    "import": import_employees,
+}
@@ -0,0 +1,384 @@
+"""
+This module provides the JobService class, which queues long-running operations as background
+jobs and runs them on worker processes.
+The web workers only record the job and return; `flask jobs-worker` claims queued jobs, runs
+their handler (see app.services.job_handlers) in the submitting tenant's context and stores a
+summary and an optional result file for download. A tenant whose database fails is skipped
+until the next round, so the other tenants' jobs keep running, and finished jobs are deleted
+with their files after the retention period.
+"""
+
+import json
+import logging
+import os
+import socket
+import tempfile
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+from app.exceptions import JobLeaseLost, JobNotFound, JobNotReadyError
+from app.extensions import db
+from app.models.job import Job
+from app.repositories.job_repository import JobRepository, job_repository
+from app.services.job_handlers import JOB_HANDLERS
+from app.utils.tenant import tenant_context
+
+logger = logging.getLogger("app.jobs")
+
+PRUNE_INTERVAL_SECONDS = 3600
+# Upper bound of the polling delay while a tenant's database keeps failing
+ERROR_BACKOFF_MAX_SECONDS = 60.0
+
+
+class JobContext:
+    """
+    What a running job handler may use: progress reporting, checkpoints, batch size and file
+    locations.
+
+    Every write is fenced by the attempt that claimed the job, and raises JobLeaseLost once
+    another worker has taken it over.
+
+    Args:
+        job (Job): The running job.
+        repository (JobRepository): Job data access.
+        storage_dir (str): Directory of job input and result files.
+        batch_size (int): Rows per batch the handler should process.
+    """
+
+    def __init__(self, job: Job, repository: JobRepository, storage_dir: str, batch_size: int):
+        self.job = job
+        self.repository = repository
+        self.storage_dir = storage_dir
+        self.batch_size = batch_size
+        self.attempt = job.attempts
+        # State committed by the last batch of an earlier attempt, to resume from
+        self.checkpoint: dict[str, Any] = dict(job.checkpoint or {})
+        self.result_file: str | None = None
+
+    def report(self, processed: int, total: int | None = None) -> None:
+        """
+        Record progress, which also serves as the worker's heartbeat.
+
+        Args:
+            processed (int): Rows processed so far.
+            total (int, optional): Rows to process, if known.
+
+        Returns:
+            None
+
+        Raises:
+            JobLeaseLost: If another worker has taken the job over.
+        """
+        self.repository.report_progress(self.job, self.attempt, processed, total)
+
+    def save(self, processed: int, checkpoint: dict[str, Any]) -> None:
+        """
+        Add progress and a checkpoint to the transaction of the batch about to be written, so
+        they commit (or roll back) with it. Call before modifying the batch.
+
+        Args:
+            processed (int): Rows processed once the batch commits.
+            checkpoint (dict): JSON-serializable state to resume from once the batch commits.
+
+        Returns:
+            None
+
+        Raises:
+            JobLeaseLost: If another worker has taken the job over.
+        """
+        self.repository.save_checkpoint(self.job, self.attempt, processed, checkpoint)
+
+    def result_path(self, extension: str) -> str:
+        """
+        Reserve the job's downloadable result file.
+
+        Args:
+            extension (str): File extension, e.g. "csv".
+
+        Returns:
+            str: Path the handler should write the result to.
+        """
+        name = f"{self.job.tenant_id}-job-{self.job.id}.{extension}"
+        self.result_file = os.path.join(self.storage_dir, name)
+        return self.result_file
+
+
+class JobService:
+    """
+    Service class for submitting, inspecting and running background jobs.
+
+    Args:
+        repository (JobRepository): Job data access.
+        handlers (dict): Job handlers keyed by kind.
+        storage_dir (str, optional): Directory of job input and result files; must be shared
+            by the web and worker processes.
+        batch_size (int): Rows per batch handed to handlers.
+        lease_seconds (float): Seconds without progress after which a running job is
+            considered abandoned and restarted.
+        max_attempts (int): Maximum number of times a job is started.
+        retention_days (float): Days finished jobs and their files are kept.
+    """
+
+    def __init__(
+        self,
+        repository: JobRepository,
+        handlers: dict[str, Callable],
+        storage_dir: str | None = None,
+        batch_size: int = 1000,
+        lease_seconds: float = 300.0,
+        max_attempts: int = 3,
+        retention_days: float = 7.0,
+    ):
+        self.repository = repository
+        self.handlers = handlers
+        self.storage_dir = storage_dir or os.path.join(tempfile.gettempdir(), "ems-jobs")
+        self.batch_size = batch_size
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retention_days = retention_days
+        self.errors = 0  # database failures of the worker loop, logged and skipped
+
+    def init_app(self, app) -> None:
+        """
+        Configure storage, batching and retries from the application config.
+
+        Args:
+            app (Flask): The Flask application instance.
+
+        Returns:
+            None
+        """
+        self.storage_dir = app.config.get("JOB_STORAGE_DIR") or self.storage_dir
+        self.batch_size = app.config.get("JOB_BATCH_SIZE", self.batch_size)
+        self.lease_seconds = app.config.get("JOB_LEASE_SECONDS", self.lease_seconds)
+        self.max_attempts = app.config.get("JOB_MAX_ATTEMPTS", self.max_attempts)
+        self.retention_days = app.config.get("JOB_RETENTION_DAYS", self.retention_days)
+
+    def submit(
+        self, kind: str, params: dict[str, Any], rows: list[dict[str, Any]] | None = None
+    ) -> Job:
+        """
+        Queue a job for the current tenant.
+
+        Args:
+            kind (str): Operation to run, a key of the handlers.
+            params (dict): Validated operation parameters.
+            rows (list[dict], optional): Uploaded input rows, stored in a file next to the
+                results instead of in the jobs table.
+
+        Returns:
+            Job: The queued job.
+        """
+        if rows is not None:
+            os.makedirs(self.storage_dir, exist_ok=True)
+            path = os.path.join(self.storage_dir, f"input-{uuid.uuid4().hex}.jsonl")
+            with open(path, "w", encoding="utf-8") as f:
+                f.writelines(json.dumps(row) + "\n" for row in rows)
+            params = {**params, "input_file": path, "rows": len(rows)}
+            try:
+                return self.repository.create(kind, params)
+            except Exception:
+                _remove_files([path])
+                raise
+        return self.repository.create(kind, params)
+
+    def get_job(self, job_id: int) -> Job:
+        """
+        Retrieve one of the current tenant's jobs.
+
+        Args:
+            job_id (int): Job ID.
+
+        Returns:
+            Job: The job.
+
+        Raises:
+            JobNotFound: If no such job exists for the tenant.
+        """
+        job = self.repository.get_by_id(job_id)
+        if job is None:
+            raise JobNotFound()
+        return job
+
+    def get_result_file(self, job_id: int) -> str:
+        """
+        Locate the downloadable result of a finished job.
+
+        Args:
+            job_id (int): Job ID.
+
+        Returns:
+            str: Path of the result file.
+
+        Raises:
+            JobNotFound: If no such job exists for the tenant.
+            JobNotReadyError: If the job has not succeeded or produces no file.
+        """
+        job = self.get_job(job_id)
+        if job.status != "succeeded" or not job.result_file:
+            raise JobNotReadyError()
+        return job.result_file
+
+    def run_next(self, worker: str) -> bool:
+        """
+        Claim one job from the session's database and run it to completion.
+
+        Args:
+            worker (str): Name of this worker.
+
+        Returns:
+            bool: Whether a job was claimed.
+        """
+        job = self.repository.claim(worker, self.lease_seconds, self.max_attempts)
+        if job is None:
+            return False
+        job_id = job.id
+        logger.info("Running job %s (%s)", job_id, job.kind)
+        os.makedirs(self.storage_dir, exist_ok=True)
+        with tenant_context(job.tenant_id):
+            context = JobContext(job, self.repository, self.storage_dir, self.batch_size)
+            input_file = job.params.get("input_file")
+            try:
+                result = self.handlers[job.kind](job.params, context)
+                self.repository.finish(job, context.attempt, result, context.result_file)
+            except JobLeaseLost:
+                # The job stalled past its lease and another worker runs it now
+                db.session.rollback()
+                logger.warning("Job %s was taken over by another worker", job_id)
+                return True
+            except Exception as e:
+                logger.exception("Job %s failed", job_id)
+                db.session.rollback()
+                try:
+                    self.repository.fail(
+                        db.session.get(Job, job_id), f"{type(e).__name__}: {e}", context.attempt
+                    )
+                except JobLeaseLost:
+                    logger.warning("Job %s was taken over by another worker", job_id)
+                    return True
+        # The upload is only read by attempts of the job, and none follows
+        _remove_files([input_file] if input_file else [])
+        return True
+
+    def prune(self, tenants: list[str | None]) -> int:
+        """
+        Delete the jobs that finished more than retention_days ago, with their files.
+
+        Args:
+            tenants (list[str | None]): Tenants whose databases to prune.
+
+        Returns:
+            int: Number of deleted files.
+        """
+        cutoff = datetime.utcnow() - timedelta(days=self.retention_days)
+        deleted = 0
+        for tenant_id in tenants:
+            deleted += self._in_tenant(
+                tenant_id, "Pruning jobs", lambda: _remove_files(self.repository.prune(cutoff))
+            )
+        return deleted
+
+    def run_worker(
+        self,
+        tenants: list[str | None],
+        poll_seconds: float = 1.0,
+        stop: threading.Event | None = None,
+        once: bool = False,
+    ) -> int:
+        """
+        Run jobs until stopped, polling when no job is queued and pruning finished jobs about
+        once an hour.
+
+        A database failure (e.g. a lost connection) is logged and skips the tenant for the
+        round; while failures persist, idle polls back off exponentially up to
+        ERROR_BACKOFF_MAX_SECONDS.
+
+        Args:
+            tenants (list[str | None]): Tenants whose databases to serve; None stands for the
+                shared database.
+            poll_seconds (float): Seconds to sleep when no job is queued.
+            stop (threading.Event, optional): Event that ends the loop once set.
+            once (bool): Return as soon as no job is queued.
+
+        Returns:
+            int: Number of jobs run.
+        """
+        worker = f"{socket.gethostname()}:{os.getpid()}"
+        stop = stop or threading.Event()
+        count = 0
+        failures = 0
+        last_prune = float("-inf")
+
+        def run_jobs() -> int:
+            ran = 0
+            while not stop.is_set() and self.run_next(worker):
+                ran += 1
+            return ran
+
+        while not stop.is_set():
+            errors = self.errors
+            ran = sum(
+                self._in_tenant(tenant_id, "Running jobs", run_jobs) for tenant_id in tenants
+            )
+            count += ran
+            if time.monotonic() - last_prune > PRUNE_INTERVAL_SECONDS:
+                self.prune(tenants)
+                last_prune = time.monotonic()
+            failures = failures + 1 if self.errors > errors else 0
+            if not ran:
+                if once:
+                    break
+                delay = max(poll_seconds, 1.0) * 2**failures if failures else poll_seconds
+                stop.wait(min(delay, ERROR_BACKOFF_MAX_SECONDS))
+        return count
+
+    def _in_tenant(self, tenant_id: str | None, operation: str, action: Callable[[], int]) -> int:
+        """
+        Run an action in a tenant's context, logging and counting a failure instead of
+        raising it.
+
+        Args:
+            tenant_id (str | None): Tenant whose database to use.
+            operation (str): Name of the action, for the log.
+            action (Callable): The action.
+
+        Returns:
+            int: The action's result, or 0 if it failed.
+        """
+        try:
+            with tenant_context(tenant_id):
+                return action()
+        except Exception:
+            logger.exception("%s failed for tenant %s", operation, tenant_id or "shared")
+            self.errors += 1
+            # Discard the failed transaction and its connection; the next round starts afresh
+            db.session.remove()
+            return 0
+
+
+def _remove_files(paths: list[str]) -> int:
+    """
+    Delete job files, ignoring those already gone.
+
+    Args:
+        paths (list[str]): File paths.
+
+    Returns:
+        int: Number of deleted files.
+    """
+    removed = 0
+    for path in paths:
+        try:
+            os.remove(path)
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+# Instantiate the service for dependency injection
+job_service = JobService(job_repository, JOB_HANDLERS)
@@ -0,0 +1,225 @@
+"""
+This module provides the OutboxDispatcher, which delivers outbox messages to downstream sinks.
+It runs outside the request path (see `flask outbox-dispatch`), so notifying payroll and IT
+systems adds no latency to employee writes, and retries failed deliveries with exponential
+backoff until they succeed or run out of attempts. A tenant whose database fails is skipped
+until the next round, so the other tenants' messages keep flowing.
+"""
+
+import logging
+import random
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from app.extensions import db
+from app.repositories.outbox_repository import OutboxRepository, outbox_repository
+from app.utils.outbox_sinks import OutboxSink, create_sink
+from app.utils.tenant import tenant_context
+
+logger = logging.getLogger("app.outbox")
+
+PRUNE_INTERVAL_SECONDS = 3600
+
+
+class OutboxDispatcher:
+    """
+    Claims batches of outbox messages and delivers them to every sink.
+
+    Args:
+        repository (OutboxRepository): Outbox data access.
+        sinks (list[OutboxSink], optional): Destinations of every message.
+        batch_size (int): Maximum number of messages claimed at once.
+        max_attempts (int): Attempts before a message is marked dead.
+        backoff_seconds (float): Delay before the first retry; doubled on every attempt.
+        backoff_max_seconds (float): Upper bound of the retry delay.
+        lease_seconds (float): Seconds a claimed message is reserved for this dispatcher.
+    """
+
+    def __init__(
+        self,
+        repository: OutboxRepository,
+        sinks: list[OutboxSink] | None = None,
+        batch_size: int = 100,
+        max_attempts: int = 10,
+        backoff_seconds: float = 1.0,
+        backoff_max_seconds: float = 300.0,
+        lease_seconds: float = 60.0,
+    ):
+        self.repository = repository
+        self.sinks = sinks or []
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.lease_seconds = lease_seconds
+        self.errors = 0  # database failures of drain and prune, logged and skipped
+
+    def init_app(self, app) -> None:
+        """
+        Configure sinks, batching and retries from the application config.
+
+        Args:
+            app (Flask): The Flask application instance.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If a configured sink URI is not supported.
+        """
+        self.sinks = [create_sink(uri) for uri in app.config["OUTBOX_SINKS"]]
+        self.batch_size = app.config["OUTBOX_BATCH_SIZE"]
+        self.max_attempts = app.config["OUTBOX_MAX_ATTEMPTS"]
+        self.backoff_seconds = app.config["OUTBOX_BACKOFF_SECONDS"]
+        self.backoff_max_seconds = app.config["OUTBOX_BACKOFF_MAX_SECONDS"]
+        self.lease_seconds = app.config["OUTBOX_LEASE_SECONDS"]
+
+    def retry_delay(self, attempt: int) -> float:
+        """
+        Compute the delay before the next attempt: exponential, jittered between half and all
+        of it so that messages failing together do not all retry together.
+
+        Args:
+            attempt (int): Number of the attempt that just failed, starting at 1.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        ceiling = min(self.backoff_max_seconds, self.backoff_seconds * 2 ** (attempt - 1))
+        return random.uniform(ceiling / 2, ceiling)
+
+    def dispatch_once(self) -> int:
+        """
+        Claim one batch of due messages and deliver it to every sink.
+
+        Must run inside an application context (and tenant context, for dedicated binds).
+
+        Returns:
+            int: Number of messages claimed (0 when nothing is due).
+        """
+        messages = self.repository.claim(self.batch_size, self.lease_seconds)
+        if not messages:
+            return 0
+        ids = [message["id"] for message in messages]
+        try:
+            for sink in self.sinks:
+                sink.send(messages)
+        except Exception as e:
+            error = f"{getattr(sink, 'name', type(sink).__name__)}: {e!r}"
+            logger.warning("Outbox delivery of %d messages failed: %s", len(ids), error)
+            by_attempt = defaultdict(list)
+            for message in messages:
+                by_attempt[message["attempt"]].append(message["id"])
+            now = datetime.utcnow()
+            for attempt, attempt_ids in by_attempt.items():
+                retry_at = None
+                if attempt < self.max_attempts:
+                    retry_at = now + timedelta(seconds=self.retry_delay(attempt))
+                self.repository.mark_failed(attempt_ids, error, retry_at)
+        else:
+            self.repository.mark_delivered(ids)
+        return len(messages)
+
+    def drain(self, tenants: list[str | None]) -> int:
+        """
+        Dispatch batches until no message is due in any of the tenants' databases.
+
+        A tenant whose database fails (e.g. a lost connection) is logged, counted in `errors`
+        and skipped for the rest of the drain, without affecting the other tenants.
+
+        Args:
+            tenants (list[str | None]): Tenants whose databases to serve; None stands for the
+                shared database (see archive_deleted for the same convention).
+
+        Returns:
+            int: Number of messages claimed.
+        """
+        total = 0
+        pending = list(tenants)
+        while pending:
+            for tenant_id in list(pending):
+                claimed = self._in_tenant(tenant_id, "dispatch", self.dispatch_once)
+                total += claimed
+                if not claimed:
+                    pending.remove(tenant_id)
+        return total
+
+    def prune(self, tenants: list[str | None], retention_days: float) -> int:
+        """
+        Delete messages delivered more than retention_days ago.
+
+        Args:
+            tenants (list[str | None]): Tenants whose databases to prune.
+            retention_days (float): Days delivered messages are kept.
+
+        Returns:
+            int: Number of deleted messages.
+        """
+        cutoff = datetime.utcnow() - timedelta(days=retention_days)
+        deleted = 0
+        for tenant_id in tenants:
+            deleted += self._in_tenant(tenant_id, "prune", lambda: self.repository.prune(cutoff))
+        return deleted
+
+    def run(
+        self,
+        tenants: list[str | None],
+        poll_seconds: float = 1.0,
+        retention_days: float = 7.0,
+        stop: threading.Event | None = None,
+    ) -> None:
+        """
+        Deliver messages until stopped, polling when the outbox is drained and pruning
+        delivered messages about once an hour. While database failures persist, polls back off
+        exponentially up to backoff_max_seconds.
+
+        Args:
+            tenants (list[str | None]): Tenants whose databases to serve.
+            poll_seconds (float): Seconds to sleep when no message is due.
+            retention_days (float): Days delivered messages are kept.
+            stop (threading.Event, optional): Event that ends the loop once set.
+
+        Returns:
+            None
+        """
+        stop = stop or threading.Event()
+        last_prune = float("-inf")
+        failures = 0
+        while not stop.is_set():
+            errors = self.errors
+            self.drain(tenants)
+            if time.monotonic() - last_prune > PRUNE_INTERVAL_SECONDS:
+                self.prune(tenants, retention_days)
+                last_prune = time.monotonic()
+            failures = failures + 1 if self.errors > errors else 0
+            stop.wait(max(poll_seconds, self.retry_delay(failures)) if failures else poll_seconds)
+
+    def _in_tenant(self, tenant_id: str | None, operation: str, action: Callable[[], int]) -> int:
+        """
+        Run an action in a tenant's context, logging and counting a failure instead of
+        raising it.
+
+        Args:
+            tenant_id (str | None): Tenant whose database to use.
+            operation (str): Name of the action, for the log.
+            action (Callable): The action.
+
+        Returns:
+            int: The action's result, or 0 if it failed.
+        """
+        try:
+            with tenant_context(tenant_id):
+                return action()
+        except Exception:
+            logger.exception("Outbox %s failed for tenant %s", operation, tenant_id or "shared")
+            self.errors += 1
+            # Discard the failed transaction and its connection; the next round starts afresh
+            db.session.remove()
+            return 0
+
+
+# Instantiate the dispatcher; sinks are configured by init_app
+outbox_dispatcher = OutboxDispatcher(outbox_repository)
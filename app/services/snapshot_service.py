@@ -0,0 +1,147 @@
+"""
+This module provides the SnapshotService class, which maintains daily headcount and payroll
+aggregates per department and serves downsampled trends from them.
+The `flask snapshot-employees` job catches up incrementally: it rewrites the latest snapshot day
+(which may have been taken before the day ended) and every day after it, so running it daily
+records each day's actual state. Days it never ran for are reconstructed from join and deletion
+dates, with current salaries and departments.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from app.repositories.department_repository import department_repository
+from app.repositories.snapshot_repository import snapshot_repository
+
+INTERVALS = ("day", "week", "month")
+
+
+def period_start(day: date, interval: str) -> date:
+    """
+    Return the first day of the period containing a day.
+
+    Args:
+        day (date): Any day.
+        interval (str): "day", "week" (starting Monday) or "month".
+
+    Returns:
+        date: Start of the period.
+    """
+    if interval == "week":
+        return day - timedelta(days=day.weekday())
+    if interval == "month":
+        return day.replace(day=1)
+    return day
+
+
+class SnapshotService:
+    """
+    Business logic layer for headcount and payroll snapshots and trends.
+
+    Args:
+        repository: The snapshot repository.
+        departments: The department repository, to resolve department names.
+    """
+
+    def __init__(self, repository, departments):
+        self.repository = repository
+        self.departments = departments
+
+    def take_snapshots(self, through: date | None = None) -> int:
+        """
+        Write the current tenant's missing daily aggregates, up to and including a day.
+
+        Args:
+            through (date, optional): Last day to write (default: today, UTC).
+
+        Returns:
+            int: Number of days written.
+        """
+        through = through or datetime.utcnow().date()
+        start = self.repository.latest_day() or self.repository.first_join_day()
+        if start is None or start > through:
+            return 0
+        days = (through - start).days + 1
+
+        # Headcount and payroll changes per day offset and department, swept into daily totals
+        changes: dict[int, dict[int | None, list[float]]] = {}
+
+        def add(offset: int, department_id: int | None, heads: int, pay: float) -> None:
+            if offset < days:
+                change = changes.setdefault(offset, {}).setdefault(department_id, [0, 0.0])
+                change[0] += heads
+                change[1] += pay
+
+        employed_at = datetime.combine(start + timedelta(days=1), datetime.min.time())
+        for department_id, salary, date_joined, deleted_at in self.repository.iter_history(
+            employed_at
+        ):
+            # Counted on every day whose end falls between joining and deletion
+            first = max((date_joined.date() - start).days, 0)
+            last = days - 1 if deleted_at is None else (deleted_at.date() - start).days - 1
+            if last < first:
+                continue
+            add(first, department_id, 1, salary or 0.0)
+            add(last + 1, department_id, -1, -(salary or 0.0))
+
+        rows, totals = [], {}
+        for offset in range(days):
+            for department_id, (heads, pay) in changes.get(offset, {}).items():
+                total = totals.setdefault(department_id, [0, 0.0])
+                total[0] += heads
+                total[1] += pay
+            day = start + timedelta(days=offset)
+            rows.extend(
+                {
+                    "day": day,
+                    "department_id": department_id,
+                    "headcount": heads,
+                    "payroll": round(pay, 2),
+                }
+                for department_id, (heads, pay) in totals.items()
+                if heads
+            )
+        self.repository.replace_from(start, rows)
+        return days
+
+    def get_trends(
+        self,
+        start: date,
+        end: date,
+        interval: str = "day",
+        department: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Retrieve headcount and payroll over time from the daily aggregates.
+
+        Each period reports its last snapshot day, i.e. the state at the end of the period.
+
+        Args:
+            start (date): First day.
+            end (date): Last day.
+            interval (str): "day", "week" or "month".
+            department (str, optional): Only this department.
+
+        Returns:
+            list[dict]: period, day, headcount and payroll of each period with snapshots.
+        """
+        department_id = None
+        if department:
+            department_id = self.departments.get_id(department)
+            if department_id is None:
+                return []
+        points: dict[date, dict[str, Any]] = {}
+        for day, headcount, payroll in self.repository.get_series(start, end, department_id):
+            points[period_start(day, interval)] = {
+                "period": period_start(day, interval),
+                "day": day,
+                "headcount": headcount,
+                "payroll": round(payroll, 2),
+            }
+        return list(points.values())
+
+
+# Instantiate the service for dependency injection
+snapshot_service = SnapshotService(
+    repository=snapshot_repository, departments=department_repository
+)
@@ -0,0 +1,99 @@
+"""
+This module provides ChangeCursor, a resume cursor over an append-only table keyed by an
+auto-incrementing ID, such as the employee change log or the cache invalidation table.
+IDs are assigned when a row is inserted but become visible when its transaction commits, so a
+reader may see ID N+1 before N. A plain "highest ID seen" cursor would then skip N for good.
+ChangeCursor keeps its position below the lowest ID that may still be in flight, and gives up
+on a missing ID after a grace period (it was rolled back, or its transaction ran too long),
+telling the consumer to fall back to a full reload.
+"""
+
+import time
+from collections.abc import Iterable
+
+# Missing IDs tracked at most; a larger jump in the sequence is given up on at once
+MAX_TRACKED_GAP = 100_000
+
+
+class ChangeCursor:
+    """
+    Gap-aware resume cursor.
+
+    Every ID up to `position` has been consumed or given up on. IDs above it that were already
+    consumed are remembered, so readers resume from `position` and skip them with `in`.
+
+    Args:
+        position (int): IDs up to this one are considered consumed.
+        grace_seconds (float): Time a missing ID is waited for before it is given up on.
+    """
+
+    def __init__(self, position: int = 0, grace_seconds: float = 60.0):
+        self.position = position
+        self.grace_seconds = grace_seconds
+        self._seen: set[int] = set()
+        self._missing_since: dict[int, float] = {}
+
+    def __contains__(self, id_: int) -> bool:
+        """
+        Tell whether an ID was already consumed (or given up on).
+
+        Args:
+            id_ (int): Row ID.
+
+        Returns:
+            bool: True if the row must not be consumed again.
+        """
+        return id_ <= self.position or id_ in self._seen
+
+    def advance(self, ids: Iterable[int]) -> bool:
+        """
+        Record consumed IDs and move the position over every settled ID.
+
+        Args:
+            ids (Iterable[int]): Every visible ID read above the position, consumed or not
+                (e.g. those of other tenants), in any order.
+
+        Returns:
+            bool: True if missing IDs were given up on, so their rows may never be consumed:
+            the consumer should reload from scratch.
+        """
+        self._seen.update(id_ for id_ in ids if id_ > self.position)
+        if not self._seen:
+            return False
+        highest = max(self._seen)
+        now = time.monotonic()
+        gave_up = False
+        if highest - self.position - len(self._seen) > MAX_TRACKED_GAP:
+            # E.g. a sequence jump after a crash: too many IDs to wait for one by one
+            self._reset(highest)
+            return True
+        while self.position < highest:
+            next_id = self.position + 1
+            if next_id in self._seen:
+                self._seen.discard(next_id)
+            else:
+                missing_since = self._missing_since.setdefault(next_id, now)
+                if now - missing_since < self.grace_seconds:
+                    break
+                del self._missing_since[next_id]
+                gave_up = True
+            self.position = next_id
+        # Track the other missing IDs, so each one's grace period starts when it is first seen
+        for id_ in range(self.position + 1, highest):
+            if id_ not in self._seen:
+                self._missing_since.setdefault(id_, now)
+        return gave_up
+
+    def _reset(self, position: int) -> None:
+        """
+        Move to a position, forgetting every tracked ID.
+
+        Args:
+            position (int): New position.
+
+        Returns:
+            None
+        """
+        self.position = position
+        self._seen.clear()
+        self._missing_since.clear()
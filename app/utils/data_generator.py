@@ -0,0 +1,132 @@
+"""
+This module generates deterministic synthetic employee data for load tests and benchmarks.
+Department sizes follow a Zipf-like skew, salaries follow a configurable distribution scaled by
+department, and emails are unique by construction. The same arguments always produce the same
+rows, so performance runs are comparable.
+"""
+
+import random
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from typing import Any
+
+FIRST_NAMES = [
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda", "David",
+    "Elizabeth", "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas",
+    "Sarah", "Charles", "Karen", "Priya", "Wei", "Aisha", "Mateo", "Yuki", "Olga", "Kwame",
+    "Fatima", "Lars", "Sofia",
+]  # fmt: skip
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez",
+    "Martinez", "Hernandez", "Lopez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore",
+    "Jackson", "Martin", "Lee", "Sharma", "Chen", "Okafor", "Rossi", "Tanaka", "Ivanova",
+    "Mensah", "Haddad", "Nielsen", "Silva",
+]  # fmt: skip
+DEPARTMENT_NAMES = [
+    "Engineering", "Sales", "Support", "Operations", "Marketing", "Finance", "HR", "Product",
+    "Design", "Legal",
+]  # fmt: skip
+DISTRIBUTIONS = ("lognormal", "normal", "uniform", "pareto")
+
+MEDIAN_SALARY = 60000.0
+JOINED_FROM = datetime(2010, 1, 1)
+JOINED_SECONDS = 15 * 365 * 86400
+
+
+def department_names(count: int) -> list[str]:
+    """
+    Name the given number of departments, largest first.
+
+    Args:
+        count (int): Number of departments.
+
+    Returns:
+        list[str]: Department names.
+    """
+    return [
+        DEPARTMENT_NAMES[k] if k < len(DEPARTMENT_NAMES) else f"Department {k + 1}"
+        for k in range(count)
+    ]
+
+
+def _salary_sampler(rng: random.Random, distribution: str):
+    """
+    Build a function drawing a salary multiplier around 1.0 from the named distribution.
+
+    Args:
+        rng (random.Random): Seeded random generator.
+        distribution (str): One of DISTRIBUTIONS.
+
+    Returns:
+        Callable[[], float]: Sampler of positive multipliers.
+
+    Raises:
+        ValueError: If the distribution is unknown.
+    """
+    if distribution == "lognormal":
+        return lambda: rng.lognormvariate(0.0, 0.35)
+    if distribution == "normal":
+        return lambda: max(0.2, rng.gauss(1.0, 0.25))
+    if distribution == "uniform":
+        return lambda: rng.uniform(0.5, 1.5)
+    if distribution == "pareto":
+        return lambda: 0.6 * rng.paretovariate(2.5)
+    raise ValueError(f"Unknown distribution {distribution!r}; use one of {DISTRIBUTIONS}.")
+
+
+def generate_employees(
+    count: int,
+    departments: int = 8,
+    distribution: str = "lognormal",
+    skew: float = 1.0,
+    seed: int = 0,
+    start: int = 0,
+    batch_size: int = 10000,
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    Generate employee rows in batches, ready for a bulk INSERT into the employees table.
+
+    Args:
+        count (int): Number of employees to generate.
+        departments (int): Number of departments; department k gets a share proportional to
+            1 / k**skew, so the first departments are much larger.
+        distribution (str): Salary distribution, one of DISTRIBUTIONS.
+        skew (float): Zipf exponent of the department sizes (0 for equal sizes).
+        seed (int): Random seed; equal arguments always produce equal rows.
+        start (int): Index of the first employee, used in emails so repeated runs with
+            different starts do not collide.
+        batch_size (int): Number of rows per yielded batch.
+
+    Yields:
+        list[dict]: Column dictionaries for up to batch_size employees.
+
+    Raises:
+        ValueError: If the distribution is unknown.
+    """
+    rng = random.Random(seed)
+    sample_salary = _salary_sampler(rng, distribution)
+    names = department_names(departments)
+    weights = [1 / (k + 1) ** skew for k in range(departments)]
+    # Smaller departments pay somewhat more on average
+    pay_scale = [0.85 + 0.3 * k / max(1, departments - 1) for k in range(departments)]
+
+    for batch_start in range(start, start + count, batch_size):
+        batch_end = min(batch_start + batch_size, start + count)
+        size = batch_end - batch_start
+        codes = rng.choices(range(departments), weights=weights, k=size)
+        firsts = rng.choices(FIRST_NAMES, k=size)
+        lasts = rng.choices(LAST_NAMES, k=size)
+        rows = [
+            {
+                "name": f"{first} {last}",
+                "email": f"{first.lower()}.{last.lower()}.{index}@example.com",
+                "department": names[code],
+                "salary": round(MEDIAN_SALARY * pay_scale[code] * sample_salary(), 2),
+                "date_joined": JOINED_FROM + timedelta(seconds=int(rng.random() * JOINED_SECONDS)),
+                "version": 1,
+            }
+            for index, code, first, last in zip(
+                range(batch_start, batch_end), codes, firsts, lasts, strict=True
+            )
+        ]
+        yield rows
@@ -3,12 +3,75 @@ This module provides error handler registration for the Flask application.
 It defines handlers for HTTP, database, validation, and general exceptions.
 """
 
-from flask import jsonify
+import json
+from functools import lru_cache
+
+from flask import Response, jsonify
 from pydantic import ValidationError
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from werkzeug.exceptions import HTTPException
 
-from app.exceptions import DuplicateEmailError, EmployeeNotFound
+from app.exceptions import EmployeeManagementError
+
+
+def encode(body: dict) -> bytes:
+    """
+    Encode an error body the way jsonify does outside debug mode.
+
+    Args:
+        body (dict): JSON-serializable response body.
+
+    Returns:
+        bytes: Compact JSON followed by a newline.
+    """
+    return json.dumps(body, separators=(",", ":")).encode() + b"\n"
+
+
+def error_response(body: bytes, status: int, headers: dict | None = None) -> Response:
+    """
+    Build a JSON response from an already encoded body.
+
+    Args:
+        body (bytes): Encoded JSON body.
+        status (int): HTTP status code.
+        headers (dict, optional): Extra response headers.
+
+    Returns:
+        Response: The response.
+    """
+    return Response(body, status=status, headers=headers, mimetype="application/json")
+
+
+def _subclasses(cls: type) -> list[type]:
+    return [cls, *(sub for child in cls.__subclasses__() for sub in _subclasses(child))]
+
+
+@lru_cache(maxsize=256)
+def _http_error_body(name: str, description: str, code: int) -> bytes:
+    return encode({"error": name, "message": description, "status_code": code})
+
+
+INTEGRITY_ERROR_BODY = encode(
+    {
+        "error": "Database integrity error",
+        "code": "integrity_error",
+        "message": "The request conflicts with existing data.",
+    }
+)
+DATABASE_ERROR_BODY = encode(
+    {
+        "error": "Database error",
+        "code": "database_error",
+        "message": "The request could not be completed.",
+    }
+)
+INTERNAL_ERROR_BODY = encode(
+    {
+        "error": "InternalServerError",
+        "message": "An unexpected error occurred.",
+        "status_code": 500,
+    }
+)
 
 
 def register_error_handlers(app):
@@ -21,6 +84,8 @@ def register_error_handlers(app):
     Returns:
         None
     """
+    # Bodies of errors raised with their default message, encoded once instead of per request
+    static_bodies = {cls: encode(cls().to_dict()) for cls in _subclasses(EmployeeManagementError)}
 
     @app.errorhandler(HTTPException)
     def handle_http_exception(e):
@@ -33,51 +98,54 @@ def register_error_handlers(app):
         Returns:
             Response: JSON response with error details and status code.
         """
-        response = {
-            "error": e.name,
-            "message": e.description,
-            "status_code": e.code,
-        }
-        return jsonify(response), e.code
+        return error_response(_http_error_body(e.name, e.description, e.code), e.code)
 
     @app.errorhandler(IntegrityError)
     def handle_integrity_error(e):
         """
         Handle database integrity errors (e.g., constraint violations).
 
+        The driver message names tables and constraints, so it is logged rather than returned.
+
         Args:
             e (IntegrityError): The exception instance.
 
         Returns:
-            Response: JSON response with error message and 409 status.
+            Response: Pre-encoded JSON error response with 409 status.
         """
-        return jsonify({"error": "Database integrity error", "message": str(e.orig)}), 409
+        app.logger.warning("Integrity error: %s", e.orig)
+        return error_response(INTEGRITY_ERROR_BODY, 409)
 
-    @app.errorhandler(EmployeeNotFound)
-    def handle_employee_not_found(e):
+    @app.errorhandler(SQLAlchemyError)
+    def handle_database_error(e):
         """
-        Handle EmployeeNotFound exceptions.
+        Handle other database errors (lost connections, timeouts, schema mismatches).
+
+        The driver message may reveal SQL, tables or hosts, so it is logged rather than
+        returned.
 
         Args:
-            e (EmployeeNotFound): The exception instance.
+            e (SQLAlchemyError): The exception instance.
 
         Returns:
-            Response: JSON response with error message and 404 status.
+            Response: Pre-encoded JSON error response with 500 status.
         """
-        return jsonify({"error": str(e)}), 404
+        app.logger.exception("Database error: %s", e)
+        return error_response(DATABASE_ERROR_BODY, 500)
 
-    @app.errorhandler(DuplicateEmailError)
-    def handle_duplicate_email(e):
+    @app.errorhandler(EmployeeManagementError)
+    def handle_application_error(e):
         """
-        Handle DuplicateEmailError exceptions.
+        Handle the application's own exceptions (not found, conflicts, rate limits, ...).
 
         Args:
-            e (DuplicateEmailError): The exception instance.
+            e (EmployeeManagementError): The exception instance.
 
         Returns:
-            Response: JSON response with error message and 409 status.
+            Response: JSON error response with the exception's status and headers.
         """
-        return jsonify({"error": str(e)}), 409  # 409 Conflict
+        body = static_bodies[type(e)] if e.is_static else encode(e.to_dict())
+        return error_response(body, e.status_code, e.headers)
 
     @app.errorhandler(ValidationError)
     def handle_pydantic_validation_error(error):
@@ -96,7 +164,7 @@ def register_error_handlers(app):
                 jsonify({"error": "Validation failed", "details": error_messages}),
                 400,
             )
-        except (TypeError, KeyError):
+        except (TypeError, KeyError, IndexError):
             # Fallback for non-standard validation errors
             return jsonify({"error": str(error)}), 400
 
@@ -105,15 +173,13 @@ def register_error_handlers(app):
         """
         Handle uncaught exceptions and return a generic error response.
 
+        The exception message may reveal internals, so it is logged rather than returned.
+
         Args:
             e (Exception): The exception instance.
 
         Returns:
-            Response: JSON response with error message and 500 status.
+            Response: Pre-encoded JSON error response with 500 status.
         """
-        response = {
-            "error": "InternalServerError",
-            "message": str(e),
-            "status_code": 500,
-        }
-        return jsonify(response), 500
+        app.logger.exception("Unhandled exception: %s", e)
+        return error_response(INTERNAL_ERROR_BODY, 500)
@@ -0,0 +1,235 @@
+"""
+This module provides an in-process fan-out of employee change events to live subscribers.
+It backs the server-sent events stream, giving each subscriber a bounded queue and dropping
+consumers that fall behind with a resume token instead of blocking writers. Events and
+subscriptions belong to a tenant, and subscribers only see their own tenant's events and
+the control events addressed to every subscriber.
+"""
+
+import json
+import queue
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class BroadcastEvent:
+    """
+    A single event delivered to subscribers.
+
+    Attributes:
+        id (int): Increasing event ID (e.g. the change log ID), used as the resume token.
+        type (str): Event type ("insert", "update", "delete", or a control event).
+        data (dict): JSON-serializable event payload.
+        tenant_id (str | None): Tenant the event belongs to (None for control events, which
+            every subscriber receives).
+    """
+
+    id: int
+    type: str
+    data: dict[str, Any]
+    tenant_id: str | None = None
+
+    def to_sse(self) -> str:
+        """
+        Encode the event in the text/event-stream wire format.
+
+        Returns:
+            str: The encoded event, terminated by a blank line.
+        """
+        return f"id: {self.id}\nevent: {self.type}\ndata: {json.dumps(self.data)}\n\n"
+
+
+class Subscription:
+    """
+    A subscriber's bounded view of the event stream.
+
+    Args:
+        maxsize (int): Maximum number of undelivered events before the subscriber is dropped.
+        tenant_id (str | None): Only receive this tenant's events (None for every tenant).
+    """
+
+    def __init__(self, maxsize: int, tenant_id: str | None = None):
+        self.tenant_id = tenant_id
+        self._queue: queue.Queue[BroadcastEvent] = queue.Queue(maxsize=maxsize)
+        self.last_event_id = 0
+        # Events up to this ID were delivered before the subscription resumed
+        self.resumed_after = 0
+        self.dropped = False
+
+    def offer(self, event: BroadcastEvent) -> bool:
+        """
+        Enqueue an event without blocking.
+
+        Args:
+            event (BroadcastEvent): Event to enqueue.
+
+        Returns:
+            bool: False if the queue is full and the subscriber should be dropped.
+        """
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            return False
+        return True
+
+    def receives(self, event: BroadcastEvent) -> bool:
+        """
+        Check whether an event belongs to this subscription's tenant and was not delivered
+        before it resumed.
+
+        Args:
+            event (BroadcastEvent): Published event.
+
+        Returns:
+            bool: True if the event should be delivered.
+        """
+        if event.id <= self.resumed_after:
+            return False
+        return event.tenant_id is None or self.tenant_id in (None, event.tenant_id)
+
+    def get(self, timeout: float | None = None) -> BroadcastEvent | None:
+        """
+        Wait for the next event.
+
+        Once a dropped subscriber has drained its queue, a final "dropped" control event
+        carrying the resume token is returned.
+
+        Args:
+            timeout (float, optional): Seconds to wait before returning None.
+
+        Returns:
+            BroadcastEvent | None: The next event, or None if the timeout elapsed.
+        """
+        try:
+            event = self._queue.get(timeout=0 if self.dropped else timeout)
+        except queue.Empty:
+            if self.dropped:
+                return BroadcastEvent(
+                    id=self.last_event_id,
+                    type="dropped",
+                    data={"resume": self.last_event_id},
+                )
+            return None
+        self.last_event_id = event.id
+        return event
+
+
+class EventBroadcaster:
+    """
+    Thread-safe publisher that fans events out to every live subscription.
+
+    A bounded history of recent events lets reconnecting subscribers resume from their
+    last seen event ID without missing anything.
+
+    Args:
+        history_size (int): Number of recent events kept for resumption.
+        sequence (int): ID of the last event published before this broadcaster existed;
+            resuming from an earlier one starts with a "reset" event.
+    """
+
+    def __init__(self, history_size: int = 1024, sequence: int = 0):
+        self._lock = threading.Lock()
+        self._subscribers: set[Subscription] = set()
+        self._history: deque[BroadcastEvent] = deque(maxlen=history_size)
+        self._sequence = sequence
+
+    def publish(
+        self,
+        event_type: str,
+        data: dict[str, Any],
+        tenant_id: str | None = None,
+        event_id: int | None = None,
+    ) -> BroadcastEvent:
+        """
+        Publish an event to the tenant's subscribers, dropping any whose queue is full.
+
+        Args:
+            event_type (str): Event type.
+            data (dict): JSON-serializable event payload.
+            tenant_id (str, optional): Tenant the event belongs to.
+            event_id (int, optional): Event ID, higher than the previous one's; defaults to
+                the next number in sequence.
+
+        Returns:
+            BroadcastEvent: The published event.
+        """
+        with self._lock:
+            self._sequence = self._sequence + 1 if event_id is None else event_id
+            event = BroadcastEvent(
+                id=self._sequence, type=event_type, data=data, tenant_id=tenant_id
+            )
+            self._history.append(event)
+            for subscription in list(self._subscribers):
+                if not subscription.receives(event):
+                    continue
+                if not subscription.offer(event):
+                    subscription.dropped = True
+                    self._subscribers.discard(subscription)
+        return event
+
+    def subscribe(
+        self, last_event_id: int | None = None, maxsize: int = 256, tenant_id: str | None = None
+    ) -> Subscription:
+        """
+        Register a new subscription, replaying events after last_event_id if given.
+
+        If the requested events are no longer in the history, the subscription starts with
+        a "reset" control event telling the client to resynchronize from the change feed.
+        A last_event_id beyond the latest event (e.g. one streamed by another process that
+        is further along) skips the events up to it.
+
+        Args:
+            last_event_id (int, optional): Resume token from a previous subscription.
+            maxsize (int): Maximum number of undelivered events before the subscriber is dropped.
+            tenant_id (str, optional): Only deliver this tenant's events.
+
+        Returns:
+            Subscription: The new subscription.
+        """
+        subscription = Subscription(maxsize, tenant_id)
+        with self._lock:
+            if last_event_id is not None:
+                subscription.last_event_id = last_event_id
+                subscription.resumed_after = last_event_id
+                oldest = self._history[0].id if self._history else self._sequence + 1
+                if last_event_id + 1 < oldest:
+                    subscription.offer(
+                        BroadcastEvent(
+                            id=self._sequence, type="reset", data={"resume": self._sequence}
+                        )
+                    )
+                else:
+                    for event in self._history:
+                        if not subscription.receives(event):
+                            continue
+                        if not subscription.offer(event):
+                            subscription.dropped = True
+                            return subscription
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Remove a subscription so it no longer receives events.
+
+        Args:
+            subscription (Subscription): Subscription to remove.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        """
+        Number of live subscriptions.
+
+        Returns:
+            int: Count of subscriptions currently receiving events.
+        """
+        return len(self._subscribers)
@@ -0,0 +1,260 @@
+"""
+This module implements the compact filter expression language accepted by the employee list
+endpoint, e.g. `department in (A, B) and date_joined >= 2024-01-01 and name ~ "ann"`.
+Expressions are parsed once, validated against the Employee columns, compiled to SQLAlchemy
+expressions and cached by their source string, so filtering runs in the database.
+
+Grammar (keywords are case-insensitive):
+
+    expr       := and_expr ("or" and_expr)*
+    and_expr   := not_expr ("and" not_expr)*
+    not_expr   := "not" not_expr | "(" expr ")" | comparison
+    comparison := field op value
+                | field ["not"] "in" "(" value ("," value)* ")"
+                | field "is" ["not"] "null"
+    op         := "=" | "!=" | "<" | "<=" | ">" | ">=" | "~" (contains) | "^=" (starts with)
+    value      := "quoted string" | 'quoted string' | number | YYYY-MM-DD[THH:MM[:SS]] | word
+
+"~" and "^=" are case-insensitive on every backend; the other operators compare with the
+column's collation.
+"""
+
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import Date, DateTime, Float, Integer, and_, not_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.exceptions import InvalidFilterError
+from app.models.employee import Employee
+
+MAX_FILTER_LENGTH = 1000
+# Deepest nesting of parentheses and "not" accepted, well below Python's recursion limit
+MAX_FILTER_DEPTH = 32
+
+# Bookkeeping columns that are not part of the public employee record (the department name
+# is the public form of department_id; version is public, as the ETag)
+HIDDEN_FIELDS = frozenset({"deleted_at", "tenant_id", "department_id"})
+FIELDS = [name for name in Employee.__table__.columns.keys() if name not in HIDDEN_FIELDS]
+
+TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<ws>\s+)
+    | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+    | (?P<date>\d{4}-\d{2}-\d{2}(?:T\d{2}:\d{2}(?::\d{2})?)?)
+    | (?P<number>-?\d+(?:\.\d+)?)
+    | (?P<op>!=|<=|>=|\^=|=|<|>|~)
+    | (?P<punct>[(),])
+    | (?P<word>[A-Za-z_][\w.@+\-]*)
+    """,
+    re.VERBOSE,
+)
+
+KEYWORDS = {"and", "or", "not", "in", "is", "null"}
+
+
+def _tokenize(text: str) -> list[tuple[str, Any, int]]:
+    """
+    Split a filter expression into (kind, value, position) tokens.
+
+    Args:
+        text (str): Filter expression.
+
+    Returns:
+        list[tuple[str, Any, int]]: Tokens followed by an ("end", None, len(text)) marker.
+
+    Raises:
+        InvalidFilterError: If the expression contains an unexpected character.
+    """
+    tokens = []
+    position = 0
+    while position < len(text):
+        match = TOKEN_PATTERN.match(text, position)
+        if match is None:
+            raise InvalidFilterError(f"Unexpected character {text[position]!r} at {position}.")
+        kind = match.lastgroup
+        value: Any = match.group()
+        if kind == "string":
+            value = re.sub(r"\\(.)", r"\1", value[1:-1])
+        elif kind == "word" and value.lower() in KEYWORDS:
+            kind, value = "keyword", value.lower()
+        if kind != "ws":
+            tokens.append((kind, value, position))
+        position = match.end()
+    tokens.append(("end", None, len(text)))
+    return tokens
+
+
+class _Parser:
+    """
+    Recursive-descent parser producing SQLAlchemy expressions over the Employee columns.
+
+    Args:
+        text (str): Filter expression.
+    """
+
+    def __init__(self, text: str):
+        self.tokens = _tokenize(text)
+        self.index = 0
+        self.depth = 0
+
+    def parse(self) -> ColumnElement:
+        """
+        Parse the whole expression.
+
+        Returns:
+            ColumnElement: The compiled boolean expression.
+
+        Raises:
+            InvalidFilterError: If the expression is malformed or references unknown fields.
+        """
+        expression = self._or()
+        kind, value, position = self._peek()
+        if kind != "end":
+            raise InvalidFilterError(f"Unexpected {value!r} at {position}.")
+        return expression
+
+    def _peek(self) -> tuple[str, Any, int]:
+        return self.tokens[self.index]
+
+    def _next(self) -> tuple[str, Any, int]:
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+
+    def _accept(self, kind: str, value: Any = None) -> bool:
+        token_kind, token_value, _ = self._peek()
+        if token_kind == kind and (value is None or token_value == value):
+            self.index += 1
+            return True
+        return False
+
+    def _expect(self, kind: str, value: Any = None) -> tuple[str, Any, int]:
+        token = self._next()
+        if token[0] != kind or (value is not None and token[1] != value):
+            found = "end of filter" if token[0] == "end" else repr(token[1])
+            raise InvalidFilterError(f"Expected {value or kind} but found {found} at {token[2]}.")
+        return token
+
+    def _or(self) -> ColumnElement:
+        clauses = [self._and()]
+        while self._accept("keyword", "or"):
+            clauses.append(self._and())
+        return clauses[0] if len(clauses) == 1 else or_(*clauses)
+
+    def _and(self) -> ColumnElement:
+        clauses = [self._not()]
+        while self._accept("keyword", "and"):
+            clauses.append(self._not())
+        return clauses[0] if len(clauses) == 1 else and_(*clauses)
+
+    def _not(self) -> ColumnElement:
+        if self._accept("keyword", "not"):
+            with self._nested():
+                return not_(self._not())
+        if self._accept("punct", "("):
+            with self._nested():
+                expression = self._or()
+            self._expect("punct", ")")
+            return expression
+        return self._comparison()
+
+    @contextmanager
+    def _nested(self) -> Iterator[None]:
+        _, _, position = self.tokens[self.index - 1]
+        if self.depth >= MAX_FILTER_DEPTH:
+            raise InvalidFilterError(
+                f"Filter is nested deeper than {MAX_FILTER_DEPTH} levels at {position}."
+            )
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self.depth -= 1
+
+    def _comparison(self) -> ColumnElement:
+        _, name, position = self._expect("word")
+        column = Employee.__table__.columns.get(name) if name not in HIDDEN_FIELDS else None
+        if column is None:
+            fields = ", ".join(FIELDS)
+            raise InvalidFilterError(f"Unknown field {name!r} at {position}; use one of {fields}.")
+        attribute = getattr(Employee, name)
+
+        if self._accept("keyword", "is"):
+            negate = self._accept("keyword", "not")
+            self._expect("keyword", "null")
+            return attribute.is_not(None) if negate else attribute.is_(None)
+
+        negate = self._accept("keyword", "not")
+        if negate or self._accept("keyword", "in"):
+            if negate:
+                self._expect("keyword", "in")
+            self._expect("punct", "(")
+            values = [self._value(column)]
+            while self._accept("punct", ","):
+                values.append(self._value(column))
+            self._expect("punct", ")")
+            return attribute.not_in(values) if negate else attribute.in_(values)
+
+        _, op, op_position = self._expect("op")
+        value = self._value(column)
+        if op in ("~", "^="):
+            if not isinstance(value, str):
+                raise InvalidFilterError(f"Operator {op!r} at {op_position} needs a text field.")
+            escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            pattern = f"%{escaped}%" if op == "~" else f"{escaped}%"
+            # ilike for both, as LIKE's case sensitivity differs between backends
+            return attribute.ilike(pattern, escape="\\")
+        return {
+            "=": attribute.__eq__,
+            "!=": attribute.__ne__,
+            "<": attribute.__lt__,
+            "<=": attribute.__le__,
+            ">": attribute.__gt__,
+            ">=": attribute.__ge__,
+        }[op](value)
+
+    def _value(self, column) -> Any:
+        kind, raw, position = self._next()
+        if kind not in ("string", "number", "date", "word"):
+            found = "end of filter" if kind == "end" else repr(raw)
+            raise InvalidFilterError(f"Expected a value but found {found} at {position}.")
+        try:
+            if isinstance(column.type, Integer):
+                return int(raw)
+            if isinstance(column.type, Float):
+                return float(raw)
+            if isinstance(column.type, DateTime):
+                return datetime.fromisoformat(raw)
+            if isinstance(column.type, Date):
+                return date.fromisoformat(raw)
+        except ValueError:
+            raise InvalidFilterError(
+                f"Invalid value {raw!r} for field {column.key!r} at {position}."
+            ) from None
+        return str(raw)
+
+
+@lru_cache(maxsize=512)
+def compile_filter(text: str) -> ColumnElement:
+    """
+    Parse, validate and compile a filter expression, caching the result by its source string.
+
+    The returned SQLAlchemy expression is immutable and safe to share between requests.
+
+    Args:
+        text (str): Filter expression.
+
+    Returns:
+        ColumnElement: Boolean expression to pass to `Query.filter`.
+
+    Raises:
+        InvalidFilterError: If the expression is malformed or references unknown fields.
+    """
+    if len(text) > MAX_FILTER_LENGTH:
+        raise InvalidFilterError(f"Filter is longer than {MAX_FILTER_LENGTH} characters.")
+    return _Parser(text).parse()
@@ -0,0 +1,465 @@
+"""
+This module provides the transports of the cache invalidation bus.
+A backend publishes invalidation messages (JSON-serializable dicts carrying the publishing
+node's ID) to every other node, and delivers the messages of the other nodes to a callback on
+a daemon thread. Delivery is best effort: a backend that may have missed messages delivers a
+{"kind": "reset"} message, after which nodes drop everything they cached.
+"""
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any, Protocol
+
+from app.utils.change_cursor import ChangeCursor
+
+logger = logging.getLogger("app.invalidation")
+
+Deliver = Callable[[dict[str, Any]], None]
+
+# Message delivered when a backend may have missed messages
+RESET = {"node": None, "kind": "reset"}
+
+# Seconds a Unix socket node that missed a message is given to make room for the reset
+RESET_TIMEOUT_SECONDS = 60.0
+
+
+class BusBackend(Protocol):
+    """Transport of invalidation messages between nodes."""
+
+    name: str
+
+    def publish(self, message: dict[str, Any]) -> None:
+        """
+        Send a message to every other node.
+
+        Args:
+            message (dict): The message, with the publishing node's ID under "node".
+
+        Raises:
+            Exception: If the message could not be sent.
+        """
+
+    def listen(self, node: str, deliver: Deliver) -> None:
+        """
+        Start delivering messages to a callback on a daemon thread, replacing the previous
+        listener, e.g. the one inherited from the parent of a forked worker.
+
+        Args:
+            node (str): ID of the listening node.
+            deliver (Callable): Called with each received message.
+        """
+
+    def close(self) -> None:
+        """
+        Stop listening and release the backend's resources.
+        """
+
+
+class LocalBackend:
+    """Backend of a single-process deployment: there are no other nodes to notify."""
+
+    name = "local"
+
+    def publish(self, message: dict[str, Any]) -> None:
+        """
+        Drop a message.
+
+        Args:
+            message (dict): The message.
+        """
+
+    def listen(self, node: str, deliver: Deliver) -> None:
+        """
+        Do nothing, as no message ever arrives.
+
+        Args:
+            node (str): ID of the listening node.
+            deliver (Callable): Called with each received message.
+        """
+
+    def close(self) -> None:
+        """
+        Do nothing.
+        """
+
+
+class UnixSocketBackend:
+    """
+    Backend exchanging datagrams between the processes of one host through Unix sockets, e.g.
+    the workers of a gunicorn server, or containers sharing a volume.
+
+    Each listening node binds `<directory>/<node>.sock`; a publisher sends each message to
+    every socket in the directory, and removes those nobody listens on anymore. Sends never
+    block: a node whose receive buffer is full misses the message, and is sent a reset from a
+    background thread as soon as it has room again.
+
+    Args:
+        directory (str): Directory shared by the nodes.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.name = f"unix://{directory}"
+        os.makedirs(directory, exist_ok=True)
+        self._sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        # A node whose receive buffer is full misses the message instead of blocking writes
+        self._sender.setblocking(False)
+        self._receiver: socket.socket | None = None
+        self._path: str | None = None
+        self._lock = threading.Lock()  # guards _dropped
+        # Messages dropped per socket since the reset on its way to it was last sent
+        self._dropped: dict[str, int] = {}
+
+    def publish(self, message: dict[str, Any]) -> None:
+        """
+        Send a message to every other socket in the directory.
+
+        Args:
+            message (dict): The message.
+        """
+        data = json.dumps(message).encode()
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".sock") or entry.path == self._path:
+                continue
+            try:
+                self._sender.sendto(data, entry.path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Left behind by a node that exited without closing
+                try:
+                    os.unlink(entry.path)
+                except FileNotFoundError:
+                    pass
+            except BlockingIOError:
+                logger.warning("Invalidation dropped: %s is not keeping up", entry.path)
+                self._reset_later(entry.path)
+
+    def _reset_later(self, path: str) -> None:
+        """
+        Send a reset to a node that missed a message, once its receive buffer has room, so it
+        drops the cached results the message would have invalidated.
+
+        Args:
+            path (str): The node's socket.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            dropped = self._dropped.get(path, 0)
+            self._dropped[path] = dropped + 1
+            if dropped:
+                return  # the reset on its way is sent again if needed
+
+        def send() -> None:
+            sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            sender.settimeout(RESET_TIMEOUT_SECONDS)
+            try:
+                while True:
+                    with self._lock:
+                        dropped = self._dropped.get(path)
+                    sender.sendto(json.dumps(RESET).encode(), path)
+                    with self._lock:
+                        if self._dropped.get(path) == dropped:
+                            # No message was dropped after the reset went out
+                            self._dropped.pop(path, None)
+                            return
+            except OSError as e:
+                if not isinstance(e, (ConnectionRefusedError, FileNotFoundError)):
+                    logger.error("Invalidation reset dropped: %s is not receiving", path)
+                # Otherwise the node exited, and its successor starts with empty caches
+                with self._lock:
+                    self._dropped.pop(path, None)
+            finally:
+                sender.close()
+
+        threading.Thread(target=send, name="invalidation-reset", daemon=True).start()
+
+    def listen(self, node: str, deliver: Deliver) -> None:
+        """
+        Bind this node's socket and deliver the datagrams it receives.
+
+        Args:
+            node (str): ID of the listening node.
+            deliver (Callable): Called with each received message.
+        """
+        if self._receiver is not None:
+            # Inherited from the parent process, whose socket file stays in place
+            self._receiver.close()
+        self._sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sender.setblocking(False)
+        # Resets in flight belong to the parent's threads, which do not survive fork()
+        self._lock = threading.Lock()
+        self._dropped = {}
+        self._path = os.path.join(self.directory, f"{node}.sock")
+        receiver = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        receiver.bind(self._path)
+        self._receiver = receiver
+
+        def receive() -> None:
+            while True:
+                try:
+                    data = receiver.recv(65536)
+                except OSError:
+                    return  # closed
+                deliver(json.loads(data))
+
+        threading.Thread(target=receive, name="invalidation-bus", daemon=True).start()
+
+    def close(self) -> None:
+        """
+        Close this node's socket and remove its file.
+        """
+        if self._receiver is not None:
+            self._receiver.close()
+            self._receiver = None
+        if self._path is not None:
+            try:
+                os.unlink(self._path)
+            except FileNotFoundError:
+                pass
+            self._path = None
+
+
+class DatabaseBackend:
+    """
+    Backend exchanging messages through the cache_invalidations table of the default database,
+    which every node polls. Needs nothing but the database the nodes already share.
+
+    Messages become visible in commit order rather than ID order, so the poll cursor waits
+    for missing IDs (see ChangeCursor) and delivers a reset if one is given up on.
+
+    Args:
+        app (Flask): The application, whose default database holds the table.
+        poll_seconds (float): Interval between polls.
+        retention_seconds (float): Age after which messages are pruned.
+        grace_seconds (float): Time a missing message ID is waited for.
+    """
+
+    name = "db"
+
+    def __init__(
+        self,
+        app,
+        poll_seconds: float = 0.5,
+        retention_seconds: float = 3600,
+        grace_seconds: float = 60,
+    ):
+        from app.extensions import db
+        from app.models.cache_invalidation import CacheInvalidation
+
+        with app.app_context():
+            self._engine = db.engines[None]
+        self._table = CacheInvalidation.__table__
+        self.poll_seconds = poll_seconds
+        self.retention_seconds = retention_seconds
+        self.grace_seconds = grace_seconds
+        self._cursor = ChangeCursor(grace_seconds=grace_seconds)
+        self._listener = 0  # incremented to stop the previous polling thread
+        self._last_prune = 0.0
+
+    def publish(self, message: dict[str, Any]) -> None:
+        """
+        Append a message to the table.
+
+        Args:
+            message (dict): The message.
+        """
+        with self._engine.begin() as connection:
+            connection.execute(
+                self._table.insert().values(
+                    node=message["node"], message=message, created_at=datetime.utcnow()
+                )
+            )
+
+    def listen(self, node: str, deliver: Deliver) -> None:
+        """
+        Start polling for the messages published from now on.
+
+        Messages still in flight when polling starts are not waited for: they follow writes
+        that were already committed, which this node reads fresh.
+
+        Args:
+            node (str): ID of the listening node.
+            deliver (Callable): Called with each received message.
+        """
+        from sqlalchemy import func, select
+
+        try:
+            with self._engine.connect() as connection:
+                position = connection.scalar(select(func.max(self._table.c.id))) or 0
+        except Exception:
+            # E.g. the table is not created yet: start polling anyway, and reset once it works
+            logger.exception("Reading the cache invalidation cursor failed")
+            position = 0
+        self._cursor = ChangeCursor(position, self.grace_seconds)
+        self._listener += 1
+        listener = self._listener
+
+        def poll_forever() -> None:
+            failed = False
+            while True:
+                time.sleep(self.poll_seconds)
+                if listener != self._listener:
+                    return  # closed, or replaced by a newer listener
+                try:
+                    self.poll(node, deliver)
+                    if failed:
+                        # Messages may have been pruned while the database was unreachable
+                        deliver(RESET)
+                    failed = False
+                except Exception:
+                    if not failed:
+                        logger.exception("Polling cache invalidations failed")
+                    failed = True
+
+        threading.Thread(target=poll_forever, name="invalidation-bus", daemon=True).start()
+
+    def poll(self, node: str, deliver: Deliver) -> int:
+        """
+        Deliver the messages of the other nodes that became visible since the last poll, and
+        prune old messages now and then. Delivers a reset if a missing message is given up on.
+
+        Args:
+            node (str): ID of the listening node.
+            deliver (Callable): Called with each received message.
+
+        Returns:
+            int: Number of messages delivered.
+        """
+        from sqlalchemy import delete, select
+
+        cursor = self._cursor
+        with self._engine.connect() as connection:
+            rows = connection.execute(
+                select(self._table.c.id, self._table.c.node, self._table.c.message)
+                .where(self._table.c.id > cursor.position)
+                .order_by(self._table.c.id)
+            ).all()
+            if time.monotonic() - self._last_prune > 60:
+                cutoff = datetime.utcnow() - timedelta(seconds=self.retention_seconds)
+                connection.execute(delete(self._table).where(self._table.c.created_at < cutoff))
+                connection.commit()
+                self._last_prune = time.monotonic()
+        delivered = 0
+        for id_, publisher, message in rows:
+            if publisher != node and id_ not in cursor:
+                deliver(message)
+                delivered += 1
+        if cursor.advance(id_ for id_, _, _ in rows):
+            deliver(RESET)
+            delivered += 1
+        return delivered
+
+    def close(self) -> None:
+        """
+        Stop polling.
+        """
+        self._listener += 1
+
+
+class RedisBackend:
+    """
+    Backend using Redis pub/sub, for deployments that already run Redis. Requires
+    `pip install -r requirements-bus.txt`.
+
+    Args:
+        url (str): Redis URL, e.g. redis://redis:6379/0.
+        channel (str): Pub/sub channel.
+    """
+
+    def __init__(self, url: str, channel: str = "employee-management:invalidations"):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError(
+                "The redis invalidation bus requires the redis package "
+                "(pip install -r requirements-bus.txt)."
+            ) from None
+        self._redis = redis
+        self.url = url
+        self.channel = channel
+        self.name = url
+        self._client = redis.Redis.from_url(url)
+        self._listener = 0
+
+    def publish(self, message: dict[str, Any]) -> None:
+        """
+        Publish a message on the channel.
+
+        Args:
+            message (dict): The message.
+        """
+        self._client.publish(self.channel, json.dumps(message))
+
+    def listen(self, node: str, deliver: Deliver) -> None:
+        """
+        Subscribe to the channel, resubscribing after connection failures.
+
+        Args:
+            node (str): ID of the listening node.
+            deliver (Callable): Called with each received message.
+        """
+        # A forked worker must not share the parent's connections
+        self._client = self._redis.Redis.from_url(self.url)
+        self._listener += 1
+        listener = self._listener
+
+        def subscribe_forever() -> None:
+            while listener == self._listener:
+                try:
+                    pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+                    pubsub.subscribe(self.channel)
+                    for item in pubsub.listen():
+                        if listener != self._listener:
+                            return
+                        deliver(json.loads(item["data"]))
+                except self._redis.RedisError:
+                    logger.exception("Cache invalidation subscription failed; resubscribing")
+                    time.sleep(1)
+                    deliver(RESET)  # messages published meanwhile were lost
+
+        threading.Thread(target=subscribe_forever, name="invalidation-bus", daemon=True).start()
+
+    def close(self) -> None:
+        """
+        Stop listening.
+        """
+        self._listener += 1
+
+
+def create_backend(uri: str, app) -> BusBackend:
+    """
+    Build a backend from its URI.
+
+    Args:
+        uri (str): "local:", "unix:///path/to/directory", "db:" or a redis:// URL.
+        app (Flask): The application, for the settings of the database backend.
+
+    Returns:
+        BusBackend: The backend.
+
+    Raises:
+        ValueError: If the URI scheme is not supported.
+    """
+    if uri in ("", "local:"):
+        return LocalBackend()
+    if uri.startswith("unix://"):
+        return UnixSocketBackend(uri.removeprefix("unix://"))
+    if uri == "db:":
+        return DatabaseBackend(
+            app,
+            poll_seconds=app.config.get("INVALIDATION_POLL_SECONDS", 0.5),
+            retention_seconds=app.config.get("INVALIDATION_RETENTION_SECONDS", 3600),
+            grace_seconds=app.config.get("CHANGE_CURSOR_GRACE_SECONDS", 60),
+        )
+    if uri.startswith(("redis://", "rediss://")):
+        return RedisBackend(uri)
+    raise ValueError(
+        f"Unsupported invalidation bus {uri!r}; use local:, unix://, db: or redis://."
+    )
@@ -0,0 +1,172 @@
+"""
+This module provides the cache invalidation bus, which keeps the in-process caches of several
+application nodes (processes, containers or hosts sharing a database) coherent.
+Writes publish what they invalidated, and every other node applies it to its own caches, so
+reads keep being served from memory on every node. Each process is one node; a process forked
+from a listening one (e.g. a gunicorn worker of a preloaded application) calls `after_fork`
+to become a new node and listen on its own.
+"""
+
+import logging
+import os
+import threading
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+from app.utils.invalidation_backends import BusBackend, LocalBackend, create_backend
+
+logger = logging.getLogger("app.invalidation")
+
+Handler = Callable[[dict[str, Any]], None]
+
+
+class InvalidationBus:
+    """
+    Publishes invalidation messages to the other nodes and dispatches theirs to the handlers
+    subscribed to the message kind.
+
+    Messages are dicts with the publishing node's ID under "node", the message kind under
+    "kind", and kind-specific fields. A "reset" message means invalidations may have been
+    lost: subscribers should drop everything they cached.
+
+    Args:
+        backend (BusBackend, optional): Transport; defaults to the single-node LocalBackend.
+    """
+
+    def __init__(self, backend: BusBackend | None = None):
+        self.backend: BusBackend = backend if backend is not None else LocalBackend()
+        self.node = _node_id()
+        self._handlers: dict[str, list[Handler]] = {}
+        self._listening = False
+        self._lock = threading.Lock()
+        self._published = 0
+        self._received = 0
+        self._failed = 0
+
+    def init_app(self, app) -> None:
+        """
+        Configure the backend from the application config.
+
+        Args:
+            app (Flask): The Flask application instance.
+
+        Returns:
+            None
+        """
+        self.backend.close()
+        self.backend = create_backend(app.config.get("INVALIDATION_BUS", "local:"), app)
+        self._listening = False
+
+    def subscribe(self, kind: str, handler: Handler) -> None:
+        """
+        Call a handler with every message of a kind received from another node.
+
+        Handlers run on the backend's receiving thread and must be thread-safe.
+
+        Args:
+            kind (str): Message kind.
+            handler (Callable): Called with the message.
+
+        Returns:
+            None
+        """
+        self._handlers.setdefault(kind, []).append(handler)
+
+    def publish(self, kind: str, **fields: Any) -> None:
+        """
+        Send a message to the other nodes.
+
+        Never raises: the write that caused the message has already committed, so a failure
+        is logged and counted, and the other nodes serve their cached results until their
+        next invalidation.
+
+        Args:
+            kind (str): Message kind.
+            **fields: JSON-serializable message fields.
+
+        Returns:
+            None
+        """
+        try:
+            self.backend.publish({"node": self.node, "kind": kind, **fields})
+        except Exception:
+            logger.exception("Publishing a %s invalidation failed", kind)
+            with self._lock:
+                self._failed += 1
+            return
+        with self._lock:
+            self._published += 1
+
+    def listen(self) -> None:
+        """
+        Start receiving the messages of the other nodes.
+
+        Returns:
+            None
+        """
+        self._listening = True
+        self.backend.listen(self.node, self._deliver)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Report bus statistics.
+
+        Returns:
+            dict: Backend name, node ID and message counts.
+        """
+        with self._lock:
+            return {
+                "backend": self.backend.name,
+                "node": self.node,
+                "published": self._published,
+                "received": self._received,
+                "failed": self._failed,
+            }
+
+    def after_fork(self) -> None:
+        """
+        Become a new node in a forked child, listening again if the parent was, since the
+        receiving thread does not survive fork(). Call it once the child's database connection
+        pools have been reset.
+
+        Returns:
+            None
+        """
+        self.node = _node_id()
+        if self._listening:
+            self.listen()
+
+    def _deliver(self, message: dict[str, Any]) -> None:
+        """
+        Dispatch a received message to the handlers of its kind, skipping this node's own.
+
+        Args:
+            message (dict): The message.
+
+        Returns:
+            None
+        """
+        if message.get("node") == self.node:
+            return
+        with self._lock:
+            self._received += 1
+        for handler in self._handlers.get(message.get("kind"), ()):
+            try:
+                handler(message)
+            except Exception:
+                logger.exception("Applying a %s invalidation failed", message.get("kind"))
+
+
+def _node_id() -> str:
+    """
+    Generate an ID for the current process.
+
+    Returns:
+        str: Process ID and a random suffix, unique across hosts.
+    """
+    return f"{os.getpid()}-{uuid.uuid4().hex[:12]}"
+
+
+# Instantiate the bus for dependency injection
+invalidation_bus = InvalidationBus()
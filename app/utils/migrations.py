@@ -0,0 +1,273 @@
+"""
+This module holds schema changes for databases created by an earlier `flask init-db`.
+`db.create_all()` creates missing tables but never alters existing ones; the functions here add
+what later versions need and are safe to run repeatedly. `migrate_database` applies them all.
+"""
+
+from sqlalchemy import MetaData, Table, inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+from app.models.department import Department
+from app.models.employee import Employee
+from app.models.employee_archive import EmployeeArchive
+from app.models.employee_change import EmployeeChange
+from app.models.job import Job
+from app.utils.tenant import TENANT_ID_PATTERN
+
+
+def migrate_database(engine: Engine, tenant_id: str) -> list[str]:
+    """
+    Apply every schema change to a database whose tables exist. The tenant step comes last,
+    as on SQLite it rebuilds the employees table with every model column.
+
+    Args:
+        engine (Engine): Database to migrate.
+        tenant_id (str): Tenant the existing rows are assigned to, if they have none yet (the
+            default tenant for the shared database, or the owner of a dedicated one).
+
+    Returns:
+        list[str]: Names of the steps that changed the schema.
+    """
+    steps = {
+        "add_employee_soft_delete": lambda: add_employee_soft_delete(engine),
+        "add_employee_version": lambda: add_employee_version(engine),
+        "add_employee_department_key": lambda: add_employee_department_key(engine),
+        "add_job_checkpoint": lambda: add_job_checkpoint(engine),
+        "add_employee_tenant": lambda: add_employee_tenant(engine, tenant_id),
+    }
+    applied = [name for name, step in steps.items() if step()]
+    for table in (Employee.__table__, EmployeeChange.__table__, EmployeeArchive.__table__):
+        create_missing_indexes(engine, table)
+    return applied
+
+
+def add_employee_soft_delete(engine: Engine) -> bool:
+    """
+    Add employees.deleted_at; existing employees are not deleted.
+
+    Args:
+        engine (Engine): Database to migrate.
+
+    Returns:
+        bool: True if the column was added, False if it already existed.
+    """
+    return _add_column(engine, Employee.__table__, "deleted_at")
+
+
+def add_employee_version(engine: Engine) -> bool:
+    """
+    Add employees.version, starting every existing employee at version 1.
+
+    Args:
+        engine (Engine): Database to migrate.
+
+    Returns:
+        bool: True if the column was added, False if it already existed.
+    """
+    return _add_column(engine, Employee.__table__, "version", "NOT NULL DEFAULT 1")
+
+
+def add_job_checkpoint(engine: Engine) -> bool:
+    """
+    Add jobs.checkpoint; jobs already running restart from the beginning.
+
+    Args:
+        engine (Engine): Database to migrate.
+
+    Returns:
+        bool: True if the column was added, False if it already existed.
+    """
+    return _add_column(engine, Job.__table__, "checkpoint")
+
+
+def add_employee_tenant(engine: Engine, tenant_id: str) -> bool:
+    """
+    Add tenant_id to the employees, employee_changes and employees_archive tables, assigning
+    the existing rows to a tenant, and make employee emails unique per tenant rather than
+    across the database.
+
+    Args:
+        engine (Engine): Database to migrate.
+        tenant_id (str): Tenant the existing rows belong to.
+
+    Returns:
+        bool: True if a column was added, False if every table already had one.
+
+    Raises:
+        ValueError: If the tenant ID is malformed.
+    """
+    if not TENANT_ID_PATTERN.match(tenant_id):
+        raise ValueError(f"Invalid tenant ID {tenant_id!r}.")
+    backfill = f"NOT NULL DEFAULT '{tenant_id}'"
+    added = False
+    for table in (EmployeeChange.__table__, EmployeeArchive.__table__):
+        added |= _add_column(engine, table, "tenant_id", backfill)
+    if "tenant_id" in _column_names(engine, "employees"):
+        return added
+    if engine.dialect.name == "sqlite":
+        # SQLite cannot drop the inline UNIQUE (email) constraint of an existing table
+        _rebuild_sqlite_table(engine, Employee.__table__, {"tenant_id": tenant_id})
+        return True
+    with engine.begin() as connection:
+        connection.execute(
+            text(f"ALTER TABLE employees ADD COLUMN tenant_id VARCHAR(64) {backfill}")
+        )
+        _drop_email_unique(connection)
+        connection.execute(
+            text(
+                "ALTER TABLE employees ADD CONSTRAINT uq_employees_tenant_email "
+                "UNIQUE (tenant_id, email)"
+            )
+        )
+    return True
+
+
+def add_employee_department_key(engine: Engine) -> bool:
+    """
+    Create the departments table and add employees.department_id, with its foreign key and
+    index, to an existing employees table.
+
+    Args:
+        engine (Engine): Database to migrate.
+
+    Returns:
+        bool: True if the column was added, False if it already existed.
+    """
+    Department.__table__.create(engine, checkfirst=True)
+    if "department_id" in _column_names(engine, "employees"):
+        return False
+    with engine.begin() as connection:
+        if engine.dialect.name == "sqlite":
+            # SQLite cannot add constraints to an existing table, only inline references
+            connection.execute(
+                text(
+                    "ALTER TABLE employees ADD COLUMN department_id INTEGER "
+                    "REFERENCES departments (id)"
+                )
+            )
+        else:
+            connection.execute(text("ALTER TABLE employees ADD COLUMN department_id INTEGER NULL"))
+            connection.execute(
+                text(
+                    "ALTER TABLE employees ADD CONSTRAINT fk_employees_department_id "
+                    "FOREIGN KEY (department_id) REFERENCES departments (id)"
+                )
+            )
+    create_missing_indexes(engine, Employee.__table__)
+    return True
+
+
+def create_missing_indexes(engine: Engine, table: Table) -> None:
+    """
+    Create the indexes a model declares on an existing table, skipping those over columns a
+    later step adds.
+
+    Args:
+        engine (Engine): Database to migrate.
+        table (Table): Model table.
+
+    Returns:
+        None
+    """
+    columns = _column_names(engine, table.name)
+    for index in table.indexes:
+        if all(column.name in columns for column in index.columns):
+            index.create(engine, checkfirst=True)
+
+
+def _column_names(engine: Engine, table_name: str) -> set[str]:
+    """
+    Read the column names of an existing table.
+
+    Args:
+        engine (Engine): Database to inspect.
+        table_name (str): Table name.
+
+    Returns:
+        set[str]: The table's column names.
+    """
+    return {column["name"] for column in inspect(engine).get_columns(table_name)}
+
+
+def _add_column(engine: Engine, table: Table, name: str, definition: str = "") -> bool:
+    """
+    Add a model column to an existing table, unless it is already there.
+
+    Args:
+        engine (Engine): Database to migrate.
+        table (Table): Model table declaring the column.
+        name (str): Column name.
+        definition (str): DDL following the column type, e.g. "NOT NULL DEFAULT 1".
+
+    Returns:
+        bool: True if the column was added, False if it already existed.
+    """
+    if name in _column_names(engine, table.name):
+        return False
+    column_type = table.c[name].type.compile(dialect=engine.dialect)
+    with engine.begin() as connection:
+        connection.execute(
+            text(f"ALTER TABLE {table.name} ADD COLUMN {name} {column_type} {definition}".rstrip())
+        )
+    return True
+
+
+def _drop_email_unique(connection: Connection) -> None:
+    """
+    Drop the unique constraint (or unique index) on employees.email alone.
+
+    Args:
+        connection (Connection): Connection in the migrating transaction.
+
+    Returns:
+        None
+    """
+    inspector = inspect(connection)
+    mysql = connection.dialect.name == "mysql"
+    for constraint in inspector.get_unique_constraints("employees"):
+        if constraint["column_names"] == ["email"]:
+            # MySQL implements unique constraints as unique indexes
+            statement = (
+                "DROP INDEX {} ON employees"
+                if mysql
+                else "ALTER TABLE employees DROP CONSTRAINT {}"
+            )
+            connection.execute(text(statement.format(constraint["name"])))
+            return
+    for index in inspector.get_indexes("employees"):
+        if index["unique"] and index["column_names"] == ["email"]:
+            statement = "DROP INDEX {} ON employees" if mysql else "DROP INDEX {}"
+            connection.execute(text(statement.format(index["name"])))
+            return
+
+
+def _rebuild_sqlite_table(engine: Engine, table: Table, defaults: dict[str, str]) -> None:
+    """
+    Recreate a SQLite table with the model's columns and constraints, copying its rows.
+
+    Indexes are left to `create_missing_indexes`.
+
+    Args:
+        engine (Engine): SQLite database to migrate.
+        table (Table): Model table.
+        defaults (dict[str, str]): Values of the columns the existing table lacks.
+
+    Returns:
+        None
+    """
+    metadata = MetaData()
+    for foreign_key in table.foreign_keys:
+        foreign_key.column.table.to_metadata(metadata)
+    rebuilt = table.to_metadata(metadata, name=f"{table.name}_rebuilt")
+    rebuilt.indexes.clear()
+    copied = [name for name in _column_names(engine, table.name) if name in table.c]
+    columns = ", ".join([*copied, *defaults])
+    values = ", ".join([*copied, *(f":{name}" for name in defaults)])
+    with engine.begin() as connection:
+        rebuilt.create(connection)
+        connection.execute(
+            text(f"INSERT INTO {rebuilt.name} ({columns}) SELECT {values} FROM {table.name}"),
+            defaults,
+        )
+        connection.execute(text(f"DROP TABLE {table.name}"))
+        connection.execute(text(f"ALTER TABLE {rebuilt.name} RENAME TO {table.name}"))
@@ -0,0 +1,232 @@
+"""
+This module provides the OpenAPI specification extension used to validate and document the API.
+It extends FlaskPydanticSpec so that the OpenAPI document is built lazily, encoded once per
+process, and optionally loaded from a file precomputed at build time, and so that validated
+endpoints are traced. Its backend validates request bodies straight from the JSON bytes and
+reuses the query models of repeated query strings.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from flask import Blueprint, Flask, Response
+from flask import Request as FlaskRequest
+from flask_pydantic_spec import FlaskPydanticSpec
+from flask_pydantic_spec.flask_backend import Context, FlaskBackend
+from flask_pydantic_spec.page import PAGES
+from flask_pydantic_spec.types import RequestBase
+from flask_pydantic_spec.utils import parse_multi_dict
+from pydantic import BaseModel
+
+from app.utils.tracing import traced_function
+
+
+class FastFlaskBackend(FlaskBackend):
+    """
+    FlaskBackend with a fast path for the common request shapes.
+
+    - JSON bodies are validated from the raw bytes with `model_validate_json`, skipping the
+      intermediate dict of `request.get_json()`.
+    - Query models that set `cache_by_query_string` are validated once per distinct query
+      string and then reused from an LRU cache; cached models are shared between requests and
+      must be treated as read-only.
+
+    Other requests (header or cookie models, gzip, form or non-JSON bodies) are validated as
+    FlaskBackend does.
+
+    Args:
+        spec (FlaskPydanticSpec): The spec the backend belongs to.
+        query_cache_size (int): Maximum number of cached query models (0 disables the cache).
+    """
+
+    def __init__(self, spec: FlaskPydanticSpec, query_cache_size: int = 1024):
+        super().__init__(spec)
+        self.query_cache_size = query_cache_size
+        self._lock = threading.Lock()
+        self._query_models: OrderedDict[tuple[type, bytes], BaseModel] = OrderedDict()
+
+    def request_validation(
+        self,
+        request: FlaskRequest,
+        query: type | None,
+        body: RequestBase | None,
+        headers: type | None,
+        cookies: type | None,
+    ) -> None:
+        """
+        Validate the query string and body of a request into `request.context`.
+
+        Raises:
+            ValidationError: If the query string or the body is invalid.
+        """
+        body_model = getattr(body, "model", None) if body else None
+        if (
+            headers is not None
+            or cookies is not None
+            or not _is_v2_model(query)
+            or not _is_v2_model(body_model)
+            or (body_model is not None and not _is_plain_json(request))
+        ):
+            return super().request_validation(request, query, body, headers, cookies)
+        request.context = Context(  # type: ignore[attr-defined]
+            query=self._load_query(request, query) if query is not None else None,
+            body=(
+                body_model.model_validate_json(request.get_data() or b"{}")
+                if body_model is not None
+                else None
+            ),
+            headers=None,
+            cookies=None,
+        )
+
+    def clear(self) -> None:
+        """
+        Empty the query model cache.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._query_models.clear()
+
+    def _load_query(self, request: FlaskRequest, model: type[BaseModel]) -> BaseModel:
+        """
+        Validate the query string of a request, reusing the model of an identical one.
+
+        Args:
+            request (Request): The current request.
+            model (type[BaseModel]): Query model.
+
+        Returns:
+            BaseModel: The validated query model.
+        """
+        if not getattr(model, "cache_by_query_string", False) or self.query_cache_size <= 0:
+            return model.model_validate(parse_multi_dict(request.args))
+        key = (model, request.query_string)
+        with self._lock:
+            cached = self._query_models.get(key)
+            if cached is not None:
+                self._query_models.move_to_end(key)
+                return cached
+        validated = model.model_validate(parse_multi_dict(request.args))
+        with self._lock:
+            self._query_models[key] = validated
+            while len(self._query_models) > self.query_cache_size:
+                self._query_models.popitem(last=False)
+        return validated
+
+
+def _is_v2_model(model: type | None) -> bool:
+    """
+    Tell whether a request model is absent or a Pydantic v2 model.
+    """
+    return model is None or (isinstance(model, type) and issubclass(model, BaseModel))
+
+
+def _is_plain_json(request: FlaskRequest) -> bool:
+    """
+    Tell whether a request body is uncompressed JSON.
+    """
+    content_type = request.content_type or ""
+    return "application/json" in content_type and "gzip" not in (request.content_encoding or "")
+
+
+class CachedFlaskPydanticSpec(FlaskPydanticSpec):
+    """
+    FlaskPydanticSpec that serves the OpenAPI document from a per-process byte cache.
+
+    The document is generated on first request rather than at startup, encoded once, and can
+    be loaded from a file precomputed at build time (see `flask openapi-export`) so workers
+    never generate it at all.
+
+    Attributes:
+        spec_file (str | None): Path of a precomputed OpenAPI JSON document, if any.
+    """
+
+    spec_file: str | None = None
+    _encoded: bytes | None = None
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        kwargs.setdefault("backend", FastFlaskBackend)
+        super().__init__(*args, **kwargs)
+
+    def register(self, app: Flask | Blueprint) -> None:
+        """
+        Register the documentation routes, and size the query model cache from the
+        application config (QUERY_MODEL_CACHE_SIZE).
+
+        Args:
+            app (Flask | Blueprint): Target to register the routes on.
+
+        Returns:
+            None
+        """
+        if isinstance(app, Flask) and isinstance(self.backend, FastFlaskBackend):
+            self.backend.query_cache_size = app.config.get(
+                "QUERY_MODEL_CACHE_SIZE", self.backend.query_cache_size
+            )
+            self.backend.clear()
+        super().register(app)
+
+    def validate(self, *args: Any, **kwargs: Any) -> Callable:
+        """
+        Validate requests and responses of an endpoint, as FlaskPydanticSpec.validate, and
+        trace it: the endpoint function is a "controller" span inside a "validate" span that
+        covers request validation, response validation and encoding.
+
+        Returns:
+            Callable: The decorator.
+        """
+        decorate = super().validate(*args, **kwargs)
+
+        def decorate_traced(func: Callable) -> Callable:
+            # wraps() carries over the attributes the spec registers routes by
+            return traced_function("validate", decorate(traced_function("controller", func)))
+
+        return decorate_traced
+
+    def register_spec_routes(self, app_or_blueprint: Flask | Blueprint) -> None:
+        """
+        Register the OpenAPI JSON route and the documentation UI pages.
+
+        Args:
+            app_or_blueprint (Flask | Blueprint): Target to register the routes on.
+
+        Returns:
+            None
+        """
+        app_or_blueprint.add_url_rule(self.config.spec_url, "openapi", self.spec_response)
+        for ui in PAGES:
+            app_or_blueprint.add_url_rule(
+                f"/{self.config.PATH}/{ui}",
+                f"doc_page_{ui}",
+                lambda ui=ui: PAGES[ui].format(self.config),
+            )
+
+    def encoded_spec(self) -> bytes:
+        """
+        Return the OpenAPI document as JSON bytes, reading or generating it only once.
+
+        Returns:
+            bytes: The encoded OpenAPI document.
+        """
+        if self._encoded is None:
+            if self.spec_file and os.path.exists(self.spec_file):
+                with open(self.spec_file, "rb") as f:
+                    self._encoded = f.read()
+            else:
+                self._encoded = json.dumps(self.spec, sort_keys=True).encode()
+        return self._encoded
+
+    def spec_response(self) -> Response:
+        """
+        Serve the cached OpenAPI document.
+
+        Returns:
+            Response: JSON response with the OpenAPI document.
+        """
+        return Response(self.encoded_spec(), mimetype="application/json")
@@ -0,0 +1,129 @@
+"""
+This module provides the sinks outbox messages are delivered to.
+A sink receives a batch of messages and either delivers all of them or raises; the dispatcher
+then retries the whole batch later, so delivery is at least once and consumers should
+deduplicate on the message ID.
+"""
+
+import json
+import logging
+import os
+import urllib.request
+from typing import Any, Protocol
+
+logger = logging.getLogger("app.outbox")
+
+
+class OutboxSink(Protocol):
+    """Destination of outbox messages."""
+
+    name: str
+
+    def send(self, messages: list[dict[str, Any]]) -> None:
+        """
+        Deliver a batch of messages.
+
+        Args:
+            messages (list[dict]): Messages to deliver.
+
+        Raises:
+            Exception: If the batch could not be delivered.
+        """
+
+
+class LogSink:
+    """Sink writing each message to the application log, for development."""
+
+    name = "log"
+
+    def send(self, messages: list[dict[str, Any]]) -> None:
+        """
+        Log a batch of messages.
+
+        Args:
+            messages (list[dict]): Messages to deliver.
+        """
+        for message in messages:
+            logger.info("Outbox message %s %s", message["id"], message["topic"])
+
+
+class FileSink:
+    """
+    Sink appending messages as JSON lines to a local file, e.g. a spool directory picked up by
+    another process, or a stand-in for a real integration in tests.
+
+    Args:
+        path (str): Path of the file to append to.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.name = f"file://{path}"
+
+    def send(self, messages: list[dict[str, Any]]) -> None:
+        """
+        Append a batch of messages and flush them to disk.
+
+        Args:
+            messages (list[dict]): Messages to deliver.
+        """
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(message) + "\n" for message in messages)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class HttpSink:
+    """
+    Sink POSTing each batch as {"messages": [...]} to a webhook URL.
+
+    Args:
+        url (str): Webhook URL.
+        timeout (float): Seconds to wait for the response.
+    """
+
+    def __init__(self, url: str, timeout: float = 5.0):
+        self.url = url
+        self.timeout = timeout
+        self.name = url
+
+    def send(self, messages: list[dict[str, Any]]) -> None:
+        """
+        POST a batch of messages.
+
+        Args:
+            messages (list[dict]): Messages to deliver.
+
+        Raises:
+            urllib.error.URLError: If the request fails or the response is not 2xx.
+        """
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps({"messages": messages}).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass  # non-2xx responses raise HTTPError
+
+
+def create_sink(uri: str) -> OutboxSink:
+    """
+    Build a sink from its URI.
+
+    Args:
+        uri (str): "log:", "file:///path/to/file.jsonl" or an http(s):// webhook URL.
+
+    Returns:
+        OutboxSink: The sink.
+
+    Raises:
+        ValueError: If the URI scheme is not supported.
+    """
+    if uri == "log:":
+        return LogSink()
+    if uri.startswith("file://"):
+        return FileSink(uri.removeprefix("file://"))
+    if uri.startswith(("http://", "https://")):
+        return HttpSink(uri)
+    raise ValueError(f"Unsupported outbox sink {uri!r}; use log:, file:// or http(s)://.")
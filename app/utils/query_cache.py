@@ -0,0 +1,173 @@
+"""
+This module provides a size-bounded LRU cache for employee list query results.
+Entries are tagged with the repository write generation they were computed at, so a page is
+never served after any write has happened since it was cached, unless stale-while-revalidate
+is explicitly enabled.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any
+
+Key = tuple[tuple[str, Any], ...]
+
+
+class QueryResultCache:
+    """
+    Thread-safe LRU cache keyed by normalized list filters.
+
+    Args:
+        maxsize (int): Maximum number of cached result pages (0 disables caching).
+        stale_while_revalidate (bool): Allow serving an outdated entry while it is refreshed.
+    """
+
+    def __init__(self, maxsize: int = 1024, stale_while_revalidate: bool = False):
+        self.maxsize = maxsize
+        self.stale_while_revalidate = stale_while_revalidate
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Key, tuple[int, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.stale_served = 0
+
+    def init_app(self, app) -> None:
+        """
+        Configure the cache size from the application config.
+
+        Args:
+            app (Flask): The Flask application instance.
+
+        Returns:
+            None
+        """
+        self.maxsize = app.config.get("QUERY_CACHE_SIZE", self.maxsize)
+        self.stale_while_revalidate = app.config.get(
+            "QUERY_CACHE_STALE_WHILE_REVALIDATE", self.stale_while_revalidate
+        )
+        self.clear()
+
+    @staticmethod
+    def make_key(filters: dict[str, Any] | None) -> Key:
+        """
+        Normalize list filters into a hashable cache key.
+
+        Unset filters are dropped and values are coerced so that equivalent requests share
+        one entry regardless of parameter order or representation.
+
+        Args:
+            filters (dict, optional): Filtering, sorting, and pagination options.
+
+        Returns:
+            tuple: Sorted (name, value) pairs.
+        """
+        normalized = {}
+        for name, value in (filters or {}).items():
+            if value is None:
+                continue
+            if name in ("min_salary", "max_salary"):
+                value = float(value)
+            elif name in ("page", "page_size"):
+                value = int(value)
+            elif name == "order":
+                value = value.lower()
+            normalized[name] = value
+        return tuple(sorted(normalized.items()))
+
+    def get(self, key: Key, generation: int) -> Any | None:
+        """
+        Look up a cached result computed at the given write generation.
+
+        Args:
+            key (tuple): Key from make_key.
+            generation (int): Current repository write generation.
+
+        Returns:
+            Any | None: The cached result, or None on a miss or a stale entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != generation:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def get_stale(self, key: Key) -> Any | None:
+        """
+        Look up an entry regardless of its generation, for stale-while-revalidate.
+
+        Args:
+            key (tuple): Key from make_key.
+
+        Returns:
+            Any | None: The cached result if stale serving is enabled and an entry exists.
+        """
+        if not self.stale_while_revalidate:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self.stale_served += 1
+            return entry[1]
+
+    def set(self, key: Key, generation: int, value: Any) -> None:
+        """
+        Store a result computed at the given write generation, evicting the least recently
+        used entry if the cache is full.
+
+        Args:
+            key (tuple): Key from make_key.
+            generation (int): Repository write generation read before running the query.
+            value (Any): Result to cache.
+
+        Returns:
+            None
+        """
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            current = self._entries.get(key)
+            if current is not None and current[0] > generation:
+                return  # a newer result was stored while this one was being computed
+            self._entries[key] = (generation, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Remove all entries and reset the statistics.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.stale_served = 0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Report cache effectiveness.
+
+        Returns:
+            dict: Hit and miss counts, hit ratio, evictions, stale results served, and
+            current/maximum size.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "stale_served": self.stale_served,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+
+# Instantiate the cache shared by the service layer
+query_cache = QueryResultCache()
@@ -0,0 +1,334 @@
+"""
+This module provides per-client token-bucket rate limiting and a bounded concurrency limiter
+for expensive endpoints.
+Buckets live in process memory by default; a SQLite file can be configured as a local shared
+backend so that all workers on a host enforce one limit per client.
+"""
+
+import math
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+PERIODS = {"second": 1.0, "minute": 60.0, "hour": 3600.0, "day": 86400.0}
+# Seconds between two deletions of idle buckets from a SQLite store, per process
+PRUNE_INTERVAL = 60.0
+
+
+def parse_limit(limit: str) -> tuple[float, float]:
+    """
+    Parse a limit such as "100/minute" into a bucket capacity and refill rate.
+
+    The bucket holds up to `count` tokens (the allowed burst) and refills at count/period.
+
+    Args:
+        limit (str): "<count>/<second|minute|hour|day>".
+
+    Returns:
+        tuple[float, float]: Capacity in tokens and refill rate in tokens per second.
+
+    Raises:
+        ValueError: If the limit is malformed.
+    """
+    count, _, period = limit.partition("/")
+    try:
+        capacity = float(count)
+        seconds = PERIODS[period.strip().lower().rstrip("s")]
+    except (KeyError, ValueError):
+        raise ValueError(f"Invalid rate limit {limit!r}; use e.g. '100/minute'.") from None
+    if capacity <= 0:
+        raise ValueError(f"Invalid rate limit {limit!r}; the count must be positive.")
+    return capacity, capacity / seconds
+
+
+def _refill(tokens: float, updated: float, capacity: float, rate: float, now: float) -> float:
+    return min(capacity, tokens + (now - updated) * rate)
+
+
+class MemoryBucketStore:
+    """
+    Thread-safe in-process token buckets, bounded to the most recently used keys.
+
+    Args:
+        maxsize (int): Maximum number of buckets kept; evicted clients start with a full bucket.
+    """
+
+    def __init__(self, maxsize: int = 100_000):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def take(self, key: str, capacity: float, rate: float) -> tuple[bool, float]:
+        """
+        Take one token from a bucket if available.
+
+        Args:
+            key (str): Bucket key.
+            capacity (float): Maximum tokens in the bucket.
+            rate (float): Tokens added per second.
+
+        Returns:
+            tuple[bool, float]: Whether the token was granted, and the seconds until one will
+            be available if not.
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens = _refill(tokens, updated, capacity, rate, now)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+        return allowed, 0.0 if allowed else (1 - tokens) / rate
+
+    def clear(self) -> None:
+        """Forget every bucket."""
+        with self._lock:
+            self._buckets.clear()
+
+
+class SQLiteBucketStore:
+    """
+    Token buckets in a SQLite file shared by every worker process on the host.
+
+    Each take is one short IMMEDIATE transaction, so concurrent workers serialize on the
+    bucket update instead of racing. Buckets left idle long enough to be full again are
+    deleted now and then, as a missing bucket is full too.
+
+    Args:
+        path (str): Path of the SQLite database file.
+        idle_seconds (float): Time after which an unused bucket is full again.
+    """
+
+    def __init__(self, path: str, idle_seconds: float = 86400.0):
+        self.path = path
+        self.idle_seconds = idle_seconds
+        self._local = threading.local()
+        self._last_prune = time.monotonic()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=1.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=OFF")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_buckets "
+                "(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+            self._local.connection = connection
+        return connection
+
+    def take(self, key: str, capacity: float, rate: float) -> tuple[bool, float]:
+        """
+        Take one token from a bucket if available.
+
+        Args:
+            key (str): Bucket key.
+            capacity (float): Maximum tokens in the bucket.
+            rate (float): Tokens added per second.
+
+        Returns:
+            tuple[bool, float]: Whether the token was granted, and the seconds until one will
+            be available if not.
+        """
+        connection = self._connection()
+        now = time.time()  # wall clock: monotonic clocks are not shared between processes
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT tokens, updated FROM rate_limit_buckets WHERE key = ?", (key,)
+            ).fetchone()
+            tokens, updated = row if row else (capacity, now)
+            tokens = _refill(tokens, updated, capacity, rate, now)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            connection.execute(
+                "INSERT OR REPLACE INTO rate_limit_buckets (key, tokens, updated) "
+                "VALUES (?, ?, ?)",
+                (key, tokens, now),
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        if time.monotonic() - self._last_prune > PRUNE_INTERVAL:
+            self.prune(now)
+        return allowed, 0.0 if allowed else (1 - tokens) / rate
+
+    def prune(self, now: float | None = None) -> int:
+        """
+        Delete the buckets left idle for longer than idle_seconds.
+
+        Args:
+            now (float, optional): Current wall clock time.
+
+        Returns:
+            int: Number of buckets deleted.
+        """
+        self._last_prune = time.monotonic()
+        cutoff = (time.time() if now is None else now) - self.idle_seconds
+        cursor = self._connection().execute(
+            "DELETE FROM rate_limit_buckets WHERE updated < ?", (cutoff,)
+        )
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        """Forget every bucket."""
+        self._connection().execute("DELETE FROM rate_limit_buckets")
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limits per client and route.
+
+    Args:
+        default_limit (str): Limit applied to every route without an override.
+        route_limits (dict, optional): Limits keyed by endpoint name.
+    """
+
+    def __init__(self, default_limit: str = "100/second", route_limits: dict | None = None):
+        self.store: MemoryBucketStore | SQLiteBucketStore = MemoryBucketStore()
+        self.configure(default_limit, route_limits or {})
+
+    def configure(self, default_limit: str, route_limits: dict[str, str]) -> None:
+        """
+        Replace the configured limits.
+
+        Args:
+            default_limit (str): Limit applied to every route without an override.
+            route_limits (dict): Limits keyed by endpoint name.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If a limit is malformed.
+        """
+        self.default = parse_limit(default_limit)
+        self.routes = {endpoint: parse_limit(limit) for endpoint, limit in route_limits.items()}
+
+    def init_app(self, app) -> None:
+        """
+        Configure limits and the bucket backend from the application config.
+
+        Args:
+            app (Flask): The Flask application instance.
+
+        Returns:
+            None
+        """
+        self.configure(app.config["RATE_LIMIT_DEFAULT"], app.config.get("RATE_LIMIT_ROUTES", {}))
+        storage = app.config.get("RATE_LIMIT_STORAGE", "memory")
+        if storage.startswith("sqlite:///"):
+            # The slowest bucket to refill bounds how long an idle one must be kept
+            idle_seconds = max(
+                capacity / rate for capacity, rate in [self.default, *self.routes.values()]
+            )
+            self.store = SQLiteBucketStore(storage.removeprefix("sqlite:///"), idle_seconds)
+        else:
+            self.store = MemoryBucketStore()
+
+    def hit(self, client: str, endpoint: str) -> tuple[bool, int]:
+        """
+        Count one request of a client to an endpoint.
+
+        Args:
+            client (str): Client identity (known API key or address).
+            endpoint (str): Endpoint name.
+
+        Returns:
+            tuple[bool, int]: Whether the request is allowed, and the Retry-After seconds if
+            it is not.
+        """
+        capacity, rate = self.routes.get(endpoint, self.default)
+        allowed, wait = self.store.take(f"{client}|{endpoint}", capacity, rate)
+        return allowed, 0 if allowed else max(1, math.ceil(wait))
+
+
+class ConcurrencyLimiter:
+    """
+    Bounded number of in-flight requests per expensive endpoint, within this process.
+
+    Args:
+        limits (dict, optional): Maximum concurrent requests keyed by endpoint name or
+            blueprint name.
+        queue_timeout (float): Seconds a request may wait for a slot before being shed.
+    """
+
+    def __init__(self, limits: dict[str, int] | None = None, queue_timeout: float = 0.0):
+        self.queue_timeout = queue_timeout
+        self.configure(limits or {})
+
+    def configure(self, limits: dict[str, int]) -> None:
+        """
+        Replace the configured limits.
+
+        Args:
+            limits (dict): Maximum concurrent requests keyed by endpoint or blueprint name.
+
+        Returns:
+            None
+        """
+        self.limits = dict(limits)
+        self._slots = {name: threading.BoundedSemaphore(limit) for name, limit in limits.items()}
+        self.shed = 0
+
+    def init_app(self, app) -> None:
+        """
+        Configure limits from the application config.
+
+        Args:
+            app (Flask): The Flask application instance.
+
+        Returns:
+            None
+        """
+        self.queue_timeout = app.config.get("CONCURRENCY_QUEUE_TIMEOUT", self.queue_timeout)
+        self.configure(app.config.get("CONCURRENCY_LIMITS", {}))
+
+    def acquire(self, endpoint: str) -> str | None | bool:
+        """
+        Claim a slot for a request to the endpoint.
+
+        Args:
+            endpoint (str): Endpoint name, e.g. "employee.get_all_employees".
+
+        Returns:
+            str | None | bool: The limit name to release later, None if the endpoint is not
+            limited, or False if no slot became free in time.
+        """
+        name = endpoint if endpoint in self._slots else endpoint.partition(".")[0]
+        slots = self._slots.get(name)
+        if slots is None:
+            return None
+        if (
+            slots.acquire(timeout=self.queue_timeout)
+            if self.queue_timeout
+            else slots.acquire(False)
+        ):
+            return name
+        self.shed += 1
+        return False
+
+    def release(self, name: str) -> None:
+        """
+        Free a slot claimed by acquire.
+
+        Args:
+            name (str): Limit name returned by acquire.
+
+        Returns:
+            None
+        """
+        self._slots[name].release()
+
+
+# Instantiate the limiters shared by the admission control middleware
+rate_limiter = RateLimiter()
+concurrency_limiter = ConcurrencyLimiter()
@@ -0,0 +1,98 @@
+"""
+This module provides request coalescing ("single-flight") for identical concurrent reads.
+While a read for a given key is in flight, later callers for the same key wait for it and
+share its result instead of running their own database query.
+"""
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class _Call:
+    """
+    State of one in-flight execution shared by its leader and followers.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Thread-safe coalescing of concurrent calls that share a key.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn, or wait for the in-flight call with the same key and share its outcome.
+
+        Args:
+            key (Hashable): Identity of the read, e.g. ("get", emp_id).
+            fn (Callable): Zero-argument function performing the read.
+
+        Returns:
+            Any: The result of fn from whichever caller executed it.
+
+        Raises:
+            Exception: Whatever fn raised, re-raised in every waiting caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self, key: Hashable) -> bool:
+        """
+        Check whether a call with the given key is currently executing.
+
+        Args:
+            key (Hashable): Identity of the read.
+
+        Returns:
+            bool: True if a call with this key has not finished yet.
+        """
+        with self._lock:
+            return key in self._calls
+
+    def stats(self) -> dict[str, int]:
+        """
+        Report how many reads were executed versus shared.
+
+        Returns:
+            dict: Counts of executions and coalesced callers.
+        """
+        return {"executions": self.executions, "coalesced": self.coalesced}
+
+
+# Instantiate the coalescer shared by the service layer
+single_flight = SingleFlight()
@@ -0,0 +1,129 @@
+"""
+This module provides a cache of prebuilt SQLAlchemy statements for repository queries, keyed by
+query shape, together with statistics of the engine's compiled SQL cache.
+
+The shapes of the employee queries (which filters are set, the sort field and order) are few,
+while building a select() and generating its cache key on every call costs more Python time
+than running a small indexed query. A statement built once per shape is executed with bound
+parameters; reusing the same object also reuses its memoized cache key, so the engine finds
+the compiled SQL without traversing the statement again.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS
+
+T = TypeVar("T")
+
+
+class StatementCache:
+    """
+    Thread-safe LRU cache of statements keyed by query shape.
+
+    Args:
+        maxsize (int): Maximum number of cached statements (0 builds every statement anew).
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._statements: OrderedDict[Hashable, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.compiled_hits = 0
+        self.compiled_misses = 0
+
+    def init_app(self, app) -> None:
+        """
+        Configure the cache size from the application config and start counting compiled
+        SQL cache lookups.
+
+        Args:
+            app (Flask): The Flask application instance.
+
+        Returns:
+            None
+        """
+        self.maxsize = app.config.get("STATEMENT_CACHE_SIZE", self.maxsize)
+        self.clear()
+        if not event.contains(Engine, "before_cursor_execute", self._count_compilation):
+            event.listen(Engine, "before_cursor_execute", self._count_compilation)
+
+    def get(self, shape: Hashable, build: Callable[[], T]) -> T:
+        """
+        Return the statement cached for a query shape, building it on a miss.
+
+        Args:
+            shape (Hashable): Everything that changes the statement's SQL; values that only
+                change its bound parameters must not be part of it.
+            build (Callable): Builds the statement for the shape.
+
+        Returns:
+            The cached or newly built statement.
+        """
+        with self._lock:
+            statement = self._statements.get(shape)
+            if statement is not None:
+                self._statements.move_to_end(shape)
+                self.hits += 1
+                return statement
+            self.misses += 1
+        statement = build()
+        if self.maxsize > 0:
+            with self._lock:
+                self._statements[shape] = statement
+                while len(self._statements) > self.maxsize:
+                    self._statements.popitem(last=False)
+        return statement
+
+    def clear(self) -> None:
+        """
+        Remove all statements and reset the statistics.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._statements.clear()
+            self.hits = self.misses = self.compiled_hits = self.compiled_misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Report statement and compiled SQL cache effectiveness.
+
+        Returns:
+            dict: Statement cache hits, misses and size, and the engine's compiled SQL cache
+            hits, misses and hit ratio for statements executed by this process.
+        """
+        compiled = self.compiled_hits + self.compiled_misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._statements),
+            "maxsize": self.maxsize,
+            "compiled_hits": self.compiled_hits,
+            "compiled_misses": self.compiled_misses,
+            "compiled_hit_ratio": self.compiled_hits / compiled if compiled else 0.0,
+        }
+
+    def _count_compilation(self, conn, cursor, statement, parameters, context, executemany):
+        """
+        Count whether the engine reused the compiled form of an executed statement.
+
+        Textual SQL has no compiled form and is not counted.
+        """
+        if context is None:
+            return
+        if context.cache_hit is CACHE_HIT:
+            self.compiled_hits += 1
+        elif context.cache_hit is CACHE_MISS:
+            self.compiled_misses += 1
+
+
+# Instantiate the cache shared by the repositories
+statement_cache = StatementCache()
@@ -0,0 +1,94 @@
+"""
+This module provides the tenant context for multi-tenant deployments.
+The tenant of a request is resolved by the tenant middleware and stored on `g`; the repository
+scopes every query to it, and the session routes tenants with a dedicated database bind to
+their own engine.
+"""
+
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from flask import current_app, g, has_app_context
+from flask_sqlalchemy.session import Session
+
+DEFAULT_TENANT = "default"
+TENANT_ID_PATTERN = re.compile(r"^[a-z0-9][a-z0-9_-]{0,63}$")
+BIND_KEY_PREFIX = "tenant:"
+
+
+def current_tenant() -> str:
+    """
+    Return the tenant of the current request or CLI context.
+
+    Returns:
+        str: The tenant ID, or the configured default tenant outside a tenant context.
+    """
+    if not has_app_context():
+        return DEFAULT_TENANT
+    tenant_id = g.get("tenant_id")
+    if tenant_id is None:
+        return current_app.config.get("DEFAULT_TENANT", DEFAULT_TENANT)
+    return tenant_id
+
+
+@contextmanager
+def tenant_context(tenant_id: str | None) -> Iterator[None]:
+    """
+    Run a block of code (e.g. a CLI job) as the given tenant.
+
+    Must be used inside an application context.
+
+    Args:
+        tenant_id (str | None): Tenant ID, or None for the default tenant.
+
+    Yields:
+        None
+    """
+    previous = g.get("tenant_id")
+    g.tenant_id = tenant_id
+    try:
+        yield
+    finally:
+        g.tenant_id = previous
+
+
+def tenant_bind_key(tenant_id: str) -> str:
+    """
+    Return the SQLALCHEMY_BINDS key of a tenant's dedicated database.
+
+    Args:
+        tenant_id (str): Tenant ID.
+
+    Returns:
+        str: The bind key.
+    """
+    return f"{BIND_KEY_PREFIX}{tenant_id}"
+
+
+class TenantSession(Session):
+    """
+    Session that sends every statement of a tenant with a dedicated bind to that database.
+
+    Tenants without an entry in TENANT_BINDS share the default database, where rows are
+    separated by their tenant_id column.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        """
+        Select the engine for a statement, preferring the current tenant's bind.
+
+        Args:
+            mapper: Mapper or mapped class the statement targets.
+            clause: The statement being executed.
+            bind: Explicit bind, which always wins.
+            **kwargs: Passed through to the default implementation.
+
+        Returns:
+            Engine: The engine to execute against.
+        """
+        if bind is None:
+            engine = self._db.engines.get(tenant_bind_key(current_tenant()))
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
@@ -0,0 +1,217 @@
+"""
+This module provides the sinks finished request traces are exported to.
+A sink receives a batch of spans (see `Trace.export`) from the tracer's exporter thread;
+failures are logged and the batch is dropped, since traces are diagnostics, not data.
+"""
+
+import json
+import logging
+import os
+import urllib.request
+from typing import Any, Protocol
+
+logger = logging.getLogger("app.tracing")
+
+# OpenTelemetry span kinds
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+
+
+class TraceSink(Protocol):
+    """Destination of exported spans."""
+
+    name: str
+
+    def export(self, spans: list[dict[str, Any]]) -> None:
+        """
+        Export a batch of spans.
+
+        Args:
+            spans (list[dict]): Spans to export.
+
+        Raises:
+            Exception: If the batch could not be exported.
+        """
+
+
+class LogSink:
+    """Sink logging one line per request with its per-layer breakdown, for development."""
+
+    name = "log"
+
+    def export(self, spans: list[dict[str, Any]]) -> None:
+        """
+        Log the root span of each trace in a batch, with the durations of its layers.
+
+        Args:
+            spans (list[dict]): Spans to export.
+        """
+        layers: dict[str, dict[str, float]] = {}
+        for span in spans:
+            if span["parent_id"] is not None:
+                trace = layers.setdefault(span["trace_id"], {})
+                trace[span["layer"]] = trace.get(span["layer"], 0.0) + span["duration_ms"]
+        for span in spans:
+            if span["parent_id"] is None:
+                logger.info(
+                    "Trace %s %s %.2fms %s",
+                    span["trace_id"],
+                    span["name"],
+                    span["duration_ms"],
+                    " ".join(
+                        f"{layer}={ms:.2f}ms"
+                        for layer, ms in layers.get(span["trace_id"], {}).items()
+                    ),
+                )
+
+
+class FileSink:
+    """
+    Sink appending spans as JSON lines to a local file.
+
+    Args:
+        path (str): Path of the file to append to.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.name = f"file://{path}"
+
+    def export(self, spans: list[dict[str, Any]]) -> None:
+        """
+        Append a batch of spans.
+
+        Args:
+            spans (list[dict]): Spans to export.
+        """
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(span) + "\n" for span in spans)
+
+
+class OtlpSink:
+    """
+    Sink POSTing spans to an OpenTelemetry collector over OTLP/HTTP with JSON encoding.
+
+    Args:
+        url (str): Traces endpoint, e.g. http://localhost:4318/v1/traces.
+        service_name (str): Value of the `service.name` resource attribute.
+        timeout (float): Seconds to wait for the collector.
+    """
+
+    def __init__(self, url: str, service_name: str = "employee-management-system", timeout=5.0):
+        self.url = url
+        self.service_name = service_name
+        self.timeout = timeout
+        self.name = url
+
+    def export(self, spans: list[dict[str, Any]]) -> None:
+        """
+        POST a batch of spans as an OTLP ExportTraceServiceRequest.
+
+        Args:
+            spans (list[dict]): Spans to export.
+
+        Raises:
+            urllib.error.URLError: If the request fails or the response is not 2xx.
+        """
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps(self.encode(spans)).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass  # non-2xx responses raise HTTPError
+
+    def encode(self, spans: list[dict[str, Any]]) -> dict[str, Any]:
+        """
+        Convert spans to the OTLP/JSON trace format.
+
+        Args:
+            spans (list[dict]): Spans to convert.
+
+        Returns:
+            dict: The request body.
+        """
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": _attributes({"service.name": self.service_name})},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "app.tracing"},
+                            "spans": [
+                                {
+                                    "traceId": span["trace_id"],
+                                    "spanId": span["span_id"],
+                                    **(
+                                        {"parentSpanId": span["parent_id"]}
+                                        if span["parent_id"]
+                                        else {}
+                                    ),
+                                    "name": span["name"],
+                                    "kind": (
+                                        SPAN_KIND_INTERNAL
+                                        if span["parent_id"]
+                                        else SPAN_KIND_SERVER
+                                    ),
+                                    "startTimeUnixNano": str(span["start_unix_nano"]),
+                                    "endTimeUnixNano": str(span["end_unix_nano"]),
+                                    "attributes": _attributes(
+                                        {"app.layer": span["layer"], **span["attributes"]}
+                                    ),
+                                }
+                                for span in spans
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+
+
+def _attributes(values: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Convert a mapping to OTLP key/value attributes.
+
+    Args:
+        values (dict): Attribute values.
+
+    Returns:
+        list[dict]: OTLP attributes.
+    """
+    attributes = []
+    for key, value in values.items():
+        if isinstance(value, bool):
+            encoded = {"boolValue": value}
+        elif isinstance(value, int):
+            encoded = {"intValue": str(value)}
+        elif isinstance(value, float):
+            encoded = {"doubleValue": value}
+        else:
+            encoded = {"stringValue": str(value)}
+        attributes.append({"key": key, "value": encoded})
+    return attributes
+
+
+def create_sink(uri: str) -> TraceSink:
+    """
+    Build a sink from its URI.
+
+    Args:
+        uri (str): "log:", "file:///path/to/spans.jsonl" or the http(s):// OTLP traces
+            endpoint of a collector.
+
+    Returns:
+        TraceSink: The sink.
+
+    Raises:
+        ValueError: If the URI scheme is not supported.
+    """
+    if uri == "log:":
+        return LogSink()
+    if uri.startswith("file://"):
+        return FileSink(uri.removeprefix("file://"))
+    if uri.startswith(("http://", "https://")):
+        return OtlpSink(uri, os.getenv("OTEL_SERVICE_NAME", "employee-management-system"))
+    raise ValueError(f"Unsupported trace sink {uri!r}; use log:, file:// or http(s)://.")
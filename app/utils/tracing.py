@@ -0,0 +1,492 @@
+"""
+This module provides lightweight request tracing: timed spans for each layer a request passes
+through (request validation, controller, service, repository, SQL and serialization), exported
+in batches to pluggable sinks by a background thread.
+
+A trace exists only while the tracing middleware has started one for the current request, and
+every instrumentation point first checks a context variable for it. Without a trace, a traced
+call costs that one lookup, so instrumentation stays in place when tracing is disabled.
+"""
+
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from functools import wraps
+from inspect import isfunction, isgeneratorfunction
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+if TYPE_CHECKING:
+    from app.utils.trace_sinks import TraceSink
+
+logger = logging.getLogger("app.tracing")
+
+T = TypeVar("T")
+
+# Layers in the order a request passes through them; "app" is the time outside every layer
+# (routing, middleware, error handlers)
+LAYERS = ("validate", "controller", "service", "repository", "db", "serialize", "app")
+
+# Longest SQL statement text kept on a span
+MAX_STATEMENT_LENGTH = 500
+
+_current: ContextVar["Trace | None"] = ContextVar("trace", default=None)
+
+
+class Span:
+    """
+    One timed operation of a trace.
+
+    Attributes:
+        name (str): Operation name, e.g. "repository.EmployeeRepository.get_all".
+        layer (str): Layer the operation belongs to (see LAYERS), or "request" for the root.
+        span_id (int): 64-bit span ID.
+        parent_id (int | None): ID of the enclosing span, None for the root.
+        start_ns (int): Start, in perf_counter nanoseconds.
+        end_ns (int | None): End, in perf_counter nanoseconds, once finished.
+        child_ns (int): Total duration of the direct children.
+        attributes (dict): Extra key/value data.
+    """
+
+    __slots__ = (
+        "name",
+        "layer",
+        "span_id",
+        "parent_id",
+        "start_ns",
+        "end_ns",
+        "child_ns",
+        "attributes",
+    )
+
+    def __init__(self, name: str, layer: str, parent_id: int | None, attributes: dict):
+        self.name = name
+        self.layer = layer
+        self.span_id = random.getrandbits(64) or 1
+        self.parent_id = parent_id
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: int | None = None
+        self.child_ns = 0
+        self.attributes = attributes
+
+
+class Trace:
+    """
+    The spans of one request.
+
+    Args:
+        name (str): Name of the root span, e.g. "GET /employees/".
+        attributes (dict, optional): Attributes of the root span.
+    """
+
+    def __init__(self, name: str, attributes: dict | None = None):
+        self.trace_id = os.urandom(16).hex()
+        # Anchors perf_counter readings to wall-clock time for export
+        self._epoch_ns = time.time_ns() - time.perf_counter_ns()
+        self.spans: list[Span] = []
+        self._stack: list[Span] = []
+        self.root = self.start(name, "request", attributes)
+
+    def start(self, name: str, layer: str, attributes: dict | None = None) -> Span:
+        """
+        Open a span as a child of the innermost open span.
+
+        Args:
+            name (str): Operation name.
+            layer (str): Layer of the operation.
+            attributes (dict, optional): Extra key/value data.
+
+        Returns:
+            Span: The open span.
+        """
+        parent = self._stack[-1].span_id if self._stack else None
+        span = Span(name, layer, parent, attributes or {})
+        self.spans.append(span)
+        self._stack.append(span)
+        return span
+
+    def end(self, span: Span) -> None:
+        """
+        Close a span, and any span left open inside it.
+
+        Args:
+            span (Span): A span opened by `start`.
+
+        Returns:
+            None
+        """
+        span.end_ns = time.perf_counter_ns()
+        while self._stack and self._stack.pop() is not span:
+            pass
+        if self._stack:
+            self._stack[-1].child_ns += span.end_ns - span.start_ns
+
+    def breakdown(self) -> dict[str, float]:
+        """
+        Sum the exclusive time of the finished spans per layer.
+
+        Exclusive time leaves out the time spent in child spans, so the layers add up to the
+        duration of the request.
+
+        Returns:
+            dict[str, float]: Milliseconds per layer, in request order, then "total".
+        """
+        totals: dict[str, int] = {}
+        for span in self.spans:
+            if span.end_ns is not None:
+                layer = "app" if span.layer == "request" else span.layer
+                totals[layer] = totals.get(layer, 0) + span.end_ns - span.start_ns - span.child_ns
+        breakdown = {layer: totals[layer] / 1e6 for layer in LAYERS if layer in totals}
+        if self.root.end_ns is not None:
+            breakdown["total"] = (self.root.end_ns - self.root.start_ns) / 1e6
+        return breakdown
+
+    def export(self) -> list[dict[str, Any]]:
+        """
+        Convert the finished spans for the sinks.
+
+        Returns:
+            list[dict]: trace_id, span_id, parent_id, name, layer, start_unix_nano,
+                end_unix_nano, duration_ms and attributes of each span.
+        """
+        return [
+            {
+                "trace_id": self.trace_id,
+                "span_id": f"{span.span_id:016x}",
+                "parent_id": f"{span.parent_id:016x}" if span.parent_id else None,
+                "name": span.name,
+                "layer": span.layer,
+                "start_unix_nano": self._epoch_ns + span.start_ns,
+                "end_unix_nano": self._epoch_ns + span.end_ns,
+                "duration_ms": (span.end_ns - span.start_ns) / 1e6,
+                "attributes": span.attributes,
+            }
+            for span in self.spans
+            if span.end_ns is not None
+        ]
+
+
+class _SpanContext:
+    """
+    Context manager timing a block as a span of the current trace.
+    """
+
+    __slots__ = ("trace", "name", "layer", "attributes", "span")
+
+    def __init__(self, trace: Trace, name: str, layer: str, attributes: dict):
+        self.trace = trace
+        self.name = name
+        self.layer = layer
+        self.attributes = attributes
+
+    def __enter__(self) -> Span:
+        self.span = self.trace.start(self.name, self.layer, self.attributes)
+        return self.span
+
+    def __exit__(self, *exc_info) -> None:
+        self.trace.end(self.span)
+
+
+class _NoSpan:
+    """
+    Context manager doing nothing, used outside traced requests.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+def current_trace() -> Trace | None:
+    """
+    Return the trace of the current request.
+
+    Returns:
+        Trace | None: The trace, or None if the request is not traced.
+    """
+    return _current.get()
+
+
+def span(name: str, layer: str | None = None, **attributes: Any):
+    """
+    Time a block as a span of the current trace, if any.
+
+    Usage:
+        with span("serialize"):
+            body = response.model_dump(mode="json")
+
+    Args:
+        name (str): Operation name.
+        layer (str, optional): Layer of the operation (default: the name).
+        **attributes: Extra key/value data.
+
+    Returns:
+        A context manager.
+    """
+    trace = _current.get()
+    if trace is None:
+        return _NO_SPAN
+    return _SpanContext(trace, name, layer or name, attributes)
+
+
+def traced_function(
+    layer: str, func: Callable[..., T], name: str | None = None
+) -> Callable[..., T]:
+    """
+    Wrap a function so that each call made during a traced request is a span.
+
+    Args:
+        layer (str): Layer of the function.
+        func (Callable): Function to wrap.
+        name (str, optional): Span name (default: "<layer>.<qualified name>").
+
+    Returns:
+        Callable: The wrapped function.
+    """
+    name = name or f"{layer}.{func.__qualname__}"
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        trace = _current.get()
+        if trace is None:
+            return func(*args, **kwargs)
+        span = trace.start(name, layer)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            trace.end(span)
+
+    return wrapper
+
+
+def traced(layer: str) -> Callable[[type[T]], type[T]]:
+    """
+    Class decorator tracing every public method of a layer's class.
+
+    Generator methods are left alone, since their work happens after the call returns.
+
+    Args:
+        layer (str): Layer of the class, e.g. "service" or "repository".
+
+    Returns:
+        Callable: The class decorator.
+    """
+
+    def decorate(cls: type[T]) -> type[T]:
+        for attribute, value in list(vars(cls).items()):
+            if attribute.startswith("_") or not isfunction(value):
+                continue
+            if isgeneratorfunction(value):
+                continue
+            setattr(cls, attribute, traced_function(layer, value))
+        return cls
+
+    return decorate
+
+
+class Tracer:
+    """
+    Starts and finishes request traces and exports them to sinks in the background.
+
+    Finished traces go through a bounded queue to an exporter thread, which sends them to every
+    sink in batches; when the queue is full, traces are dropped and counted rather than slowing
+    requests down.
+
+    Args:
+        queue_size (int): Maximum number of traces waiting for export.
+        batch_size (int): Maximum number of traces per sink call.
+    """
+
+    def __init__(self, queue_size: int = 1000, batch_size: int = 100):
+        self.sinks: list[TraceSink] = []
+        self.batch_size = batch_size
+        self._queue: queue.Queue[list[dict[str, Any]] | None] = queue.Queue(queue_size)
+        self._lock = threading.Lock()
+        self._exporter_pid: int | None = None
+        self.exported = 0
+        self.dropped = 0
+
+    def init_app(self, app) -> None:
+        """
+        Create the sinks from the application config and trace SQL statements.
+
+        Args:
+            app (Flask): The Flask application instance.
+
+        Returns:
+            None
+        """
+        # Deferred so that processes that only trace in-process do not import the sink clients
+        from app.utils.trace_sinks import create_sink
+
+        self.sinks = [create_sink(uri) for uri in app.config.get("TRACING_SINKS", ["log:"])]
+        with self._lock:
+            if self._exporter_pid == os.getpid():
+                self._queue.put(None)  # stops the exporter of the previous queue
+            self._exporter_pid = None
+            self._queue = queue.Queue(app.config.get("TRACING_QUEUE_SIZE", self._queue.maxsize))
+        if not event.contains(Engine, "before_cursor_execute", _start_statement):
+            event.listen(Engine, "before_cursor_execute", _start_statement)
+            event.listen(Engine, "after_cursor_execute", _end_statement)
+            event.listen(Engine, "handle_error", _fail_statement)
+
+    def start(self, name: str, attributes: dict | None = None) -> Trace:
+        """
+        Start the trace of the current request.
+
+        Args:
+            name (str): Name of the root span.
+            attributes (dict, optional): Attributes of the root span.
+
+        Returns:
+            Trace: The new trace.
+        """
+        trace = Trace(name, attributes)
+        _current.set(trace)
+        return trace
+
+    def finish(self) -> Trace | None:
+        """
+        Finish the trace of the current request.
+
+        Returns:
+            Trace | None: The finished trace, or None if the request was not traced.
+        """
+        trace = _current.get()
+        if trace is None:
+            return None
+        _current.set(None)
+        trace.end(trace.root)
+        return trace
+
+    def export(self, trace: Trace) -> None:
+        """
+        Queue a finished trace for the sinks, or drop it if the queue is full.
+
+        Args:
+            trace (Trace): The finished trace.
+
+        Returns:
+            None
+        """
+        self._ensure_exporter()
+        try:
+            self._queue.put_nowait(trace.export())
+        except queue.Full:
+            self.dropped += 1
+
+    def discard(self) -> None:
+        """
+        Drop the trace of the current request, if one is still open.
+
+        Returns:
+            None
+        """
+        _current.set(None)
+
+    def flush(self) -> None:
+        """
+        Block until every queued trace has been sent to the sinks.
+
+        Returns:
+            None
+        """
+        self._queue.join()
+
+    def _ensure_exporter(self) -> None:
+        """
+        Start the exporter thread in this process, e.g. in each forked server worker.
+        """
+        if self._exporter_pid == os.getpid():
+            return
+        with self._lock:
+            if self._exporter_pid != os.getpid():
+                threading.Thread(
+                    target=self._export_forever,
+                    args=(self._queue,),
+                    name="trace-exporter",
+                    daemon=True,
+                ).start()
+                self._exporter_pid = os.getpid()
+
+    def _export_forever(self, traces: queue.Queue) -> None:
+        """
+        Send queued traces to the sinks, one batch at a time, until a None is queued.
+
+        Args:
+            traces (queue.Queue): Queue of exported traces.
+        """
+        while True:
+            batch = [traces.get()]
+            while len(batch) < self.batch_size and batch[-1] is not None:
+                try:
+                    batch.append(traces.get_nowait())
+                except queue.Empty:
+                    break
+            stop = batch[-1] is None
+            if stop:
+                batch.pop()
+                traces.task_done()
+            spans = [span for trace in batch for span in trace]
+            for sink in self.sinks if spans else ():
+                try:
+                    sink.export(spans)
+                except Exception:
+                    logger.exception("Exporting %d spans to %s failed", len(spans), sink.name)
+            self.exported += len(batch)
+            for _ in batch:
+                traces.task_done()
+            if stop:
+                return
+
+
+def _start_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    """
+    Open a span for a SQL statement run during a traced request.
+    """
+    trace = _current.get()
+    if trace is not None:
+        conn.info.setdefault("trace_spans", []).append(
+            trace.start("db.query", "db", {"db.statement": statement[:MAX_STATEMENT_LENGTH]})
+        )
+
+
+def _end_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    """
+    Close the span of a SQL statement.
+    """
+    trace = _current.get()
+    spans = conn.info.get("trace_spans")
+    if trace is not None and spans:
+        trace.end(spans.pop())
+
+
+def _fail_statement(exception_context) -> None:
+    """
+    Close the span of a SQL statement that raised.
+    """
+    conn = exception_context.connection
+    trace = _current.get()
+    spans = conn.info.get("trace_spans") if conn is not None else None
+    if trace is not None and spans:
+        span = spans.pop()
+        span.attributes["error"] = type(exception_context.original_exception).__name__
+        trace.end(span)
+
+
+# Instantiate the tracer for dependency injection
+tracer = Tracer()
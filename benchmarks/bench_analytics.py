@@ -0,0 +1,172 @@
+"""
+Salary analytics benchmark: in-memory columnar snapshot versus the SQL path.
+
+Builds a SQLite database with --rows employees (1M by default), then times percentile,
+histogram, top-N and filter queries answered by SQL against the same queries answered by
+AnalyticsService. Requires the optional NumPy dependency.
+
+Usage:
+    python benchmarks/bench_analytics.py [--rows 1000000] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DEPARTMENTS = ["Engineering", "Sales", "HR", "Finance", "Support", "Legal", "Marketing", "Ops"]
+
+
+def populate(db, Employee, rows: int) -> None:
+    """
+    Insert synthetic employees in batches.
+
+    Args:
+        db: The SQLAlchemy extension instance.
+        Employee: The Employee model.
+        rows (int): Number of employees to insert.
+
+    Returns:
+        None
+    """
+    rng = random.Random(42)
+    start = datetime(2010, 1, 1)
+    batch = []
+    for i in range(rows):
+        batch.append(
+            {
+                "name": f"Employee {i}",
+                "email": f"employee{i}@example.com",
+                "department": rng.choice(DEPARTMENTS),
+                "salary": round(rng.lognormvariate(11, 0.4), 2),
+                "date_joined": start + timedelta(days=rng.randrange(5000)),
+                "version": 1,
+            }
+        )
+        if len(batch) == 50000:
+            db.session.execute(db.insert(Employee), batch)
+            batch.clear()
+    if batch:
+        db.session.execute(db.insert(Employee), batch)
+    db.session.commit()
+
+
+def timed(fn, repeat: int) -> float:
+    """
+    Return the median wall time of fn in milliseconds.
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def sql_percentiles(db, department: str, percentiles: list[float]) -> list[float]:
+    count = db.session.execute(
+        db.text("SELECT COUNT(salary) FROM employees WHERE department = :d"), {"d": department}
+    ).scalar()
+    return [
+        db.session.execute(
+            db.text(
+                "SELECT salary FROM employees WHERE department = :d AND salary IS NOT NULL "
+                "ORDER BY salary LIMIT 1 OFFSET :k"
+            ),
+            {"d": department, "k": int(round(p / 100 * (count - 1)))},
+        ).scalar()
+        for p in percentiles
+    ]
+
+
+def sql_histogram(db, bins: int):
+    low, high = db.session.execute(db.text("SELECT MIN(salary), MAX(salary) FROM employees")).one()
+    width = (high - low) / bins
+    return db.session.execute(
+        db.text(
+            "SELECT MIN(CAST((salary - :low) / :width AS INTEGER), :last) AS b, COUNT(*) "
+            "FROM employees WHERE salary IS NOT NULL GROUP BY b ORDER BY b"
+        ),
+        {"low": low, "width": width, "last": bins - 1},
+    ).all()
+
+
+def sql_top(db, n: int):
+    return db.session.execute(
+        db.text("SELECT id, department, salary FROM employees ORDER BY salary DESC LIMIT :n"),
+        {"n": n},
+    ).all()
+
+
+def sql_filter(db, department: str, joined_from: date):
+    return db.session.execute(
+        db.text(
+            "SELECT COUNT(*), SUM(salary), AVG(salary), MIN(salary), MAX(salary) FROM employees "
+            "WHERE department = :d AND date_joined >= :j"
+        ),
+        {"d": department, "j": datetime.combine(joined_from, datetime.min.time())},
+    ).one()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+
+    from app import create_app
+    from app.extensions import db
+    from app.models.employee import Employee
+    from app.services.analytics_service import analytics_service
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        start = time.perf_counter()
+        populate(db, Employee, args.rows)
+        print(f"populated {args.rows:,} rows in {time.perf_counter() - start:.1f}s")
+
+        start = time.perf_counter()
+        analytics_service.percentiles({}, [50])
+        print(f"snapshot load: {(time.perf_counter() - start) * 1000:.0f} ms (once per process)")
+        analytics_service.refresh_interval = 3600  # measure the query path, not catch-ups
+
+        joined_from = date(2018, 1, 1)
+        cases = {
+            "percentiles p50/p90/p99 (1 dept)": (
+                lambda: sql_percentiles(db, "Sales", [50, 90, 99]),
+                lambda: analytics_service.percentiles({"department": "Sales"}, [50, 90, 99]),
+            ),
+            "histogram, 20 bins": (
+                lambda: sql_histogram(db, 20),
+                lambda: analytics_service.histogram({}, bins=20),
+            ),
+            "top 10 salaries": (
+                lambda: sql_top(db, 10),
+                lambda: analytics_service.top({}, n=10),
+            ),
+            "filter dept + joined_from": (
+                lambda: sql_filter(db, "HR", joined_from),
+                lambda: analytics_service.filter(
+                    {"department": "HR", "joined_from": joined_from}, limit=0
+                ),
+            ),
+        }
+        print(f"{'query':<36} {'SQL ms':>10} {'columnar ms':>12} {'speedup':>8}")
+        for name, (sql_fn, columnar_fn) in cases.items():
+            sql_ms = timed(sql_fn, args.repeat)
+            columnar_ms = timed(columnar_fn, args.repeat)
+            print(f"{name:<36} {sql_ms:>10.1f} {columnar_ms:>12.2f} {sql_ms / columnar_ms:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Error path benchmark: pre-encoded error bodies versus per-request jsonify.
+
+Times GET /employees/<missing id> (404) and a duplicate-email POST (409) through the test
+client, once with the application's error handlers and once with handlers that build the
+body with jsonify on every request, as the error handlers did before. The rest of the request
+path is identical, so the difference is the cost of rendering the error; the handler alone is
+also timed by dispatching exceptions inside a request context.
+
+Usage:
+    python benchmarks/bench_errors.py [--requests 5000] [--repeat 5]
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def make_app(legacy: bool):
+    """
+    Create an app over an in-memory database holding one employee.
+
+    Args:
+        legacy (bool): Replace the application's error handlers with jsonify-based ones.
+
+    Returns:
+        Flask: The application.
+    """
+    from flask import jsonify
+
+    from app import create_app, db
+    from app.exceptions import EmployeeManagementError
+
+    app = create_app(config={"SQLALCHEMY_DATABASE_URI": "sqlite://", "RATE_LIMIT_ENABLED": False})
+    app.logger.setLevel(logging.WARNING)  # keep request logging out of the timings
+    if legacy:
+        app.register_error_handler(
+            EmployeeManagementError, lambda e: (jsonify({"error": str(e)}), e.status_code)
+        )
+    with app.app_context():
+        from app.models import employee_change  # noqa: F401
+
+        db.create_all()
+        app.test_client().post("/employees/", json={"name": "Taken", "email": "taken@test.com"})
+    return app
+
+
+def time_requests(app, send, requests: int) -> float:
+    """
+    Time a number of requests.
+
+    Args:
+        app (Flask): The application.
+        send (Callable): Function sending one request with a test client.
+        requests (int): Number of requests.
+
+    Returns:
+        float: Microseconds per request.
+    """
+    with app.app_context():
+        client = app.test_client()
+        send(client)  # warm up
+        start = time.perf_counter()
+        for _ in range(requests):
+            send(client)
+        return (time.perf_counter() - start) / requests * 1e6
+
+
+def time_handler(app, error: type, requests: int) -> float:
+    """
+    Time dispatching an exception to its error handler and finalizing the response.
+
+    Args:
+        app (Flask): The application.
+        error (type): Exception class, raised with its default message.
+        requests (int): Number of dispatches.
+
+    Returns:
+        float: Microseconds per dispatch.
+    """
+    with app.test_request_context("/employees/424242"):
+        start = time.perf_counter()
+        for _ in range(requests):
+            app.make_response(app.handle_user_exception(error()))
+        return (time.perf_counter() - start) / requests * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    duplicate = json.dumps({"name": "Again", "email": "taken@test.com"})
+    paths = {
+        "404 GET missing employee": lambda client: client.get("/employees/424242"),
+        "409 POST duplicate email": lambda client: client.post(
+            "/employees/", data=duplicate, content_type="application/json"
+        ),
+    }
+    apps = {"jsonify per request": make_app(legacy=True), "pre-encoded": make_app(legacy=False)}
+
+    print(f"{'path':<28} {'handler':<22} {'median us':>10} {'req/s':>10}")
+    for path, send in paths.items():
+        for name, app in apps.items():
+            micros = statistics.median(
+                time_requests(app, send, args.requests) for _ in range(args.repeat)
+            )
+            print(f"{path:<28} {name:<22} {micros:>10.1f} {1e6 / micros:>10.0f}")
+
+    from app.exceptions import DuplicateEmailError, EmployeeNotFound
+
+    print(f"\n{'handler only':<28} {'handler':<22} {'median us':>10}")
+    for error in (EmployeeNotFound, DuplicateEmailError):
+        for name, app in apps.items():
+            micros = statistics.median(
+                time_handler(app, error, args.requests) for _ in range(args.repeat)
+            )
+            print(f"{error.__name__:<28} {name:<22} {micros:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
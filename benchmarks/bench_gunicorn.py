@@ -0,0 +1,161 @@
+"""
+Gunicorn profile benchmark: the sync, gthread and gevent profiles of gunicorn.conf.py under load.
+
+For each profile, starts `gunicorn -c gunicorn.conf.py app.run:app` on a seeded database,
+drives it with benchmarks/load_test.py at a fixed request rate and prints throughput, error
+rate and latency percentiles side by side. The default database is a temporary SQLite file;
+pass --database-url to benchmark against MySQL as deployed. Profiles whose worker class is not
+installed (gevent) are skipped. Rate limiting is disabled so that the profiles, not the
+limits, are compared.
+
+Usage:
+    python benchmarks/bench_gunicorn.py [--rate 300] [--duration 20] [--profiles sync,gthread]
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROFILES = ("sync", "gthread", "gevent")
+WORKER_MODULES = {"gevent": "gevent"}
+
+
+def flask_command(env: dict, *args: str) -> None:
+    """
+    Run a CLI command of the CLI-only application.
+
+    Args:
+        env (dict): Environment with DATABASE_URL.
+        *args (str): Command and options.
+
+    Returns:
+        None
+    """
+    command = [sys.executable, "-m", "flask", "--app", "app:create_app(with_api=False)", *args]
+    subprocess.run(command, cwd=ROOT, env=env, check=True, stdout=subprocess.DEVNULL)
+
+
+def start_server(env: dict, port: int) -> subprocess.Popen:
+    """
+    Start gunicorn and wait until it answers.
+
+    Args:
+        env (dict): Environment with DATABASE_URL and the GUNICORN_* settings.
+        port (int): Local port to bind.
+
+    Returns:
+        subprocess.Popen: The gunicorn master process.
+
+    Raises:
+        RuntimeError: If the server does not answer within 30 seconds.
+    """
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "app.run:app"],
+        cwd=ROOT,
+        env={**env, "GUNICORN_BIND": f"127.0.0.1:{port}"},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/employees/?page_size=1", timeout=1)
+            return server
+        except OSError:
+            if server.poll() is not None:
+                break
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError(f"gunicorn did not start on port {port}")
+
+
+def run_load(port: int, args) -> dict:
+    """
+    Drive the server with the load generator.
+
+    Args:
+        port (int): Local port of the server.
+        args (argparse.Namespace): Benchmark options.
+
+    Returns:
+        dict: The load generator's JSON summary.
+    """
+    with tempfile.NamedTemporaryFile(suffix=".json") as summary:
+        subprocess.run(
+            [
+                sys.executable,
+                os.path.join(ROOT, "benchmarks", "load_test.py"),
+                "--url",
+                f"http://127.0.0.1:{port}",
+                "--rate",
+                str(args.rate),
+                "--duration",
+                str(args.duration),
+                "--concurrency",
+                str(args.concurrency),
+                "--json",
+                summary.name,
+            ],
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        with open(summary.name) as f:
+            return json.load(f)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--profiles", default=",".join(PROFILES))
+    parser.add_argument("--rate", type=float, default=300, help="Target requests per second")
+    parser.add_argument("--duration", type=float, default=20, help="Measured seconds")
+    parser.add_argument("--concurrency", type=int, default=128, help="Maximum in-flight requests")
+    parser.add_argument("--workers", type=int, help="Override GUNICORN_WORKERS for all profiles")
+    parser.add_argument("--database-url", help="Database to seed (default: temp SQLite)")
+    parser.add_argument("--seed-count", type=int, default=10000)
+    parser.add_argument("--port", type=int, default=5055)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "DATABASE_URL": args.database_url or f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+            "RATE_LIMIT_ENABLED": "false",
+        }
+        if args.workers:
+            env["GUNICORN_WORKERS"] = str(args.workers)
+        flask_command(env, "init-db")
+        flask_command(env, "seed", "--count", str(args.seed_count))
+
+        print(
+            f"{'profile':<9} {'req/s':>8} {'errors':>7} {'p50 ms':>8} {'p90 ms':>8} "
+            f"{'p99 ms':>8} {'p99.9 ms':>9}"
+        )
+        for profile in args.profiles.split(","):
+            module = WORKER_MODULES.get(profile)
+            if module and importlib.util.find_spec(module) is None:
+                print(f"{profile:<9} skipped: {module} is not installed")
+                continue
+            server = start_server({**env, "GUNICORN_PROFILE": profile}, args.port)
+            try:
+                summary = run_load(args.port, args)
+            finally:
+                server.terminate()
+                server.wait()
+            latency = summary["latency"]
+            print(
+                f"{profile:<9} {summary['throughput_rps']:>8.1f} "
+                f"{summary['error_rate']:>7.2%} {latency['p50_ms']:>8.2f} "
+                f"{latency['p90_ms']:>8.2f} {latency['p99_ms']:>8.2f} "
+                f"{latency['p99.9_ms']:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Startup-time benchmark for the Employee Management System.
+
+Each scenario runs in a fresh interpreter so that import costs are measured cold, the way a
+container start, a CLI invocation or a recycled gunicorn worker experiences them.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 10]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIO = """
+import json, sys, time
+start = time.perf_counter()
+from app import create_app
+app = create_app(with_api={with_api})
+booted = time.perf_counter()
+first_spec = None
+if {with_api}:
+    app.test_client().get("/docs/openapi.json")
+    first_spec = time.perf_counter() - booted
+print(json.dumps({{"boot": booted - start, "first_spec": first_spec}}))
+"""
+
+
+def run_scenario(with_api: bool, env: dict[str, str]) -> dict[str, float]:
+    """
+    Run one cold-start scenario in a subprocess.
+
+    Args:
+        with_api (bool): Whether the API layer is registered.
+        env (dict): Environment for the subprocess.
+
+    Returns:
+        dict: Boot time and first OpenAPI request time in seconds.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", SCENARIO.format(with_api=with_api)],
+        cwd=ROOT,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    env = {**os.environ, "DATABASE_URL": "sqlite:///:memory:"}
+    env.pop("OPENAPI_SPEC_FILE", None)
+    spec_file = os.path.join(tempfile.mkdtemp(), "openapi.json")
+    subprocess.run(
+        [sys.executable, "-m", "flask", "--app", "app:create_app()", "openapi-export", spec_file],
+        cwd=ROOT,
+        env=env,
+        check=True,
+        capture_output=True,
+    )
+
+    scenarios = {
+        "full app, spec generated on first request": (True, env),
+        "full app, precomputed spec file": (True, {**env, "OPENAPI_SPEC_FILE": spec_file}),
+        "CLI-only app (with_api=False)": (False, env),
+    }
+    print(f"{'scenario':<45} {'boot ms':>10} {'1st spec ms':>12}")
+    for name, (with_api, scenario_env) in scenarios.items():
+        results = [run_scenario(with_api, scenario_env) for _ in range(args.runs)]
+        boot = statistics.median(r["boot"] for r in results) * 1000
+        spec = (
+            f"{statistics.median(r['first_spec'] for r in results) * 1000:>12.2f}"
+            if with_api
+            else f"{'-':>12}"
+        )
+        print(f"{name:<45} {boot:>10.1f} {spec}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,662 @@
+"""
+Open-loop load generator and latency report for the employee API.
+
+Replays a weighted mix of employee endpoint operations (reads, paginated and filtered lists,
+creates, updates and deletes) at a fixed target rate, either against a running instance over
+HTTP or against an in-process WSGI application. Requests are scheduled by asyncio on a fixed
+timetable and latency is measured from each request's scheduled start, so a slow server shows
+up as queueing delay instead of silently lowering the offered load (no coordinated omission).
+
+The report shows throughput, error rate, per-operation counts and an HDR-style log-linear
+latency histogram (about 1% value precision). Use --seed for a reproducible operation
+sequence and --json to keep results for comparing configurations and commits.
+
+Usage:
+    python benchmarks/load_test.py --url http://localhost:5000 --rate 200 --duration 30
+    python benchmarks/load_test.py --in-process --seed-count 10000 --rate 100 --duration 10
+    python benchmarks/load_test.py --url http://localhost:5000 --mix read=80,list=20 --json a.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+OPERATIONS = ("read", "list", "filter", "create", "update", "delete")
+DEFAULT_MIX = "read=50,list=20,filter=10,create=10,update=8,delete=2"
+REPORT_PERCENTILES = (50.0, 75.0, 90.0, 95.0, 99.0, 99.9, 99.99, 100.0)
+
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram in the style of HdrHistogram.
+
+    Values (in microseconds) below 256 are counted exactly; above that, every power-of-two
+    range is split into 128 equal buckets, bounding the relative error by 1/128.
+    """
+
+    SUB_BUCKET_BITS = 8
+    SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+    HALF = SUB_BUCKETS // 2
+
+    def __init__(self):
+        self.counts: dict[int, int] = {}
+        self.total = 0
+        self.sum = 0
+        self.min = None
+        self.max = 0
+
+    @classmethod
+    def _index(cls, value: int) -> int:
+        if value < cls.SUB_BUCKETS:
+            return value
+        shift = value.bit_length() - cls.SUB_BUCKET_BITS
+        return cls.SUB_BUCKETS + (shift - 1) * cls.HALF + ((value >> shift) - cls.HALF)
+
+    @classmethod
+    def _highest_equivalent(cls, index: int) -> int:
+        if index < cls.SUB_BUCKETS:
+            return index
+        shift, offset = divmod(index - cls.SUB_BUCKETS, cls.HALF)
+        return ((offset + cls.HALF + 1) << (shift + 1)) - 1
+
+    def record(self, seconds: float) -> None:
+        """
+        Record one latency.
+
+        Args:
+            seconds (float): Latency in seconds.
+
+        Returns:
+            None
+        """
+        value = max(0, round(seconds * 1_000_000))
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.total += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Add another histogram's counts to this one.
+
+        Args:
+            other (LatencyHistogram): Histogram to merge.
+
+        Returns:
+            None
+        """
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total += other.total
+        self.sum += other.sum
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Return the latency at a percentile, in milliseconds.
+
+        Args:
+            percentile (float): Percentile between 0 and 100.
+
+        Returns:
+            float: Highest value equivalent to the bucket holding the percentile.
+        """
+        if not self.total:
+            return 0.0
+        target = max(1, round(self.total * percentile / 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._highest_equivalent(index), self.max) / 1000
+        return self.max / 1000
+
+    def distribution(self, steps_per_half: int = 2) -> list[tuple[float, float, int]]:
+        """
+        Build the percentile distribution table printed by HdrHistogram.
+
+        Percentile steps halve the remaining tail at each level (50, 75, 87.5, ...).
+
+        Args:
+            steps_per_half (int): Ticks between each halving of the tail.
+
+        Returns:
+            list[tuple]: (latency ms, percentile, cumulative count) rows.
+        """
+        rows = []
+        percentile, tail = 0.0, 100.0
+        while self.total and tail * self.total / 100 >= 1:
+            step = tail / 2 / steps_per_half
+            for _ in range(steps_per_half):
+                percentile += step
+                value = self.percentile(percentile)
+                rows.append((value, percentile, round(self.total * percentile / 100)))
+            tail /= 2
+        rows.append((self.max / 1000, 100.0, self.total))
+        return rows
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in milliseconds."""
+        return self.sum / self.total / 1000 if self.total else 0.0
+
+
+class HttpTransport:
+    """
+    Minimal asyncio HTTP/1.1 client with a keep-alive connection pool.
+
+    Args:
+        base_url (str): Scheme, host, port and optional path prefix of the API.
+        headers (dict): Headers sent with every request.
+    """
+
+    def __init__(self, base_url: str, headers: dict[str, str]):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self.netloc = parts.netloc
+        self.prefix = parts.path.rstrip("/")
+        self.headers = "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+
+    async def request(self, method: str, path: str, body: dict | None) -> tuple[int, bytes]:
+        """
+        Send one request and read the whole response.
+
+        Args:
+            method (str): HTTP method.
+            path (str): Path and query string.
+            body (dict, optional): JSON body.
+
+        Returns:
+            tuple[int, bytes]: Status code and response body.
+        """
+        if self._idle:
+            reader, writer = self._idle.pop()
+        else:
+            reader, writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+        try:
+            payload = json.dumps(body).encode() if body is not None else b""
+            head = (
+                f"{method} {self.prefix}{path} HTTP/1.1\r\nHost: {self.netloc}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n"
+                f"{self.headers}\r\n"
+            )
+            writer.write(head.encode("latin-1") + payload)
+            await writer.drain()
+            status_line = await reader.readline()
+            if not status_line:
+                raise ConnectionError("Connection closed by server.")
+            status = int(status_line.split()[1])
+            headers = {}
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            keep_alive = headers.get("connection", "").lower() != "close"
+            if "content-length" in headers:
+                data = await reader.readexactly(int(headers["content-length"]))
+            elif headers.get("transfer-encoding", "").lower() == "chunked":
+                chunks = []
+                while size := int((await reader.readline()).split(b";")[0], 16):
+                    chunks.append(await reader.readexactly(size))
+                    await reader.readline()
+                await reader.readline()
+                data = b"".join(chunks)
+            else:
+                data, keep_alive = await reader.read(), False
+        except BaseException:
+            writer.close()
+            raise
+        if keep_alive:
+            self._idle.append((reader, writer))
+        else:
+            writer.close()
+        return status, data
+
+    async def close(self) -> None:
+        """Close every pooled connection."""
+        for _, writer in self._idle:
+            writer.close()
+        self._idle.clear()
+
+
+class WsgiTransport:
+    """
+    Calls an in-process Flask application through per-thread test clients.
+
+    WSGI is synchronous, so requests run on a thread pool sized like a threaded server.
+
+    Args:
+        app (Flask): The application under test.
+        headers (dict): Headers sent with every request.
+        threads (int): Number of worker threads.
+    """
+
+    def __init__(self, app, headers: dict[str, str], threads: int):
+        self.app = app
+        self.headers = headers
+        self._executor = ThreadPoolExecutor(max_workers=threads)
+        self._local = threading.local()
+
+    def _call(self, method: str, path: str, body: dict | None) -> tuple[int, bytes]:
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = self.app.test_client()
+        response = client.open(path, method=method, json=body, headers=self.headers)
+        return response.status_code, response.get_data()
+
+    async def request(self, method: str, path: str, body: dict | None) -> tuple[int, bytes]:
+        """
+        Run one request on the thread pool.
+
+        Args:
+            method (str): HTTP method.
+            path (str): Path and query string.
+            body (dict, optional): JSON body.
+
+        Returns:
+            tuple[int, bytes]: Status code and response body.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, method, path, body)
+
+    async def close(self) -> None:
+        """Stop the thread pool."""
+        self._executor.shutdown(wait=True)
+
+
+class Workload:
+    """
+    Generates the operation sequence and tracks the employee IDs it can act on.
+
+    Deletes only target employees created by this run, so repeated runs do not drain a
+    seeded dataset.
+
+    Args:
+        mix (dict): Relative weight of each operation.
+        rng (random.Random): Seeded random generator.
+        ids (list[int]): IDs of existing employees to read and update.
+        departments (list[str]): Department names used by filtered lists.
+    """
+
+    def __init__(self, mix: dict[str, int], rng: random.Random, ids, departments):
+        self.operations = [op for op in OPERATIONS if mix.get(op)]
+        self.weights = [mix[op] for op in self.operations]
+        self.rng = rng
+        self.ids = list(ids)
+        self.created: list[int] = []
+        self.departments = departments
+        self.run_id = f"{int(time.time())}{rng.randrange(10**6):06d}"
+        self.counter = 0
+
+    def next(self) -> tuple[str, str, str, dict | None]:
+        """
+        Pick the next operation.
+
+        Returns:
+            tuple: (operation, method, path, JSON body or None).
+        """
+        rng = self.rng
+        op = rng.choices(self.operations, weights=self.weights)[0]
+        if (op in ("read", "update") and not self.ids) or (op == "delete" and not self.created):
+            op = "create"
+        if op == "read":
+            return op, "GET", f"/employees/{rng.choice(self.ids)}", None
+        if op == "list":
+            return op, "GET", f"/employees/?page={rng.randint(1, 20)}&page_size=20", None
+        if op == "filter":
+            department = rng.choice(self.departments)
+            if rng.random() < 0.5:
+                path = f"/employees/?department={department}&min_salary={rng.randrange(30, 90)}000"
+            else:
+                path = (
+                    f"/employees/?filter=department%20%3D%20%22{department}%22%20and%20"
+                    f"salary%20%3E%3D%20{rng.randrange(30, 90)}000&sort=salary&order=desc"
+                )
+            return op, "GET", path, None
+        if op == "create":
+            self.counter += 1
+            return (
+                op,
+                "POST",
+                "/employees/",
+                {
+                    "name": f"Load Test {self.counter}",
+                    "email": f"load.{self.run_id}.{self.counter}@example.com",
+                    "department": rng.choice(self.departments),
+                    "salary": round(rng.lognormvariate(11, 0.35), 2),
+                },
+            )
+        if op == "update":
+            body = {"salary": round(rng.lognormvariate(11, 0.35), 2)}
+            return op, "PUT", f"/employees/{rng.choice(self.ids)}", body
+        emp_id = self.created.pop(rng.randrange(len(self.created)))
+        self.ids.remove(emp_id)
+        return op, "DELETE", f"/employees/{emp_id}", None
+
+    def completed(self, op: str, status: int, data: bytes) -> None:
+        """
+        Track employees created by the run.
+
+        Args:
+            op (str): Operation that completed.
+            status (int): Response status code.
+            data (bytes): Response body.
+
+        Returns:
+            None
+        """
+        if op == "create" and status == 201:
+            emp_id = json.loads(data)["id"]
+            self.ids.append(emp_id)
+            self.created.append(emp_id)
+
+
+async def discover_ids(transport, pages: int) -> list[int]:
+    """
+    Collect existing employee IDs from the first pages of the list endpoint.
+
+    Args:
+        transport: HttpTransport or WsgiTransport.
+        pages (int): Number of 100-employee pages to read.
+
+    Returns:
+        list[int]: Employee IDs.
+    """
+    ids = []
+    for page in range(1, pages + 1):
+        status, data = await transport.request(
+            "GET", f"/employees/?page={page}&page_size=100", None
+        )
+        if status != 200:
+            raise SystemExit(f"Listing employees failed with status {status}: {data[:200]!r}")
+        employees = json.loads(data)["employees"]
+        ids.extend(employee["id"] for employee in employees)
+        if len(employees) < 100:
+            break
+    return ids
+
+
+async def run_load(transport, workload: Workload, args) -> dict:
+    """
+    Offer load on a fixed schedule and measure every request from its scheduled start.
+
+    Args:
+        transport: HttpTransport or WsgiTransport.
+        workload (Workload): Operation generator.
+        args (argparse.Namespace): Rate, duration, warmup, concurrency and arrival options.
+
+    Returns:
+        dict: Histograms, status counts and timing of the measured window.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(args.concurrency)
+    overall = LatencyHistogram()
+    per_op = {op: LatencyHistogram() for op in OPERATIONS}
+    statuses: dict[str, dict[str, int]] = {op: {} for op in OPERATIONS}
+    errors = 0
+
+    async def fire(op: str, method: str, path: str, body, scheduled: float, measured: bool):
+        nonlocal errors
+        async with semaphore:
+            try:
+                status, data = await transport.request(method, path, body)
+            except Exception as e:  # count transport failures as errors
+                status, data = type(e).__name__, b""
+        latency = loop.time() - scheduled
+        if isinstance(status, int):
+            workload.completed(op, status, data)
+        if measured:
+            overall.record(latency)
+            per_op[op].record(latency)
+            key = str(status)
+            statuses[op][key] = statuses[op].get(key, 0) + 1
+            if not isinstance(status, int) or status >= 400:
+                errors += 1
+
+    start = loop.time() + 0.05
+    measure_from = start + args.warmup
+    end = measure_from + args.duration
+    scheduled = start
+    tasks = set()
+    while scheduled < end:
+        delay = scheduled - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        op, method, path, body = workload.next()
+        task = asyncio.create_task(
+            fire(op, method, path, body, scheduled, scheduled >= measure_from)
+        )
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        if args.arrival == "poisson":
+            scheduled += workload.rng.expovariate(args.rate)
+        else:
+            scheduled += 1 / args.rate
+    await asyncio.gather(*tasks)
+    elapsed = loop.time() - measure_from
+    return {
+        "overall": overall,
+        "per_op": per_op,
+        "statuses": statuses,
+        "errors": errors,
+        "elapsed": elapsed,
+    }
+
+
+def git_revision() -> str | None:
+    """Return the short commit hash of the working tree, if available."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def summarize(result: dict, args) -> dict:
+    """
+    Build a JSON-serializable summary of a run.
+
+    Args:
+        result (dict): Output of run_load.
+        args (argparse.Namespace): Run options.
+
+    Returns:
+        dict: Configuration, throughput, error rate and latency percentiles.
+    """
+    overall = result["overall"]
+
+    def latencies(histogram: LatencyHistogram) -> dict:
+        return {
+            "mean_ms": round(histogram.mean, 3),
+            **{f"p{p:g}_ms": histogram.percentile(p) for p in REPORT_PERCENTILES},
+        }
+
+    return {
+        "revision": git_revision(),
+        "target": args.url or "in-process",
+        "rate": args.rate,
+        "arrival": args.arrival,
+        "duration": args.duration,
+        "concurrency": args.concurrency,
+        "mix": args.mix,
+        "seed": args.seed,
+        "requests": overall.total,
+        "throughput_rps": round(overall.total / result["elapsed"], 1),
+        "error_rate": round(result["errors"] / overall.total, 4) if overall.total else 0.0,
+        "latency": latencies(overall),
+        "operations": {
+            op: {
+                "count": histogram.total,
+                "statuses": result["statuses"][op],
+                **latencies(histogram),
+            }
+            for op, histogram in result["per_op"].items()
+            if histogram.total
+        },
+    }
+
+
+def print_report(summary: dict, overall: LatencyHistogram) -> None:
+    """
+    Print the human-readable report.
+
+    Args:
+        summary (dict): Output of summarize.
+        overall (LatencyHistogram): Latencies of all measured requests.
+
+    Returns:
+        None
+    """
+    print(
+        f"target {summary['target']}  rate {summary['rate']}/s ({summary['arrival']})  "
+        f"duration {summary['duration']}s  revision {summary['revision'] or '-'}"
+    )
+    print(
+        f"requests {summary['requests']}  throughput {summary['throughput_rps']}/s  "
+        f"errors {summary['error_rate']:.2%}"
+    )
+    print()
+    print(f"{'operation':<10}{'count':>8}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}  statuses")
+    for op, stats in summary["operations"].items():
+        statuses = " ".join(
+            f"{status}:{count}" for status, count in sorted(stats["statuses"].items())
+        )
+        print(
+            f"{op:<10}{stats['count']:>8}{stats['p50_ms']:>10.2f}{stats['p99_ms']:>10.2f}"
+            f"{stats['p100_ms']:>10.2f}  {statuses}"
+        )
+    print()
+    print(f"{'Value (ms)':>12}{'Percentile':>14}{'TotalCount':>12}{'1/(1-Percentile)':>18}")
+    for value, percentile, count in overall.distribution():
+        inverse = f"{1 / (1 - percentile / 100):.2f}" if percentile < 100 else "inf"
+        print(f"{value:>12.3f}{percentile / 100:>14.6f}{count:>12}{inverse:>18}")
+    print(
+        f"#[Mean = {overall.mean:.3f}, Max = {overall.max / 1000:.3f}, "
+        f"Total count = {overall.total}]"
+    )
+
+
+def parse_mix(text: str) -> dict[str, int]:
+    """
+    Parse an operation mix such as "read=80,list=20".
+
+    Args:
+        text (str): Comma-separated operation=weight pairs.
+
+    Returns:
+        dict[str, int]: Weight of each operation.
+
+    Raises:
+        argparse.ArgumentTypeError: If an operation or weight is invalid.
+    """
+    mix = {}
+    for item in text.split(","):
+        op, _, weight = item.partition("=")
+        if op.strip() not in OPERATIONS or not weight.strip().isdigit():
+            raise argparse.ArgumentTypeError(
+                f"Invalid mix entry {item!r}; use operation=weight with one of {OPERATIONS}."
+            )
+        mix[op.strip()] = int(weight)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("The mix needs at least one positive weight.")
+    return mix
+
+
+def build_app(args):
+    """
+    Create the in-process application, initializing and seeding its database if empty.
+
+    Args:
+        args (argparse.Namespace): Database URL, seed count and tenant options.
+
+    Returns:
+        Flask: The application.
+    """
+    from app import create_app
+    from app.extensions import db
+    from app.models import employee_archive, employee_change  # noqa: F401
+    from app.repositories.employee_repository import employee_repository
+    from app.utils.data_generator import generate_employees
+    from app.utils.tenant import tenant_context
+
+    database_url = args.database_url or os.getenv("DATABASE_URL")
+    if database_url is None:
+        database_url = f"sqlite:///{tempfile.mkdtemp()}/load_test.db"
+    app = create_app(config={"SQLALCHEMY_DATABASE_URI": database_url})
+    app.logger.disabled = True
+    with app.app_context(), tenant_context(args.tenant):
+        db.create_all()
+        if args.seed_count and not employee_repository.get_all({"page_size": 1})[1]:
+            employee_repository.bulk_create(generate_employees(args.seed_count, seed=args.seed))
+    return app
+
+
+async def main_async(args) -> None:
+    from app.utils.data_generator import department_names
+
+    headers = {"X-Tenant-ID": args.tenant} if args.tenant else {}
+    if args.url:
+        transport = HttpTransport(args.url, headers)
+    else:
+        transport = WsgiTransport(build_app(args), headers, threads=args.concurrency)
+    try:
+        ids = await discover_ids(transport, args.id_pages)
+        workload = Workload(args.mix, random.Random(args.seed), ids, department_names(8))
+        result = await run_load(transport, workload, args)
+    finally:
+        await transport.close()
+    summary = summarize(result, args)
+    print_report(summary, result["overall"])
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(summary, f, indent=2)
+        print(f"\nWrote {args.json}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--url", help="Base URL of a running instance")
+    target.add_argument("--in-process", action="store_true", help="Drive create_app() via WSGI")
+    parser.add_argument("--rate", type=float, default=100, help="Target requests per second")
+    parser.add_argument("--duration", type=float, default=10, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=2, help="Unmeasured seconds first")
+    parser.add_argument("--concurrency", type=int, default=64, help="Maximum in-flight requests")
+    parser.add_argument("--arrival", choices=("constant", "poisson"), default="constant")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX))
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the operation mix")
+    parser.add_argument("--tenant", help="Tenant ID sent as X-Tenant-ID")
+    parser.add_argument("--id-pages", type=int, default=10, help="Pages of IDs to discover")
+    parser.add_argument("--database-url", help="In-process database (default: temp SQLite)")
+    parser.add_argument("--seed-count", type=int, default=10000, help="In-process seed rows")
+    parser.add_argument("--json", help="Write the summary to this JSON file")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
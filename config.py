@@ -1,3 +1,4 @@
+import json
 import os
 
 
@@ -11,3 +12,116 @@ class Config:
         f"{os.getenv('DB_NAME', 'employee')}"
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Multi-tenancy: the tenant comes from this header, else from the subdomain of
+    # TENANT_SUBDOMAIN_BASE (e.g. acme.example.com), else DEFAULT_TENANT
+    TENANT_HEADER = os.getenv("TENANT_HEADER", "X-Tenant-ID")
+    TENANT_SUBDOMAIN_BASE = os.getenv("TENANT_SUBDOMAIN_BASE")
+    DEFAULT_TENANT = os.getenv("DEFAULT_TENANT", "default")
+    # Optional dedicated databases, as a JSON object of tenant ID to database URI
+    TENANT_BINDS = json.loads(os.getenv("TENANT_BINDS") or "{}")
+    SQLALCHEMY_BINDS = {f"tenant:{tenant}": uri for tenant, uri in TENANT_BINDS.items()}
+
+    # Server-sent events stream
+    SSE_QUEUE_SIZE = int(os.getenv("SSE_QUEUE_SIZE", 256))
+    SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", 15))
+    # Interval at which waiting subscribers poll the change log for other processes' writes
+    SSE_POLL_SECONDS = float(os.getenv("SSE_POLL_SECONDS", 0.5))
+    # Open streams per worker, each holding a thread for its lifetime; further streams are shed
+    # with 503 so they cannot take every thread (gunicorn.conf.py adds as many threads)
+    SSE_MAX_STREAMS = int(os.getenv("SSE_MAX_STREAMS", 16))
+
+    # List query result cache (0 disables it)
+    QUERY_CACHE_SIZE = int(os.getenv("QUERY_CACHE_SIZE", 1024))
+    # Serve the previous page while one background refresh runs after a write
+    QUERY_CACHE_STALE_WHILE_REVALIDATE = (
+        os.getenv("QUERY_CACHE_STALE_WHILE_REVALIDATE", "false").lower() == "true"
+    )
+
+    # Validated query parameter models reused per distinct query string (0 disables the cache)
+    QUERY_MODEL_CACHE_SIZE = int(os.getenv("QUERY_MODEL_CACHE_SIZE", 1024))
+
+    # Prebuilt repository statements, one per query shape (0 builds every statement anew)
+    STATEMENT_CACHE_SIZE = int(os.getenv("STATEMENT_CACHE_SIZE", 256))
+
+    # Precomputed OpenAPI document (see `flask openapi-export`); generated lazily if unset
+    OPENAPI_SPEC_FILE = os.getenv("OPENAPI_SPEC_FILE")
+
+    # Salary analytics snapshot: minimum seconds between change log catch-ups
+    ANALYTICS_REFRESH_SECONDS = float(os.getenv("ANALYTICS_REFRESH_SECONDS", 1))
+
+    # Change log readers (analytics, the db: invalidation bus) wait this long for an ID that is
+    # missing (not yet committed, or rolled back) before giving up on it and reloading
+    CHANGE_CURSOR_GRACE_SECONDS = float(os.getenv("CHANGE_CURSOR_GRACE_SECONDS", 60))
+
+    # Soft-deleted employees are moved to employees_archive after this many days
+    ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", 30))
+
+    # Reverse proxies (e.g. nginx, a load balancer) in front of the app whose X-Forwarded-For and
+    # X-Forwarded-Proto headers are trusted; clients are identified by the address they report
+    PROXY_FIX_HOPS = int(os.getenv("PROXY_FIX_HOPS", 0))
+
+    # Admission control: token buckets per client (known API key, else address) and route,
+    # as "<count>/<second|minute|hour|day>"; RATE_LIMIT_ROUTES overrides by endpoint name
+    RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_KEY_HEADER = os.getenv("RATE_LIMIT_KEY_HEADER", "X-API-Key")
+    # Comma-separated API keys with buckets of their own; other keys count as their address
+    RATE_LIMIT_API_KEYS = frozenset(
+        key.strip() for key in os.getenv("RATE_LIMIT_API_KEYS", "").split(",") if key.strip()
+    )
+    RATE_LIMIT_DEFAULT = os.getenv("RATE_LIMIT_DEFAULT", "100/second")
+    RATE_LIMIT_ROUTES = json.loads(
+        os.getenv("RATE_LIMIT_ROUTES") or '{"employee.get_all_employees": "20/second"}'
+    )
+    # "memory" (per process) or "sqlite:///<path>" to share buckets between local workers
+    RATE_LIMIT_STORAGE = os.getenv("RATE_LIMIT_STORAGE", "memory")
+    # Maximum in-flight requests per worker, by endpoint or blueprint name; excess requests
+    # wait up to CONCURRENCY_QUEUE_TIMEOUT seconds and are then shed with 503
+    CONCURRENCY_LIMITS = {
+        "employee.stream_employee_changes": SSE_MAX_STREAMS,
+        **json.loads(
+            os.getenv("CONCURRENCY_LIMITS")
+            or '{"employee.get_all_employees": 8, "employee.get_cache_stats": 2, "analytics": 4}'
+        ),
+    }
+    CONCURRENCY_QUEUE_TIMEOUT = float(os.getenv("CONCURRENCY_QUEUE_TIMEOUT", 0.05))
+
+    # Transactional outbox: employee writes also record a message for downstream systems,
+    # delivered by `flask outbox-dispatch` to each sink ("log:", "file:///path", http(s) URL)
+    OUTBOX_ENABLED = os.getenv("OUTBOX_ENABLED", "false").lower() == "true"
+    OUTBOX_SINKS = json.loads(os.getenv("OUTBOX_SINKS") or '["log:"]')
+    OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", 100))
+    OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", 10))
+    OUTBOX_BACKOFF_SECONDS = float(os.getenv("OUTBOX_BACKOFF_SECONDS", 1))
+    OUTBOX_BACKOFF_MAX_SECONDS = float(os.getenv("OUTBOX_BACKOFF_MAX_SECONDS", 300))
+    OUTBOX_LEASE_SECONDS = float(os.getenv("OUTBOX_LEASE_SECONDS", 60))
+    OUTBOX_POLL_SECONDS = float(os.getenv("OUTBOX_POLL_SECONDS", 1))
+    OUTBOX_RETENTION_DAYS = float(os.getenv("OUTBOX_RETENTION_DAYS", 7))
+
+    # Request tracing: spans per layer (validate, controller, service, repository, db,
+    # serialize) exported in the background to each sink ("log:", "file:///path", or the
+    # http(s):// OTLP traces endpoint of a collector). TRACING_SERVER_TIMING (on in debug
+    # mode) adds a Server-Timing header with the per-layer breakdown of each response
+    TRACING_ENABLED = os.getenv("TRACING_ENABLED", "false").lower() == "true"
+    TRACING_SINKS = json.loads(os.getenv("TRACING_SINKS") or '["log:"]')
+    TRACING_SERVER_TIMING = os.getenv("TRACING_SERVER_TIMING", "false").lower() == "true"
+    TRACING_QUEUE_SIZE = int(os.getenv("TRACING_QUEUE_SIZE", 1000))
+
+    # Cache invalidation bus between the nodes of a scaled-out deployment: "local:" (single
+    # process), "db:" (poll the shared database), "unix:///shared/dir" (processes of one host)
+    # or a redis:// URL (requires requirements-bus.txt); gunicorn.conf.py defaults to unix://
+    # when it runs more than one worker
+    INVALIDATION_BUS = os.getenv("INVALIDATION_BUS", "local:")
+    INVALIDATION_POLL_SECONDS = float(os.getenv("INVALIDATION_POLL_SECONDS", 0.5))
+    INVALIDATION_RETENTION_SECONDS = float(os.getenv("INVALIDATION_RETENTION_SECONDS", 3600))
+
+    # Background jobs (POST /jobs), run by `flask jobs-worker`; result and upload files live in
+    # JOB_STORAGE_DIR, which the web and worker processes must share
+    JOB_STORAGE_DIR = os.getenv("JOB_STORAGE_DIR")
+    JOB_WORKER_PROCESSES = int(os.getenv("JOB_WORKER_PROCESSES", 2))
+    JOB_BATCH_SIZE = int(os.getenv("JOB_BATCH_SIZE", 1000))
+    JOB_POLL_SECONDS = float(os.getenv("JOB_POLL_SECONDS", 1))
+    JOB_LEASE_SECONDS = float(os.getenv("JOB_LEASE_SECONDS", 300))
+    JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", 3))
+    # Days finished jobs are kept, with their result files, before workers delete them
+    JOB_RETENTION_DAYS = float(os.getenv("JOB_RETENTION_DAYS", 7))
@@ -1,6 +1,21 @@
+import sqlite3
+
 import pytest
 
 from app import create_app, db
+from app.repositories.department_repository import department_repository
+from app.repositories.employee_repository import employee_repository
+from app.services.analytics_service import analytics_service
+from app.services.change_stream import change_stream
+from app.services.department_service import department_service
+from app.utils.data_generator import generate_employees
+from app.utils.query_cache import query_cache
+
+# Template databases are built once per test session (and per xdist worker, since each worker
+# is its own process with its own in-memory database) and copied into the app's database
+# before every test with the SQLite backup API, which is much cheaper than recreating the
+# schema or re-inserting the rows.
+DATASETS = {"empty": 0, "1k": 1_000, "100k": 100_000}
 
 
 @pytest.fixture(scope="session")
@@ -8,24 +23,100 @@ def app():
     """
     Create and configure a new app instance for each test session.
     """
-    # Use a dedicated testing configuration
-    app = create_app()
-    app.config.update(
-        {
+    # Use a dedicated testing configuration, applied before the database is initialized
+    app = create_app(
+        config={
             "TESTING": True,
-            "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",  # Use in-memory SQLite
+            "SQLALCHEMY_DATABASE_URI": "sqlite://",  # Use in-memory SQLite
             "WTF_CSRF_ENABLED": False,  # Disable CSRF for tests
             "DEBUG": False,
+            "RATE_LIMIT_ENABLED": False,  # Enabled explicitly by the admission control tests
         }
     )
+    with app.app_context():
+        from app.models import (  # noqa: F401
+            cache_invalidation,
+            department,
+            employee_archive,
+            employee_change,
+            employee_snapshot,
+            job,
+            outbox_message,
+        )
+
+        db.create_all()
     yield app
 
 
-@pytest.fixture(scope="function")
-def client(app):
-    """A test client for the app."""
+@pytest.fixture(scope="session")
+def templates(app):
+    """
+    Lazily built in-memory template databases, keyed by dataset name.
+    """
+    built: dict[str, sqlite3.Connection] = {}
+
+    def get(name: str) -> sqlite3.Connection:
+        if name not in built:
+            with app.app_context():
+                _restore(built.get("empty"))
+                _seed(DATASETS[name])
+                template = sqlite3.connect(":memory:", check_same_thread=False)
+                _backup(target=template)
+                built[name] = template
+        return built[name]
+
+    get("empty")
+    yield get
+    for template in built.values():
+        template.close()
+
+
+def _backup(source: sqlite3.Connection | None = None, target: sqlite3.Connection | None = None):
+    """Copy between a template and the app's single in-memory SQLite connection."""
+    connection = db.engine.raw_connection()
+    try:
+        (source or connection.driver_connection).backup(target or connection.driver_connection)
+    finally:
+        connection.close()
+
+
+def _restore(template: sqlite3.Connection | None) -> None:
+    """Overwrite the app's database with a copy of a template database."""
+    if template is not None:
+        _backup(source=template)
+
+
+def _seed(count: int) -> None:
+    """Bulk insert a deterministic set of employees."""
+    employee_repository.bulk_create(generate_employees(count, seed=count))
+
+
+def _client(app, templates, dataset: str):
+    """Yield a test client over a fresh copy of the given dataset."""
+    query_cache.clear()
+    department_repository.clear()  # the restored copy may number departments differently
+    department_service.reset()
+    analytics_service.reset()
+    change_stream.reset()
     with app.app_context():
-        db.create_all()
+        _restore(templates(dataset))
         yield app.test_client()
         db.session.remove()
-        db.drop_all()
+
+
+@pytest.fixture(scope="function")
+def client(app, templates):
+    """A test client for the app, over an empty copy of the schema."""
+    yield from _client(app, templates, "empty")
+
+
+@pytest.fixture(scope="function")
+def seeded_1k(app, templates):
+    """A test client over a copy of a deterministic 1,000-employee dataset."""
+    yield from _client(app, templates, "1k")
+
+
+@pytest.fixture(scope="function")
+def seeded_100k(app, templates):
+    """A test client over a copy of a deterministic 100,000-employee dataset."""
+    yield from _client(app, templates, "100k")
@@ -4,6 +4,8 @@
 set -e
 
 echo "Running database initializations..."
-flask --app app/run.py init-db
+flask --app "app:create_app(with_api=False)" init-db
+flask --app "app:create_app(with_api=False)" migrate-db
+flask --app "app:create_app(with_api=False)" migrate-departments
 
 exec "$@"
@@ -0,0 +1,131 @@
+"""
+Gunicorn settings for production deployments, with one profile per worker model.
+
+Select the profile with GUNICORN_PROFILE:
+    sync     One request per process. Workers = 2 * CPUs + 1. Simple and isolated, but a slow
+             client or an open /employees/stream connection occupies a whole worker.
+    gthread  Default. Workers = CPUs + 1, each with GUNICORN_THREADS request threads (4)
+             that overlap database waits, plus SSE_MAX_STREAMS threads (16) for
+             /employees/stream. Each open stream holds a thread for its lifetime; streams
+             beyond SSE_MAX_STREAMS are shed with 503 instead of taking the request threads.
+    gevent   Workers = CPUs + 1, each serving up to GUNICORN_WORKER_CONNECTIONS (1000)
+             greenlets, of which up to SSE_MAX_STREAMS (500) may be streams. Best for many
+             concurrent, mostly waiting connections, such as SSE subscribers. Requires
+             `pip install gevent` (PyMySQL is pure Python and yields cooperatively).
+
+Every value can be overridden through the GUNICORN_* environment variables below. With more
+than one worker, INVALIDATION_BUS defaults to a Unix socket bus between the workers. The
+application is preloaded in the master, so workers fork with the imported code and the
+precomputed OpenAPI document already in memory; each worker then discards the database
+connection pools inherited from the master and opens its own.
+
+Usage:
+    gunicorn -c gunicorn.conf.py "app.run:app"
+"""
+
+import os
+import tempfile
+
+
+def _cpu_count() -> int:
+    # The CPUs this container may run on, rather than every CPU of the host
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, default))
+
+
+PROFILES = {
+    "sync": {
+        "worker_class": "sync",
+        "workers": 2 * _cpu_count() + 1,
+        "threads": 1,
+        "streams": 1,
+    },
+    "gthread": {
+        "worker_class": "gthread",
+        "workers": _cpu_count() + 1,
+        "threads": 4,
+        "streams": 16,
+    },
+    "gevent": {
+        "worker_class": "gevent",
+        "workers": _cpu_count() + 1,
+        "threads": 1,
+        "streams": 500,
+    },
+}
+
+profile_name = os.getenv("GUNICORN_PROFILE", "gthread")
+if profile_name not in PROFILES:
+    raise RuntimeError(
+        f"Unknown GUNICORN_PROFILE {profile_name!r}; expected one of {', '.join(PROFILES)}."
+    )
+profile = PROFILES[profile_name]
+
+if profile_name == "gevent":
+    # Patch before the preloaded application creates its locks, sockets and threads
+    from gevent import monkey
+
+    monkey.patch_all()
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+worker_class = profile["worker_class"]
+workers = _env_int("GUNICORN_WORKERS", profile["workers"])
+worker_connections = _env_int("GUNICORN_WORKER_CONNECTIONS", 1000)
+
+# Open /employees/stream connections per worker, enforced by the application (config.py reads
+# the variable); under gthread, each gets a thread of its own on top of the request threads,
+# so streams never hold the threads that serve ordinary requests
+sse_max_streams = _env_int("SSE_MAX_STREAMS", profile["streams"])
+os.environ["SSE_MAX_STREAMS"] = str(sse_max_streams)
+threads = _env_int("GUNICORN_THREADS", profile["threads"])
+if worker_class == "gthread":
+    threads += sse_max_streams
+
+# Several workers each cache list pages and counts, so a write must reach the other workers'
+# caches. Unless a bus is configured (e.g. db: to include other hosts and the jobs worker), the
+# workers of this server exchange invalidations through Unix sockets in a directory of their own
+if workers > 1 and not os.getenv("INVALIDATION_BUS"):
+    os.environ["INVALIDATION_BUS"] = "unix://" + tempfile.mkdtemp(prefix="ems-invalidation-")
+
+# Import the application once in the master; see post_fork for the database connections
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() == "true"
+
+# Recycle workers after a bounded number of requests, staggered so they do not restart together
+max_requests = _env_int("GUNICORN_MAX_REQUESTS", 2000)
+max_requests_jitter = _env_int("GUNICORN_MAX_REQUESTS_JITTER", 200)
+
+# Seconds a worker may stay silent before it is killed and replaced (request time for sync)
+timeout = _env_int("GUNICORN_TIMEOUT", 30)
+# Seconds in-flight requests get to finish after a restart or shutdown signal
+graceful_timeout = _env_int("GUNICORN_GRACEFUL_TIMEOUT", 30)
+# Seconds an idle keep-alive connection stays open; above the proxy's idle timeout behind a
+# load balancer, so the proxy closes first
+keepalive = _env_int("GUNICORN_KEEPALIVE", 5)
+
+# Heartbeat files on tmpfs: a Docker overlay filesystem can stall the worker heartbeat
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def post_fork(server, worker):
+    """
+    Drop the database connection pools a worker inherited from the preloaded master, then
+    join the cache invalidation bus as a node of its own.
+
+    Connections opened before the fork would otherwise be shared by every worker's process.
+    `close=False` leaves the parent's connections alone and starts a fresh pool.
+    """
+    if not server.cfg.preload_app:
+        return
+    from app.extensions import db
+    from app.utils.invalidation_bus import invalidation_bus
+
+    with server.app.wsgi().app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+    invalidation_bus.after_fork()
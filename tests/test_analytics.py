@@ -0,0 +1,144 @@
+import json
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from app.services.analytics_service import analytics_service  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def fresh_snapshot(client):
+    """Fixture to rebuild the analytics snapshot from each test's database."""
+    analytics_service.reset()
+    analytics_service.refresh_interval = 0
+
+
+def _create(client, name, department, salary):
+    response = client.post(
+        "/employees/",
+        data=json.dumps(
+            {
+                "name": name,
+                "email": f"{name.lower()}@test.com",
+                "department": department,
+                "salary": salary,
+            }
+        ),
+        content_type="application/json",
+    )
+    return response.get_json()["id"]
+
+
+def test_percentiles_and_histogram(client):
+    """Test GET /employees/analytics/percentiles and /histogram."""
+    for i, salary in enumerate([10, 20, 30, 40, 50]):
+        _create(client, f"P{i}", "IT", salary)
+    _create(client, "Other", "HR", 1000)
+
+    data = client.get("/employees/analytics/percentiles?department=IT&p=50,100").get_json()
+    assert data == {"count": 5, "percentiles": {"50": 30.0, "100": 50.0}}
+
+    data = client.get("/employees/analytics/histogram?edges=0,25,1000,2000").get_json()
+    assert data["counts"] == [2, 3, 1]
+
+
+def test_snapshot_follows_writes_incrementally(client):
+    """Test that updates and deletes after the initial load are reflected."""
+    low = _create(client, "Low", "IT", 100)
+    high = _create(client, "High", "IT", 900)
+    assert client.get("/employees/analytics/top?n=1").get_json()["employees"][0]["id"] == high
+
+    client.put(
+        f"/employees/{low}", data=json.dumps({"salary": 5000}), content_type="application/json"
+    )
+    client.delete(f"/employees/{high}")
+    _create(client, "New", "Sales", 50)
+
+    top = client.get("/employees/analytics/top?n=5").get_json()["employees"]
+    assert [(e["department"], e["salary"]) for e in top] == [("IT", 5000.0), ("Sales", 50.0)]
+    assert top[0]["id"] == low
+
+    data = client.get("/employees/analytics/filter?department=Sales").get_json()
+    assert data["count"] == 1
+    assert data["salary_mean"] == 50.0
+
+
+def test_invalid_percentile_is_rejected(client):
+    """Test that out-of-range percentiles fail validation."""
+    response = client.get("/employees/analytics/percentiles?p=150")
+    assert response.status_code == 422
+
+
+def test_changes_committed_out_of_order_are_applied(client):
+    """Test that a change log entry becoming visible after a later one is not skipped."""
+    from app.extensions import db
+    from app.models.employee_change import EmployeeChange
+
+    _create(client, "First", "IT", 100)
+    assert client.get("/employees/analytics/filter").get_json()["count"] == 1
+    last = db.session.scalar(db.select(db.func.max(EmployeeChange.id)))
+
+    def commit_change(change_id, emp_id, salary):
+        payload = {"department": "IT", "salary": salary, "date_joined": "2024-01-01T00:00:00"}
+        db.session.add(
+            EmployeeChange(id=change_id, employee_id=emp_id, operation="insert", payload=payload)
+        )
+        db.session.commit()
+
+    commit_change(last + 2, 1001, 200)  # last + 1 is still in flight
+    assert client.get("/employees/analytics/filter").get_json()["count"] == 2
+    commit_change(last + 1, 1000, 300)
+    data = client.get("/employees/analytics/filter").get_json()
+    assert data["count"] == 3
+    assert sorted(data["ids"])[-2:] == [1000, 1001]
+
+
+def test_bulk_inserted_employees_reach_the_snapshot(client):
+    """Test that employees inserted by bulk_create after the initial load are included."""
+    from app.repositories.employee_repository import employee_repository
+    from app.utils.data_generator import generate_employees
+
+    _create(client, "First", "IT", 100)
+    assert client.get("/employees/analytics/filter").get_json()["count"] == 1
+
+    rows = [row for batch in generate_employees(25, batch_size=10) for row in batch]
+    employee_repository.bulk_create([rows[:10], rows[10:]])
+    data = client.get("/employees/analytics/filter?limit=100").get_json()
+    assert data["count"] == 26
+    assert len(data["ids"]) == 26
+
+
+def test_reload_of_one_tenant_does_not_block_another(app, client, monkeypatch):
+    """Test that a tenant's snapshot is loaded without holding other tenants' snapshots."""
+    import threading
+
+    from app.utils.tenant import current_tenant, tenant_context
+
+    _create(client, "First", "IT", 100)
+    loading, release = threading.Event(), threading.Event()
+    iter_columns = analytics_service.repository.iter_columns
+
+    def slow_iter_columns(*args, **kwargs):
+        if current_tenant() == "slow":
+            loading.set()
+            release.wait(timeout=5)
+        return iter_columns(*args, **kwargs)
+
+    monkeypatch.setattr(analytics_service.repository, "iter_columns", slow_iter_columns)
+    results = []
+
+    def query_slow_tenant():
+        with app.app_context(), tenant_context("slow"):
+            results.append(analytics_service.filter({})["count"])
+
+    thread = threading.Thread(target=query_slow_tenant)
+    thread.start()
+    assert loading.wait(timeout=5)
+    try:
+        assert client.get("/employees/analytics/filter").get_json()["count"] == 1
+        assert results == []  # still loading
+    finally:
+        release.set()
+        thread.join()
+    assert results == [0]
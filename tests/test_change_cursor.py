@@ -0,0 +1,20 @@
+from app.utils.change_cursor import ChangeCursor
+
+
+def test_cursor_waits_for_missing_ids():
+    """Test that the position stays below a missing ID until it shows up."""
+    cursor = ChangeCursor(position=10)
+    assert not cursor.advance([11, 13, 14])
+    assert cursor.position == 11
+    assert 13 in cursor and 12 not in cursor
+
+    assert not cursor.advance([12, 13, 14, 15])
+    assert cursor.position == 15
+
+
+def test_cursor_gives_up_on_ids_missing_past_the_grace_period():
+    """Test that a missing ID is given up on after the grace period, asking for a reload."""
+    cursor = ChangeCursor(position=0, grace_seconds=0)
+    assert cursor.advance([1, 3])
+    assert cursor.position == 3
+    assert not cursor.advance([4])
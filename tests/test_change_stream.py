@@ -0,0 +1,60 @@
+from app.extensions import db
+from app.models.employee import Employee
+from app.models.employee_change import EmployeeChange
+from app.repositories.employee_repository import employee_repository
+from app.services.change_stream import ChangeStream, change_stream
+
+
+def _drain(subscription):
+    """Collect the events a subscription has queued."""
+    events = []
+    while (event := subscription.get(timeout=0)) is not None:
+        events.append(event)
+    return events
+
+
+def test_writes_of_other_processes_are_streamed_in_change_id_order(client):
+    """Test that polled change log entries are streamed with their ID, waiting for gaps."""
+    subscription = change_stream.subscribe(None, maxsize=16, tenant_id="default")
+    # Written by another process: nothing notifies this one
+    employee = employee_repository.create(Employee(name="Other", email="other@stream.com"))
+    change_stream.poll()
+    (event,) = _drain(subscription)
+    last = db.session.scalar(db.select(db.func.max(EmployeeChange.id)))
+    assert (event.id, event.type, event.data["email"]) == (last, "insert", "other@stream.com")
+
+    def commit_change(change_id, tenant_id="default"):
+        db.session.add(
+            EmployeeChange(
+                id=change_id, tenant_id=tenant_id, employee_id=employee.id, operation="delete"
+            )
+        )
+        db.session.commit()
+
+    commit_change(last + 3)  # last + 1 and last + 2 are still in flight
+    commit_change(last + 2, tenant_id="acme")
+    change_stream.poll()
+    assert _drain(subscription) == []
+    commit_change(last + 1)
+    change_stream.poll()
+    events = _drain(subscription)
+    assert [(e.id, e.data) for e in events] == [
+        (last + 1, {"id": employee.id}),
+        (last + 3, {"id": employee.id}),
+    ]
+    change_stream.unsubscribe(subscription)
+
+
+def test_resume_token_is_valid_on_another_process(client, app):
+    """Test that a process that never streamed an event replays the events after it."""
+    ids = []
+    for name in ("A", "B", "C"):
+        client.post("/employees/", json={"name": name, "email": f"{name}@resume.com"})
+        ids.extend(employee_repository.get_recent_change_ids(1))
+
+    other = ChangeStream(employee_repository)
+    other.init_app(app)
+    subscription = other.subscribe(ids[0], maxsize=16, tenant_id="default")
+    events = _drain(subscription)
+    assert [event.id for event in events] == ids[1:]
+    assert [event.data["name"] for event in events] == ["B", "C"]
@@ -0,0 +1,46 @@
+from collections import Counter
+
+import pytest
+
+from app.repositories.employee_repository import employee_repository
+from app.utils.data_generator import generate_employees
+
+
+def test_generation_is_deterministic_and_batched():
+    """Test that equal arguments give equal rows, split into batches."""
+    first = list(generate_employees(25, seed=7, batch_size=10))
+    second = list(generate_employees(25, seed=7, batch_size=10))
+
+    assert [len(batch) for batch in first] == [10, 10, 5]
+    assert first == second
+    assert first != list(generate_employees(25, seed=8, batch_size=10))
+
+
+def test_emails_are_unique_and_departments_skewed():
+    """Test unique emails, the requested department count and Zipf-skewed sizes."""
+    rows = [row for batch in generate_employees(5000, departments=5) for row in batch]
+
+    assert len({row["email"] for row in rows}) == 5000
+    sizes = Counter(row["department"] for row in rows).most_common()
+    assert len(sizes) == 5
+    assert sizes[0][0] == "Engineering"
+    assert sizes[0][1] > 2 * sizes[-1][1]
+    assert all(row["salary"] > 0 for row in rows)
+
+
+def test_unknown_distribution_is_rejected():
+    """Test that an unknown salary distribution raises ValueError."""
+    with pytest.raises(ValueError):
+        next(generate_employees(1, distribution="bimodal"))
+
+
+def test_seed_command_inserts_employees(app, client):
+    """Test that `flask seed` bulk inserts employees for the requested tenant."""
+    result = app.test_cli_runner().invoke(
+        args=["seed", "--count", "120", "--distribution", "pareto", "--tenant", "acme"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Seeded 120 employees" in result.output
+    assert client.get("/employees/", headers={"X-Tenant-ID": "acme"}).get_json()["total"] == 120
+    assert employee_repository.get_all()[1] == 0  # default tenant untouched
@@ -0,0 +1,93 @@
+from sqlalchemy import create_engine, delete, inspect, text, update
+
+from app.extensions import db
+from app.models.department import Department
+from app.models.employee import Employee
+from app.repositories.department_repository import department_repository
+from app.repositories.employee_repository import employee_repository
+from app.utils.migrations import add_employee_department_key
+
+
+def test_list_departments_with_headcounts(client, monkeypatch):
+    """Test GET /departments - headcounts by key, cached until the next employee write."""
+    for i, department in enumerate(["IT", "IT", "HR"]):
+        client.post(
+            "/employees/", json={"name": f"E{i}", "email": f"e{i}@t.com", "department": department}
+        )
+    response = client.get("/departments/")
+    assert response.status_code == 200
+    departments = response.get_json()["departments"]
+    assert [(d["name"], d["headcount"]) for d in departments] == [("HR", 1), ("IT", 2)]
+
+    def fail():
+        raise AssertionError("served from the database")
+
+    monkeypatch.setattr(employee_repository, "count_by_department", fail)
+    assert client.get("/departments/").get_json()["departments"] == departments
+
+    monkeypatch.undo()
+    hr = next(d for d in departments if d["name"] == "HR")
+    client.delete(
+        f"/employees/{client.get('/employees/?department=HR').get_json()['employees'][0]['id']}"
+    )
+    after = client.get("/departments/").get_json()["departments"]
+    assert {d["name"]: d["headcount"] for d in after} == {"HR": 0, "IT": 2}
+    assert next(d for d in after if d["name"] == "HR")["id"] == hr["id"]
+
+
+def test_department_keys_are_written_and_filtered(client):
+    """Test that writes store the department key and filters compare keys."""
+    created = client.post(
+        "/employees/", json={"name": "Key", "email": "key@t.com", "department": "Ops"}
+    ).get_json()
+    client.put(f"/employees/{created['id']}", json={"department": "Legal"})
+    employee = db.session.get(Employee, created["id"])
+    assert employee.department_id == department_repository.get_id("Legal")
+    assert employee.version == 2
+
+    assert client.get("/employees/?department=Legal").get_json()["total"] == 1
+    assert client.get("/employees/?department=Ops").get_json()["total"] == 0
+    assert client.get("/employees/?department=Nowhere").get_json()["total"] == 0
+
+
+def test_rolled_back_department_is_not_cached(client):
+    """Test that a department created by a rolled-back transaction never enters the cache."""
+    db.session.add(Employee(name="Gone", email="gone@t.com", department="Temp"))
+    db.session.flush()
+    db.session.rollback()
+    assert department_repository.get_id("Temp") is None
+
+
+def test_migrate_departments_backfills_keys(app, seeded_1k):
+    """Test that the migration command backfills keys of rows written without them."""
+    db.session.execute(update(Employee).values(department_id=None))
+    db.session.execute(delete(Department))
+    db.session.commit()
+    department_repository.clear()
+
+    result = app.test_cli_runner().invoke(args=["migrate-departments", "--batch-size", "300"])
+    assert result.exit_code == 0, result.output
+    assert "Backfilled the department of 1000 employees." in result.output
+
+    missing = Employee.query.filter(
+        Employee.department.is_not(None), Employee.department_id.is_(None)
+    ).count()
+    assert missing == 0
+    total = Employee.query.filter_by(department="HR", deleted_at=None).count()
+    assert seeded_1k.get("/employees/?department=HR").get_json()["total"] == total
+    rerun = app.test_cli_runner().invoke(args=["migrate-departments"])
+    assert "Backfilled the department of 0 employees." in rerun.output
+
+
+def test_add_department_key_to_legacy_schema(tmp_path):
+    """Test that the schema migration adds the column to an old employees table, once."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as connection:
+        connection.execute(
+            text("CREATE TABLE employees (id INTEGER PRIMARY KEY, tenant_id VARCHAR(64))")
+        )
+    assert add_employee_department_key(engine) is True
+    assert "department_id" in {c["name"] for c in inspect(engine).get_columns("employees")}
+    assert "departments" in inspect(engine).get_table_names()
+    assert add_employee_department_key(engine) is False
+    engine.dispose()
@@ -1,9 +1,12 @@
 import json
 
 import pytest
+from sqlalchemy.exc import IntegrityError, OperationalError
 
 from app.extensions import db
 from app.models.employee import Employee
+from app.repositories.employee_repository import employee_repository
+from app.utils.rate_limiter import concurrency_limiter
 
 
 @pytest.fixture(autouse=True)
@@ -61,6 +64,7 @@ def test_get_employee_not_found(client):
     assert response.status_code == 404
     data = response.get_json()
     assert "not found" in data["error"]
+    assert data["code"] == "employee_not_found"
 
 
 def test_get_employee_success(client):
@@ -117,6 +121,59 @@ def test_update_employee_not_found(client):
     assert response.status_code == 404
 
 
+def test_update_employee_checks_version(client):
+    """Test PUT /employees/<id> - If-Match and body versions are enforced with 409."""
+    emp = Employee(name="Versioned", email="version@test.com")
+    db.session.add(emp)
+    db.session.commit()
+
+    etag = client.get(f"/employees/{emp.id}").headers["ETag"]
+    assert etag == '"1"'
+
+    response = client.put(
+        f"/employees/{emp.id}",
+        data=json.dumps({"name": "First"}),
+        content_type="application/json",
+        headers={"If-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.get_json()["version"] == 2
+    assert response.headers["ETag"] == '"2"'
+
+    # A second writer still holding the old version is rejected
+    response = client.put(
+        f"/employees/{emp.id}",
+        data=json.dumps({"name": "Second"}),
+        content_type="application/json",
+        headers={"If-Match": etag},
+    )
+    assert response.status_code == 409
+
+    response = client.put(
+        f"/employees/{emp.id}",
+        data=json.dumps({"name": "Second", "version": 1}),
+        content_type="application/json",
+    )
+    assert response.status_code == 409
+    assert client.get(f"/employees/{emp.id}").get_json()["name"] == "First"
+
+
+def test_update_employee_version_zero_and_disagreeing_versions(client):
+    """Test PUT /employees/<id> - If-Match "0" is a version, and header and body must agree."""
+    created = client.post("/employees/", json={"name": "Zero", "email": "zero@test.com"})
+    assert created.headers["ETag"] == '"1"'
+    url = f"/employees/{created.get_json()['id']}"
+
+    response = client.put(url, json={"name": "Stale"}, headers={"If-Match": '"0"'})
+    assert response.status_code == 409
+
+    response = client.put(url, json={"name": "Mixed", "version": 2}, headers={"If-Match": '"1"'})
+    assert response.status_code == 409
+    response = client.put(url, json={"name": "Mixed", "version": 1}, headers={"If-Match": '"2"'})
+    assert response.status_code == 409
+    assert client.get(url).get_json()["name"] == "Zero"
+
+
 def test_delete_employee_success(client):
     """Test DELETE /employees/<id> - success."""
     emp = Employee(name="Delete Me", email="delete@test.com")
@@ -151,4 +208,225 @@ def test_generic_exception_handler(client, monkeypatch):
     assert response.status_code == 500
     data = response.get_json()
     assert data["error"] == "InternalServerError"
-    assert data["message"] == "A wild error appeared!"
+    assert data["message"] == "An unexpected error occurred."
+
+
+def test_database_error_hides_driver_message(client, monkeypatch):
+    """Test that database errors other than constraint violations are not echoed either."""
+
+    def _raise(*args, **kwargs):
+        raise OperationalError("SELECT secret FROM employees", {}, Exception("host db-1 down"))
+
+    monkeypatch.setattr(
+        "app.services.employee_service.employee_service.list_employees",
+        _raise,
+    )
+
+    response = client.get("/employees/")
+    assert response.status_code == 500
+    assert response.get_json()["code"] == "database_error"
+    assert b"secret" not in response.data and b"db-1" not in response.data
+
+
+def test_integrity_error_hides_driver_message(client, monkeypatch):
+    """Test that database constraint errors are reported without the driver's message."""
+
+    def _raise(*args, **kwargs):
+        raise IntegrityError("INSERT", {}, Exception("UNIQUE constraint failed: employees.email"))
+
+    monkeypatch.setattr(
+        "app.services.employee_service.employee_service.create_employee",
+        _raise,
+    )
+
+    response = client.post(
+        "/employees/",
+        data=json.dumps({"name": "User", "email": "user@test.com"}),
+        content_type="application/json",
+    )
+    assert response.status_code == 409
+    assert response.get_json()["code"] == "integrity_error"
+    assert b"UNIQUE" not in response.data
+
+
+def test_get_employee_changes(client):
+    """Test GET /employees/changes - ordered events with a resumable cursor."""
+    response = client.post(
+        "/employees/",
+        data=json.dumps({"name": "Feed User", "email": "feed@test.com"}),
+        content_type="application/json",
+    )
+    emp_id = response.get_json()["id"]
+    client.put(
+        f"/employees/{emp_id}",
+        data=json.dumps({"name": "Feed User 2"}),
+        content_type="application/json",
+    )
+    client.delete(f"/employees/{emp_id}")
+
+    response = client.get("/employees/changes?limit=2")
+    assert response.status_code == 200
+    data = response.get_json()
+    assert [c["operation"] for c in data["changes"]] == ["insert", "update"]
+    assert data["changes"][1]["payload"]["name"] == "Feed User 2"
+    assert data["has_more"] is True
+
+    response = client.get(f"/employees/changes?since={data['next_since']}")
+    data = response.get_json()
+    assert [c["operation"] for c in data["changes"]] == ["delete"]
+    assert data["changes"][0]["employee_id"] == emp_id
+    assert data["has_more"] is False
+
+
+def test_stream_employee_changes_replays_after_last_event_id(client):
+    """Test GET /employees/stream - events after Last-Event-ID are pushed as SSE."""
+    start = employee_repository.get_recent_change_ids(1)
+    start = start[-1] if start else 0
+    client.post(
+        "/employees/",
+        data=json.dumps({"name": "Stream User", "email": "stream@test.com"}),
+        content_type="application/json",
+    )
+
+    response = client.get("/employees/stream", headers={"Last-Event-ID": str(start)})
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+    chunk = next(response.response).decode()
+    response.close()
+    assert "event: insert" in chunk
+    assert '"email": "stream@test.com"' in chunk
+
+
+def test_open_streams_per_worker_are_capped(app, client, monkeypatch):
+    """Test GET /employees/stream - a stream holds its slot until closed, and streams beyond
+    SSE_MAX_STREAMS are shed with 503 instead of taking every worker thread."""
+    monkeypatch.setitem(app.config, "SSE_HEARTBEAT_SECONDS", 0)  # send the first chunk at once
+    monkeypatch.setattr(concurrency_limiter, "queue_timeout", 0)
+    concurrency_limiter.configure({"employee.stream_employee_changes": 1})
+    try:
+        first = client.get("/employees/stream")
+        assert first.status_code == 200
+        assert client.get("/employees/stream").status_code == 503
+        first.close()
+        second = client.get("/employees/stream")
+        assert second.status_code == 200
+        second.close()
+    finally:
+        concurrency_limiter.init_app(app)
+
+
+def test_list_results_are_cached_until_next_write(client):
+    """Test GET /employees/ - repeated lists hit the cache and writes invalidate it."""
+    client.post(
+        "/employees/",
+        data=json.dumps({"name": "Cached", "email": "cached@test.com", "department": "IT"}),
+        content_type="application/json",
+    )
+    client.get("/employees/?department=IT&sort=name")
+    client.get("/employees/?sort=name&department=IT")
+    stats = client.get("/employees/cache/stats").get_json()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+    client.post(
+        "/employees/",
+        data=json.dumps({"name": "Fresh", "email": "fresh@test.com", "department": "IT"}),
+        content_type="application/json",
+    )
+    data = client.get("/employees/?department=IT&sort=name").get_json()
+    assert data["total"] == 2
+    assert client.get("/employees/cache/stats").get_json()["misses"] == 2
+
+
+def test_get_all_employees_with_filter_expression(client):
+    """Test GET /employees/ - filter expressions are applied in the database."""
+    db.session.add_all(
+        [
+            Employee(name="Anna", email="anna@a.com", department="IT", salary=100),
+            Employee(name="Joanne", email="jo@a.com", department="HR", salary=300),
+            Employee(name="Bob", email="bob@a.com", department="Sales", salary=200),
+        ]
+    )
+    db.session.commit()
+
+    response = client.get(
+        "/employees/", query_string={"filter": 'department in (IT, HR) and name ~ "ANN"'}
+    )
+    assert response.status_code == 200
+    assert {e["name"] for e in response.get_json()["employees"]} == {"Anna", "Joanne"}
+
+    response = client.get("/employees/", query_string={"filter": "ssn = 1"})
+    assert response.status_code == 422
+
+
+def test_upsert_employee_by_email(client):
+    """Test PUT /employees/by-email/<email> - creates, then updates only the sent fields."""
+    response = client.put(
+        "/employees/by-email/sync@test.com", json={"name": "Sync", "department": "IT"}
+    )
+    assert response.status_code == 201
+    created = response.get_json()
+    assert created["version"] == 1 and response.headers["ETag"] == '"1"'
+
+    response = client.put("/employees/by-email/sync@test.com", json={"name": "Sync 2"})
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["id"] == created["id"] and data["version"] == 2
+    assert data["name"] == "Sync 2" and data["department"] == "IT"
+
+    changes = client.get("/employees/changes").get_json()["changes"]
+    assert [c["operation"] for c in changes] == ["insert", "update"]
+    assert client.put("/employees/by-email/nope", json={"name": "X"}).status_code == 400
+
+
+def test_upsert_employees_batch(client):
+    """Test PUT /employees/by-email - one request reports created and updated rows."""
+    existing = client.post("/employees/", json={"name": "Old", "email": "old@test.com"})
+    gone = client.post("/employees/", json={"name": "Gone", "email": "gone@test.com"})
+    client.delete(f"/employees/{gone.get_json()['id']}")
+
+    response = client.put(
+        "/employees/by-email",
+        json={
+            "employees": [
+                {"name": "New", "email": "new@test.com", "salary": 10},
+                {"name": "Old 2", "email": "old@test.com"},
+                {"name": "Back", "email": "gone@test.com"},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    data = response.get_json()
+    assert (data["created"], data["updated"]) == (2, 1)
+    assert [r["status"] for r in data["results"]] == ["created", "updated", "created"]
+    assert data["results"][1]["id"] == existing.get_json()["id"]
+    assert client.get("/employees/").get_json()["total"] == 3
+
+    duplicate = {"name": "Twice", "email": "twice@test.com"}
+    response = client.put("/employees/by-email", json={"employees": [duplicate, duplicate]})
+    assert response.status_code == 422
+
+
+def test_request_validation_fast_path(client):
+    """Test that JSON bodies are validated from bytes and query models reused per query."""
+    from app.extensions import spec
+
+    response = client.post("/employees/", data=b'{"name": ', content_type="application/json")
+    assert response.status_code == 422
+    assert response.get_json()[0]["type"] == "json_invalid"
+    for _ in range(2):
+        response = client.post("/employees/", json={"name": "Bad", "email": "not-an-email"})
+        assert response.status_code == 422
+        assert response.get_json()[0]["loc"] == ["email"]
+    created = client.post("/employees/", json={"name": "Fast", "email": "Fast@Example.COM"})
+    assert created.get_json()["email"] == "Fast@example.com"
+
+    spec.backend.clear()
+    for _ in range(2):
+        assert client.get("/employees/?department=IT&page=1").status_code == 200
+    assert client.get("/employees/?page=0").status_code == 422
+    assert client.get("/employees/?department=HR").status_code == 200
+    assert [query for _, query in spec.backend._query_models] == [
+        b"department=IT&page=1",
+        b"department=HR",
+    ]
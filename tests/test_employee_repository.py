@@ -1,6 +1,12 @@
+from datetime import datetime, timedelta
+
 import pytest
+from sqlalchemy import update
 
+from app.exceptions import VersionConflictError
+from app.extensions import db
 from app.models.employee import Employee
+from app.models.employee_archive import EmployeeArchive
 from app.repositories.employee_repository import employee_repository
 
 
@@ -106,3 +112,103 @@ def test_get_all_with_filters_and_sorting(client):  # Add client fixture
     assert total == 3
     assert len(employees) == 1
     assert employees[0].name == "Bob"
+
+
+def test_writes_are_recorded_in_change_log(client):
+    """Test that create, update and delete append ordered change log entries."""
+    emp = employee_repository.create(Employee(name="Log User", email="log@test.com"))
+    emp.salary = 1000
+    employee_repository.update(emp)
+    employee_repository.delete(emp)
+
+    changes = employee_repository.get_changes()
+    assert [c.operation for c in changes] == ["insert", "update", "delete"]
+    assert changes[1].payload["salary"] == 1000
+    assert changes[2].payload is None
+    assert employee_repository.get_changes(since=changes[1].id) == [changes[2]]
+
+
+def test_soft_deleted_employee_is_hidden_and_archived(client):
+    """Test that a deleted employee is kept but hidden until the archive job moves it."""
+    emp = employee_repository.create(Employee(name="Gone", email="gone@test.com"))
+    employee_repository.create(Employee(name="Stays", email="stays@test.com"))
+    emp_id = emp.id
+    employee_repository.delete(emp)
+
+    assert db.session.get(Employee, emp_id).deleted_at is not None
+    assert employee_repository.get_by_email("gone@test.com") is None
+    assert [e.name for e in employee_repository.get_all()[0]] == ["Stays"]
+
+    assert employee_repository.archive_deleted(datetime.utcnow() - timedelta(days=1)) == 0
+    assert employee_repository.archive_deleted(datetime.utcnow() + timedelta(seconds=1)) == 1
+    assert db.session.get(Employee, emp_id) is None
+    assert db.session.get(EmployeeArchive, emp_id).email == "gone@test.com"
+
+
+def test_email_of_soft_deleted_employee_can_be_reused(client):
+    """Test that creating an employee with a deleted employee's email archives the old row."""
+    emp = employee_repository.create(Employee(name="Old", email="reuse@test.com"))
+    employee_repository.delete(emp)
+
+    new = employee_repository.create(Employee(name="New", email="reuse@test.com"))
+    assert employee_repository.get_by_email("reuse@test.com").name == "New"
+    assert EmployeeArchive.query.filter_by(email="reuse@test.com").count() == 1
+    assert new.deleted_at is None
+
+
+def test_update_detects_concurrent_write(client):
+    """Test that committing over a row changed since it was loaded raises a conflict."""
+    emp = employee_repository.create(Employee(name="Racer", email="race@test.com"))
+    assert emp.version == 1
+
+    # Another writer commits version 2 behind this session's back
+    db.session.execute(
+        update(Employee)
+        .where(Employee.id == emp.id)
+        .values(name="Winner", version=2)
+        .execution_options(synchronize_session=False)
+    )
+    emp.name = "Loser"
+    with pytest.raises(VersionConflictError):
+        employee_repository.update(emp)
+    assert [c.operation for c in employee_repository.get_changes()] == ["insert"]
+
+
+def test_get_all_paginates_seeded_dataset(seeded_1k):
+    """Test filtering and pagination over the deterministic 1k-employee dataset."""
+    employees, total = employee_repository.get_all(filters={"page_size": 50})
+    assert total == 1000
+    assert len(employees) == 50
+
+    engineers, engineering_total = employee_repository.get_all(
+        filters={"department": "Engineering", "sort": "salary", "order": "desc"}
+    )
+    assert 0 < engineering_total < total
+    assert engineers[0].salary >= engineers[-1].salary
+
+
+def test_list_statements_are_cached_by_shape(client):
+    """Test that list queries of one shape share a statement and its compiled SQL."""
+    db.session.add_all(
+        Employee(name=f"Shape {i}", email=f"shape{i}@test.com", department="IT", salary=i)
+        for i in range(5)
+    )
+    db.session.commit()
+    statements = employee_repository.statements
+    statements.clear()
+
+    _, total = employee_repository.get_all({"department": "IT", "min_salary": 3})
+    assert total == 2
+    employees, total = employee_repository.get_all(
+        {"department": "HR", "min_salary": 0, "page": 1, "page_size": 2}
+    )
+    assert (employees, total) == ([], 0)
+    stats = statements.stats()
+    assert (stats["misses"], stats["hits"], stats["size"]) == (2, 2, 2)
+    assert stats["compiled_hits"] >= 2
+
+    employees, _ = employee_repository.get_all(
+        {"department": "IT", "min_salary": 3, "sort": "salary", "order": "desc"}
+    )
+    assert [e.salary for e in employees] == [4, 3]
+    assert statements.stats()["size"] == 3  # a new page statement, the count is shared
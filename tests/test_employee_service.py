@@ -1,3 +1,4 @@
+import time
 from unittest.mock import MagicMock
 
 import pytest
@@ -111,3 +112,64 @@ def test_list_employees(employee_service, mock_repository):
     assert total == 2
     assert len(employees) == 2
     mock_repository.get_all.assert_called_once()
+
+
+def test_coalesced_reads_share_snapshots_not_orm_instances(mock_repository, app):
+    """Test that reads shared through the coalescer return EmployeeResponse snapshots."""
+    from datetime import datetime
+
+    from app.schemas.employee_schema import EmployeeResponse
+    from app.utils.single_flight import SingleFlight
+
+    service = EmployeeService(repository=mock_repository, coalescer=SingleFlight())
+    employee = Employee(
+        id=1,
+        name="Jane Doe",
+        email="jane@example.com",
+        salary=100,
+        date_joined=datetime(2024, 1, 1),
+        version=3,
+    )
+    mock_repository.generation = 0
+    mock_repository.get_by_id.return_value = employee
+    mock_repository.get_all.return_value = ([employee], 1)
+
+    with app.app_context():
+        single = service.get_employee(1)
+        employees, total = service.list_employees({"page": 1})
+
+    assert isinstance(single, EmployeeResponse)
+    assert (single.id, single.name, single.version) == (1, "Jane Doe", 3)
+    assert total == 1
+    assert all(isinstance(e, EmployeeResponse) for e in employees)
+
+
+def test_list_changes_reports_more(employee_service, mock_repository):
+    """Test that list_changes over-fetches by one to report has_more."""
+    mock_repository.get_changes.return_value = ["c1", "c2", "c3"]
+
+    changes, has_more = employee_service.list_changes(since=5, limit=2)
+
+    mock_repository.get_changes.assert_called_once_with(5, 3)
+    assert changes == ["c1", "c2"]
+    assert has_more is True
+
+
+def test_list_employees_serves_stale_page_while_revalidating(mock_repository, app):
+    """Test stale-while-revalidate: a stale page is returned and refreshed in the background."""
+    from app.utils.query_cache import QueryResultCache
+    from app.utils.single_flight import SingleFlight
+
+    cache = QueryResultCache(maxsize=8, stale_while_revalidate=True)
+    coalescer = SingleFlight()
+    service = EmployeeService(repository=mock_repository, cache=cache, coalescer=coalescer)
+    key = cache.make_key({"page": 1, "tenant_id": "default"})
+    cache.set(key, 0, (["stale"], 1))
+    mock_repository.generation = 1
+    mock_repository.get_all.return_value = ([], 0)
+
+    with app.app_context():
+        assert service.list_employees({"page": 1}) == (["stale"], 1)
+    while cache.get(key, 1) is None:
+        time.sleep(0.001)
+    mock_repository.get_all.assert_called_once_with({"page": 1})
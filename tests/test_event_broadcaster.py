@@ -0,0 +1,61 @@
+from app.utils.event_broadcaster import EventBroadcaster
+
+
+def test_publish_fans_out_to_all_subscribers():
+    """Test that every subscriber receives each published event in order."""
+    broadcaster = EventBroadcaster()
+    first, second = broadcaster.subscribe(), broadcaster.subscribe()
+
+    broadcaster.publish("insert", {"id": 1})
+    broadcaster.publish("delete", {"id": 1})
+
+    for subscription in (first, second):
+        assert subscription.get(timeout=0).type == "insert"
+        assert subscription.get(timeout=0).type == "delete"
+        assert subscription.get(timeout=0) is None
+
+
+def test_slow_subscriber_is_dropped_with_resume_token():
+    """Test that a full queue drops the subscriber, which can then resume from history."""
+    broadcaster = EventBroadcaster()
+    slow = broadcaster.subscribe(maxsize=1)
+
+    for emp_id in range(3):
+        broadcaster.publish("insert", {"id": emp_id})
+
+    assert broadcaster.subscriber_count == 0
+    delivered = slow.get(timeout=0)
+    dropped = slow.get(timeout=0)
+    assert dropped.type == "dropped"
+    assert dropped.data["resume"] == delivered.id
+
+    resumed = broadcaster.subscribe(last_event_id=dropped.data["resume"])
+    assert [resumed.get(timeout=0).data["id"] for _ in range(2)] == [1, 2]
+
+
+def test_resume_beyond_history_sends_reset():
+    """Test that resuming from an evicted event ID yields a reset event."""
+    broadcaster = EventBroadcaster(history_size=2)
+    for emp_id in range(5):
+        broadcaster.publish("update", {"id": emp_id})
+
+    subscription = broadcaster.subscribe(last_event_id=1)
+
+    assert subscription.get(timeout=0).type == "reset"
+    broadcaster.publish("update", {"id": 5})
+    assert subscription.get(timeout=0).data == {"id": 5}
+
+
+def test_subscribers_only_receive_their_tenants_events():
+    """Test that live and replayed events are filtered by the subscription's tenant."""
+    broadcaster = EventBroadcaster()
+    acme = broadcaster.subscribe(tenant_id="acme")
+
+    broadcaster.publish("insert", {"id": 1}, "globex")
+    broadcaster.publish("insert", {"id": 2}, "acme")
+
+    assert acme.get(timeout=0).data == {"id": 2}
+    assert acme.get(timeout=0) is None
+    replayed = broadcaster.subscribe(last_event_id=0, tenant_id="globex")
+    assert replayed.get(timeout=0).data == {"id": 1}
+    assert replayed.get(timeout=0) is None
@@ -0,0 +1,86 @@
+import pytest
+
+from app.exceptions import InvalidFilterError
+from app.utils.filter_dsl import compile_filter
+
+
+def _sql(text):
+    return str(compile_filter(text).compile(compile_kwargs={"literal_binds": True}))
+
+
+def test_compiles_to_sql_with_precedence():
+    """Test that and binds tighter than or and values are typed by column."""
+    sql = _sql('department in (A, "B C") and salary >= 5000 or not name ~ "an_n"')
+    assert sql == (
+        "employees.department IN ('A', 'B C') AND employees.salary >= 5000.0 "
+        "OR lower(employees.name) NOT LIKE lower('%an\\_n%') ESCAPE '\\'"
+    )
+
+
+def test_dates_null_checks_and_prefix_match():
+    """Test date literals, is [not] null and the ^= prefix operator."""
+    sql = _sql("date_joined >= 2024-01-01 and (salary is null or email ^= ann)")
+    assert "employees.date_joined >= '2024-01-01 00:00:00'" in sql
+    assert "employees.salary IS NULL OR lower(employees.email) LIKE lower('ann%')" in sql
+
+
+@pytest.mark.parametrize(
+    ("text", "names"),
+    [
+        ('name ~ "nNE"', {"JoANNe"}),
+        ('name ~ "aNn"', {"Anna", "JoANNe"}),
+        ('name ^= "aNN"', {"Anna"}),
+        ('name ^= "JOA"', {"JoANNe"}),
+    ],
+)
+def test_text_operators_ignore_case(client, text, names):
+    """Test that ~ and ^= match regardless of the case of the value and the column."""
+    from app.extensions import db
+    from app.models.employee import Employee
+
+    db.session.add_all(
+        [
+            Employee(name="Anna", email="anna@a.com"),
+            Employee(name="JoANNe", email="jo@a.com"),
+            Employee(name="Bob", email="bob@a.com"),
+        ]
+    )
+    db.session.commit()
+
+    assert "lower(employees.name) LIKE lower(" in _sql(text)
+    employees = db.session.scalars(db.select(Employee).where(compile_filter(text))).all()
+    assert {e.name for e in employees} == names
+
+
+def test_parse_result_is_cached():
+    """Test that the same filter string is compiled only once."""
+    assert compile_filter("id = 1") is compile_filter("id = 1")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "password = x",
+        "salary >= abc",
+        "salary ~ 5",
+        "name = ",
+        "(id = 1",
+        "id = 1 id = 2",
+        "id $ 1",
+        "department_id = 1",
+        "(" * 400 + "name = a" + ")" * 400,
+        "not " * 400 + "name = a",
+    ],
+)
+def test_invalid_filters_raise(text):
+    """Test that malformed filters and unknown fields are rejected."""
+    with pytest.raises(InvalidFilterError):
+        compile_filter(text)
+
+
+def test_nesting_is_limited(client):
+    """Test that deeply nested filters are rejected like any invalid filter, not with a 500."""
+    assert compile_filter("(" * 32 + "name = a" + ")" * 32) is not None
+    response = client.get("/employees/", query_string={"filter": "(" * 33 + "name = a" + ")" * 33})
+    assert response.status_code == 422
+    assert "nested deeper than 32" in response.get_data(as_text=True)
@@ -0,0 +1,119 @@
+import json
+import socket
+import threading
+
+from app.extensions import db
+from app.models.employee import Employee
+from app.repositories.employee_repository import employee_repository
+from app.utils.invalidation_backends import (
+    RESET,
+    DatabaseBackend,
+    UnixSocketBackend,
+    create_backend,
+)
+from app.utils.invalidation_bus import InvalidationBus, invalidation_bus
+
+
+class RecordingBackend:
+    name = "recording"
+
+    def __init__(self):
+        self.published = []
+
+    def publish(self, message):
+        self.published.append(message)
+
+
+def test_writes_publish_and_remote_invalidations_refresh_caches(client, monkeypatch):
+    """Test that writes publish their IDs, and another node's write invalidates cached lists."""
+    backend = RecordingBackend()
+    monkeypatch.setattr(invalidation_bus, "backend", backend)
+    created = client.post("/employees/", json={"name": "A", "email": "a@bus.com"}).get_json()
+    assert backend.published == [
+        {
+            "node": invalidation_bus.node,
+            "kind": "employee",
+            "tenant": "default",
+            "ids": [created["id"]],
+        }
+    ]
+    assert client.get("/employees/").get_json()["total"] == 1
+
+    # Another node inserts an employee: this node keeps serving its cached page...
+    db.session.add(Employee(name="B", email="b@bus.com", tenant_id="default"))
+    db.session.commit()
+    assert client.get("/employees/").get_json()["total"] == 1
+
+    # ...until the other node's invalidation arrives; this node's own are ignored
+    generation = employee_repository.generation
+    invalidation_bus._deliver({"node": invalidation_bus.node, "kind": "employee", "ids": [1]})
+    assert employee_repository.generation == generation
+    invalidation_bus._deliver(
+        {"node": "other", "kind": "employee", "tenant": "default", "ids": [2]}
+    )
+    assert employee_repository.generation == generation + 1
+    assert client.get("/employees/").get_json()["total"] == 2
+    assert len(backend.published) == 1  # applying an invalidation does not republish it
+
+
+def test_unix_socket_backend_delivers_to_other_nodes(tmp_path):
+    """Test that datagrams reach every other node, and abandoned sockets are removed."""
+    nodes = [InvalidationBus(UnixSocketBackend(str(tmp_path))) for _ in range(3)]
+    received = {bus.node: [] for bus in nodes}
+    deliveries = threading.Semaphore(0)
+    for bus in nodes:
+
+        def handler(message, node=bus.node):
+            received[node].append(message["ids"])
+            deliveries.release()
+
+        bus.subscribe("employee", handler)
+        bus.listen()
+    (tmp_path / "gone.sock").touch()  # left behind by a node that crashed
+
+    nodes[0].publish("employee", ids=[7])
+    nodes[1].publish("employee", ids=[8])
+    assert all(deliveries.acquire(timeout=5) for _ in range(4))
+    assert received[nodes[0].node] == [[8]]
+    assert sorted(received[nodes[2].node]) == [[7], [8]]
+    assert not (tmp_path / "gone.sock").exists()
+    for bus in nodes:
+        bus.backend.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unix_socket_node_that_misses_a_message_gets_a_reset(tmp_path):
+    """Test that a node whose receive buffer was full is sent a reset once it drains it."""
+    slow = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    slow.bind(str(tmp_path / "slow.sock"))
+    slow.settimeout(5)
+    backend = UnixSocketBackend(str(tmp_path))
+    for i in range(1000):  # more than any datagram queue holds; publishing never blocks
+        backend.publish({"node": "writer", "kind": "employee", "ids": [i]})
+
+    received = []
+    while not received or received[-1] != RESET:
+        received.append(json.loads(slow.recv(65536)))
+    assert 0 < len(received) - 1 < 1000  # some messages were dropped, and reset after
+    slow.close()
+    backend.close()
+
+
+def test_database_backend_polls_messages_of_other_nodes(client, app):
+    """Test the DB-polling backend: each node reads the others' messages once, in order."""
+    first, second = DatabaseBackend(app), DatabaseBackend(app)
+    first.publish({"node": "first", "kind": "employee", "ids": [1]})
+    second.listen("second", lambda message: None)  # starts after the existing messages
+    second.close()
+    first.publish({"node": "first", "kind": "employee", "ids": [2]})
+    second.publish({"node": "second", "kind": "employee", "ids": [3]})
+    first.publish({"node": "first", "kind": "reset"})
+
+    received = []
+    assert second.poll("second", received.append) == 2
+    assert received == [
+        {"node": "first", "kind": "employee", "ids": [2]},
+        {"node": "first", "kind": "reset"},
+    ]
+    assert second.poll("second", received.append) == 0
+    assert create_backend("local:", app).name == "local"
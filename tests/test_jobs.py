@@ -0,0 +1,209 @@
+import csv
+import io
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.exceptions import JobLeaseLost
+from app.extensions import db
+from app.models.employee import Employee
+from app.models.employee_change import EmployeeChange
+from app.models.job import Job
+from app.repositories.employee_repository import employee_repository
+from app.services.job_service import JobContext, job_service
+from app.utils.tenant import current_tenant
+
+
+@pytest.fixture(autouse=True)
+def job_storage(tmp_path, monkeypatch):
+    """Keep job files in a per-test directory."""
+    monkeypatch.setattr(job_service, "storage_dir", str(tmp_path))
+
+
+def run_jobs() -> int:
+    """Run every queued job in this process, as `flask jobs-worker --once` does."""
+    return job_service.run_worker([None], once=True)
+
+
+def test_export_job(seeded_1k):
+    """Test that an export is queued with 202, runs on a worker and can be downloaded."""
+    response = seeded_1k.post("/jobs/", json={"kind": "export", "params": {"department": "HR"}})
+    assert response.status_code == 202
+    job = response.get_json()
+    assert job["status"] == "queued" and job["result_url"] is None
+    assert response.headers["Location"].endswith(f"/jobs/{job['id']}")
+    assert seeded_1k.get(f"/jobs/{job['id']}/result").status_code == 409
+
+    assert run_jobs() == 1
+    job = seeded_1k.get(f"/jobs/{job['id']}").get_json()
+    expected = db.session.query(Employee).filter_by(department="HR").count()
+    assert job["status"] == "succeeded" and job["progress"] == 1.0
+    assert job["result"] == {"rows": expected, "format": "csv"} and job["total"] == expected
+
+    download = seeded_1k.get(job["result_url"])
+    assert download.mimetype == "text/csv"
+    rows = list(csv.DictReader(io.StringIO(download.get_data(as_text=True))))
+    assert len(rows) == expected and {row["department"] for row in rows} == {"HR"}
+
+
+def test_bulk_update_job(seeded_1k, monkeypatch):
+    """Test that a bulk update goes through the versioned, change-logged write path."""
+    monkeypatch.setattr(job_service, "batch_size", 100)
+    before = {e.id: e.salary for e in Employee.query.filter_by(department="Sales")}
+    response = seeded_1k.post(
+        "/jobs/",
+        json={"kind": "bulk_update", "params": {"department": "Sales", "salary_factor": 1.1}},
+    )
+    assert run_jobs() == 1
+    assert seeded_1k.get(response.headers["Location"]).get_json()["result"] == {
+        "updated": len(before)
+    }
+
+    db.session.expire_all()
+    after = Employee.query.filter_by(department="Sales").all()
+    assert all(e.salary == round(before[e.id] * 1.1, 2) and e.version == 2 for e in after)
+    assert db.session.query(EmployeeChange).filter_by(operation="update").count() == len(before)
+
+
+def test_killed_bulk_update_resumes_after_its_last_batch(seeded_1k, monkeypatch):
+    """Test that a bulk update killed partway is resumed by another worker without applying
+    the salary factor twice, and that the stalled worker can no longer write to the job."""
+
+    class Killed(BaseException):
+        """Ends the worker like a SIGKILL: no handler runs."""
+
+    monkeypatch.setattr(job_service, "batch_size", 20)
+    before = {e.id: e.salary for e in Employee.query.filter_by(department="Sales")}
+    update_many = employee_repository.update_many
+    calls = []
+
+    def killed_on_third_batch(batch):
+        calls.append(len(batch))
+        if len(calls) == 3:
+            raise Killed()
+        update_many(batch)
+
+    monkeypatch.setattr(employee_repository, "update_many", killed_on_third_batch)
+    response = seeded_1k.post(
+        "/jobs/",
+        json={"kind": "bulk_update", "params": {"department": "Sales", "salary_factor": 1.1}},
+    )
+    with pytest.raises(Killed):
+        run_jobs()
+    db.session.rollback()
+    job = db.session.get(Job, response.get_json()["id"])
+    assert (job.status, job.attempts, job.processed) == ("running", 1, sum(calls[:2]))
+    stalled = JobContext(job, job_service.repository, job_service.storage_dir, 20)
+
+    monkeypatch.setattr(employee_repository, "update_many", update_many)
+    monkeypatch.setattr(job_service, "lease_seconds", 0)
+    assert run_jobs() == 1
+    db.session.expire_all()
+    assert (job.status, job.attempts, job.result) == ("succeeded", 2, {"updated": len(before)})
+    after = Employee.query.filter_by(department="Sales").all()
+    assert all(e.salary == round(before[e.id] * 1.1, 2) and e.version == 2 for e in after)
+    assert db.session.query(EmployeeChange).filter_by(operation="update").count() == len(before)
+    with pytest.raises(JobLeaseLost):
+        stalled.report(len(before))
+
+
+def test_import_job_skips_taken_emails(client):
+    """Test that an import creates new employees and reports the skipped ones."""
+    client.post("/employees/", json={"name": "Existing", "email": "taken@test.com"})
+    rows = [
+        {"name": "New", "email": "new@test.com", "department": "IT"},
+        {"name": "Taken", "email": "taken@test.com"},
+        {"name": "Twice", "email": "new@test.com"},
+    ]
+    response = client.post("/jobs/", json={"kind": "import", "params": {"rows": rows}})
+    assert response.status_code == 202
+    run_jobs()
+
+    job = client.get(response.headers["Location"]).get_json()
+    assert job["result"] == {
+        "created": 1,
+        "skipped": 2,
+        "skipped_emails": ["taken@test.com", "new@test.com"],
+    }
+    assert client.get("/employees/").get_json()["total"] == 2
+
+
+def test_job_validation_and_isolation(client):
+    """Test parameter validation, unknown jobs and tenant isolation."""
+    bad = client.post("/jobs/", json={"kind": "bulk_update", "params": {"department": "IT"}})
+    assert bad.status_code == 400
+    assert client.post("/jobs/", json={"kind": "reindex"}).status_code == 422
+
+    job = client.post("/jobs/", json={"kind": "export"}).get_json()
+    assert client.get(f"/jobs/{job['id']}", headers={"X-Tenant-ID": "acme"}).status_code == 404
+    assert client.get("/jobs/999").get_json()["code"] == "job_not_found"
+
+
+def test_failed_job_reports_error(client, monkeypatch):
+    """Test that a handler exception fails the job instead of the worker."""
+
+    def explode(params, context):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setitem(job_service.handlers, "export", explode)
+    job = client.post("/jobs/", json={"kind": "export"}).get_json()
+    assert run_jobs() == 1
+
+    job = client.get(f"/jobs/{job['id']}").get_json()
+    assert job["status"] == "failed" and job["error"] == "RuntimeError: disk full"
+
+
+def test_jobs_worker_command(app, client):
+    """Test that the CLI worker runs queued jobs in-process with a single process."""
+    client.post("/jobs/", json={"kind": "export", "params": {"format": "jsonl"}})
+    result = app.test_cli_runner().invoke(args=["jobs-worker", "--processes", "1", "--once"])
+    assert result.exit_code == 0, result.output
+    assert "Ran 1 jobs." in result.output
+
+
+def test_database_failure_of_one_tenant_does_not_stop_the_worker(client, monkeypatch):
+    """Test that a tenant whose database fails is logged and skipped while the other tenants'
+    jobs still run."""
+    claim = job_service.repository.claim
+
+    def claim_unless_broken(*args):
+        if current_tenant() == "broken":
+            raise OperationalError("SELECT", {}, Exception("server has gone away"))
+        return claim(*args)
+
+    monkeypatch.setattr(job_service.repository, "claim", claim_unless_broken)
+    monkeypatch.setattr(job_service, "errors", 0)
+    job = client.post("/jobs/", json={"kind": "export"}).get_json()
+    assert job_service.run_worker(["broken", None], once=True) == 1
+    assert job_service.errors == 2  # once per round
+    assert client.get(f"/jobs/{job['id']}").get_json()["status"] == "succeeded"
+
+
+def test_job_files_are_removed(client, tmp_path, monkeypatch):
+    """Test that uploads are deleted when their job cannot be queued or has finished, and
+    results when the finished job is pruned."""
+
+    def refuse(kind, params):
+        raise OperationalError("INSERT", {}, Exception("server has gone away"))
+
+    rows = [{"name": "New", "email": "new@files.com"}]
+    monkeypatch.setattr(job_service.repository, "create", refuse)
+    with pytest.raises(OperationalError):
+        job_service.submit("import", {}, rows)
+    assert os.listdir(tmp_path) == []
+    monkeypatch.undo()
+    monkeypatch.setattr(job_service, "storage_dir", str(tmp_path))
+
+    client.post("/jobs/", json={"kind": "import", "params": {"rows": rows}})
+    export = client.post("/jobs/", json={"kind": "export"}).get_json()
+    assert run_jobs() == 2
+    (result,) = os.listdir(tmp_path)  # the upload is gone, the export's result is kept
+
+    assert job_service.prune([None]) == 0
+    db.session.query(Job).update({Job.finished_at: datetime.utcnow() - timedelta(days=8)})
+    db.session.commit()
+    assert job_service.prune([None]) == 1
+    assert os.listdir(tmp_path) == []
+    assert client.get(f"/jobs/{export['id']}").status_code == 404
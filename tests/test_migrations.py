@@ -0,0 +1,72 @@
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.exc import IntegrityError
+
+from app.extensions import db
+from app.utils.migrations import migrate_database
+
+# The employees table as created by the first release's `flask init-db`
+BASELINE_SCHEMA = """
+CREATE TABLE employees (
+    id INTEGER NOT NULL PRIMARY KEY,
+    name VARCHAR(120) NOT NULL,
+    email VARCHAR(120) NOT NULL UNIQUE,
+    department VARCHAR(100),
+    date_joined DATETIME NOT NULL,
+    salary FLOAT
+)
+"""
+
+
+@pytest.fixture
+def baseline_engine(app, tmp_path):
+    """A SQLite database created by the first release, holding one employee."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'baseline.db'}")
+    with engine.begin() as connection:
+        connection.execute(text(BASELINE_SCHEMA))
+        connection.execute(
+            text(
+                "INSERT INTO employees (name, email, department, date_joined, salary) "
+                "VALUES ('Ann', 'ann@example.com', 'IT', '2024-01-01 00:00:00', 100)"
+            )
+        )
+    db.metadata.create_all(engine)  # as `flask migrate-db` does first
+    yield engine
+    engine.dispose()
+
+
+def test_migrate_database_upgrades_a_baseline_database(baseline_engine):
+    """Test that every step applies to a baseline database, once."""
+    assert migrate_database(baseline_engine, "default") == [
+        "add_employee_soft_delete",
+        "add_employee_version",
+        "add_employee_department_key",
+        "add_employee_tenant",
+    ]
+    inspector = inspect(baseline_engine)
+    columns = {c["name"] for c in inspector.get_columns("employees")}
+    assert {"tenant_id", "deleted_at", "version", "department_id"} <= columns
+    assert {i["name"] for i in inspector.get_indexes("employees")} >= {
+        "ix_employees_tenant_department",
+        "ix_employees_tenant_deleted_at",
+        "ix_employees_tenant_department_id",
+    }
+    for table in ("employee_changes", "employees_archive"):
+        assert "tenant_id" in {c["name"] for c in inspector.get_columns(table)}
+    with baseline_engine.connect() as connection:
+        rows = connection.execute(text("SELECT tenant_id, deleted_at, version FROM employees"))
+        assert rows.all() == [("default", None, 1)]
+    assert migrate_database(baseline_engine, "default") == []
+
+
+def test_emails_are_unique_per_tenant_after_migration(baseline_engine):
+    """Test that the global unique email is replaced by a per-tenant one."""
+    migrate_database(baseline_engine, "default")
+    insert = text(
+        "INSERT INTO employees (tenant_id, name, email, date_joined, version) "
+        "VALUES (:tenant, 'Ann', 'ann@example.com', '2024-01-01 00:00:00', 1)"
+    )
+    with baseline_engine.begin() as connection:
+        connection.execute(insert, {"tenant": "acme"})
+    with pytest.raises(IntegrityError), baseline_engine.begin() as connection:
+        connection.execute(insert, {"tenant": "default"})
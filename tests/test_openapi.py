@@ -0,0 +1,32 @@
+import json
+
+from app.extensions import spec
+
+
+def test_openapi_document_is_served_from_the_byte_cache(client, monkeypatch):
+    """Test that the OpenAPI document is encoded once, then served from the cache."""
+    monkeypatch.setattr(spec, "_encoded", None)
+    response = client.get(spec.config.spec_url)
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    assert "/employees/" in response.get_json()["paths"]
+    assert spec._encoded == response.data
+
+    monkeypatch.setattr(spec, "_encoded", b'{"cached": true}')
+    assert client.get(spec.config.spec_url).get_json() == {"cached": True}
+
+
+def test_openapi_export_writes_the_served_document(app, client, monkeypatch, tmp_path):
+    """Test that `flask openapi-export` writes the document served by the API, and that a
+    worker pointed at the file serves it without generating the document."""
+    path = tmp_path / "openapi.json"
+    result = app.test_cli_runner().invoke(args=["openapi-export", str(path)])
+    assert result.exit_code == 0, result.output
+    assert path.read_bytes() == client.get(spec.config.spec_url).data
+
+    exported = json.loads(path.read_bytes())
+    exported["info"]["title"] = "Precomputed"
+    path.write_text(json.dumps(exported))
+    monkeypatch.setattr(spec, "_encoded", None)
+    monkeypatch.setattr(spec, "spec_file", str(path))
+    assert client.get(spec.config.spec_url).get_json()["info"]["title"] == "Precomputed"
@@ -0,0 +1,151 @@
+import json
+import threading
+from datetime import datetime
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.extensions import db
+from app.models.outbox_message import OutboxMessage
+from app.repositories.outbox_repository import outbox_repository
+from app.services.outbox_dispatcher import OutboxDispatcher
+from app.utils.outbox_sinks import FileSink, create_sink
+from app.utils.tenant import current_tenant
+
+
+@pytest.fixture
+def outbox(client):
+    """Enable the outbox for one test."""
+    outbox_repository.enabled = True
+    yield client
+    outbox_repository.enabled = False
+
+
+class FailingSink:
+    name = "failing"
+
+    def send(self, messages):
+        raise ConnectionError("payroll is down")
+
+
+def create(client, email):
+    """Create an employee and return its JSON body."""
+    response = client.post(
+        "/employees/",
+        data=json.dumps({"name": "Outbox User", "email": email}),
+        content_type="application/json",
+    )
+    return response.get_json()
+
+
+def test_writes_add_messages_in_the_same_transaction(outbox):
+    """Test that committed writes add outbox messages and rejected writes do not."""
+    emp = create(outbox, "outbox@test.com")
+    create(outbox, "outbox@test.com")  # duplicate, rejected
+    outbox.put(
+        f"/employees/{emp['id']}",
+        data=json.dumps({"salary": 1000, "version": 99}),
+        content_type="application/json",
+    )  # version conflict, rejected
+    outbox.delete(f"/employees/{emp['id']}")
+
+    messages = db.session.scalars(db.select(OutboxMessage).order_by(OutboxMessage.id)).all()
+    assert [m.topic for m in messages] == ["employee.insert", "employee.delete"]
+    assert messages[0].payload["email"] == "outbox@test.com"
+    assert messages[1].payload == {"id": emp["id"]}
+    assert {m.status for m in messages} == {"pending"}
+
+
+def test_outbox_is_disabled_by_default(client):
+    """Test that no messages are written unless the outbox is enabled."""
+    create(client, "quiet@test.com")
+    assert db.session.scalar(db.select(db.func.count(OutboxMessage.id))) == 0
+
+
+def test_dispatcher_delivers_to_file_sink(outbox, tmp_path):
+    """Test that due messages are delivered once and marked delivered."""
+    create(outbox, "a@test.com")
+    create(outbox, "b@test.com")
+    path = tmp_path / "outbox.jsonl"
+    dispatcher = OutboxDispatcher(outbox_repository, [FileSink(str(path))], batch_size=1)
+
+    assert dispatcher.drain([None]) == 2
+    assert dispatcher.drain([None]) == 0
+    delivered = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [m["payload"]["email"] for m in delivered] == ["a@test.com", "b@test.com"]
+    assert delivered[0]["tenant_id"] == "default"
+    assert all(m.status == "delivered" for m in db.session.scalars(db.select(OutboxMessage)))
+
+
+def test_failed_delivery_is_retried_with_backoff(outbox):
+    """Test that failures reschedule messages with backoff until they are marked dead."""
+    create(outbox, "retry@test.com")
+    dispatcher = OutboxDispatcher(
+        outbox_repository, [FailingSink()], max_attempts=2, backoff_seconds=60
+    )
+
+    before = datetime.utcnow()
+    assert dispatcher.dispatch_once() == 1
+    message = db.session.scalars(db.select(OutboxMessage)).one()
+    assert message.status == "pending" and message.attempts == 1
+    assert 30 <= (message.next_attempt_at - before).total_seconds() <= 61
+    assert "payroll is down" in message.last_error
+    assert dispatcher.dispatch_once() == 0  # not due yet
+
+    message.next_attempt_at = before
+    db.session.commit()
+    assert dispatcher.dispatch_once() == 1
+    db.session.refresh(message)
+    assert message.status == "dead" and message.attempts == 2
+
+
+def test_database_failure_of_one_tenant_does_not_stop_the_dispatcher(
+    outbox, tmp_path, monkeypatch
+):
+    """Test that a tenant whose database fails is logged and skipped, and that the dispatcher
+    keeps running with a growing backoff instead of exiting."""
+    create(outbox, "ok@test.com")
+    claim = outbox_repository.claim
+
+    def claim_unless_broken(*args):
+        if current_tenant() == "broken":
+            raise OperationalError("SELECT", {}, Exception("server has gone away"))
+        return claim(*args)
+
+    monkeypatch.setattr(outbox_repository, "claim", claim_unless_broken)
+    path = tmp_path / "outbox.jsonl"
+    dispatcher = OutboxDispatcher(outbox_repository, [FileSink(str(path))])
+    assert dispatcher.drain(["broken", None]) == 1
+    assert dispatcher.errors == 1
+    assert json.loads(path.read_text())["payload"]["email"] == "ok@test.com"
+
+    stop, waits = threading.Event(), []
+
+    def wait(seconds):
+        waits.append(seconds)
+        if len(waits) == 3:
+            stop.set()
+
+    monkeypatch.setattr(stop, "wait", wait)
+    dispatcher.run(["broken"], poll_seconds=0.01, stop=stop)
+    assert dispatcher.errors == 4  # one more per round
+    assert 0.5 <= waits[0] <= 1 and 1 <= waits[1] <= 2 and 2 <= waits[2] <= 4
+
+
+def test_outbox_dispatch_command(app, outbox, tmp_path, monkeypatch):
+    """Test that the CLI worker drains the outbox into the configured sinks."""
+    create(outbox, "cli@test.com")
+    path = tmp_path / "cli.jsonl"
+    monkeypatch.setitem(app.config, "OUTBOX_SINKS", [f"file://{path}"])
+
+    result = app.test_cli_runner().invoke(args=["outbox-dispatch", "--once"])
+    assert result.exit_code == 0, result.output
+    assert "Processed 1 outbox messages" in result.output
+    assert json.loads(path.read_text())["topic"] == "employee.insert"
+
+
+def test_create_sink_rejects_unknown_scheme():
+    """Test that unsupported sink URIs are rejected."""
+    assert create_sink("https://example.com/hook").url == "https://example.com/hook"
+    with pytest.raises(ValueError):
+        create_sink("ftp://example.com")
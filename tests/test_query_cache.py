@@ -0,0 +1,35 @@
+from app.utils.query_cache import QueryResultCache
+
+
+def test_make_key_normalizes_filters():
+    """Test that equivalent filters map to the same key."""
+    first = QueryResultCache.make_key({"department": "IT", "order": "DESC", "min_salary": 10})
+    second = QueryResultCache.make_key(
+        {"min_salary": 10.0, "order": "desc", "department": "IT", "sort": None}
+    )
+    assert first == second
+
+
+def test_stale_generation_is_a_miss():
+    """Test that entries cached at an older write generation are not served."""
+    cache = QueryResultCache(maxsize=4)
+    key = cache.make_key({"page": 1})
+    cache.set(key, 1, "page-1")
+
+    assert cache.get(key, 1) == "page-1"
+    assert cache.get(key, 2) is None
+    assert cache.stats()["hit_ratio"] == 0.5
+
+
+def test_lru_eviction():
+    """Test that the least recently used entry is evicted once maxsize is reached."""
+    cache = QueryResultCache(maxsize=2)
+    a, b, c = (cache.make_key({"page": n}) for n in (1, 2, 3))
+    cache.set(a, 0, "a")
+    cache.set(b, 0, "b")
+    cache.get(a, 0)
+    cache.set(c, 0, "c")
+
+    assert cache.get(b, 0) is None
+    assert cache.get(a, 0) == "a"
+    assert cache.stats()["evictions"] == 1
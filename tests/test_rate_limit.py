@@ -0,0 +1,121 @@
+import threading
+
+import pytest
+
+from app.utils.rate_limiter import (
+    ConcurrencyLimiter,
+    MemoryBucketStore,
+    SQLiteBucketStore,
+    concurrency_limiter,
+    parse_limit,
+    rate_limiter,
+)
+
+
+@pytest.fixture
+def limited(app, client, monkeypatch):
+    """Enable admission control with tight limits on the list endpoint for one test."""
+    monkeypatch.setitem(app.config, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setitem(app.config, "RATE_LIMIT_API_KEYS", frozenset({"other"}))
+    rate_limiter.store = MemoryBucketStore()
+    rate_limiter.configure("100/second", {"employee.get_all_employees": "2/minute"})
+    yield client
+    rate_limiter.init_app(app)
+    concurrency_limiter.init_app(app)
+
+
+def test_parse_limit():
+    """Test that limits parse into a capacity and a per-second refill rate."""
+    assert parse_limit("120/minute") == (120.0, 2.0)
+    assert parse_limit("5/seconds") == (5.0, 5.0)
+    with pytest.raises(ValueError):
+        parse_limit("fast")
+
+
+def test_route_limit_returns_429_with_retry_after(limited):
+    """Test that a client over its route limit is rejected without affecting other clients."""
+    assert limited.get("/employees/").status_code == 200
+    assert limited.get("/employees/").status_code == 200
+
+    response = limited.get("/employees/")
+    assert response.status_code == 429
+    assert 1 <= int(response.headers["Retry-After"]) <= 30
+
+    # Other routes and other clients have their own buckets
+    assert limited.get("/employees/changes").status_code == 200
+    assert limited.get("/employees/", headers={"X-API-Key": "other"}).status_code == 200
+    # An unknown key is not a client of its own
+    assert limited.get("/employees/", headers={"X-API-Key": "made-up"}).status_code == 429
+
+
+def test_clients_behind_trusted_proxies_get_their_own_buckets(app, limited, monkeypatch):
+    """Test that with PROXY_FIX_HOPS, clients are identified by their forwarded address."""
+    from app.middleware.proxy_middleware import setup_proxy_fix
+
+    monkeypatch.setattr(app, "wsgi_app", app.wsgi_app)
+    monkeypatch.setitem(app.config, "PROXY_FIX_HOPS", 1)
+    setup_proxy_fix(app)
+
+    def get(forwarded_for):
+        return limited.get("/employees/", headers={"X-Forwarded-For": forwarded_for})
+
+    assert get("10.0.0.1").status_code == 200
+    assert get("10.0.0.1").status_code == 200
+    assert get("10.0.0.1").status_code == 429
+    assert get("10.0.0.2").status_code == 200
+    # Only the address appended by the trusted proxy counts, not one sent by the client
+    assert get("10.0.0.2, 10.0.0.1").status_code == 429
+
+
+def test_expensive_endpoint_sheds_load_with_503(limited):
+    """Test that requests beyond an endpoint's concurrency limit get 503 with Retry-After."""
+    concurrency_limiter.queue_timeout = 0
+    concurrency_limiter.configure({"employee.get_all_employees": 1})
+    slot = concurrency_limiter.acquire("employee.get_all_employees")
+
+    response = limited.get("/employees/", headers={"X-API-Key": "key"})
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+    concurrency_limiter.release(slot)
+    assert limited.get("/employees/", headers={"X-API-Key": "key"}).status_code == 200
+    # The request released its slot on teardown
+    assert concurrency_limiter.acquire("employee.get_all_employees") == slot
+
+
+def test_concurrency_limit_by_blueprint():
+    """Test that a blueprint-wide limit covers its endpoints and queued requests get a slot."""
+    limiter = ConcurrencyLimiter({"analytics": 1}, queue_timeout=1.0)
+    assert limiter.acquire("employee.get_employee") is None
+    assert limiter.acquire("analytics.percentiles") == "analytics"
+
+    threading.Timer(0.05, limiter.release, args=("analytics",)).start()
+    assert limiter.acquire("analytics.histogram") == "analytics"
+    limiter.queue_timeout = 0
+    assert limiter.acquire("analytics.top") is False
+    assert limiter.shed == 1
+
+
+def test_sqlite_backend_is_shared(tmp_path):
+    """Test that bucket state in a SQLite file is shared between limiter instances."""
+    path = str(tmp_path / "buckets.db")
+    first, second = SQLiteBucketStore(path), SQLiteBucketStore(path)
+
+    assert first.take("client|route", 2, 0.001) == (True, 0.0)
+    assert second.take("client|route", 2, 0.001) == (True, 0.0)
+    allowed, wait = first.take("client|route", 2, 0.001)
+    assert not allowed and wait > 100
+
+
+def test_sqlite_backend_prunes_idle_buckets(tmp_path):
+    """Test that buckets idle long enough to be full again are deleted from the file."""
+    store = SQLiteBucketStore(str(tmp_path / "buckets.db"), idle_seconds=60)
+    store.take("idle|route", 2, 1)
+    store.take("busy|route", 2, 1)
+    store._connection().execute(
+        "UPDATE rate_limit_buckets SET updated = updated - 120 WHERE key = 'idle|route'"
+    )
+
+    assert store.prune() == 1
+    keys = store._connection().execute("SELECT key FROM rate_limit_buckets").fetchall()
+    assert keys == [("busy|route",)]
@@ -0,0 +1,47 @@
+import threading
+import time
+
+import pytest
+
+from app.utils.single_flight import SingleFlight
+
+
+def test_concurrent_callers_share_one_execution():
+    """Test that identical in-flight reads run once and every caller gets the result."""
+    coalescer = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow_read():
+        calls.append(1)
+        release.wait(timeout=5)
+        return "row"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(coalescer.do("key", slow_read)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    while coalescer.stats()["coalesced"] < 4:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
+    assert results == ["row"] * 5
+    assert not coalescer.in_flight("key")
+
+
+def test_errors_propagate_and_key_is_released():
+    """Test that a failing read raises for the caller and does not stick in flight."""
+    coalescer = SingleFlight()
+
+    def failing_read():
+        raise RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        coalescer.do("key", failing_read)
+    assert coalescer.do("key", lambda: "ok") == "ok"
@@ -0,0 +1,97 @@
+from datetime import date, datetime
+
+from app.extensions import db
+from app.models.employee import Employee
+from app.models.employee_archive import EmployeeArchive
+from app.models.employee_snapshot import EmployeeSnapshot
+from app.services.snapshot_service import snapshot_service
+
+
+def add_employee(name, department, salary, joined, deleted=None):
+    db.session.add(
+        Employee(
+            name=name,
+            email=f"{name}@t.com",
+            department=department,
+            salary=salary,
+            date_joined=joined,
+            deleted_at=deleted,
+        )
+    )
+    db.session.commit()
+
+
+def test_snapshots_follow_joins_and_deletions(client):
+    """Test that daily aggregates count employees from joining until deletion, incrementally."""
+    add_employee("a", "IT", 100, datetime(2024, 1, 1, 9))
+    add_employee("b", "IT", 200, datetime(2024, 1, 2, 9), deleted=datetime(2024, 1, 4, 12))
+    add_employee("c", "HR", 50, datetime(2024, 1, 3, 9))
+
+    assert snapshot_service.take_snapshots(date(2024, 1, 5)) == 5
+    daily = snapshot_service.get_trends(date(2024, 1, 1), date(2024, 1, 5))
+    assert [(p["day"].day, p["headcount"], p["payroll"]) for p in daily] == [
+        (1, 1, 100),
+        (2, 2, 300),
+        (3, 3, 350),
+        (4, 2, 150),
+        (5, 2, 150),
+    ]
+    hr = snapshot_service.get_trends(date(2024, 1, 1), date(2024, 1, 5), department="HR")
+    assert [p["headcount"] for p in hr] == [1, 1, 1]
+    assert snapshot_service.get_trends(date(2024, 1, 1), date(2024, 1, 5), department="X") == []
+
+    # Catch-up rewrites only the latest day onwards
+    add_employee("d", "HR", 10, datetime(2024, 1, 6, 9))
+    assert snapshot_service.take_snapshots(date(2024, 1, 7)) == 3
+    assert db.session.query(EmployeeSnapshot).filter_by(day=date(2024, 1, 5)).count() == 2
+    last = snapshot_service.get_trends(date(2024, 1, 7), date(2024, 1, 7))
+    assert (last[0]["headcount"], last[0]["payroll"]) == (3, 160)
+
+
+def test_archived_employees_keep_their_department(client):
+    """Test that archived employees are counted in their department until their deletion."""
+    add_employee("a", "HR", 100, datetime(2024, 1, 1, 9))
+    for id_, department in ((1001, "HR"), (1002, "Gone")):
+        db.session.add(
+            EmployeeArchive(
+                id=id_,
+                name=f"archived{id_}",
+                email=f"archived{id_}@t.com",
+                department=department,
+                salary=10,
+                date_joined=datetime(2024, 1, 1, 9),
+                deleted_at=datetime(2024, 1, 3, 12),
+            )
+        )
+    db.session.commit()
+
+    assert snapshot_service.take_snapshots(date(2024, 1, 3)) == 3
+    hr = snapshot_service.get_trends(date(2024, 1, 1), date(2024, 1, 3), department="HR")
+    assert [(p["headcount"], p["payroll"]) for p in hr] == [(2, 110), (2, 110), (1, 100)]
+    daily = snapshot_service.get_trends(date(2024, 1, 1), date(2024, 1, 3))
+    # A department no live employee ever used is counted without one
+    assert [p["headcount"] for p in daily] == [3, 3, 1]
+
+
+def test_trends_endpoint_downsamples(client, app):
+    """Test GET /employees/trends - one point per period, from the snapshot CLI job."""
+    add_employee("a", "IT", 100, datetime(2024, 1, 1))
+    add_employee("b", "IT", 100, datetime(2024, 2, 10))
+    result = app.test_cli_runner().invoke(args=["snapshot-employees", "--through", "2024-02-29"])
+    assert result.exit_code == 0, result.output
+    assert "Snapshotted 60 days." in result.output
+
+    response = client.get("/employees/trends?from=2024-01-01&to=2024-02-29&interval=month")
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["interval"] == "month"
+    assert body["points"] == [
+        {"period": "2024-01-01", "day": "2024-01-31", "headcount": 1, "payroll": 100.0},
+        {"period": "2024-02-01", "day": "2024-02-29", "headcount": 2, "payroll": 200.0},
+    ]
+    weekly = client.get("/employees/trends?from=2024-01-01&to=2024-01-31&interval=week")
+    assert [p["period"] for p in weekly.get_json()["points"]][:2] == ["2024-01-01", "2024-01-08"]
+    assert len(weekly.get_json()["points"]) == 5
+
+    assert client.get("/employees/trends?from=2024-02-01&to=2024-01-01").status_code == 422
+    assert client.get("/employees/trends?interval=year").status_code == 422
@@ -0,0 +1,78 @@
+import json
+import threading
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def setup_db(client):
+    """Fixture to ensure the database is clean for each test in this module."""
+    pass
+
+
+def create(client, tenant, **fields):
+    """Create an employee as the given tenant and return the response."""
+    return client.post(
+        "/employees/",
+        data=json.dumps({"name": "Employee", **fields}),
+        content_type="application/json",
+        headers={"X-Tenant-ID": tenant},
+    )
+
+
+def test_tenants_are_isolated(client):
+    """Test that each tenant only sees its own employees and emails are unique per tenant."""
+    acme = create(client, "acme", email="same@test.com").get_json()
+    assert create(client, "globex", email="same@test.com").status_code == 201
+    assert create(client, "acme", email="same@test.com").status_code == 409
+
+    listing = client.get("/employees/", headers={"X-Tenant-ID": "acme"}).get_json()
+    assert [e["id"] for e in listing["employees"]] == [acme["id"]]
+    assert (
+        client.get(f"/employees/{acme['id']}", headers={"X-Tenant-ID": "globex"}).status_code
+        == 404
+    )
+    assert client.get("/employees/").get_json()["total"] == 0  # default tenant
+
+
+def test_list_cache_is_per_tenant(client):
+    """Test that a cached page of one tenant is never served to another."""
+    create(client, "acme", email="a@test.com")
+    assert client.get("/employees/", headers={"X-Tenant-ID": "acme"}).get_json()["total"] == 1
+    assert client.get("/employees/", headers={"X-Tenant-ID": "globex"}).get_json()["total"] == 0
+
+
+def test_tenant_resolved_from_subdomain(app, client, monkeypatch):
+    """Test that the subdomain of TENANT_SUBDOMAIN_BASE selects the tenant without a header."""
+    monkeypatch.setitem(app.config, "TENANT_SUBDOMAIN_BASE", "example.com")
+    create(client, "acme", email="sub@test.com")
+
+    response = client.get("/employees/", base_url="http://acme.example.com")
+    assert response.get_json()["total"] == 1
+
+
+def test_invalid_tenant_is_rejected(client):
+    """Test that a malformed tenant ID returns 400."""
+    response = client.get("/employees/", headers={"X-Tenant-ID": "not a tenant!"})
+    assert response.status_code == 400
+
+
+def test_stale_page_is_revalidated_as_its_tenant(client, monkeypatch):
+    """Test that the background refresh of a stale page reads the requesting tenant's rows."""
+    from app.utils.query_cache import query_cache
+
+    monkeypatch.setattr(query_cache, "stale_while_revalidate", True)
+    create(client, "default", email="default@test.com")
+    first = create(client, "acme", email="first@test.com").get_json()
+    acme = {"X-Tenant-ID": "acme"}
+    assert client.get("/employees/", headers=acme).get_json()["total"] == 1
+    second = create(client, "acme", email="second@test.com").get_json()
+
+    running = set(threading.enumerate())
+    stale = client.get("/employees/", headers=acme).get_json()
+    assert [e["id"] for e in stale["employees"]] == [first["id"]]
+    for thread in set(threading.enumerate()) - running:
+        thread.join(timeout=5)
+
+    fresh = client.get("/employees/", headers=acme).get_json()
+    assert sorted(e["id"] for e in fresh["employees"]) == [first["id"], second["id"]]
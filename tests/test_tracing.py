@@ -0,0 +1,71 @@
+import json
+
+from app.utils.trace_sinks import FileSink, OtlpSink
+from app.utils.tracing import tracer
+
+
+def test_server_timing_breaks_requests_down_by_layer(app, client, monkeypatch):
+    """Test the Server-Timing header - exclusive time per layer, adding up to the total."""
+    created = client.post("/employees/", json={"name": "T", "email": "t@t.com"})
+    assert "Server-Timing" not in created.headers
+
+    monkeypatch.setitem(app.config, "TRACING_SERVER_TIMING", True)
+    response = client.get("/employees/?department=IT")
+    timings = {
+        name: float(duration.removeprefix("dur="))
+        for name, duration in (
+            part.strip().split(";") for part in response.headers["Server-Timing"].split(",")
+        )
+    }
+    assert list(timings) == [
+        "validate",
+        "controller",
+        "service",
+        "repository",
+        "db",
+        "serialize",
+        "app",
+        "total",
+    ]
+    total = timings.pop("total")
+    assert abs(sum(timings.values()) - total) < 0.01
+
+
+def test_traces_are_exported_to_sinks(app, client, monkeypatch, tmp_path):
+    """Test that traced requests are exported as nested spans, also as OTLP."""
+    path = tmp_path / "spans.jsonl"
+    monkeypatch.setitem(app.config, "TRACING_ENABLED", True)
+    monkeypatch.setattr(tracer, "sinks", [FileSink(str(path))])
+    employee = client.post("/employees/", json={"name": "S", "email": "s@t.com"}).get_json()
+    client.get(f"/employees/{employee['id']}")
+    tracer.flush()
+
+    spans = [json.loads(line) for line in path.read_text().splitlines()]
+    roots = [span for span in spans if span["parent_id"] is None]
+    assert [root["name"] for root in roots] == [
+        "POST /employees/",
+        f"GET /employees/{employee['id']}",
+    ]
+    assert roots[1]["attributes"]["http.status_code"] == 200
+
+    trace = [span for span in spans if span["trace_id"] == roots[1]["trace_id"]]
+    by_id = {span["span_id"]: span for span in trace}
+    lookup = next(s for s in trace if s["name"] == "repository.EmployeeRepository.get_by_id")
+    parents = []
+    span = lookup
+    while span["parent_id"]:
+        span = by_id[span["parent_id"]]
+        parents.append(span["name"])
+    assert parents == [
+        "service.EmployeeService.get_employee",
+        "controller.get_employee",
+        "validate.get_employee",
+        roots[1]["name"],
+    ]
+    assert any(s["layer"] == "db" and s["parent_id"] == lookup["span_id"] for s in trace)
+
+    otlp = OtlpSink("http://localhost:4318/v1/traces").encode(trace)
+    otlp_spans = otlp["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert len(otlp_spans) == len(trace)
+    assert {s["traceId"] for s in otlp_spans} == {roots[1]["trace_id"]}
+    assert sum("parentSpanId" not in s for s in otlp_spans) == 1